@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# benchmarks/parse.py
+"""Compares the fast grid model parsers against pydantic's validation, and the
+compact format against URL-encoded JSON.
+
+Run from the repository's root directory:
+
+    PYTHONPATH=src python benchmarks/parse.py
+"""
+from json import dumps
+from timeit import repeat
+from typing import Callable, Dict
+from urllib.parse import quote, unquote
+
+from pydantic import parse_raw_as
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortModel,
+    decode_grid_filter_model,
+    decode_grid_sort_model,
+    encode_grid_filter_model,
+    encode_grid_sort_model,
+    parse_grid_filter_model_raw,
+    parse_grid_pagination_model,
+    parse_grid_sort_model_raw,
+)
+
+FILTER_MODEL = dumps(
+    {
+        "items": [
+            {"columnField": "name", "id": 1, "operatorValue": "contains", "value": "a"},
+            {"columnField": "id", "id": 2, "operatorValue": ">", "value": 10},
+            {"columnField": "id", "id": 3, "operatorValue": "isAnyOf", "value": [1, 2]},
+        ],
+        "linkOperator": "and",
+        "quickFilterLogicOperator": "and",
+        "quickFilterValues": ["a", "b"],
+    }
+)
+SORT_MODEL = dumps([{"field": "name", "sort": "asc"}, {"field": "id", "sort": "desc"}])
+PAGINATION_MODEL = {"page": "3", "pageSize": "25"}
+QUOTED_FILTER_MODEL = quote(FILTER_MODEL)
+QUOTED_SORT_MODEL = quote(SORT_MODEL)
+COMPACT_FILTER_MODEL = encode_grid_filter_model(
+    parse_grid_filter_model_raw(FILTER_MODEL)
+)
+COMPACT_SORT_MODEL = encode_grid_sort_model(parse_grid_sort_model_raw(SORT_MODEL))
+
+
+def parse_with_pydantic() -> None:
+    GridFilterModel.parse_raw(FILTER_MODEL)
+    parse_raw_as(GridSortModel, SORT_MODEL)
+    GridPaginationModel.parse_obj(PAGINATION_MODEL)
+
+
+def parse_with_fast_path() -> None:
+    parse_grid_filter_model_raw(FILTER_MODEL)
+    parse_grid_sort_model_raw(SORT_MODEL)
+    parse_grid_pagination_model(PAGINATION_MODEL)
+
+
+def parse_url_encoded_json() -> None:
+    parse_grid_filter_model_raw(unquote(QUOTED_FILTER_MODEL))
+    parse_grid_sort_model_raw(unquote(QUOTED_SORT_MODEL))
+
+
+def parse_compact() -> None:
+    decode_grid_filter_model(unquote(COMPACT_FILTER_MODEL))
+    decode_grid_sort_model(unquote(COMPACT_SORT_MODEL))
+
+
+def compare(parsers: Dict[str, Callable[[], None]], number: int) -> None:
+    baseline, candidate = parsers
+    timings = {
+        name: min(repeat(parser, number=number, repeat=5)) / number
+        for name, parser in parsers.items()
+    }
+    for name, timing in timings.items():
+        print(f"{name:>10}: {timing * 1_000_000:8.2f} µs per request")
+    print(f"   speedup: {timings[baseline] / timings[candidate]:8.2f}x")
+
+
+def main(number: int = 20_000) -> None:
+    compare(
+        {"pydantic": parse_with_pydantic, "fast path": parse_with_fast_path},
+        number=number,
+    )
+    print()
+    json_size = len(QUOTED_FILTER_MODEL) + len(QUOTED_SORT_MODEL)
+    compact_size = len(COMPACT_FILTER_MODEL) + len(COMPACT_SORT_MODEL)
+    print(f"      json: {json_size:8} bytes per request")
+    print(f"   compact: {compact_size:8} bytes per request")
+    compare({"json": parse_url_encoded_json, "compact": parse_compact}, number=number)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,8 @@ from mui.v5.grid import (
     SnakeCaseGridFilterModelDict,
     Sort,
     Value,
+    decode_cursor,
+    encode_cursor,
 )
 
 # do not re-export the integrations, they are optional dependencies, so they should
@@ -64,4 +66,6 @@ __all__ = [
     "SnakeCaseGridFilterModelDict",
     "Sort",
     "Value",
+    "decode_cursor",
+    "encode_cursor",
 ]
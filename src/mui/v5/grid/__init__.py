@@ -1,4 +1,10 @@
 from mui.v5.grid.base import GridBaseModel
+from mui.v5.grid.compact import (
+    decode_grid_filter_model,
+    decode_grid_sort_model,
+    encode_grid_filter_model,
+    encode_grid_sort_model,
+)
 from mui.v5.grid.filter import (
     CamelCaseGridFilterItemDict,
     CamelCaseGridFilterModelDict,
@@ -20,9 +26,64 @@ from mui.v5.grid.filter import (
     SnakeCaseGridFilterModelDict,
     Value,
 )
+from mui.v5.grid.frozen import (
+    FrozenDict,
+    FrozenGridFilterItem,
+    FrozenGridFilterModel,
+    FrozenGridPaginationModel,
+    FrozenGridSortItem,
+    FrozenList,
+    FrozenRequestGridModels,
+    freeze_grid_filter_item,
+    freeze_grid_filter_model,
+    freeze_grid_pagination_model,
+    freeze_grid_sort_model,
+    freeze_request_grid_models,
+    freeze_value,
+    thaw_value,
+)
 from mui.v5.grid.link import GridLinkOperator, GridLinkOperatorLiterals
-from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.normalize import (
+    OPERATOR_SYNONYMS,
+    GridModel,
+    fingerprint,
+    normalize,
+    normalize_grid_filter_model,
+    normalize_grid_sort_model,
+    normalize_operator_value,
+    normalize_request_grid_models,
+    shape_fingerprint,
+)
+from mui.v5.grid.pagination import (
+    GridPaginationModel,
+    decode_cursor,
+    encode_cursor,
+)
+from mui.v5.grid.parse import (
+    DEFAULT_JSON_DECODER,
+    GridModelFormat,
+    JsonDecoder,
+    parse_grid_filter_model,
+    parse_grid_filter_model_raw,
+    parse_grid_pagination_model,
+    parse_grid_pagination_model_raw,
+    parse_grid_sort_model,
+    parse_grid_sort_model_raw,
+)
+from mui.v5.grid.querystring import (
+    parse_grid_filter_model_from_query_string,
+    parse_grid_pagination_model_from_query_string,
+    parse_grid_sort_model_from_query_string,
+    parse_nested_query_string,
+)
 from mui.v5.grid.request import RequestGridModels
+from mui.v5.grid.snapshot import (
+    GridFilterItemSnapshot,
+    GridFilterModelSnapshot,
+    GridPaginationModelSnapshot,
+    GridSortItemSnapshot,
+    GridSortModelSnapshot,
+)
 from mui.v5.grid.sort import Field, GridSortDirection, GridSortItem, GridSortModel, Sort
 
 # isort: unique-list
@@ -30,23 +91,40 @@ __all__ = [
     "CamelCaseGridFilterItemDict",
     "CamelCaseGridFilterModelDict",
     "ColumnField",
+    "DEFAULT_JSON_DECODER",
     "Field",
+    "FrozenDict",
+    "FrozenGridFilterItem",
+    "FrozenGridFilterModel",
+    "FrozenGridPaginationModel",
+    "FrozenGridSortItem",
+    "FrozenList",
+    "FrozenRequestGridModels",
     "GridBaseModel",
     "GridFilterItem",
     "GridFilterItemDict",
+    "GridFilterItemSnapshot",
     "GridFilterModel",
     "GridFilterModelDict",
+    "GridFilterModelSnapshot",
     "GridLinkOperator",
     "GridLinkOperatorLiterals",
+    "GridModel",
+    "GridModelFormat",
     "GridPaginationModel",
+    "GridPaginationModelSnapshot",
     "GridSortDirection",
     "GridSortItem",
+    "GridSortItemSnapshot",
     "GridSortModel",
+    "GridSortModelSnapshot",
     "Id",
     "Items",
     "ItemsLiterals",
+    "JsonDecoder",
     "LinkOperator",
     "LinkOperatorLiterals",
+    "OPERATOR_SYNONYMS",
     "OperatorValue",
     "QuickFilterLogicOperator",
     "QuickFilterLogicOperatorLiterals",
@@ -56,4 +134,34 @@ __all__ = [
     "SnakeCaseGridFilterModelDict",
     "Sort",
     "Value",
+    "decode_cursor",
+    "decode_grid_filter_model",
+    "decode_grid_sort_model",
+    "encode_cursor",
+    "encode_grid_filter_model",
+    "encode_grid_sort_model",
+    "fingerprint",
+    "freeze_grid_filter_item",
+    "freeze_grid_filter_model",
+    "freeze_grid_pagination_model",
+    "freeze_grid_sort_model",
+    "freeze_request_grid_models",
+    "freeze_value",
+    "normalize",
+    "normalize_grid_filter_model",
+    "normalize_grid_sort_model",
+    "normalize_operator_value",
+    "normalize_request_grid_models",
+    "parse_grid_filter_model",
+    "parse_grid_filter_model_from_query_string",
+    "parse_grid_filter_model_raw",
+    "parse_grid_pagination_model",
+    "parse_grid_pagination_model_from_query_string",
+    "parse_grid_pagination_model_raw",
+    "parse_grid_sort_model",
+    "parse_grid_sort_model_from_query_string",
+    "parse_grid_sort_model_raw",
+    "parse_nested_query_string",
+    "shape_fingerprint",
+    "thaw_value",
 ]
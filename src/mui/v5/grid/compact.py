@@ -0,0 +1,204 @@
+"""The compact module contains a compact, URL-safe encoding of the grid models.
+
+URL-encoded JSON is verbose: every key is repeated for each filter item, and each
+quote, bracket, and brace is percent-encoded into three characters. The compact format
+instead stores the models as positional arrays, omitting trailing nulls, which are
+then base64url encoded without padding:
+
+    filter model: [items, linkOperator, quickFilterValues, quickFilterLogicOperator]
+    filter item: [columnField, operatorValue, value, id]
+    sort model: [[field, sort], ...]
+
+For example, `{"items": [{"columnField": "name", "operatorValue": "contains",
+"value": "a"}], "linkOperator": "and"}` is encoded as `[[["name","contains","a"]],
+"and"]`, or `W1tbIm5hbWUiLCJjb250YWlucyIsImEiXV0sImFuZCJd`.
+
+The decoded models are parsed using the fast parsers, so they are validated in the
+same way as the JSON encoded models.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from json import dumps, loads
+from typing import Any, Dict, List, Tuple
+
+from pydantic.json import pydantic_encoder
+
+from mui.v5.grid.filter import GridFilterModel
+from mui.v5.grid.parse import (
+    DEFAULT_JSON_DECODER,
+    JsonDecoder,
+    parse_grid_filter_model,
+    parse_grid_sort_model,
+)
+from mui.v5.grid.sort import GridSortModel
+
+# the keys of the positional filter model and filter item arrays, in order
+_FILTER_MODEL_KEYS = (
+    "items",
+    "linkOperator",
+    "quickFilterValues",
+    "quickFilterLogicOperator",
+)
+_FILTER_ITEM_KEYS = ("columnField", "operatorValue", "value", "id")
+_SORT_ITEM_KEYS = ("field", "sort")
+
+
+def _trim(values: List[Any]) -> List[Any]:
+    """Removes the trailing null values of a positional array.
+
+    Args:
+        values (List[Any]): The positional array.
+
+    Returns:
+        List[Any]: The positional array, without its trailing null values.
+    """
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def _encode(obj: Any) -> str:
+    """Encodes a positional array into the compact format.
+
+    Args:
+        obj (Any): The positional array.
+
+    Returns:
+        str: The base64url encoded JSON document, without padding.
+    """
+    raw = dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=pydantic_encoder
+    ).encode("utf-8")
+    return urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode(compact: str, decoder: JsonDecoder) -> Any:
+    """Decodes a positional array from the compact format.
+
+    Args:
+        compact (str): The base64url encoded JSON document.
+        decoder (JsonDecoder): The function decoding the JSON document.
+
+    Raises:
+        ValueError: Raised when the document isn't valid base64url encoded JSON.
+
+    Returns:
+        Any: The decoded positional array.
+    """
+    padding = "=" * (-len(compact) % 4)
+    try:
+        raw = urlsafe_b64decode(compact + padding)
+    except (BinasciiError, ValueError) as e:
+        raise ValueError("Invalid compact grid model") from e
+    try:
+        return decoder(raw)
+    except ValueError:
+        pass
+    # documents the decoder rejects, such as those using NaN with orjson, are decoded
+    # by the standard library, as they are for the JSON encoded models
+    try:
+        return loads(raw)
+    except ValueError as e:
+        raise ValueError("Invalid compact grid model") from e
+
+
+def _expand(values: Any, keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Converts a positional array into an object, using the keys of each position.
+
+    Args:
+        values (Any): The positional array.
+        keys (Tuple[str, ...]): The key of each position.
+
+    Raises:
+        ValueError: Raised when the value isn't an array, or has too many positions.
+
+    Returns:
+        Dict[str, Any]: The object, which excludes the omitted trailing positions.
+    """
+    if type(values) is not list or len(values) > len(keys):
+        raise ValueError("Invalid compact grid model")
+    return dict(zip(keys, values))
+
+
+def encode_grid_filter_model(model: GridFilterModel) -> str:
+    """Encodes a grid filter model into the compact format.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+
+    Returns:
+        str: The compact grid filter model.
+    """
+    items = [
+        _trim([item.column_field, item.operator_value, item.value, item.id])
+        for item in model.items
+    ]
+    return _encode(
+        _trim(
+            [
+                items,
+                model.link_operator,
+                model.quick_filter_values,
+                model.quick_filter_logic_operator,
+            ]
+        )
+    )
+
+
+def decode_grid_filter_model(
+    compact: str, decoder: JsonDecoder = DEFAULT_JSON_DECODER
+) -> GridFilterModel:
+    """Decodes a grid filter model from the compact format.
+
+    Args:
+        compact (str): The compact grid filter model.
+        decoder (JsonDecoder, optional): The function decoding the JSON document.
+            Defaults to DEFAULT_JSON_DECODER.
+
+    Raises:
+        ValueError: Raised when the compact grid filter model is malformed.
+        ValidationError: Raised when the decoded grid filter model is invalid.
+
+    Returns:
+        GridFilterModel: The grid filter model.
+    """
+    obj = _expand(_decode(compact=compact, decoder=decoder), _FILTER_MODEL_KEYS)
+    items = obj.get("items")
+    if type(items) is list:
+        obj["items"] = [_expand(item, _FILTER_ITEM_KEYS) for item in items]
+    return parse_grid_filter_model(obj)
+
+
+def encode_grid_sort_model(model: GridSortModel) -> str:
+    """Encodes a grid sort model into the compact format.
+
+    Args:
+        model (GridSortModel): The grid sort model.
+
+    Returns:
+        str: The compact grid sort model.
+    """
+    return _encode([[item.field, item.sort] for item in model])
+
+
+def decode_grid_sort_model(
+    compact: str, decoder: JsonDecoder = DEFAULT_JSON_DECODER
+) -> GridSortModel:
+    """Decodes a grid sort model from the compact format.
+
+    Args:
+        compact (str): The compact grid sort model.
+        decoder (JsonDecoder, optional): The function decoding the JSON document.
+            Defaults to DEFAULT_JSON_DECODER.
+
+    Raises:
+        ValueError: Raised when the compact grid sort model is malformed.
+        ValidationError: Raised when the decoded grid sort model is invalid.
+
+    Returns:
+        GridSortModel: The grid sort model.
+    """
+    obj = _decode(compact=compact, decoder=decoder)
+    if type(obj) is not list:
+        raise ValueError("Invalid compact grid model")
+    return parse_grid_sort_model([_expand(item, _SORT_ITEM_KEYS) for item in obj])
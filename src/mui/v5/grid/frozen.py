@@ -0,0 +1,294 @@
+"""The frozen module contains immutable variants of the grid models.
+
+Frozen grid models may be shared between requests, such as by a cache, because they
+cannot be modified after they are created. Each frozen model is a subclass of the
+mutable model, so it may be used anywhere the mutable model is accepted, while lists
+and dictionaries are replaced by frozen lists and frozen dictionaries, which raise a
+TypeError when they are modified.
+"""
+from typing import Any, Dict, List, NoReturn, Tuple, Type, TypeVar
+
+from mui.v5.grid.filter import GridFilterItem, GridFilterModel
+from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.request import RequestGridModels
+from mui.v5.grid.sort import GridSortItem, GridSortModel
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+_V = TypeVar("_V")
+
+
+class FrozenList(List[_T]):
+    """An immutable, hashable list.
+
+    Frozen lists are lists, so they may be used where a list is expected, but each
+    method which would modify the list raises a TypeError instead.
+    """
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Replaces each method which would modify the list.
+
+        Raises:
+            TypeError: Always, as the list can't be modified.
+        """
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    __setitem__ = _immutable  # type: ignore[assignment]
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        """Returns the hash of the list's elements."""
+        return hash(tuple(self))
+
+    def __reduce__(self) -> Tuple[Type["FrozenList[_T]"], Tuple[List[_T]]]:
+        """Supports copying and pickling without modifying the list."""
+        return (type(self), (list(self),))
+
+
+class FrozenDict(Dict[_K, _V]):
+    """An immutable, hashable dictionary.
+
+    Frozen dictionaries are dictionaries, so they may be used where a dictionary is
+    expected, but each method which would modify the dictionary raises a TypeError
+    instead.
+    """
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Replaces each method which would modify the dictionary.
+
+        Raises:
+            TypeError: Always, as the dictionary can't be modified.
+        """
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __delitem__ = _immutable
+    __ior__ = _immutable  # type: ignore[assignment]
+    __setitem__ = _immutable
+    clear = _immutable
+    pop = _immutable  # type: ignore[assignment]
+    popitem = _immutable
+    setdefault = _immutable  # type: ignore[assignment]
+    update = _immutable  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        """Returns the hash of the dictionary's items."""
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> Tuple[Type["FrozenDict[_K, _V]"], Tuple[Dict[_K, _V]]]:
+        """Supports copying and pickling without modifying the dictionary."""
+        return (type(self), (dict(self),))
+
+
+class FrozenGridFilterItem(GridFilterItem):
+    """An immutable grid filter item."""
+
+    class Config:
+        """
+
+        Attributes:
+            frozen: True to prevent assignment and to make the model hashable.
+        """
+
+        frozen = True
+
+
+class FrozenGridFilterModel(GridFilterModel):
+    """An immutable grid filter model."""
+
+    class Config:
+        """
+
+        Attributes:
+            frozen: True to prevent assignment and to make the model hashable.
+        """
+
+        frozen = True
+
+
+class FrozenGridSortItem(GridSortItem):
+    """An immutable grid sort item."""
+
+    class Config:
+        """
+
+        Attributes:
+            frozen: True to prevent assignment and to make the model hashable.
+        """
+
+        frozen = True
+
+
+class FrozenGridPaginationModel(GridPaginationModel):
+    """An immutable grid pagination model."""
+
+    class Config:
+        """
+
+        Attributes:
+            frozen: True to prevent assignment and to make the model hashable.
+        """
+
+        frozen = True
+
+
+class FrozenRequestGridModels(RequestGridModels):
+    """Immutable request grid models."""
+
+    class Config:
+        """
+
+        Attributes:
+            frozen: True to prevent assignment and to make the model hashable.
+        """
+
+        frozen = True
+
+
+def freeze_value(value: Any) -> Any:
+    """Converts values, such as those of the isAnyOf operator, into immutable values.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The value, with its lists and dictionaries converted into frozen lists
+            and frozen dictionaries.
+    """
+    if isinstance(value, list):
+        return FrozenList(freeze_value(element) for element in value)
+    if isinstance(value, tuple):
+        return tuple(freeze_value(element) for element in value)
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze_value(v) for key, v in value.items()})
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """Converts the values created by `freeze_value` back into mutable values.
+
+    Args:
+        value (Any): The immutable value.
+
+    Returns:
+        Any: The value, with its frozen lists and frozen dictionaries converted into
+            lists and dictionaries.
+    """
+    if isinstance(value, list):
+        return [thaw_value(element) for element in value]
+    if isinstance(value, tuple):
+        return tuple(thaw_value(element) for element in value)
+    if isinstance(value, dict):
+        return {key: thaw_value(v) for key, v in value.items()}
+    return value
+
+
+def freeze_grid_filter_item(item: GridFilterItem) -> FrozenGridFilterItem:
+    """Creates an immutable copy of a grid filter item.
+
+    Args:
+        item (GridFilterItem): The grid filter item.
+
+    Returns:
+        FrozenGridFilterItem: The frozen grid filter item.
+    """
+    if isinstance(item, FrozenGridFilterItem):
+        return item
+    return FrozenGridFilterItem.construct(
+        _fields_set=set(item.__fields_set__),
+        column_field=item.column_field,
+        id=item.id,
+        operator_value=item.operator_value,
+        value=freeze_value(item.value),
+    )
+
+
+def freeze_grid_filter_model(model: GridFilterModel) -> FrozenGridFilterModel:
+    """Creates an immutable copy of a grid filter model.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+
+    Returns:
+        FrozenGridFilterModel: The frozen grid filter model.
+    """
+    if isinstance(model, FrozenGridFilterModel):
+        return model
+    return FrozenGridFilterModel.construct(
+        _fields_set=set(model.__fields_set__),
+        items=FrozenList(freeze_grid_filter_item(item) for item in model.items),
+        link_operator=model.link_operator,
+        quick_filter_logic_operator=model.quick_filter_logic_operator,
+        quick_filter_values=freeze_value(model.quick_filter_values),
+    )
+
+
+def freeze_grid_sort_model(model: GridSortModel) -> GridSortModel:
+    """Creates an immutable copy of a grid sort model.
+
+    Args:
+        model (GridSortModel): The grid sort model.
+
+    Returns:
+        GridSortModel: The frozen grid sort model, a frozen list of frozen grid sort
+            items.
+    """
+    return FrozenList(
+        item
+        if isinstance(item, FrozenGridSortItem)
+        else FrozenGridSortItem.construct(
+            _fields_set=set(item.__fields_set__), field=item.field, sort=item.sort
+        )
+        for item in model
+    )
+
+
+def freeze_grid_pagination_model(
+    model: GridPaginationModel,
+) -> FrozenGridPaginationModel:
+    """Creates an immutable copy of a grid pagination model.
+
+    Args:
+        model (GridPaginationModel): The grid pagination model.
+
+    Returns:
+        FrozenGridPaginationModel: The frozen grid pagination model.
+    """
+    if isinstance(model, FrozenGridPaginationModel):
+        return model
+    return FrozenGridPaginationModel.construct(
+        _fields_set=set(model.__fields_set__),
+        page=model.page,
+        page_size=model.page_size,
+        cursor=model.cursor,
+    )
+
+
+def freeze_request_grid_models(models: RequestGridModels) -> FrozenRequestGridModels:
+    """Creates an immutable copy of request grid models.
+
+    The models are already validated, so they aren't validated a second time.
+
+    Args:
+        models (RequestGridModels): The request grid models.
+
+    Returns:
+        FrozenRequestGridModels: The frozen request grid models.
+    """
+    if isinstance(models, FrozenRequestGridModels):
+        return models
+    return FrozenRequestGridModels.construct(
+        _fields_set=set(models.__fields_set__),
+        filter_model=freeze_grid_filter_model(models.filter_model),
+        sort_model=freeze_grid_sort_model(models.sort_model),
+        pagination_model=freeze_grid_pagination_model(models.pagination_model),
+    )
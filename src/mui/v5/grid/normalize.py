@@ -0,0 +1,407 @@
+"""The normalize module canonicalizes grid models and creates their fingerprints.
+
+Two grid models may be semantically equal while differing in their data. For example,
+these filter models match the same rows:
+
+    {"items": [{"columnField": "id", "id": 1, "operatorValue": "eq", "value": 1}]}
+    {"items": [{"column_field": "id", "id": 7, "operator_value": "=", "value": 1}],
+     "linkOperator": "and"}
+
+Normalizing a model converts it into a canonical form, so that semantically equal
+models are equal after normalization, and the fingerprint of a model is the
+fingerprint of its normalized snapshot. Fingerprints are therefore suitable as cache
+keys, as a cached result is shared by every request which is semantically the same.
+
+The shape fingerprint of a model ignores its values, such as the filter values or the
+page number, so that it identifies the kind of request being made. This is useful for
+caching the work which doesn't depend on the values, such as building a statement.
+
+Normalized operators are canonical spellings, such as "=" for "eq", so normalized
+models are intended for comparisons and cache keys. Custom operator applicators may
+only support the spelling they were registered with.
+"""
+from hashlib import sha256
+from json import dumps
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, overload
+
+from pydantic.json import pydantic_encoder
+
+from mui.v5.grid.filter import GridFilterItem, GridFilterModel
+from mui.v5.grid.link import GridLinkOperator
+from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.request import RequestGridModels
+from mui.v5.grid.snapshot import (
+    GridFilterModelSnapshot,
+    GridPaginationModelSnapshot,
+    GridSortModelSnapshot,
+)
+from mui.v5.grid.sort import GridSortItem, GridSortModel
+
+# the alternative spellings of the basic operators, and their canonical spelling
+OPERATOR_SYNONYMS: Mapping[str, str] = {
+    "==": "=",
+    "eq": "=",
+    "equals": "=",
+    "ne": "!=",
+    "gt": ">",
+    "ge": ">=",
+    "lt": "<",
+    "le": "<=",
+}
+# the operators whose value is a list of alternatives, so their order is irrelevant
+_UNORDERED_VALUE_OPERATORS = frozenset(("isAnyOf",))
+
+GridModel = Union[
+    GridFilterModel, GridPaginationModel, GridSortModel, RequestGridModels
+]
+
+
+def normalize_operator_value(operator_value: Optional[str]) -> Optional[str]:
+    """Converts an operator into its canonical spelling.
+
+    Args:
+        operator_value (Optional[str]): The operator, such as "eq".
+
+    Returns:
+        Optional[str]: The canonical operator, such as "=". Operators without
+            synonyms are returned unchanged.
+    """
+    if operator_value is None:
+        return None
+    return OPERATOR_SYNONYMS.get(operator_value, operator_value)
+
+
+def _canonical_json(value: Any) -> str:
+    """Encodes a value as canonical JSON, which is used to order values.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The canonical JSON representation of the value.
+    """
+    return dumps(
+        value,
+        default=pydantic_encoder,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+def _normalize_value(operator_value: Optional[str], value: Any) -> Any:
+    """Normalizes a filter item's value.
+
+    Args:
+        operator_value (Optional[str]): The filter item's canonical operator.
+        value (Any): The filter item's value.
+
+    Returns:
+        Any: The value. The values of operators such as isAnyOf are sorted, and their
+            duplicates are removed, as their order doesn't change which rows match.
+    """
+    if operator_value in _UNORDERED_VALUE_OPERATORS and isinstance(value, list):
+        unique: Dict[str, Any] = {_canonical_json(v): v for v in value}
+        return [unique[key] for key in sorted(unique)]
+    return value
+
+
+def _normalize_grid_filter_item(item: GridFilterItem) -> GridFilterItem:
+    """Normalizes a grid filter item.
+
+    The identifier is removed, as it only identifies the item in the data grid's user
+    interface, and the operator is converted into its canonical spelling.
+
+    Args:
+        item (GridFilterItem): The grid filter item.
+
+    Returns:
+        GridFilterItem: The normalized grid filter item.
+    """
+    operator_value = normalize_operator_value(item.operator_value)
+    # the item was already validated, so it isn't validated a second time
+    return GridFilterItem.construct(
+        _fields_set={"column_field", "id", "operator_value", "value"},
+        column_field=item.column_field,
+        id=None,
+        operator_value=operator_value,
+        value=_normalize_value(operator_value=operator_value, value=item.value),
+    )
+
+
+def _item_key(item: GridFilterItem) -> Tuple[str, str, str]:
+    """The key of the canonical order of normalized filter items.
+
+    Args:
+        item (GridFilterItem): The normalized grid filter item.
+
+    Returns:
+        Tuple[str, str, str]: The item's column field, operator, and value.
+    """
+    return (item.column_field, item.operator_value or "", _canonical_json(item.value))
+
+
+def normalize_grid_filter_model(model: GridFilterModel) -> GridFilterModel:
+    """Normalizes a grid filter model.
+
+    The items are normalized, sorted into a canonical order, and deduplicated, as
+    neither their order nor repeated items change which rows match. A missing link
+    operator is "and", which is the data grid's default, and the quick filter logic
+    operator is removed if there are no quick filter values.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+
+    Returns:
+        GridFilterModel: The normalized grid filter model.
+    """
+    items: Dict[Tuple[str, str, str], GridFilterItem] = {}
+    for item in model.items:
+        normalized = _normalize_grid_filter_item(item)
+        items.setdefault(_item_key(normalized), normalized)
+    quick_filter_values = model.quick_filter_values or None
+    return GridFilterModel.construct(
+        _fields_set={
+            "items",
+            "link_operator",
+            "quick_filter_logic_operator",
+            "quick_filter_values",
+        },
+        items=[items[key] for key in sorted(items)],
+        link_operator=model.link_operator or GridLinkOperator.And,
+        quick_filter_logic_operator=(
+            None
+            if quick_filter_values is None
+            else model.quick_filter_logic_operator or GridLinkOperator.And
+        ),
+        quick_filter_values=quick_filter_values,
+    )
+
+
+def normalize_grid_sort_model(model: GridSortModel) -> GridSortModel:
+    """Normalizes a grid sort model.
+
+    Unsorted items are removed, as they don't change the order of the rows, as are
+    repeated fields, as rows are already ordered by the field's first item.
+
+    Args:
+        model (GridSortModel): The grid sort model.
+
+    Returns:
+        GridSortModel: The normalized grid sort model.
+    """
+    items: Dict[str, GridSortItem] = {}
+    for item in model:
+        if item.sort is not None:
+            items.setdefault(item.field, item)
+    return list(items.values())
+
+
+def normalize_request_grid_models(models: RequestGridModels) -> RequestGridModels:
+    """Normalizes request grid models.
+
+    Args:
+        models (RequestGridModels): The request grid models.
+
+    Returns:
+        RequestGridModels: The request grid models, with normalized filter and sort
+            models. The pagination model has no alternative forms, so it is
+            unchanged.
+    """
+    return RequestGridModels.construct(
+        _fields_set=set(models.__fields_set__),
+        filter_model=normalize_grid_filter_model(models.filter_model),
+        sort_model=normalize_grid_sort_model(models.sort_model),
+        pagination_model=models.pagination_model,
+    )
+
+
+@overload
+def normalize(model: GridFilterModel) -> GridFilterModel:
+    """When a grid filter model is provided, return the normalized filter model.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+
+    Returns:
+        GridFilterModel: The normalized grid filter model.
+    """
+    ...
+
+
+@overload
+def normalize(model: GridPaginationModel) -> GridPaginationModel:
+    """When a grid pagination model is provided, return it unchanged.
+
+    Args:
+        model (GridPaginationModel): The grid pagination model.
+
+    Returns:
+        GridPaginationModel: The grid pagination model, which is already normalized.
+    """
+    ...
+
+
+@overload
+def normalize(model: GridSortModel) -> GridSortModel:
+    """When a grid sort model is provided, return the normalized sort model.
+
+    Args:
+        model (GridSortModel): The grid sort model.
+
+    Returns:
+        GridSortModel: The normalized grid sort model.
+    """
+    ...
+
+
+@overload
+def normalize(model: RequestGridModels) -> RequestGridModels:
+    """When request grid models are provided, return the normalized models.
+
+    Args:
+        model (RequestGridModels): The request grid models.
+
+    Returns:
+        RequestGridModels: The request grid models, with each model normalized.
+    """
+    ...
+
+
+def normalize(model: GridModel) -> GridModel:
+    """Normalizes a grid model, so that semantically equal models are equal.
+
+    Args:
+        model (GridModel): The grid filter, pagination, or sort model, or the request
+            grid models.
+
+    Raises:
+        TypeError: Raised when the model isn't a grid model.
+
+    Returns:
+        GridModel: The normalized model.
+    """
+    if isinstance(model, GridFilterModel):
+        return normalize_grid_filter_model(model)
+    if isinstance(model, GridPaginationModel):
+        return model
+    if isinstance(model, RequestGridModels):
+        return normalize_request_grid_models(model)
+    if isinstance(model, list):
+        return normalize_grid_sort_model(model)
+    raise TypeError(f"Unsupported grid model: {type(model).__name__}")
+
+
+def _digest(*parts: str) -> str:
+    """Combines several fingerprints into a single fingerprint.
+
+    Args:
+        *parts (str): The fingerprints, or other strings, being combined.
+
+    Returns:
+        str: The SHA-256 hex digest of the parts.
+    """
+    digest = sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        # separate the parts so that they can't run together ambiguously
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fingerprint(model: GridModel) -> str:
+    """Creates the stable fingerprint of a grid model.
+
+    Semantically equal models have the same fingerprint, as it is the fingerprint of
+    the normalized model. The fingerprint is stable across processes.
+
+    Args:
+        model (GridModel): The grid filter, pagination, or sort model, or the request
+            grid models.
+
+    Raises:
+        TypeError: Raised when the model isn't a grid model.
+
+    Returns:
+        str: The SHA-256 hex digest of the model.
+    """
+    if isinstance(model, GridFilterModel):
+        return GridFilterModelSnapshot.from_model(
+            normalize_grid_filter_model(model)
+        ).fingerprint
+    if isinstance(model, GridPaginationModel):
+        return GridPaginationModelSnapshot.from_model(model).fingerprint
+    if isinstance(model, RequestGridModels):
+        return _digest(
+            "RequestGridModels",
+            fingerprint(model.filter_model),
+            fingerprint(model.sort_model),
+            fingerprint(model.pagination_model),
+        )
+    if isinstance(model, list):
+        return GridSortModelSnapshot.from_model(
+            normalize_grid_sort_model(model)
+        ).fingerprint
+    raise TypeError(f"Unsupported grid model: {type(model).__name__}")
+
+
+def _get_grid_filter_model_shape(model: GridFilterModel) -> GridFilterModel:
+    """Replaces the values of a normalized grid filter model with their presence.
+
+    Missing values are kept, as they commonly change how an operator is applied.
+
+    Args:
+        model (GridFilterModel): The normalized grid filter model.
+
+    Returns:
+        GridFilterModel: The shape of the grid filter model.
+    """
+    items: List[GridFilterItem] = [
+        item.copy(update={"value": None if item.value is None else True})
+        for item in model.items
+    ]
+    return model.copy(
+        update={
+            "items": items,
+            "quick_filter_values": None if model.quick_filter_values is None else [],
+        }
+    )
+
+
+def shape_fingerprint(model: GridModel) -> str:
+    """Creates the stable fingerprint of a grid model's shape, ignoring its values.
+
+    Models with the same fields, operators, and sort directions share a shape, while
+    their filter values, quick filter values, page, and cursor may differ. Whether a
+    filter value, quick filter, or cursor is present is part of the shape.
+
+    Args:
+        model (GridModel): The grid filter, pagination, or sort model, or the request
+            grid models.
+
+    Raises:
+        TypeError: Raised when the model isn't a grid model.
+
+    Returns:
+        str: The SHA-256 hex digest of the model's shape.
+    """
+    if isinstance(model, GridFilterModel):
+        shape = _get_grid_filter_model_shape(normalize_grid_filter_model(model))
+        return _digest("shape", GridFilterModelSnapshot.from_model(shape).fingerprint)
+    if isinstance(model, GridPaginationModel):
+        snapshot = GridPaginationModelSnapshot(
+            page_size=model.page_size,
+            cursor=None if model.cursor is None else "",
+        )
+        return _digest("shape", snapshot.fingerprint)
+    if isinstance(model, RequestGridModels):
+        return _digest(
+            "RequestGridModels",
+            shape_fingerprint(model.filter_model),
+            shape_fingerprint(model.sort_model),
+            shape_fingerprint(model.pagination_model),
+        )
+    if isinstance(model, list):
+        # sort models don't have values, so their shape is the model itself
+        return _digest("shape", fingerprint(model))
+    raise TypeError(f"Unsupported grid model: {type(model).__name__}")
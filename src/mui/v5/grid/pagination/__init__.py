@@ -1,4 +1,5 @@
+from mui.v5.grid.pagination.cursor import decode_cursor, encode_cursor
 from mui.v5.grid.pagination.model import GridPaginationModel
 
 # isort: unique-list
-__all__ = ["GridPaginationModel"]
+__all__ = ["GridPaginationModel", "decode_cursor", "encode_cursor"]
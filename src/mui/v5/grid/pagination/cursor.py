@@ -0,0 +1,155 @@
+"""The cursor module contains helpers for opaque keyset pagination cursors.
+
+A cursor records the sort key values of the last row a client has seen. The next page
+is then located by seeking past those values rather than by skipping rows with an
+offset, which keeps the cost of a page flat no matter how deep the client scrolls.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from json import dumps, loads
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from mui.v5.grid.sort import GridSortModel
+
+# the tags used to round-trip values which JSON cannot represent natively
+_DATETIME_TAG = "datetime"
+_DATE_TAG = "date"
+_TIME_TAG = "time"
+_DECIMAL_TAG = "decimal"
+_UUID_TAG = "uuid"
+
+
+def _encode_value(value: Any) -> Any:
+    """Converts a sort key value into a JSON serializable representation.
+
+    Args:
+        value (Any): The value of a sort key column from the last row of a page.
+
+    Raises:
+        ValueError: Raised when the value's type cannot be stored in a cursor.
+
+    Returns:
+        Any: The JSON serializable representation of the value.
+    """
+    if isinstance(value, Enum):
+        return _encode_value(value.value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    # datetime is a subclass of date, so it must be checked first
+    if isinstance(value, datetime):
+        return {"t": _DATETIME_TAG, "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": _DATE_TAG, "v": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": _TIME_TAG, "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"t": _DECIMAL_TAG, "v": str(value)}
+    if isinstance(value, UUID):
+        return {"t": _UUID_TAG, "v": str(value)}
+    raise ValueError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    """Converts the JSON representation of a sort key value back into the value.
+
+    Args:
+        value (Any): The JSON representation created by `_encode_value`.
+
+    Raises:
+        ValueError: Raised when the representation is not recognized.
+
+    Returns:
+        Any: The original value.
+    """
+    if not isinstance(value, dict):
+        return value
+    tag = value.get("t")
+    raw = value.get("v")
+    if not isinstance(raw, str):
+        raise ValueError("Invalid cursor value")
+    if tag == _DATETIME_TAG:
+        return datetime.fromisoformat(raw)
+    if tag == _DATE_TAG:
+        return date.fromisoformat(raw)
+    if tag == _TIME_TAG:
+        return time.fromisoformat(raw)
+    if tag == _DECIMAL_TAG:
+        return Decimal(raw)
+    if tag == _UUID_TAG:
+        return UUID(raw)
+    raise ValueError(f"Unsupported cursor value tag: {tag}")
+
+
+def _get_sort_signature(sort_model: Optional[GridSortModel]) -> List[List[str]]:
+    """Builds the signature of the sort model a cursor belongs to.
+
+    Args:
+        sort_model (Optional[GridSortModel]): The sort model used to order the page.
+
+    Returns:
+        List[List[str]]: The field and direction of each sorted item.
+    """
+    if sort_model is None:
+        return []
+    return [[item.field, item.sort] for item in sort_model if item.sort is not None]
+
+
+def encode_cursor(
+    values: Sequence[Any], sort_model: Optional[GridSortModel] = None
+) -> str:
+    """Encodes the sort key values of a row into an opaque, URL-safe cursor.
+
+    Args:
+        values (Sequence[Any]): The values of the keyset columns, in order, from the
+            last row of the current page.
+        sort_model (Optional[GridSortModel], optional): The sort model used to order
+            the page. This is stored in the cursor so that a cursor cannot be reused
+            after the client changes how the grid is sorted. Defaults to None.
+
+    Raises:
+        ValueError: Raised when a value's type cannot be stored in a cursor.
+
+    Returns:
+        str: The base64url encoded cursor, without padding.
+    """
+    payload: Dict[str, Any] = {
+        "k": _get_sort_signature(sort_model),
+        "v": [_encode_value(value) for value in values],
+    }
+    raw = dumps(payload, separators=(",", ":")).encode("utf-8")
+    return urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_model: Optional[GridSortModel] = None) -> List[Any]:
+    """Decodes an opaque cursor back into the sort key values of a row.
+
+    Args:
+        cursor (str): The cursor created by `encode_cursor`.
+        sort_model (Optional[GridSortModel], optional): The sort model the current
+            request is ordered by. Defaults to None.
+
+    Raises:
+        ValueError: Raised when the cursor is malformed or was created for a different
+            sort model.
+
+    Returns:
+        List[Any]: The values of the keyset columns, in order.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        payload = loads(urlsafe_b64decode(cursor + padding))
+    except (BinasciiError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if (
+        not isinstance(payload, dict)
+        or not isinstance(payload.get("v"), list)
+        or not isinstance(payload.get("k"), list)
+    ):
+        raise ValueError("Invalid cursor")
+    if payload["k"] != _get_sort_signature(sort_model):
+        raise ValueError("The cursor was created for a different sort model")
+    return [_decode_value(value) for value in payload["v"]]
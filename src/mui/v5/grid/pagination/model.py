@@ -1,5 +1,7 @@
 """The pagination model is designed to abstract the pagination-related data grid state.
 """
+from typing import Optional
+
 from pydantic import Field, PositiveInt
 
 from mui.v5.grid.base import GridBaseModel
@@ -11,6 +13,8 @@ class GridPaginationModel(GridBaseModel):
     Attributes:
         page (int): The current page number. Defaults to 0. First page is page zero.
         page_size (int): The size of each page. Defaults to 15.
+        cursor (str | None): The opaque keyset pagination cursor returned alongside
+            the previous page, if keyset pagination is in use. Defaults to None.
     """
 
     page: int = Field(
@@ -27,6 +31,12 @@ class GridPaginationModel(GridBaseModel):
         alias="pageSize",
         example=15,
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        title="Cursor",
+        description="The opaque cursor of the last row of the previous page.",
+        example=None,
+    )
 
     @property
     def offset(self) -> int:
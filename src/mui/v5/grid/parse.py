@@ -0,0 +1,422 @@
+"""The parse module contains fast parsers for the grid models sent by the data grid.
+
+Validating a model with pydantic runs the `ensure_optional_keys_exist` root validator
+and the field validators of every nested item, which costs more than the SQL of a
+cached page. The data grid only ever sends a handful of well known shapes, so these
+parsers check those shapes directly and build the models using `construct()`:
+
+    filter_model = parse_grid_filter_model_raw('{"items": [], "linkOperator": "and"}')
+
+Anything unexpected, such as a value which pydantic would coerce or reject, falls back
+to full pydantic validation. The parsed models are therefore identical to those parsed
+by pydantic, and invalid models raise the same `ValidationError`s.
+
+The JSON documents are decoded using orjson when it's installed, and the standard
+library's json module otherwise. A different decoder, such as ujson's, can be provided
+to each of the raw parsers. Documents which the decoder rejects, such as those using
+`NaN` with orjson, are decoded by pydantic instead.
+"""
+from importlib import import_module
+from json import loads
+from re import compile
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from pydantic import parse_obj_as, parse_raw_as
+from typing_extensions import Literal, TypeAlias
+
+from mui.v5.grid.filter import GridFilterItem, GridFilterModel
+from mui.v5.grid.link import GridLinkOperator
+from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.sort import GridSortDirection, GridSortItem, GridSortModel
+
+# the formats in which the models can be sent in the query string
+GridModelFormat: TypeAlias = Literal["json", "compact", "querystring"]
+JsonDecoder: TypeAlias = Callable[[Union[str, bytes]], Any]
+
+# orjson parses integers which don't fit in 64 bits as floats, losing precision, so
+# documents containing a run of 19 or more digits are decoded by the standard library
+_LONG_DIGITS = compile(r"\d{19}")
+_LONG_DIGITS_BYTES = compile(rb"\d{19}")
+
+
+def _get_default_json_decoder() -> JsonDecoder:
+    """Retrieves the JSON decoder used by default.
+
+    orjson is an optional dependency, so it's imported dynamically.
+
+    Returns:
+        JsonDecoder: orjson's decoder if it's installed, otherwise the standard
+            library's decoder.
+    """
+    try:
+        orjson_loads: JsonDecoder = import_module("orjson").loads
+    except ImportError:  # pragma: no cover
+        return loads
+
+    def decode(raw: Union[str, bytes]) -> Any:
+        """Decodes a JSON document, using orjson unless it would lose precision.
+
+        Args:
+            raw (Union[str, bytes]): The JSON document.
+
+        Returns:
+            Any: The decoded document.
+        """
+        if isinstance(raw, str):
+            has_long_digits = _LONG_DIGITS.search(raw) is not None
+        else:
+            has_long_digits = _LONG_DIGITS_BYTES.search(raw) is not None
+        if has_long_digits:
+            return loads(raw)
+        return orjson_loads(raw)
+
+    return decode
+
+
+DEFAULT_JSON_DECODER: JsonDecoder = _get_default_json_decoder()
+
+# distinguishes a missing key from a key whose value is null
+_MISSING = object()
+
+_LINK_OPERATORS: Dict[str, GridLinkOperator] = {
+    operator.value: operator for operator in GridLinkOperator
+}
+_SORT_DIRECTIONS: Dict[str, GridSortDirection] = {
+    direction.value: direction for direction in GridSortDirection
+}
+
+# the root validator adds any missing optional keys, so these fields are always set
+_FILTER_ITEM_FIELDS_SET = frozenset(GridFilterItem.__fields__)
+_FILTER_MODEL_OPTIONAL_FIELDS_SET = frozenset(
+    ("link_operator", "quick_filter_logic_operator", "quick_filter_values")
+)
+_SORT_ITEM_FIELDS_SET = frozenset(GridSortItem.__fields__)
+
+
+def _lookup(obj: Dict[str, Any], alias: str, name: str) -> Any:
+    """Retrieves the value of a field, preferring its alias over its name.
+
+    Args:
+        obj (Dict[str, Any]): The object being parsed.
+        alias (str): The alias of the field, such as "operatorValue".
+        name (str): The name of the field, such as "operator_value".
+
+    Returns:
+        Any: The value of the field, or _MISSING if neither key exists.
+    """
+    value = obj.get(alias, _MISSING)
+    if value is _MISSING:
+        value = obj.get(name, _MISSING)
+    return value
+
+
+def _parse_link_operator(value: Any) -> Any:
+    """Parses a link operator which is either missing, null, "and", or "or".
+
+    Args:
+        value (Any): The value of the link operator.
+
+    Returns:
+        Any: The link operator, None, or _MISSING if the value is unexpected.
+    """
+    if value is None or value is _MISSING:
+        return None
+    if type(value) is str:
+        return _LINK_OPERATORS.get(value, _MISSING)
+    return _MISSING
+
+
+def _parse_grid_filter_item(obj: Any) -> Optional[GridFilterItem]:
+    """Parses a grid filter item without validation, if it has the expected shape.
+
+    Args:
+        obj (Any): The decoded grid filter item.
+
+    Returns:
+        Optional[GridFilterItem]: The grid filter item, or None if the item must be
+            validated by pydantic.
+    """
+    if type(obj) is not dict:
+        return None
+    column_field = _lookup(obj, "columnField", "column_field")
+    if type(column_field) is not str:
+        return None
+    # string identifiers are coerced to integers by pydantic, when possible
+    id_ = obj.get("id")
+    if id_ is not None and type(id_) is not int:
+        return None
+    operator_value = _lookup(obj, "operatorValue", "operator_value")
+    if operator_value is _MISSING:
+        operator_value = None
+    elif operator_value is not None and type(operator_value) is not str:
+        return None
+    return GridFilterItem.construct(
+        _fields_set=set(_FILTER_ITEM_FIELDS_SET),
+        column_field=column_field,
+        id=id_,
+        operator_value=operator_value,
+        value=obj.get("value"),
+    )
+
+
+def _parse_grid_filter_model(obj: Any) -> Optional[GridFilterModel]:
+    """Parses a grid filter model without validation, if it has the expected shape.
+
+    Args:
+        obj (Any): The decoded grid filter model.
+
+    Returns:
+        Optional[GridFilterModel]: The grid filter model, or None if the model must
+            be validated by pydantic.
+    """
+    if type(obj) is not dict:
+        return None
+    fields_set: Set[str] = set(_FILTER_MODEL_OPTIONAL_FIELDS_SET)
+    raw_items = obj.get("items", _MISSING)
+    items: List[GridFilterItem] = []
+    if raw_items is not _MISSING:
+        if type(raw_items) is not list:
+            return None
+        for raw_item in raw_items:
+            item = _parse_grid_filter_item(raw_item)
+            if item is None:
+                return None
+            items.append(item)
+        fields_set.add("items")
+    link_operator = _parse_link_operator(_lookup(obj, "linkOperator", "link_operator"))
+    quick_filter_logic_operator = _parse_link_operator(
+        _lookup(obj, "quickFilterLogicOperator", "quick_filter_logic_operator")
+    )
+    if link_operator is _MISSING or quick_filter_logic_operator is _MISSING:
+        return None
+    quick_filter_values = _lookup(obj, "quickFilterValues", "quick_filter_values")
+    if quick_filter_values is _MISSING:
+        quick_filter_values = None
+    elif quick_filter_values is not None:
+        if type(quick_filter_values) is not list:
+            return None
+        quick_filter_values = list(quick_filter_values)
+    return GridFilterModel.construct(
+        _fields_set=fields_set,
+        items=items,
+        link_operator=link_operator,
+        quick_filter_logic_operator=quick_filter_logic_operator,
+        quick_filter_values=quick_filter_values,
+    )
+
+
+def parse_grid_filter_model(obj: Any) -> GridFilterModel:
+    """Parses a grid filter model from a decoded JSON object.
+
+    Args:
+        obj (Any): The decoded grid filter model.
+
+    Raises:
+        ValidationError: Raised when the object isn't a valid grid filter model.
+
+    Returns:
+        GridFilterModel: The parsed grid filter model.
+    """
+    model = _parse_grid_filter_model(obj)
+    return model if model is not None else GridFilterModel.parse_obj(obj)
+
+
+def parse_grid_filter_model_raw(
+    raw: Union[str, bytes], decoder: JsonDecoder = DEFAULT_JSON_DECODER
+) -> GridFilterModel:
+    """Parses a grid filter model from a JSON document.
+
+    Args:
+        raw (str | bytes): The JSON encoded grid filter model.
+        decoder (JsonDecoder, optional): The function decoding the JSON document.
+            Defaults to DEFAULT_JSON_DECODER.
+
+    Raises:
+        ValidationError: Raised when the document isn't a valid grid filter model.
+
+    Returns:
+        GridFilterModel: The parsed grid filter model.
+    """
+    try:
+        obj = decoder(raw)
+    except ValueError:
+        # pydantic wraps the decoding error in a ValidationError
+        return GridFilterModel.parse_raw(raw)
+    return parse_grid_filter_model(obj)
+
+
+def _parse_grid_sort_model(obj: Any) -> Optional[GridSortModel]:
+    """Parses a grid sort model without validation, if it has the expected shape.
+
+    Args:
+        obj (Any): The decoded grid sort model.
+
+    Returns:
+        Optional[GridSortModel]: The grid sort model, or None if the model must be
+            validated by pydantic.
+    """
+    if type(obj) is not list:
+        return None
+    model: GridSortModel = []
+    for raw_item in obj:
+        if type(raw_item) is not dict:
+            return None
+        field = raw_item.get("field")
+        sort = raw_item.get("sort", _MISSING)
+        if type(field) is not str or sort is _MISSING:
+            return None
+        if sort is not None:
+            if type(sort) is not str or sort not in _SORT_DIRECTIONS:
+                return None
+            sort = _SORT_DIRECTIONS[sort]
+        model.append(
+            GridSortItem.construct(
+                _fields_set=set(_SORT_ITEM_FIELDS_SET), field=field, sort=sort
+            )
+        )
+    return model
+
+
+def parse_grid_sort_model(obj: Any) -> GridSortModel:
+    """Parses a grid sort model from a decoded JSON array.
+
+    Args:
+        obj (Any): The decoded grid sort model.
+
+    Raises:
+        ValidationError: Raised when the object isn't a valid grid sort model.
+
+    Returns:
+        GridSortModel: The parsed grid sort model.
+    """
+    model = _parse_grid_sort_model(obj)
+    return model if model is not None else parse_obj_as(GridSortModel, obj)
+
+
+def parse_grid_sort_model_raw(
+    raw: Union[str, bytes], decoder: JsonDecoder = DEFAULT_JSON_DECODER
+) -> GridSortModel:
+    """Parses a grid sort model from a JSON document.
+
+    Args:
+        raw (str | bytes): The JSON encoded grid sort model.
+        decoder (JsonDecoder, optional): The function decoding the JSON document.
+            Defaults to DEFAULT_JSON_DECODER.
+
+    Raises:
+        ValidationError: Raised when the document isn't a valid grid sort model.
+
+    Returns:
+        GridSortModel: The parsed grid sort model.
+    """
+    try:
+        obj = decoder(raw)
+    except ValueError:
+        # pydantic wraps the decoding error in a ValidationError
+        return parse_raw_as(GridSortModel, raw)
+    return parse_grid_sort_model(obj)
+
+
+def _parse_integer(value: Any) -> Optional[int]:
+    """Parses an integer which is either an int or a string of decimal digits.
+
+    Query string arguments are always strings, so these are converted here as well.
+
+    Args:
+        value (Any): The value being parsed.
+
+    Returns:
+        Optional[int]: The integer, or None if the value must be validated by pydantic.
+    """
+    if type(value) is int:
+        return value
+    if type(value) is str and value.isdecimal():
+        try:
+            return int(value)
+        except ValueError:
+            # the number of digits exceeds the interpreter's conversion limit
+            return None
+    return None
+
+
+def _parse_grid_pagination_model(obj: Any) -> Optional[GridPaginationModel]:
+    """Parses a grid pagination model without validation, if it has the expected
+    shape.
+
+    Args:
+        obj (Any): The decoded grid pagination model, or the request's arguments.
+
+    Returns:
+        Optional[GridPaginationModel]: The grid pagination model, or None if the model
+            must be validated by pydantic.
+    """
+    if not isinstance(obj, dict):
+        return None
+    fields_set: Set[str] = set()
+    page = 0
+    page_size = 15
+    cursor = None
+    raw_page = obj.get("page", _MISSING)
+    if raw_page is not _MISSING:
+        parsed_page = _parse_integer(raw_page)
+        if parsed_page is None:
+            return None
+        page = parsed_page
+        fields_set.add("page")
+    raw_page_size = _lookup(obj, "pageSize", "page_size")
+    if raw_page_size is not _MISSING:
+        parsed_page_size = _parse_integer(raw_page_size)
+        if parsed_page_size is None or parsed_page_size <= 0:
+            return None
+        page_size = parsed_page_size
+        fields_set.add("page_size")
+    raw_cursor = obj.get("cursor", _MISSING)
+    if raw_cursor is not _MISSING:
+        if raw_cursor is not None and type(raw_cursor) is not str:
+            return None
+        cursor = raw_cursor
+        fields_set.add("cursor")
+    return GridPaginationModel.construct(
+        _fields_set=fields_set, page=page, page_size=page_size, cursor=cursor
+    )
+
+
+def parse_grid_pagination_model(obj: Any) -> GridPaginationModel:
+    """Parses a grid pagination model from a decoded JSON object or query string.
+
+    Args:
+        obj (Any): The decoded grid pagination model, or a mapping of the request's
+            arguments, such as Flask's `request.args`.
+
+    Raises:
+        ValidationError: Raised when the object isn't a valid grid pagination model.
+
+    Returns:
+        GridPaginationModel: The parsed grid pagination model.
+    """
+    model = _parse_grid_pagination_model(obj)
+    return model if model is not None else GridPaginationModel.parse_obj(obj)
+
+
+def parse_grid_pagination_model_raw(
+    raw: Union[str, bytes], decoder: JsonDecoder = DEFAULT_JSON_DECODER
+) -> GridPaginationModel:
+    """Parses a grid pagination model from a JSON document.
+
+    Args:
+        raw (str | bytes): The JSON encoded grid pagination model.
+        decoder (JsonDecoder, optional): The function decoding the JSON document.
+            Defaults to DEFAULT_JSON_DECODER.
+
+    Raises:
+        ValidationError: Raised when the document isn't a valid grid pagination model.
+
+    Returns:
+        GridPaginationModel: The parsed grid pagination model.
+    """
+    try:
+        obj = decoder(raw)
+    except ValueError:
+        # pydantic wraps the decoding error in a ValidationError
+        return GridPaginationModel.parse_raw(raw)
+    return parse_grid_pagination_model(obj)
@@ -0,0 +1,234 @@
+"""The querystring module parses nested query string arguments into objects.
+
+JavaScript libraries such as Axios and qs serialize nested objects into query strings
+using brackets, rather than JSON encoding them:
+
+    filterModel[items][0][columnField]=name&filterModel[items][0][value]=a
+    sortModel[0][field]=name&sortModel[0][sort]=asc
+
+Each argument is parsed in a single pass over the arguments, so a model is built
+without an intermediate JSON document. Bracketed integers, and empty brackets, create
+arrays, while any other bracketed name creates an object:
+
+    {"filterModel": {"items": [{"columnField": "name", "value": "a"}]}}
+
+Query strings only contain strings, so the parsed values are strings as well. Numbers
+are converted by the models' validation, such as for the pagination model's page.
+"""
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+from mui.v5.grid.filter import GridFilterModel
+from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.parse import (
+    parse_grid_filter_model,
+    parse_grid_pagination_model,
+    parse_grid_sort_model,
+)
+from mui.v5.grid.sort import GridSortModel
+
+
+class _Array(Dict[int, Any]):
+    """An array being parsed, whose elements are stored by their index.
+
+    Storing the elements by index supports arguments in any order, and prevents large
+    indexes from allocating large lists.
+    """
+
+
+def _split_key(key: str) -> Optional[List[str]]:
+    """Splits a nested argument's key into its segments.
+
+    Args:
+        key (str): The key, such as "filterModel[items][0][columnField]".
+
+    Returns:
+        Optional[List[str]]: The segments, such as ["filterModel", "items", "0",
+            "columnField"], or None if the key is malformed.
+    """
+    start = key.find("[")
+    if start == -1:
+        return [key]
+    if start == 0 or not key.endswith("]"):
+        return None
+    segments = key[start + 1 : -1].split("][")
+    if any("[" in segment or "]" in segment for segment in segments):
+        return None
+    return [key[:start], *segments]
+
+
+def _is_array_segment(segment: str) -> bool:
+    """Whether a segment refers to an element of an array.
+
+    Args:
+        segment (str): The segment of a key.
+
+    Returns:
+        bool: True if the segment is empty or a non-negative integer, otherwise False.
+    """
+    return segment == "" or (segment.isdecimal() and segment.isascii())
+
+
+def _get_index(container: _Array, segment: str) -> Optional[int]:
+    """Retrieves the index of an array segment.
+
+    Args:
+        container (_Array): The array being parsed.
+        segment (str): The segment, which is either empty to append an element, or a
+            non-negative integer.
+
+    Returns:
+        Optional[int]: The index, or None if the segment isn't an array segment.
+    """
+    if not _is_array_segment(segment):
+        return None
+    if segment == "":
+        return max(container, default=-1) + 1
+    return int(segment)
+
+
+def _set_value(root: Dict[str, Any], segments: List[str], value: str) -> None:
+    """Sets the value of a nested argument, creating its parent containers.
+
+    Args:
+        root (Dict[str, Any]): The object of the parsed arguments.
+        segments (List[str]): The segments of the argument's key.
+        value (str): The value of the argument.
+
+    Raises:
+        ValueError: Raised when the argument conflicts with a previous argument.
+    """
+    container: Any = root
+    key: Any = segments[0]
+    for segment in segments[1:]:
+        child = container.get(key)
+        if child is None:
+            child = _Array() if _is_array_segment(segment) else {}
+            container[key] = child
+        elif not isinstance(child, dict):
+            raise ValueError(f"Conflicting query string argument: {segments[0]}")
+        container = child
+        key = _get_index(child, segment) if isinstance(child, _Array) else segment
+        if key is None:
+            raise ValueError(f"Conflicting query string argument: {segments[0]}")
+    if key in container:
+        raise ValueError(f"Conflicting query string argument: {segments[0]}")
+    container[key] = value
+
+
+def _finalize(value: Any) -> Any:
+    """Converts the parsed arrays into lists, ordered by their indexes.
+
+    Args:
+        value (Any): The parsed value.
+
+    Returns:
+        Any: The value, with its arrays converted into lists.
+    """
+    if isinstance(value, _Array):
+        return [_finalize(value[index]) for index in sorted(value)]
+    if isinstance(value, dict):
+        return {key: _finalize(child) for key, child in value.items()}
+    return value
+
+
+def parse_nested_query_string(
+    args: Iterable[Tuple[str, str]], keys: Optional[Collection[str]] = None
+) -> Dict[str, Any]:
+    """Parses nested query string arguments into an object.
+
+    Args:
+        args (Iterable[Tuple[str, str]]): The query string arguments, such as
+            `request.args.items(multi=True)` in Flask.
+        keys (Optional[Collection[str]], optional): The root keys to parse, such as
+            "filterModel". Arguments with other root keys are skipped. Defaults to
+            None, which parses every argument.
+
+    Raises:
+        ValueError: Raised when a key is malformed, or when arguments conflict, such
+            as "a=1&a[b]=2".
+
+    Returns:
+        Dict[str, Any]: The parsed object.
+    """
+    root: Dict[str, Any] = {}
+    for key, value in args:
+        if keys is not None and key.partition("[")[0] not in keys:
+            continue
+        segments = _split_key(key)
+        if segments is None:
+            raise ValueError(f"Malformed query string argument: {key}")
+        _set_value(root=root, segments=segments, value=value)
+    return {key: _finalize(value) for key, value in root.items()}
+
+
+def parse_grid_filter_model_from_query_string(
+    args: Iterable[Tuple[str, str]], key: str
+) -> Optional[GridFilterModel]:
+    """Parses a grid filter model from nested query string arguments.
+
+    Args:
+        args (Iterable[Tuple[str, str]]): The query string arguments.
+        key (str): The root key of the grid filter model, such as "filterModel".
+
+    Raises:
+        ValueError: Raised when the arguments are malformed.
+        ValidationError: Raised when the grid filter model is invalid.
+
+    Returns:
+        Optional[GridFilterModel]: The grid filter model, or None if there are no
+            arguments with the key.
+    """
+    obj = parse_nested_query_string(args=args, keys=(key,)).get(key)
+    return None if obj is None else parse_grid_filter_model(obj)
+
+
+def parse_grid_sort_model_from_query_string(
+    args: Iterable[Tuple[str, str]], key: str
+) -> Optional[GridSortModel]:
+    """Parses a grid sort model from nested query string arguments.
+
+    Query strings cannot represent null, and libraries such as Axios omit null values,
+    so a grid sort item without a sort direction is unsorted.
+
+    Args:
+        args (Iterable[Tuple[str, str]]): The query string arguments.
+        key (str): The root key of the grid sort model, such as "sortModel".
+
+    Raises:
+        ValueError: Raised when the arguments are malformed.
+        ValidationError: Raised when the grid sort model is invalid.
+
+    Returns:
+        Optional[GridSortModel]: The grid sort model, or None if there are no
+            arguments with the key.
+    """
+    obj = parse_nested_query_string(args=args, keys=(key,)).get(key)
+    if obj is None:
+        return None
+    if isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, dict):
+                item.setdefault("sort", None)
+    return parse_grid_sort_model(obj)
+
+
+def parse_grid_pagination_model_from_query_string(
+    args: Iterable[Tuple[str, str]], key: str
+) -> Optional[GridPaginationModel]:
+    """Parses a grid pagination model from nested query string arguments.
+
+    Args:
+        args (Iterable[Tuple[str, str]]): The query string arguments.
+        key (str): The root key of the grid pagination model, such as
+            "paginationModel".
+
+    Raises:
+        ValueError: Raised when the arguments are malformed.
+        ValidationError: Raised when the grid pagination model is invalid.
+
+    Returns:
+        Optional[GridPaginationModel]: The grid pagination model, or None if there are
+            no arguments with the key.
+    """
+    obj = parse_nested_query_string(args=args, keys=(key,)).get(key)
+    return None if obj is None else parse_grid_pagination_model(obj)
@@ -0,0 +1,423 @@
+"""The snapshot module contains fingerprinted variants of the frozen grid models.
+
+The pydantic grid models are mutable and cannot be hashed, so they cannot be used as
+the keys of a dictionary. A snapshot is a frozen grid model, which is hashable, whose
+filter items are sorted into a canonical order:
+
+    snapshot = GridFilterModelSnapshot.from_model(filter_model)
+    totals[snapshot] = total
+
+Each snapshot carries a fingerprint, a SHA-256 hex digest of its canonical JSON
+representation, which is computed once when the snapshot is created. The fingerprint
+is stable across processes, so it may be used as the key of external caches, such as
+Redis. The filter items of a filter model snapshot are sorted into a canonical order,
+as the order of filter items doesn't change which rows they match, while the items of
+a sort model snapshot keep their order, as it does change how rows are sorted.
+"""
+from hashlib import sha256
+from json import dumps
+from typing import Any, Iterable, Mapping, Set, Tuple, Type, TypeVar, cast
+
+from pydantic import PrivateAttr, validator
+from pydantic.json import pydantic_encoder
+
+from mui.v5.grid.base import GridBaseModel
+from mui.v5.grid.filter import GridFilterItem, GridFilterModel
+from mui.v5.grid.filter.model import Items
+from mui.v5.grid.frozen import (
+    FrozenGridFilterItem,
+    FrozenGridFilterModel,
+    FrozenGridPaginationModel,
+    FrozenGridSortItem,
+    FrozenList,
+    freeze_value,
+    thaw_value,
+)
+from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.sort import GridSortItem, GridSortModel
+
+_S = TypeVar("_S", bound="_GridSnapshot")
+
+
+def _encode(value: Any) -> Any:
+    """Encodes the values which JSON cannot represent natively.
+
+    Nested snapshots are represented by their fingerprint, as it was already computed.
+
+    Args:
+        value (Any): The value being encoded.
+
+    Returns:
+        Any: The JSON serializable representation of the value.
+    """
+    if isinstance(value, _GridSnapshot):
+        return value.fingerprint
+    return pydantic_encoder(value)
+
+
+def _fingerprint(snapshot: object, fields: Mapping[str, Any]) -> str:
+    """Creates the fingerprint of a snapshot from its canonical JSON representation.
+
+    Args:
+        snapshot (object): The snapshot.
+        fields (Mapping[str, Any]): The snapshot's fields, which must be JSON
+            serializable once encoded.
+
+    Returns:
+        str: The SHA-256 hex digest of the snapshot.
+    """
+    canonical = dumps(
+        [type(snapshot).__name__, fields],
+        default=_encode,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _GridSnapshot(GridBaseModel):
+    """The base class of the grid model snapshots.
+
+    Snapshots are frozen grid models, which compute their fingerprint when they are
+    created, whether they are validated or constructed from validated values.
+
+    Attributes:
+        fingerprint (str): The SHA-256 hex digest of the snapshot's canonical JSON
+            representation.
+    """
+
+    _fingerprint: str = PrivateAttr(default="")
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize a new grid model snapshot.
+
+        Args:
+            **data (Any): The fields of the snapshot, which are validated.
+        """
+        super().__init__(**data)
+        self._fingerprint = _fingerprint(self, self.__dict__)
+
+    @classmethod
+    def _create(cls: Type[_S], fields_set: Set[str], **values: Any) -> _S:
+        """Creates a snapshot from validated values, without validating them again.
+
+        Args:
+            fields_set (Set[str]): The fields which were explicitly set.
+            **values (Any): The fields of the snapshot, which must be immutable.
+
+        Returns:
+            _S: The snapshot.
+        """
+        snapshot = cls.construct(_fields_set=fields_set, **values)
+        snapshot._fingerprint = _fingerprint(snapshot, snapshot.__dict__)
+        return snapshot
+
+    def __delattr__(self, name: str) -> None:
+        """Prevents the snapshot's fields from being deleted.
+
+        Args:
+            name (str): The name of the attribute being deleted.
+
+        Raises:
+            TypeError: Always, as the snapshot can't be modified.
+        """
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def fingerprint(self) -> str:
+        """The SHA-256 hex digest of the snapshot's canonical JSON representation."""
+        return self._fingerprint
+
+
+class GridFilterItemSnapshot(_GridSnapshot, FrozenGridFilterItem):
+    """An immutable, hashable grid filter item.
+
+    Attributes:
+        column_field (str): The column from which we want to filter the rows.
+        id (str | int | None): The identifier of the filter item.
+        operator_value (str | None): The name of the operator we want to apply.
+        value (Any | None): The filtering value, with lists and dictionaries converted
+            into frozen lists and frozen dictionaries.
+        fingerprint (str): The SHA-256 hex digest of the filter item.
+    """
+
+    @validator("value")
+    def freeze_filter_value(cls, value: Any) -> Any:  # noqa: B902
+        """Converts the filtering value into an immutable value.
+
+        Args:
+            value (Any): The filtering value.
+
+        Returns:
+            Any: The immutable filtering value.
+        """
+        return freeze_value(value)
+
+    @classmethod
+    def from_model(cls, item: GridFilterItem) -> "GridFilterItemSnapshot":
+        """Creates a snapshot of a grid filter item.
+
+        Args:
+            item (GridFilterItem): The grid filter item.
+
+        Returns:
+            GridFilterItemSnapshot: The snapshot of the grid filter item.
+        """
+        if isinstance(item, cls):
+            return item
+        return cls._create(
+            fields_set=set(item.__fields_set__),
+            column_field=item.column_field,
+            id=item.id,
+            operator_value=item.operator_value,
+            value=freeze_value(item.value),
+        )
+
+    def to_model(self) -> GridFilterItem:
+        """Creates a grid filter item from the snapshot.
+
+        Returns:
+            GridFilterItem: The grid filter item.
+        """
+        # the snapshot was created from valid values, so they aren't validated again
+        return GridFilterItem.construct(
+            _fields_set=set(self.__fields_set__),
+            column_field=self.column_field,
+            id=self.id,
+            operator_value=self.operator_value,
+            value=thaw_value(self.value),
+        )
+
+
+def _sort_key(item: GridFilterItemSnapshot) -> Tuple[str, str, str]:
+    """The key of the canonical order of filter items.
+
+    Args:
+        item (GridFilterItemSnapshot): The filter item snapshot.
+
+    Returns:
+        Tuple[str, str, str]: The item's column field, operator, and fingerprint, which
+            breaks ties between items of the same column and operator.
+    """
+    return (item.column_field, item.operator_value or "", item.fingerprint)
+
+
+def _sort_items(items: Iterable[GridFilterItem]) -> Items:
+    """Sorts filter items into their canonical order.
+
+    Args:
+        items (Iterable[GridFilterItem]): The filter items, in any order.
+
+    Returns:
+        List[GridFilterItem]: The snapshots of the filter items, as a frozen list in
+            their canonical order.
+    """
+    snapshots = [GridFilterItemSnapshot.from_model(item) for item in items]
+    snapshots.sort(key=_sort_key)
+    return FrozenList(snapshots)
+
+
+class GridFilterModelSnapshot(_GridSnapshot, FrozenGridFilterModel):
+    """An immutable, hashable grid filter model.
+
+    Attributes:
+        items (FrozenList[GridFilterItemSnapshot]): The filter items, in their
+            canonical order.
+        link_operator (GridLinkOperator | None): How the filter items are linked.
+        quick_filter_logic_operator (GridLinkOperator | None): How the quick filter
+            values are linked.
+        quick_filter_values (FrozenList[Any] | None): The values used to quick filter
+            rows.
+        fingerprint (str): The SHA-256 hex digest of the filter model.
+    """
+
+    @validator("items", always=True)
+    def sort_filter_items(cls, items: Items) -> Items:  # noqa: B902
+        """Sorts the filter items into their canonical order.
+
+        Args:
+            items (List[GridFilterItem]): The filter items, in any order.
+
+        Returns:
+            List[GridFilterItem]: The snapshots of the filter items, as a frozen list
+                in their canonical order.
+        """
+        return _sort_items(items)
+
+    @validator("quick_filter_values")
+    def freeze_quick_filter_values(cls, values: Any) -> Any:  # noqa: B902
+        """Converts the quick filter values into immutable values.
+
+        Args:
+            values (Any): The quick filter values.
+
+        Returns:
+            Any: The immutable quick filter values.
+        """
+        return freeze_value(values)
+
+    @classmethod
+    def from_model(cls, model: GridFilterModel) -> "GridFilterModelSnapshot":
+        """Creates a snapshot of a grid filter model.
+
+        Args:
+            model (GridFilterModel): The grid filter model.
+
+        Returns:
+            GridFilterModelSnapshot: The snapshot of the grid filter model.
+        """
+        if isinstance(model, cls):
+            return model
+        return cls._create(
+            fields_set=set(model.__fields_set__),
+            items=_sort_items(model.items),
+            link_operator=model.link_operator,
+            quick_filter_logic_operator=model.quick_filter_logic_operator,
+            quick_filter_values=freeze_value(model.quick_filter_values),
+        )
+
+    def to_model(self) -> GridFilterModel:
+        """Creates a grid filter model from the snapshot.
+
+        Returns:
+            GridFilterModel: The grid filter model, with the items in their canonical
+                order.
+        """
+        return GridFilterModel.construct(
+            _fields_set=set(self.__fields_set__),
+            items=[
+                cast(GridFilterItemSnapshot, item).to_model() for item in self.items
+            ],
+            link_operator=self.link_operator,
+            quick_filter_logic_operator=self.quick_filter_logic_operator,
+            quick_filter_values=thaw_value(self.quick_filter_values),
+        )
+
+
+class GridSortItemSnapshot(_GridSnapshot, FrozenGridSortItem):
+    """An immutable, hashable grid sort item.
+
+    Attributes:
+        field (str): The column field identifier.
+        sort (GridSortDirection | None): The direction of the column's sort.
+        fingerprint (str): The SHA-256 hex digest of the sort item.
+    """
+
+    @classmethod
+    def from_model(cls, item: GridSortItem) -> "GridSortItemSnapshot":
+        """Creates a snapshot of a grid sort item.
+
+        Args:
+            item (GridSortItem): The grid sort item.
+
+        Returns:
+            GridSortItemSnapshot: The snapshot of the grid sort item.
+        """
+        if isinstance(item, cls):
+            return item
+        return cls._create(
+            fields_set=set(item.__fields_set__), field=item.field, sort=item.sort
+        )
+
+    def to_model(self) -> GridSortItem:
+        """Creates a grid sort item from the snapshot.
+
+        Returns:
+            GridSortItem: The grid sort item.
+        """
+        return GridSortItem.construct(
+            _fields_set=set(self.__fields_set__), field=self.field, sort=self.sort
+        )
+
+
+class GridSortModelSnapshot(FrozenList[GridSortItemSnapshot]):
+    """An immutable, hashable grid sort model.
+
+    The snapshot is a frozen list of the sort items, in the order they are applied.
+
+    Attributes:
+        fingerprint (str): The SHA-256 hex digest of the sort model.
+    """
+
+    _fingerprint: str
+
+    def __init__(self, items: Iterable[GridSortItem] = ()) -> None:
+        """Initialize a new grid sort model snapshot.
+
+        Args:
+            items (Iterable[GridSortItem], optional): The sort items, in the order
+                they are applied. Defaults to ().
+        """
+        super().__init__(GridSortItemSnapshot.from_model(item) for item in items)
+        self._fingerprint = _fingerprint(self, {"items": list(self)})
+
+    @classmethod
+    def from_model(cls, model: GridSortModel) -> "GridSortModelSnapshot":
+        """Creates a snapshot of a grid sort model.
+
+        Args:
+            model (GridSortModel): The grid sort model.
+
+        Returns:
+            GridSortModelSnapshot: The snapshot of the grid sort model.
+        """
+        if isinstance(model, cls):
+            return model
+        return cls(items=model)
+
+    @property
+    def fingerprint(self) -> str:
+        """The SHA-256 hex digest of the snapshot's canonical JSON representation."""
+        return self._fingerprint
+
+    def to_model(self) -> GridSortModel:
+        """Creates a grid sort model from the snapshot.
+
+        Returns:
+            GridSortModel: The grid sort model.
+        """
+        return [item.to_model() for item in self]
+
+
+class GridPaginationModelSnapshot(_GridSnapshot, FrozenGridPaginationModel):
+    """An immutable, hashable grid pagination model.
+
+    Attributes:
+        page (int): The current page number.
+        page_size (int): The size of each page.
+        cursor (str | None): The keyset pagination cursor.
+        fingerprint (str): The SHA-256 hex digest of the pagination model.
+    """
+
+    @classmethod
+    def from_model(cls, model: GridPaginationModel) -> "GridPaginationModelSnapshot":
+        """Creates a snapshot of a grid pagination model.
+
+        Args:
+            model (GridPaginationModel): The grid pagination model.
+
+        Returns:
+            GridPaginationModelSnapshot: The snapshot of the grid pagination model.
+        """
+        if isinstance(model, cls):
+            return model
+        return cls._create(
+            fields_set=set(model.__fields_set__),
+            page=model.page,
+            page_size=model.page_size,
+            cursor=model.cursor,
+        )
+
+    def to_model(self) -> GridPaginationModel:
+        """Creates a grid pagination model from the snapshot.
+
+        Returns:
+            GridPaginationModel: The grid pagination model.
+        """
+        return GridPaginationModel.construct(
+            _fields_set=set(self.__fields_set__),
+            page=self.page,
+            page_size=self.page_size,
+            cursor=self.cursor,
+        )
@@ -3,6 +3,7 @@
 This provides native support for parsing the filter, pagination, and sort model natively
 from request.args.
 """
+from mui.v5.integrations.flask.cache import GridModelsCache
 from mui.v5.integrations.flask.filter import get_grid_filter_model_from_request
 from mui.v5.integrations.flask.pagination import get_grid_pagination_model_from_request
 from mui.v5.integrations.flask.request import get_grid_models_from_request
@@ -10,6 +11,7 @@ from mui.v5.integrations.flask.sort import get_grid_sort_model_from_request
 
 # isort: unique-list
 __all__ = [
+    "GridModelsCache",
     "get_grid_filter_model_from_request",
     "get_grid_models_from_request",
     "get_grid_pagination_model_from_request",
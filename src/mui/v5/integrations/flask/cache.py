@@ -0,0 +1,132 @@
+"""The cache module memoizes the grid models parsed from repeated requests.
+
+Dashboards commonly poll the same endpoint with byte-identical grid model arguments.
+The request grid models are therefore cached using the raw arguments they were parsed
+from, so a repeated request skips decoding and validating its models entirely.
+
+Cached models are shared between requests, so they are frozen: modifying them raises a
+TypeError. Use `.copy(update=...)` to derive a modified model instead.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import FrozenSet, Hashable, Optional, Tuple
+
+from flask import request
+
+from mui.v5.grid.frozen import FrozenRequestGridModels
+
+# the arguments read by the pagination model when no key is provided
+_PAGINATION_ARGUMENTS: FrozenSet[str] = frozenset(
+    ("cursor", "page", "pageSize", "page_size")
+)
+
+
+class GridModelsCache:
+    """An in-process, thread-safe, least recently used cache of request grid models.
+
+    Attributes:
+        maxsize (int): The maximum number of request grid models to store.
+        hits (int): The number of lookups which found cached request grid models.
+        misses (int): The number of lookups which did not find cached request grid
+            models.
+    """
+
+    hits: int
+    maxsize: int
+    misses: int
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize a new grid models cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of request grid models to
+                store. Defaults to 256.
+
+        Raises:
+            ValueError: Raised when the maximum size isn't positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._entries: "OrderedDict[Hashable, FrozenRequestGridModels]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached request grid models."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[FrozenRequestGridModels]:
+        """Retrieves cached request grid models.
+
+        Args:
+            key (Hashable): The raw arguments the models were parsed from.
+
+        Returns:
+            Optional[FrozenRequestGridModels]: The cached request grid models, or None
+                if they aren't cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: FrozenRequestGridModels) -> None:
+        """Caches request grid models, evicting the least recently used models if
+        necessary.
+
+        Args:
+            key (Hashable): The raw arguments the models were parsed from.
+            value (FrozenRequestGridModels): The request grid models.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached request grid model and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def get_raw_grid_model_arguments(
+    sort_model_key: str,
+    filter_model_key: str,
+    pagination_model_key: Optional[str],
+) -> Tuple[Tuple[str, str], ...]:
+    """Retrieves the raw request.args the grid models are parsed from.
+
+    Arguments are matched by their root key, so the nested arguments of the
+    "querystring" format are included, such as `filter_model[items][0][value]`.
+
+    Args:
+        sort_model_key (str): The key of the grid sort model.
+        filter_model_key (str): The key of the grid filter model.
+        pagination_model_key (Optional[str]): The key of the grid pagination model, or
+            None if the pagination arguments are in the root of the query string.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: The raw arguments, in the order they were received.
+    """
+    roots = {
+        sort_model_key.partition("[")[0],
+        filter_model_key.partition("[")[0],
+    }
+    if pagination_model_key is None:
+        roots.update(_PAGINATION_ARGUMENTS)
+    else:
+        roots.add(pagination_model_key.partition("[")[0])
+    return tuple(
+        (key, value)
+        for key, value in request.args.items(multi=True)
+        if key.partition("[")[0] in roots
+    )
@@ -3,23 +3,36 @@
 Supports parsing a GridFilterModel from Flask's request.args
 """
 from flask import request
-from typing_extensions import Literal
 
+from mui.v5.grid.compact import decode_grid_filter_model
 from mui.v5.grid.filter import GridFilterModel
+from mui.v5.grid.parse import (
+    DEFAULT_JSON_DECODER,
+    GridModelFormat,
+    JsonDecoder,
+    parse_grid_filter_model_raw,
+)
+from mui.v5.grid.querystring import parse_grid_filter_model_from_query_string
 
 
 def get_grid_filter_model_from_request(
-    key: str = "filter_model", model_format: Literal["json"] = "json"
+    key: str = "filter_model",
+    model_format: GridModelFormat = "json",
+    decoder: JsonDecoder = DEFAULT_JSON_DECODER,
 ) -> GridFilterModel:
     """Retrieves a GridFilterModel from request.args.
 
-    Currently, this only supports a JSON encoded model, but in the future the plan is
-    to write a custom querystring parser to support nested arguments as JavaScript
-    libraries like Axios create out of the box.
+    This supports a JSON encoded model, the compact format created by
+    `encode_grid_filter_model`, and nested arguments as JavaScript libraries like Axios
+    create out of the box, such as `filter_model[items][0][columnField]=name`.
 
     Args:
         key (str): The key in the request args where the filter model should be parsed
             from. Defaults to "filter_model".
+        model_format (GridModelFormat, optional): The format of the model, either
+            "json", "compact", or "querystring". Defaults to "json".
+        decoder (JsonDecoder, optional): The function decoding the JSON encoded model.
+            Defaults to DEFAULT_JSON_DECODER, which uses orjson if it's installed.
 
     Raises:
         ValidationError: Raised when an invalid type was received.
@@ -33,8 +46,24 @@ def get_grid_filter_model_from_request(
     # raise an exception
     # https://github.com/pallets/werkzeug/blob/main/src/werkzeug/datastructures.py#L919
     if model_format == "json":
-        # https://pydantic-docs.helpmanual.io/usage/models/#helper-functions
         return request.args.get(
-            key=key, default=GridFilterModel(), type=GridFilterModel.parse_raw
+            key=key,
+            default=GridFilterModel(),
+            type=lambda raw: parse_grid_filter_model_raw(raw=raw, decoder=decoder),
         )
+    if model_format == "compact":
+        return request.args.get(
+            key=key,
+            default=GridFilterModel(),
+            type=lambda raw: decode_grid_filter_model(compact=raw, decoder=decoder),
+        )
+    if model_format == "querystring":
+        try:
+            model = parse_grid_filter_model_from_query_string(
+                args=request.args.items(multi=True), key=key
+            )
+        except ValueError:
+            # matches the behavior of get for the other formats
+            model = None
+        return model if model is not None else GridFilterModel()
     raise ValueError(f"Unsupported model format: {model_format}")
@@ -7,10 +7,20 @@ from typing import Optional
 from flask import request
 
 from mui.v5.grid.pagination import GridPaginationModel
+from mui.v5.grid.parse import (
+    DEFAULT_JSON_DECODER,
+    GridModelFormat,
+    JsonDecoder,
+    parse_grid_pagination_model,
+    parse_grid_pagination_model_raw,
+)
+from mui.v5.grid.querystring import parse_grid_pagination_model_from_query_string
 
 
 def get_grid_pagination_model_from_request(
     key: Optional[str] = None,
+    decoder: JsonDecoder = DEFAULT_JSON_DECODER,
+    model_format: GridModelFormat = "json",
 ) -> GridPaginationModel:
     """Retrieves a GridPaginationModel from request.args.
 
@@ -20,6 +30,11 @@ def get_grid_pagination_model_from_request(
             If set, a URL-encoded JSON object will attempt to be retrieved from the
             key, otherwise the arguments will be located in the root of the query
             string. Defaults to None.
+        decoder (JsonDecoder, optional): The function decoding the JSON encoded model,
+            if a key is provided. Defaults to DEFAULT_JSON_DECODER, which uses orjson
+            if it's installed.
+        model_format (GridModelFormat, optional): The format of the model, if a key is
+            provided, either "json" or "querystring". Defaults to "json".
 
     Example Query Strings:
         Camel case:
@@ -27,6 +42,8 @@ def get_grid_pagination_model_from_request(
                 /api/v1/endpoint?page=0&pageSize=15
             Key-based structure:
                 /api/v1/endpoint?pageModel=%7B%22page%22%3A%200%2C%20%22pageSize%22%3A%2015%7D
+            Key-based querystring structure:
+                /api/v1/endpoint?pageModel[page]=0&pageModel[pageSize]=15
         Snake case:
             Default structure:
                 /api/v1/endpoint?page=0&page_size=15
@@ -35,10 +52,18 @@ def get_grid_pagination_model_from_request(
 
     Raises:
         ValidationError: Raised when an invalid type was received.
+        ValueError: Raised when an unsupported model format was received.
 
     Returns:
         GridSortModel: The parsed sort model.
     """
+    if model_format not in ("json", "querystring"):
+        raise ValueError(f"Unsupported model format: {model_format}")
+    if isinstance(key, str) and model_format == "querystring":
+        model = parse_grid_pagination_model_from_query_string(
+            args=request.args.items(multi=True), key=key
+        )
+        return model if model is not None else GridPaginationModel()
     # get swallows `KeyError` and `ValueError`, which is why we don't allow this to
     # raise an exception
     # https://github.com/pallets/werkzeug/blob/main/src/werkzeug/datastructures.py#L919
@@ -48,7 +73,7 @@ def get_grid_pagination_model_from_request(
         else request.args
     )
     if isinstance(obj, str):
-        return GridPaginationModel.parse_raw(obj)
+        return parse_grid_pagination_model_raw(raw=obj, decoder=decoder)
     if isinstance(obj, GridPaginationModel):
         return obj
-    return GridPaginationModel.parse_obj(obj)
+    return parse_grid_pagination_model(obj)
@@ -3,9 +3,13 @@
 Supports parsing the filter, pagination, and sort models from Flask's request.args."""
 from typing import Optional
 
-from typing_extensions import Literal
-
+from mui.v5.grid.frozen import freeze_request_grid_models
+from mui.v5.grid.parse import DEFAULT_JSON_DECODER, GridModelFormat, JsonDecoder
 from mui.v5.grid.request import RequestGridModels
+from mui.v5.integrations.flask.cache import (
+    GridModelsCache,
+    get_raw_grid_model_arguments,
+)
 from mui.v5.integrations.flask.filter.model import get_grid_filter_model_from_request
 from mui.v5.integrations.flask.pagination.model import (
     get_grid_pagination_model_from_request,
@@ -17,19 +21,23 @@ def get_grid_models_from_request(
     sort_model_key: str = "sort_model[]",
     filter_model_key: str = "filter_model",
     pagination_model_key: Optional[str] = None,
-    sort_model_format: Literal["json"] = "json",
-    filter_model_format: Literal["json"] = "json",
+    sort_model_format: GridModelFormat = "json",
+    filter_model_format: GridModelFormat = "json",
+    pagination_model_format: GridModelFormat = "json",
+    decoder: JsonDecoder = DEFAULT_JSON_DECODER,
+    cache: Optional[GridModelsCache] = None,
 ) -> RequestGridModels:
     """Parses the filter, sort, and pagination models from the request.
 
     Args:
         sort_model_key (str, optional): The key to retrieve the grid sort model from in
             the request.args. The sort model is URL-encoded JSON list of grid sort
-            items. Defaults to "sort_model[]".
+            items, a compact sort model, or nested arguments. Defaults to
+            "sort_model[]".
         filter_model_key (str, optional): The key to retrieve the grid filter model
             from in the request.args. The filter model is URL-encoded JSON object with
-            the shape of a grid filter model. Defaults to "filter_model".
-            Example query string:
+            the shape of a grid filter model, a compact filter model, or nested
+            arguments. Defaults to "filter_model".
         pagination_model_key (str | None, optional): The key to retrieve the grid
             pagination model from in the request.args. The pagination model may either
             be provided in the query string directly or as a URL-encoded JSON object.
@@ -39,6 +47,20 @@ def get_grid_models_from_request(
                     ?page=0&pageSize=12
                 Example "pagination_model" query string:
                     ?pagination_model=%7B%22page%22%3A%200%2C%20%22pageSize%22%3A%2015%7D
+        sort_model_format (GridModelFormat, optional): The format of the sort model,
+            either "json", "compact", or "querystring". Defaults to "json".
+        filter_model_format (GridModelFormat, optional): The format of the filter
+            model, either "json", "compact", or "querystring". Defaults to "json".
+        pagination_model_format (GridModelFormat, optional): The format of the
+            pagination model, if a key is provided, either "json" or "querystring".
+            Defaults to "json".
+        decoder (JsonDecoder, optional): The function decoding the JSON encoded
+            models. Each model is decoded once. Defaults to DEFAULT_JSON_DECODER, which
+            uses orjson if it's installed.
+        cache (GridModelsCache | None, optional): The cache of previously parsed
+            models, keyed on the raw arguments they were parsed from. If provided,
+            repeated arguments return the cached models without being decoded or
+            validated, and the returned models are frozen. Defaults to None.
 
     Raises:
         ValidationError: Raised when an invalid or partial data structure is received
@@ -47,14 +69,83 @@ def get_grid_models_from_request(
     Returns:
         RequestGridModels: The located grid models.
     """
-    return RequestGridModels(
+    if cache is None:
+        return _get_grid_models_from_request(
+            sort_model_key=sort_model_key,
+            filter_model_key=filter_model_key,
+            pagination_model_key=pagination_model_key,
+            sort_model_format=sort_model_format,
+            filter_model_format=filter_model_format,
+            pagination_model_format=pagination_model_format,
+            decoder=decoder,
+        )
+    key = (
+        sort_model_key,
+        filter_model_key,
+        pagination_model_key,
+        sort_model_format,
+        filter_model_format,
+        pagination_model_format,
+        decoder,
+        get_raw_grid_model_arguments(
+            sort_model_key=sort_model_key,
+            filter_model_key=filter_model_key,
+            pagination_model_key=pagination_model_key,
+        ),
+    )
+    models = cache.get(key)
+    if models is None:
+        models = freeze_request_grid_models(
+            _get_grid_models_from_request(
+                sort_model_key=sort_model_key,
+                filter_model_key=filter_model_key,
+                pagination_model_key=pagination_model_key,
+                sort_model_format=sort_model_format,
+                filter_model_format=filter_model_format,
+                pagination_model_format=pagination_model_format,
+                decoder=decoder,
+            )
+        )
+        cache.set(key, models)
+    return models
+
+
+def _get_grid_models_from_request(
+    sort_model_key: str,
+    filter_model_key: str,
+    pagination_model_key: Optional[str],
+    sort_model_format: GridModelFormat,
+    filter_model_format: GridModelFormat,
+    pagination_model_format: GridModelFormat,
+    decoder: JsonDecoder,
+) -> RequestGridModels:
+    """Parses the grid models from the request's query string arguments.
+
+    Args:
+        sort_model_key (str): The key of the sort model.
+        filter_model_key (str): The key of the filter model.
+        pagination_model_key (Optional[str]): The key of the pagination model, or
+            None to read its arguments from the root of the query string.
+        sort_model_format (GridModelFormat): The format of the sort model.
+        filter_model_format (GridModelFormat): The format of the filter model.
+        pagination_model_format (GridModelFormat): The format of the pagination
+            model.
+        decoder (JsonDecoder): The decoder of the models sent as JSON.
+
+    Returns:
+        RequestGridModels: The parsed grid models.
+    """
+    # the models are already validated, so they aren't validated a second time
+    return RequestGridModels.construct(
         filter_model=get_grid_filter_model_from_request(
-            key=filter_model_key, model_format=filter_model_format
+            key=filter_model_key, model_format=filter_model_format, decoder=decoder
         ),
         sort_model=get_grid_sort_model_from_request(
-            key=sort_model_key, model_format=sort_model_format
+            key=sort_model_key, model_format=sort_model_format, decoder=decoder
         ),
         pagination_model=get_grid_pagination_model_from_request(
-            key=pagination_model_key
+            key=pagination_model_key,
+            decoder=decoder,
+            model_format=pagination_model_format,
         ),
     )
@@ -3,24 +3,37 @@
 Supports parsing a GridSortModel from Flask's request.args
 """
 from flask import request
-from pydantic import parse_raw_as
-from typing_extensions import Literal
 
+from mui.v5.grid.compact import decode_grid_sort_model
+from mui.v5.grid.parse import (
+    DEFAULT_JSON_DECODER,
+    GridModelFormat,
+    JsonDecoder,
+    parse_grid_sort_model_raw,
+)
+from mui.v5.grid.querystring import parse_grid_sort_model_from_query_string
 from mui.v5.grid.sort import GridSortModel
 
 
 def get_grid_sort_model_from_request(
-    key: str = "sorl_model[]", model_format: Literal["json"] = "json"
+    key: str = "sorl_model[]",
+    model_format: GridModelFormat = "json",
+    decoder: JsonDecoder = DEFAULT_JSON_DECODER,
 ) -> GridSortModel:
     """Retrieves a GridSortModel from request.args.
 
-    Currently, this only supports a JSON encoded model, but in the future the plan is
-    to write a custom querystring parser to support nested arguments as JavaScript
-    libraries like Axios create out of the box.
+    This supports a JSON encoded model, the compact format created by
+    `encode_grid_sort_model`, and nested arguments as JavaScript libraries like Axios
+    create out of the box, such as `sort_model[0][field]=name`.
 
     Args:
         key (str): The key in the request args where the sort model should be parsed
             from. Defaults to "sort_model[]".
+        model_format (GridModelFormat, optional): The format of the model, either
+            "json", "compact", or "querystring". When using "querystring", a trailing
+            "[]" is removed from the key. Defaults to "json".
+        decoder (JsonDecoder, optional): The function decoding the JSON encoded model.
+            Defaults to DEFAULT_JSON_DECODER, which uses orjson if it's installed.
 
     Raises:
         ValidationError: Raised when an invalid type was received.
@@ -33,5 +46,18 @@ def get_grid_sort_model_from_request(
     # https://github.com/pallets/werkzeug/blob/main/src/werkzeug/datastructures.py#L395
     if model_format == "json":
         value = request.args.get(key=key)
-        return parse_raw_as(GridSortModel, value) if value is not None else []
+        if value is None:
+            return []
+        return parse_grid_sort_model_raw(raw=value, decoder=decoder)
+    if model_format == "compact":
+        value = request.args.get(key=key)
+        if value is None:
+            return []
+        return decode_grid_sort_model(compact=value, decoder=decoder)
+    if model_format == "querystring":
+        model = parse_grid_sort_model_from_query_string(
+            args=request.args.items(multi=True),
+            key=key[:-2] if key.endswith("[]") else key,
+        )
+        return model if model is not None else []
     raise ValueError(f"Invalid model format: {model_format}")
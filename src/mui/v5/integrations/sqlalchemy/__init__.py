@@ -2,29 +2,96 @@ from mui.v5.integrations.sqlalchemy.apply_models import (
     apply_data_grid_models_to_query,
     apply_request_grid_models_to_query,
 )
+from mui.v5.integrations.sqlalchemy.cache import (
+    CountCache,
+    MemoryCountCache,
+    StatementCache,
+)
 from mui.v5.integrations.sqlalchemy.filter import (
+    DAY_GRANULARITY_OPERATORS,
+    CaseFolding,
+    ColumnCaseFolding,
+    DateGranularity,
+    Fts5QuickFilter,
+    IsAnyOfStrategy,
+    LikeQuickFilter,
+    OperatorApplicator,
+    QuickFilter,
+    TsvectorQuickFilter,
     apply_filter_items_to_query_from_items,
+    apply_filter_items_to_select_from_items,
     apply_filter_to_query_from_model,
+    apply_filter_to_select_from_model,
+    apply_quick_filter_to_query_from_model,
+    apply_quick_filter_to_select_from_model,
+    register_operator,
+    set_is_any_of_strategy,
+    simplify_filter_model,
 )
 from mui.v5.integrations.sqlalchemy.pagination import (
+    apply_deferred_join_to_query_from_model,
+    apply_deferred_join_to_select_from_model,
+    apply_keyset_to_query_from_model,
+    apply_keyset_to_select_from_model,
     apply_limit_offset_to_query_from_model,
+    apply_limit_offset_to_select_from_model,
 )
-from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.resolver import MapperResolver, Resolver
 from mui.v5.integrations.sqlalchemy.sort import (
     apply_sort_to_query_from_model,
+    apply_sort_to_select_from_model,
     get_sort_expression_from_item,
 )
-from mui.v5.integrations.sqlalchemy.structures import DataGridQuery
+from mui.v5.integrations.sqlalchemy.structures import (
+    AsyncDataGridQuery,
+    DataGridQuery,
+    DataGridSelect,
+    PaginationStrategy,
+    TotalKind,
+    TotalStrategy,
+)
 
 # isort: unique-list
 __all__ = [
+    "AsyncDataGridQuery",
+    "CaseFolding",
+    "ColumnCaseFolding",
+    "CountCache",
+    "DAY_GRANULARITY_OPERATORS",
     "DataGridQuery",
+    "DataGridSelect",
+    "DateGranularity",
+    "Fts5QuickFilter",
+    "IsAnyOfStrategy",
+    "LikeQuickFilter",
+    "MapperResolver",
+    "MemoryCountCache",
+    "OperatorApplicator",
+    "PaginationStrategy",
+    "QuickFilter",
     "Resolver",
+    "StatementCache",
+    "TotalKind",
+    "TotalStrategy",
+    "TsvectorQuickFilter",
     "apply_data_grid_models_to_query",
+    "apply_deferred_join_to_query_from_model",
+    "apply_deferred_join_to_select_from_model",
     "apply_filter_items_to_query_from_items",
+    "apply_filter_items_to_select_from_items",
     "apply_filter_to_query_from_model",
+    "apply_filter_to_select_from_model",
+    "apply_keyset_to_query_from_model",
+    "apply_keyset_to_select_from_model",
     "apply_limit_offset_to_query_from_model",
+    "apply_limit_offset_to_select_from_model",
+    "apply_quick_filter_to_query_from_model",
+    "apply_quick_filter_to_select_from_model",
     "apply_request_grid_models_to_query",
     "apply_sort_to_query_from_model",
+    "apply_sort_to_select_from_model",
     "get_sort_expression_from_item",
+    "register_operator",
+    "set_is_any_of_strategy",
+    "simplify_filter_model",
 ]
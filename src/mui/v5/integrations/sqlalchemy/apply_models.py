@@ -1,7 +1,7 @@
 """The apply_models module is used to apply the X-Data-Grid state models, such as the
 GridFilterModel, GridSortModel, and GridPaginationModel to a SQLAlchemy ORM query.
 """
-from typing import Optional, TypeVar
+from typing import Any, Mapping, Optional, TypeVar
 
 from sqlalchemy.orm import Query
 
@@ -11,8 +11,20 @@ from mui.v5.grid import (
     GridSortModel,
     RequestGridModels,
 )
+from mui.v5.integrations.sqlalchemy.cache import CountCache, StatementCache
+from mui.v5.integrations.sqlalchemy.filter import (
+    ColumnCaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    OperatorApplicator,
+    QuickFilter,
+)
 from mui.v5.integrations.sqlalchemy.resolver import Resolver
-from mui.v5.integrations.sqlalchemy.structures import DataGridQuery
+from mui.v5.integrations.sqlalchemy.structures import (
+    DataGridQuery,
+    PaginationStrategy,
+    TotalStrategy,
+)
 
 T = TypeVar("T")
 
@@ -21,6 +33,21 @@ def apply_request_grid_models_to_query(
     query: "Query[T]",
     request_model: RequestGridModels,
     column_resolver: Resolver,
+    pagination_strategy: PaginationStrategy = "offset",
+    tie_breaker: Optional[Any] = None,
+    window_total: bool = False,
+    count_cache: Optional[CountCache] = None,
+    total_strategy: TotalStrategy = "exact",
+    total_cap: int = 10000,
+    lookahead: bool = False,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+    statement_cache: Optional[StatementCache] = None,
+    is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+    temporary_table_threshold: Optional[int] = None,
+    simplify_filter: bool = False,
+    date_granularity: DateGranularity = "exact",
+    case_folding: ColumnCaseFolding = "sensitive",
+    quick_filter: Optional[QuickFilter] = None,
 ) -> "DataGridQuery[T]":
     """Applies a RequestGridModels object to a query.
 
@@ -35,6 +62,50 @@ def apply_request_grid_models_to_query(
         column_resolver (Resolver): The resolver responsible for taking an X-Data-Grid
             field name (from the UI configuration) and resolving it to the appropriate
             SQLAlchemy model column.
+        pagination_strategy (PaginationStrategy, optional): Whether to paginate using
+            "offset" (LIMIT / OFFSET), "keyset" (seek), or "deferred_join" (LIMIT /
+            OFFSET over the keys only) pagination. Defaults to "offset".
+        tie_breaker (Optional[Any], optional): The column which uniquely identifies a
+            row, used by keyset and deferred join pagination. Defaults to the primary
+            key of the query's first entity.
+        window_total (bool, optional): True to retrieve the filtered total in the
+            same statement as the page, using a `COUNT(*) OVER ()` window column.
+            Defaults to False.
+        count_cache (Optional[CountCache], optional): The cache used to store the
+            filtered total between requests. Defaults to None.
+        total_strategy (TotalStrategy, optional): Whether the total is counted
+            "exact"ly, "capped" at `total_cap + 1` rows, or "estimated" by the query
+            planner. Defaults to "exact".
+        total_cap (int, optional): The maximum number of rows counted by the "capped"
+            total strategy. Defaults to 10000.
+        lookahead (bool, optional): True to retrieve one additional row to detect
+            whether another page exists without counting the rows.
+            Defaults to False.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The filter
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+        statement_cache (Optional[StatementCache], optional): The cache used to reuse
+            the filter and sort clauses of requests sharing the same shape.
+            Defaults to None.
+        is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values of
+            isAnyOf filters are bound. Defaults to the strategy selected for the
+            session's dialect, or "expanding".
+        temporary_table_threshold (Optional[int], optional): The number of isAnyOf
+            values above which the values are inserted into a temporary table and
+            filtered using a semi-join. None to disable. Defaults to None.
+        simplify_filter (bool, optional): True to merge and remove the redundant
+            items of the filter model before applying it. A filter which provably
+            matches no rows isn't executed. Defaults to False.
+        date_granularity (DateGranularity, optional): "day" to compare the columns
+            of the date operators to the half-open range of the filtered day, rather
+            than the exact date and time. Defaults to "exact".
+        case_folding (ColumnCaseFolding, optional): The case folding strategy of the
+            contains, startsWith, and endsWith operators, or the strategies by field,
+            such as "lower" to compare strings case-insensitively using a functional
+            index. Defaults to "sensitive".
+        quick_filter (Optional[QuickFilter], optional): The backend which applies the
+            quick filter values, such as `LikeQuickFilter(fields=["name"])`. None to
+            ignore the quick filter values. Defaults to None.
 
     Returns:
         Query[T]: The query, after it's paginated, ordered, and paginated. The caller
@@ -47,6 +118,21 @@ def apply_request_grid_models_to_query(
         filter_model=request_model.filter_model,
         sort_model=request_model.sort_model,
         pagination_model=request_model.pagination_model,
+        pagination_strategy=pagination_strategy,
+        tie_breaker=tie_breaker,
+        window_total=window_total,
+        count_cache=count_cache,
+        total_strategy=total_strategy,
+        total_cap=total_cap,
+        lookahead=lookahead,
+        operators=operators,
+        statement_cache=statement_cache,
+        is_any_of_strategy=is_any_of_strategy,
+        temporary_table_threshold=temporary_table_threshold,
+        simplify_filter=simplify_filter,
+        date_granularity=date_granularity,
+        case_folding=case_folding,
+        quick_filter=quick_filter,
     )
 
 
@@ -56,6 +142,21 @@ def apply_data_grid_models_to_query(
     filter_model: Optional[GridFilterModel] = None,
     sort_model: Optional[GridSortModel] = None,
     pagination_model: Optional[GridPaginationModel] = None,
+    pagination_strategy: PaginationStrategy = "offset",
+    tie_breaker: Optional[Any] = None,
+    window_total: bool = False,
+    count_cache: Optional[CountCache] = None,
+    total_strategy: TotalStrategy = "exact",
+    total_cap: int = 10000,
+    lookahead: bool = False,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+    statement_cache: Optional[StatementCache] = None,
+    is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+    temporary_table_threshold: Optional[int] = None,
+    simplify_filter: bool = False,
+    date_granularity: DateGranularity = "exact",
+    case_folding: ColumnCaseFolding = "sensitive",
+    quick_filter: Optional[QuickFilter] = None,
 ) -> "DataGridQuery[T]":
     """Applies the provided X-Data-Grid state models to the SQLAlchemy ORM Query.
 
@@ -75,6 +176,50 @@ def apply_data_grid_models_to_query(
         pagination_model (Optional[GridPaginationModel], optional): The pagination
             model to apply to the query. If None, this stage will be skipped.
             Defaults to None.
+        pagination_strategy (PaginationStrategy, optional): Whether to paginate using
+            "offset" (LIMIT / OFFSET), "keyset" (seek), or "deferred_join" (LIMIT /
+            OFFSET over the keys only) pagination. Defaults to "offset".
+        tie_breaker (Optional[Any], optional): The column which uniquely identifies a
+            row, used by keyset and deferred join pagination. Defaults to the primary
+            key of the query's first entity.
+        window_total (bool, optional): True to retrieve the filtered total in the
+            same statement as the page, using a `COUNT(*) OVER ()` window column.
+            Defaults to False.
+        count_cache (Optional[CountCache], optional): The cache used to store the
+            filtered total between requests. Defaults to None.
+        total_strategy (TotalStrategy, optional): Whether the total is counted
+            "exact"ly, "capped" at `total_cap + 1` rows, or "estimated" by the query
+            planner. Defaults to "exact".
+        total_cap (int, optional): The maximum number of rows counted by the "capped"
+            total strategy. Defaults to 10000.
+        lookahead (bool, optional): True to retrieve one additional row to detect
+            whether another page exists without counting the rows.
+            Defaults to False.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The filter
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+        statement_cache (Optional[StatementCache], optional): The cache used to reuse
+            the filter and sort clauses of requests sharing the same shape.
+            Defaults to None.
+        is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values of
+            isAnyOf filters are bound. Defaults to the strategy selected for the
+            session's dialect, or "expanding".
+        temporary_table_threshold (Optional[int], optional): The number of isAnyOf
+            values above which the values are inserted into a temporary table and
+            filtered using a semi-join. None to disable. Defaults to None.
+        simplify_filter (bool, optional): True to merge and remove the redundant
+            items of the filter model before applying it. A filter which provably
+            matches no rows isn't executed. Defaults to False.
+        date_granularity (DateGranularity, optional): "day" to compare the columns
+            of the date operators to the half-open range of the filtered day, rather
+            than the exact date and time. Defaults to "exact".
+        case_folding (ColumnCaseFolding, optional): The case folding strategy of the
+            contains, startsWith, and endsWith operators, or the strategies by field,
+            such as "lower" to compare strings case-insensitively using a functional
+            index. Defaults to "sensitive".
+        quick_filter (Optional[QuickFilter], optional): The backend which applies the
+            quick filter values, such as `LikeQuickFilter(fields=["name"])`. None to
+            ignore the quick filter values. Defaults to None.
 
     Returns:
         Query[T]: The query, with the filter, sort, and/or pagination models applied.
@@ -85,4 +230,19 @@ def apply_data_grid_models_to_query(
         filter_model=filter_model,
         sort_model=sort_model,
         pagination_model=pagination_model,
+        pagination_strategy=pagination_strategy,
+        tie_breaker=tie_breaker,
+        window_total=window_total,
+        count_cache=count_cache,
+        total_strategy=total_strategy,
+        total_cap=total_cap,
+        lookahead=lookahead,
+        operators=operators,
+        statement_cache=statement_cache,
+        is_any_of_strategy=is_any_of_strategy,
+        temporary_table_threshold=temporary_table_threshold,
+        simplify_filter=simplify_filter,
+        date_granularity=date_granularity,
+        case_folding=case_folding,
+        quick_filter=quick_filter,
     )
@@ -0,0 +1,33 @@
+"""The cache module contains caches used to avoid repeating work across requests.
+
+Caches are opt-in and are provided to the DataGridQuery when constructing it.
+"""
+from mui.v5.integrations.sqlalchemy.cache.count import CountCache, MemoryCountCache
+from mui.v5.integrations.sqlalchemy.cache.key import (
+    get_count_cache_key,
+    get_query_table_names,
+)
+from mui.v5.integrations.sqlalchemy.cache.statement import (
+    BINDABLE_OPERATORS,
+    StatementCache,
+    get_cached_filter_clause,
+    get_cached_sort_expressions,
+    get_filter_parameters,
+    get_filter_shape,
+    get_sort_shape,
+)
+
+# isort: unique-list
+__all__ = [
+    "BINDABLE_OPERATORS",
+    "CountCache",
+    "MemoryCountCache",
+    "StatementCache",
+    "get_cached_filter_clause",
+    "get_cached_sort_expressions",
+    "get_count_cache_key",
+    "get_filter_parameters",
+    "get_filter_shape",
+    "get_query_table_names",
+    "get_sort_shape",
+]
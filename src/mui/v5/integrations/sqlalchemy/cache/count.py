@@ -0,0 +1,172 @@
+"""The count module contains the total row count cache backends.
+
+Clients commonly paginate through the same filter many times. Caching the filtered
+total means that only the first page has to pay for counting the rows.
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import AbstractSet, Callable, Dict, Optional, Set, Tuple
+
+
+class CountCache(ABC):
+    """The interface implemented by all total row count cache backends.
+
+    Custom backends, such as one backed by Redis or Memcached, may be created by
+    subclassing this and implementing each method.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[int]:
+        """Retrieves a cached total.
+
+        Args:
+            key (str): The cache key, as created by `get_count_cache_key`.
+
+        Returns:
+            Optional[int]: The cached total, or None if it isn't cached or has expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: int, tables: AbstractSet[str]) -> None:
+        """Caches a total.
+
+        Args:
+            key (str): The cache key, as created by `get_count_cache_key`.
+            value (int): The total row count.
+            tables (AbstractSet[str]): The names of the tables the count depends on.
+                These are used to invalidate the total when a table changes.
+        """
+
+    @abstractmethod
+    def invalidate(self, table_name: str) -> None:
+        """Removes every cached total which depends on the table.
+
+        Args:
+            table_name (str): The name of the table that was modified.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every cached total."""
+
+
+class MemoryCountCache(CountCache):
+    """An in-process, thread-safe, least recently used total row count cache.
+
+    Entries expire after the configured time to live, and the least recently used
+    entry is evicted when the cache is full.
+
+    Attributes:
+        maxsize (int): The maximum number of totals to store.
+        ttl (float): The number of seconds a total is considered valid for.
+    """
+
+    maxsize: int
+    ttl: float
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize a new in-memory count cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of totals to store.
+                Defaults to 1024.
+            ttl (float, optional): The number of seconds a total is considered valid
+                for. Defaults to 60.0.
+            timer (Callable[[], float], optional): The clock used to expire entries.
+                Defaults to time.monotonic.
+
+        Raises:
+            ValueError: Raised when the maximum size or time to live isn't positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[int, float, AbstractSet[str]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_table: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of cached totals, including expired totals."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[int]:
+        """Retrieves a cached total.
+
+        Args:
+            key (str): The cache key, as created by `get_count_cache_key`.
+
+        Returns:
+            Optional[int]: The cached total, or None if it isn't cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= self._timer():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: int, tables: AbstractSet[str]) -> None:
+        """Caches a total, evicting the least recently used total if necessary.
+
+        Args:
+            key (str): The cache key, as created by `get_count_cache_key`.
+            value (int): The total row count.
+            tables (AbstractSet[str]): The names of the tables the count depends on.
+        """
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, self._timer() + self.ttl, frozenset(tables))
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, table_name: str) -> None:
+        """Removes every cached total which depends on the table.
+
+        Args:
+            table_name (str): The name of the table that was modified.
+        """
+        with self._lock:
+            for key in self._keys_by_table.pop(table_name, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Removes every cached total."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def _remove(self, key: str) -> None:
+        """Removes a single entry. The caller must hold the lock.
+
+        Args:
+            key (str): The cache key to remove.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for table in entry[2]:
+            keys = self._keys_by_table.get(table)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_table[table]
@@ -0,0 +1,75 @@
+"""The key module builds the keys used by the caches."""
+from hashlib import sha256
+from typing import Any, FrozenSet, Optional, Tuple
+
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.util import find_tables
+
+from mui.v5.grid import GridFilterModel, fingerprint
+
+
+def get_query_table_names(query: "Query[Any]") -> FrozenSet[str]:
+    """Retrieves the names of the tables a query selects from.
+
+    Args:
+        query (Query[Any]): The query to inspect.
+
+    Returns:
+        FrozenSet[str]: The table names, including joined and sub-queried tables.
+    """
+    return frozenset(table.name for table in find_tables(query.statement))
+
+
+def _get_statement_parts(statement: Any) -> Tuple[str, str]:
+    """Retrieves the compiled SQL and the bound parameters of a statement or clause.
+
+    Args:
+        statement (Any): The statement or clause.
+
+    Returns:
+        Tuple[str, str]: The compiled SQL, and the representation of the sorted bound
+            parameters.
+    """
+    compiled = statement.compile()
+    parameters = sorted((key, repr(value)) for key, value in compiled.params.items())
+    return str(compiled), repr(parameters)
+
+
+def get_count_cache_key(
+    query: "Query[Any]",
+    filter_model: Optional[GridFilterModel],
+    quick_filter_clause: Optional[Any] = None,
+) -> str:
+    """Builds the count cache key for a base query and filter model.
+
+    The key is made up of the base query's compiled SQL, its bound parameters, and the
+    fingerprint of the filter model. This ensures that two requests only share a total
+    if they filter the same query in the same way, including queries which are scoped
+    with bound parameters, such as a tenant identifier. The fingerprint is created from
+    the normalized filter model, so semantically equal filters share a total, such as
+    reordered filter items or synonymous operators like "eq" and "=".
+
+    The quick filter values are matched by the quick filter backend, so the clause it
+    built is part of the key, as the same values match different rows when they are
+    searched in other fields, or using another backend.
+
+    Args:
+        query (Query[Any]): The base query, before the filter model was applied.
+        filter_model (Optional[GridFilterModel]): The filter model being applied.
+        quick_filter_clause (Optional[Any], optional): The clause built by the quick
+            filter backend from the filter model's quick filter values. None if the
+            quick filter values aren't applied. Defaults to None.
+
+    Returns:
+        str: The hex digest identifying the filtered total.
+    """
+    parts = list(_get_statement_parts(query.statement))
+    parts.append(fingerprint(filter_model) if filter_model is not None else "")
+    if quick_filter_clause is not None:
+        parts.extend(_get_statement_parts(quick_filter_clause))
+    digest = sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        # separate the parts so that they can't run together ambiguously
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,299 @@
+"""The statement module caches the filter and sort clauses of repeated request shapes.
+
+Dashboards commonly send the same few combinations of fields, operators, and sort
+directions, with only the filter values changing between requests. The shape of a
+request is everything except those values, so a clause built for one request can be
+reused by every request sharing its shape, with the values bound as parameters:
+
+    WHERE test_model.name LIKE '%' || :grid_filter_0 || '%' AND test_model.id > ...
+
+This avoids rebuilding the expression trees on each request, and keeps the statements
+identical so that SQLAlchemy's compiled cache, and the database's prepared statement
+cache, are hit as well.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Hashable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import bindparam
+
+from mui.v5.grid import GridFilterItem, GridFilterModel, GridSortModel
+from mui.v5.integrations.sqlalchemy.filter import (
+    OperatorApplicator,
+    get_filter_clause_from_items,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    SUPPORTED_BASIC_OPERATORS,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.sort import get_sort_expression_from_item
+
+# the operators whose applicators accept a bound parameter in place of the value
+BINDABLE_OPERATORS: FrozenSet[str] = frozenset(
+    SUPPORTED_BASIC_OPERATORS.union({"contains", "startsWith", "endsWith", "isAnyOf"})
+)
+_PARAMETER_PREFIX = "grid_filter_"
+
+
+class StatementCache:
+    """An in-process, thread-safe, least recently used cache of query clauses.
+
+    A statement cache must only be shared by queries using the same resolver and
+    operator applicators, such as those of a single endpoint, as these are not part
+    of the request shape.
+
+    Attributes:
+        maxsize (int): The maximum number of clauses to store.
+        hits (int): The number of lookups which found a cached clause.
+        misses (int): The number of lookups which did not find a cached clause.
+    """
+
+    hits: int
+    maxsize: int
+    misses: int
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize a new statement cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of clauses to store.
+                Defaults to 256.
+
+        Raises:
+            ValueError: Raised when the maximum size isn't positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached clauses."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retrieves a cached clause.
+
+        Args:
+            key (Hashable): The shape of the clause.
+
+        Returns:
+            Optional[Any]: The cached clause, or None if it isn't cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Caches a clause, evicting the least recently used clause if necessary.
+
+        Args:
+            key (Hashable): The shape of the clause.
+            value (Any): The clause.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached clause and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _is_bindable(
+    item: GridFilterItem, operators: Optional[Mapping[str, OperatorApplicator]]
+) -> bool:
+    """Whether the value of a filter item can be bound as a parameter.
+
+    Missing values, and empty isAnyOf lists, change the clause built by the
+    applicators, so these are part of the shape instead. Operators whose applicator
+    is overridden may not accept a bound parameter, so their values are part of the
+    shape as well.
+
+    Args:
+        item (GridFilterItem): The filter item.
+        operators (Optional[Mapping[str, OperatorApplicator]]): The operator
+            applicators which take precedence over the registered applicators.
+
+    Returns:
+        bool: True if the value can be bound as a parameter, otherwise False.
+    """
+    if item.operator_value not in BINDABLE_OPERATORS or item.value is None:
+        return False
+    if operators is not None and item.operator_value in operators:
+        return False
+    if item.operator_value == "isAnyOf":
+        return isinstance(item.value, (list, tuple)) and len(item.value) > 0
+    return not isinstance(item.value, (list, tuple, dict))
+
+
+def get_filter_shape(
+    model: GridFilterModel,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Hashable:
+    """Builds the shape of a filter model.
+
+    Bindable values are excluded from the shape, while all other values are included,
+    as the clause built for them depends on the value itself.
+
+    Args:
+        model (GridFilterModel): The filter model.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Returns:
+        Hashable: The shape of the filter model.
+    """
+    return (
+        "filter",
+        model.link_operator,
+        tuple(
+            (
+                item.column_field,
+                item.operator_value,
+                None if _is_bindable(item, operators) else repr(item.value),
+            )
+            for item in model.items
+        ),
+    )
+
+
+def get_sort_shape(model: GridSortModel) -> Hashable:
+    """Builds the shape of a sort model.
+
+    Args:
+        model (GridSortModel): The sort model.
+
+    Returns:
+        Hashable: The shape of the sort model.
+    """
+    return ("sort", tuple((item.field, item.sort) for item in model))
+
+
+def get_filter_parameters(
+    model: GridFilterModel,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Dict[str, Any]:
+    """Retrieves the values of the parameters bound by the cached filter clause.
+
+    Args:
+        model (GridFilterModel): The filter model.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The parameter values, by parameter name.
+    """
+    return {
+        f"{_PARAMETER_PREFIX}{index}": item.value
+        for index, item in enumerate(model.items)
+        if _is_bindable(item, operators)
+    }
+
+
+def _bind_filter_model(
+    model: GridFilterModel, operators: Optional[Mapping[str, OperatorApplicator]]
+) -> GridFilterModel:
+    """Replaces the bindable values of a filter model with bound parameters.
+
+    Args:
+        model (GridFilterModel): The filter model.
+        operators (Optional[Mapping[str, OperatorApplicator]]): The operator
+            applicators which take precedence over the registered applicators.
+
+    Returns:
+        GridFilterModel: A copy of the filter model, with bound parameters as values.
+    """
+    return model.copy(
+        update={
+            "items": [
+                item.copy(
+                    update={
+                        "value": bindparam(
+                            f"{_PARAMETER_PREFIX}{index}",
+                            expanding=item.operator_value == "isAnyOf",
+                        )
+                    }
+                )
+                if _is_bindable(item, operators)
+                else item
+                for index, item in enumerate(model.items)
+            ]
+        }
+    )
+
+
+def get_cached_filter_clause(
+    model: GridFilterModel,
+    resolver: Resolver,
+    cache: StatementCache,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Tuple[Optional[Any], Dict[str, Any]]:
+    """Retrieves the filter clause of a filter model, building it if necessary.
+
+    Args:
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        cache (StatementCache): The cache storing the clauses.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Returns:
+        Tuple[Optional[Any], Dict[str, Any]]: The filter clause, or None if the model
+            has no items, and the values of its bound parameters.
+    """
+    if len(model.items) == 0:
+        return None, {}
+    key = get_filter_shape(model=model, operators=operators)
+    clause = cache.get(key)
+    if clause is None:
+        clause = get_filter_clause_from_items(
+            model=_bind_filter_model(model=model, operators=operators),
+            resolver=resolver,
+            operators=operators,
+        )
+        cache.set(key, clause)
+    return clause, get_filter_parameters(model=model, operators=operators)
+
+
+def get_cached_sort_expressions(
+    model: GridSortModel, resolver: Resolver, cache: StatementCache
+) -> List[Any]:
+    """Retrieves the order by expressions of a sort model, building them if necessary.
+
+    Args:
+        model (GridSortModel): The sort model being applied.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        cache (StatementCache): The cache storing the expressions.
+
+    Returns:
+        List[Any]: The order by expressions, which are empty if nothing is sorted.
+    """
+    key = get_sort_shape(model=model)
+    expressions: Optional[List[Any]] = cache.get(key)
+    if expressions is None:
+        expressions = [
+            get_sort_expression_from_item(item=item, resolver=resolver)
+            for item in model
+            if item.sort is not None
+        ]
+        cache.set(key, expressions)
+    return expressions
@@ -1,9 +1,76 @@
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    CaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    get_is_any_of_applicator,
+    get_is_any_of_strategy,
+    set_is_any_of_strategy,
+)
 from mui.v5.integrations.sqlalchemy.filter.apply_items import (
     apply_filter_items_to_query_from_items,
+    apply_filter_items_to_select_from_items,
+    get_filter_clause_from_items,
 )
 from mui.v5.integrations.sqlalchemy.filter.apply_model import (
     apply_filter_to_query_from_model,
+    apply_filter_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.filter.quick import (
+    Fts5QuickFilter,
+    LikeQuickFilter,
+    QuickFilter,
+    TsvectorQuickFilter,
+    apply_quick_filter_to_query_from_model,
+    apply_quick_filter_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.filter.registry import (
+    DAY_GRANULARITY_OPERATORS,
+    OPERATOR_REGISTRY,
+    ColumnCaseFolding,
+    OperatorApplicator,
+    adapt_value_applicator,
+    get_case_folding_operators,
+    get_date_operators,
+    get_operator_applicator,
+    register_operator,
+)
+from mui.v5.integrations.sqlalchemy.filter.simplify import simplify_filter_model
+from mui.v5.integrations.sqlalchemy.filter.staging import (
+    TemporaryTableStaging,
+    stage_is_any_of_values,
+    stage_values_in_temporary_table,
 )
 
 # isort: unique-list
-__all__ = ["apply_filter_items_to_query_from_items", "apply_filter_to_query_from_model"]
+__all__ = [
+    "CaseFolding",
+    "ColumnCaseFolding",
+    "DAY_GRANULARITY_OPERATORS",
+    "DateGranularity",
+    "Fts5QuickFilter",
+    "IsAnyOfStrategy",
+    "LikeQuickFilter",
+    "OPERATOR_REGISTRY",
+    "OperatorApplicator",
+    "QuickFilter",
+    "TemporaryTableStaging",
+    "TsvectorQuickFilter",
+    "adapt_value_applicator",
+    "apply_filter_items_to_query_from_items",
+    "apply_filter_items_to_select_from_items",
+    "apply_filter_to_query_from_model",
+    "apply_filter_to_select_from_model",
+    "apply_quick_filter_to_query_from_model",
+    "apply_quick_filter_to_select_from_model",
+    "get_case_folding_operators",
+    "get_date_operators",
+    "get_filter_clause_from_items",
+    "get_is_any_of_applicator",
+    "get_is_any_of_strategy",
+    "get_operator_applicator",
+    "register_operator",
+    "set_is_any_of_strategy",
+    "simplify_filter_model",
+    "stage_is_any_of_values",
+    "stage_values_in_temporary_table",
+]
@@ -11,15 +11,38 @@ from mui.v5.integrations.sqlalchemy.filter.applicators.basic import (
 from mui.v5.integrations.sqlalchemy.filter.applicators.before import (
     apply_before_operator,
 )
+from mui.v5.integrations.sqlalchemy.filter.applicators.case_folding import (
+    CaseFolding,
+    StringOperator,
+    apply_case_folded_operator,
+    validate_case_folding,
+)
 from mui.v5.integrations.sqlalchemy.filter.applicators.contains import (
     apply_contains_operator,
 )
+from mui.v5.integrations.sqlalchemy.filter.applicators.day import (
+    DateGranularity,
+    apply_day_after_operator,
+    apply_day_before_operator,
+    apply_day_is_operator,
+    apply_day_not_operator,
+    apply_day_on_or_after_operator,
+    apply_day_on_or_before_operator,
+)
 from mui.v5.integrations.sqlalchemy.filter.applicators.endswith import (
     apply_endswith_operator,
 )
 from mui.v5.integrations.sqlalchemy.filter.applicators.is_ import apply_is_operator
 from mui.v5.integrations.sqlalchemy.filter.applicators.is_any_of import (
+    IS_ANY_OF_STRATEGIES,
+    IsAnyOfStrategy,
+    apply_array_is_any_of_operator,
     apply_is_any_of_operator,
+    apply_padded_is_any_of_operator,
+    apply_values_is_any_of_operator,
+    get_is_any_of_applicator,
+    get_is_any_of_strategy,
+    set_is_any_of_strategy,
 )
 from mui.v5.integrations.sqlalchemy.filter.applicators.is_empty import (
     apply_is_empty_operator,
@@ -40,11 +63,24 @@ from mui.v5.integrations.sqlalchemy.filter.applicators.startswith import (
 
 # isort: unique-list
 __all__ = [
+    "CaseFolding",
+    "DateGranularity",
+    "IS_ANY_OF_STRATEGIES",
+    "IsAnyOfStrategy",
     "SUPPORTED_BASIC_OPERATORS",
+    "StringOperator",
     "apply_after_operator",
+    "apply_array_is_any_of_operator",
     "apply_basic_operator",
     "apply_before_operator",
+    "apply_case_folded_operator",
     "apply_contains_operator",
+    "apply_day_after_operator",
+    "apply_day_before_operator",
+    "apply_day_is_operator",
+    "apply_day_not_operator",
+    "apply_day_on_or_after_operator",
+    "apply_day_on_or_before_operator",
     "apply_endswith_operator",
     "apply_is_any_of_operator",
     "apply_is_empty_operator",
@@ -53,5 +89,11 @@ __all__ = [
     "apply_not_operator",
     "apply_on_or_after_operator",
     "apply_on_or_before_operator",
+    "apply_padded_is_any_of_operator",
     "apply_startswith_operator",
+    "apply_values_is_any_of_operator",
+    "get_is_any_of_applicator",
+    "get_is_any_of_strategy",
+    "set_is_any_of_strategy",
+    "validate_case_folding",
 ]
@@ -3,16 +3,46 @@
 Literal operators are literal representations of a built-in operator.
 """
 from operator import eq, ge, gt, le, lt, ne
-from typing import Any
+from typing import Any, Callable, Dict, Set
 
-from mui.v5.grid import GridFilterItem
+from mui.v5.grid import OPERATOR_SYNONYMS, GridFilterItem
 
-EQUAL_OPERATOR_LITERALS = {"==", "=", "equals", "eq"}
-NOT_EQUAL_OPERATOR_LITERALS = {"!=", "ne"}
-GREATER_THAN_OPERATOR_LITERALS = {">", "gt"}
-GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS = {">=", "ge"}
-LESS_THAN_OPERATOR_LITERALS = {"<", "lt"}
-LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS = {"<=", "le"}
+
+def _get_operator_literals(operator: str) -> Set[str]:
+    """Retrieves the canonical spelling of an operator, and its synonyms.
+
+    Args:
+        operator (str): The canonical spelling of the operator, such as "=".
+
+    Returns:
+        Set[str]: The operator and its synonyms, such as {"=", "==", "eq", "equals"}.
+    """
+    return {operator}.union(
+        synonym
+        for synonym, canonical in OPERATOR_SYNONYMS.items()
+        if canonical == operator
+    )
+
+
+EQUAL_OPERATOR_LITERALS = _get_operator_literals("=")
+NOT_EQUAL_OPERATOR_LITERALS = _get_operator_literals("!=")
+GREATER_THAN_OPERATOR_LITERALS = _get_operator_literals(">")
+GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS = _get_operator_literals(">=")
+LESS_THAN_OPERATOR_LITERALS = _get_operator_literals("<")
+LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS = _get_operator_literals("<=")
+
+# operators comparing the column's order to the value, which defaults to zero
+_ORDERING_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    **{literal: gt for literal in GREATER_THAN_OPERATOR_LITERALS},
+    **{literal: ge for literal in GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS},
+    **{literal: lt for literal in LESS_THAN_OPERATOR_LITERALS},
+    **{literal: le for literal in LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS},
+}
+# operators comparing the column's equality to the value
+_EQUALITY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    **{literal: eq for literal in EQUAL_OPERATOR_LITERALS},
+    **{literal: ne for literal in NOT_EQUAL_OPERATOR_LITERALS},
+}
 
 SUPPORTED_BASIC_OPERATORS = EQUAL_OPERATOR_LITERALS.union(
     NOT_EQUAL_OPERATOR_LITERALS,
@@ -42,23 +72,11 @@ def apply_basic_operator(column: Any, item: GridFilterItem) -> Any:
     Returns:
         Callable[[Any, Any], Any]: The operator.
     """
-    if item.operator_value in EQUAL_OPERATOR_LITERALS:
-        # equal
-        return eq(column, item.value)
-    elif item.operator_value in NOT_EQUAL_OPERATOR_LITERALS:
-        # not equal
-        return ne(column, item.value)
-    elif item.operator_value in GREATER_THAN_OPERATOR_LITERALS:
-        # greater than
-        return gt(column, item.value if item.value is not None else 0)
-    elif item.operator_value in GREATER_THAN_OR_EQUAL_TO_OPERATOR_LITERALS:
-        # greater than or equal to
-        return ge(column, item.value if item.value is not None else 0)
-    elif item.operator_value in LESS_THAN_OPERATOR_LITERALS:
-        # greater than
-        return lt(column, item.value if item.value is not None else 0)
-    elif item.operator_value in LESS_THAN_OR_EQUAL_TO_OPERATOR_LITERALS:
-        # greater than or equal to
-        return le(column, item.value if item.value is not None else 0)
-    else:
-        raise ValueError(f"Unsupported operator {item.operator_value}")
+    operator_value = item.operator_value or ""
+    operator = _EQUALITY_OPERATORS.get(operator_value)
+    if operator is not None:
+        return operator(column, item.value)
+    operator = _ORDERING_OPERATORS.get(operator_value)
+    if operator is not None:
+        return operator(column, item.value if item.value is not None else 0)
+    raise ValueError(f"Unsupported operator {item.operator_value}")
@@ -0,0 +1,124 @@
+"""The case_folding applicators apply the string operators case-insensitively.
+
+The data grid filters its rows case-insensitively on the client, while the contains,
+startsWith, and endsWith applicators use `LIKE`, which is case-sensitive on most
+databases. How a column is best compared case-insensitively depends on how it is
+indexed, so the case folding strategy controls the expression being built:
+
+* sensitive: `name LIKE '%' || ? || '%'`, the default, which is case-sensitive.
+* ilike: `name ILIKE '%' || ? || '%'`. Dialects without `ILIKE` compare the lower
+    case column and value instead.
+* lower: `lower(name) LIKE '%' || lower(?) || '%'`, which uses a functional index
+    on `lower(name)`, such as a PostgreSQL index using `text_pattern_ops`.
+* nocase: `name COLLATE nocase LIKE '%' || ? || '%'`, for SQLite columns which are
+    declared and indexed using the NOCASE collation.
+* citext: `name LIKE '%' || ? || '%'`, for PostgreSQL citext columns, which already
+    compare case-insensitively, so the expression is left unchanged.
+"""
+from typing import Any, Callable, Dict
+
+from sqlalchemy import String, func, literal, literal_column
+from sqlalchemy.sql.elements import ClauseElement
+from typing_extensions import Literal, TypeAlias
+
+from mui.v5.integrations.sqlalchemy.filter.applicators.contains import (
+    apply_contains_operator,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators.endswith import (
+    apply_endswith_operator,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators.startswith import (
+    apply_startswith_operator,
+)
+
+CaseFolding: TypeAlias = Literal["sensitive", "ilike", "lower", "nocase", "citext"]
+StringOperator: TypeAlias = Literal["contains", "startsWith", "endsWith"]
+
+# the case folding strategies which don't change the expression
+UNCHANGED_CASE_FOLDINGS = frozenset(("sensitive", "citext"))
+
+_CASE_FOLDINGS = frozenset(("sensitive", "ilike", "lower", "nocase", "citext"))
+_WILDCARD = literal_column("'%'")
+_SENSITIVE_APPLICATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "contains": apply_contains_operator,
+    "startsWith": apply_startswith_operator,
+    "endsWith": apply_endswith_operator,
+}
+
+
+def validate_case_folding(case_folding: str) -> None:
+    """Ensures a case folding strategy is supported.
+
+    Args:
+        case_folding (str): The case folding strategy.
+
+    Raises:
+        ValueError: Raised when the strategy is not supported.
+    """
+    if case_folding not in _CASE_FOLDINGS:
+        raise ValueError(f"Unsupported case folding strategy {case_folding}")
+
+
+def _get_operand(value: Any) -> Any:
+    """Converts the value being filtered into a string expression.
+
+    Args:
+        value (Any): The value being filtered, or a bound parameter.
+
+    Returns:
+        Any: The value as a bound parameter. A missing value matches every string,
+            as with the case-sensitive applicators.
+    """
+    if isinstance(value, ClauseElement):
+        return value
+    return literal(value if value is not None else "", String())
+
+
+def _get_pattern(operator: StringOperator, operand: Any) -> Any:
+    """Builds the `LIKE` pattern of a string operator.
+
+    Args:
+        operator (StringOperator): The string operator.
+        operand (Any): The string expression being filtered.
+
+    Returns:
+        Any: The pattern, wrapping the operand in wildcards.
+    """
+    pattern = operand
+    if operator in ("contains", "endsWith"):
+        pattern = _WILDCARD.concat(pattern)
+    if operator in ("contains", "startsWith"):
+        pattern = pattern.concat(_WILDCARD)
+    return pattern
+
+
+def apply_case_folded_operator(
+    column: Any, value: Any, operator: StringOperator, case_folding: CaseFolding
+) -> Any:
+    """Handles applying a string x-data-grid operator using a case folding strategy.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+        operator (StringOperator): The string operator, such as "contains".
+        case_folding (CaseFolding): The case folding strategy.
+
+    Raises:
+        ValueError: Raised when the operator or case folding strategy is not
+            supported.
+
+    Returns:
+        Any: The column after applying the filter using the provided value.
+    """
+    if operator not in _SENSITIVE_APPLICATORS:
+        raise ValueError(f"Unsupported string operator {operator}")
+    validate_case_folding(case_folding)
+    if case_folding in UNCHANGED_CASE_FOLDINGS:
+        return _SENSITIVE_APPLICATORS[operator](column, value)
+    operand = _get_operand(value)
+    if case_folding == "ilike":
+        return column.ilike(_get_pattern(operator, operand))
+    if case_folding == "lower":
+        return func.lower(column).like(_get_pattern(operator, func.lower(operand)))
+    return column.collate("nocase").like(_get_pattern(operator, operand))
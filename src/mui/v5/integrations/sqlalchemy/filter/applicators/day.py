@@ -0,0 +1,192 @@
+"""The day applicators apply the date operators at the granularity of a day.
+
+The data grid sends the value of `type: 'date'` columns as a day, such as
+"2023-01-05", while the column commonly stores a timestamp. Comparing the timestamp to
+the start of the day only matches the rows stored at exactly midnight, and wrapping
+the column in a function such as `DATE(created_at)` prevents the database from using
+an index on the column.
+
+The day applicators instead compare the column to the half-open range of the day,
+`[day, day + 1)`, which matches every timestamp within the day while leaving the
+column bare, so that B-tree indexes on it are used:
+
+* is: `created_at >= :day AND created_at < :next_day`
+* not: `created_at < :day OR created_at >= :next_day`
+* after: `created_at >= :next_day`
+* before: `created_at < :day`
+* onOrAfter: `created_at >= :day`
+* onOrBefore: `created_at < :next_day`
+
+Time columns have no day, so they are compared exactly, as with the default
+applicators. The is and not operators are shared with the other column types, so
+they're only applied by day to Date and DateTime columns.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Any, Tuple, Union
+
+from sqlalchemy import Date, DateTime, Time, and_, or_
+from typing_extensions import Literal, TypeAlias
+
+from mui.v5.integrations.sqlalchemy.filter.applicators.after import apply_after_operator
+from mui.v5.integrations.sqlalchemy.filter.applicators.before import (
+    apply_before_operator,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators.is_ import apply_is_operator
+from mui.v5.integrations.sqlalchemy.filter.applicators.not_ import apply_not_operator
+from mui.v5.integrations.sqlalchemy.filter.applicators.on_or_after import (
+    apply_on_or_after_operator,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators.on_or_before import (
+    apply_on_or_before_operator,
+)
+
+DateGranularity: TypeAlias = Literal["exact", "day"]
+
+_Day = Union[date, datetime]
+
+
+def _get_day_range(column: Any, value: Any) -> Tuple[_Day, _Day]:
+    """Retrieves the half-open range of the day containing the value.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The ISO 8601 date or date and time being filtered.
+
+    Returns:
+        Tuple[_Day, _Day]: The start of the day, and the start of the following day.
+            These are dates when the column is a Date column, and otherwise date
+            times in the value's time zone.
+    """
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    start = datetime.combine(parsed.date(), time(), tzinfo=parsed.tzinfo)
+    end = start + timedelta(days=1)
+    if isinstance(getattr(column, "type", None), Date):
+        return start.date(), end.date()
+    return start, end
+
+
+def _is_time(column: Any) -> bool:
+    """Whether the column is a Time column, which has no day.
+
+    Args:
+        column (Any): The column the operator is being applied to.
+
+    Returns:
+        bool: True if the column is a Time column, otherwise False.
+    """
+    return isinstance(getattr(column, "type", None), Time)
+
+
+def _has_day(column: Any) -> bool:
+    """Whether the column is a Date or DateTime column, which has a day.
+
+    Args:
+        column (Any): The column the operator is being applied to.
+
+    Returns:
+        bool: True if the column is a Date or DateTime column, otherwise False.
+    """
+    return isinstance(getattr(column, "type", None), (Date, DateTime))
+
+
+def apply_day_is_operator(column: Any, value: Any) -> Any:
+    """Handles applying the is x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the is filter using the provided value.
+    """
+    if value is None or not _has_day(column):
+        return apply_is_operator(column, value)
+    start, end = _get_day_range(column, value)
+    return and_(column >= start, column < end)
+
+
+def apply_day_not_operator(column: Any, value: Any) -> Any:
+    """Handles applying the not x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the not filter using the provided value.
+    """
+    if value is None or not _has_day(column):
+        return apply_not_operator(column, value)
+    start, end = _get_day_range(column, value)
+    return or_(column < start, column >= end)
+
+
+def apply_day_after_operator(column: Any, value: Any) -> Any:
+    """Handles applying the after x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the after filter using the provided value.
+    """
+    if value is None or _is_time(column):
+        return apply_after_operator(column, value)
+    _, end = _get_day_range(column, value)
+    return column >= end
+
+
+def apply_day_before_operator(column: Any, value: Any) -> Any:
+    """Handles applying the before x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the before filter using the provided value.
+    """
+    if value is None or _is_time(column):
+        return apply_before_operator(column, value)
+    start, _ = _get_day_range(column, value)
+    return column < start
+
+
+def apply_day_on_or_after_operator(column: Any, value: Any) -> Any:
+    """Handles applying the onOrAfter x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the on or after filter using the provided value.
+    """
+    if value is None or _is_time(column):
+        return apply_on_or_after_operator(column, value)
+    start, _ = _get_day_range(column, value)
+    return column >= start
+
+
+def apply_day_on_or_before_operator(column: Any, value: Any) -> Any:
+    """Handles applying the onOrBefore x-data-grid operator to a column by day.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the on or before filter using the provided value.
+    """
+    if value is None or _is_time(column):
+        return apply_on_or_before_operator(column, value)
+    _, end = _get_day_range(column, value)
+    return column < end
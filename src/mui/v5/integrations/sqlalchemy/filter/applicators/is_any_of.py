@@ -1,8 +1,50 @@
 """The is_any_of applicator applies the isAnyOf operator to the data.
 
 isAnyOf as in "Jonathan" is any of ["Aubrey", "Jasmine", "Jonathan"]
+
+An `IN` clause renders a placeholder per value, so every distinct number of values
+produces a different SQL string, which defeats the database's prepared statement and
+query plan caches. The isAnyOf strategy controls how the values are bound:
+
+* expanding: `IN (?, ?, ?)`, with a placeholder per value.
+* padded: `IN (?, ?, ?, ?)`, with the values padded to the next power of two by
+    repeating the last value, so only a handful of distinct statements exist.
+* array: `= ANY (?)`, with the values bound as a single array parameter. This
+    requires a dialect supporting arrays, such as PostgreSQL.
+* values: `IN (SELECT value FROM (VALUES (?), (?)) AS is_any_of (value))` for lists
+    larger than a threshold, which databases such as PostgreSQL plan as a join, and an
+    expanding `IN` clause otherwise.
+
+The strategy can be selected per dialect using `set_is_any_of_strategy()`.
 """
-from typing import Any, Collection, cast
+from typing import Any, Callable, Collection, Dict, List, cast
+
+from sqlalchemy import ARRAY, any_, bindparam, select, values
+from sqlalchemy.sql import column as sql_column
+from sqlalchemy.sql.sqltypes import NullType
+from typing_extensions import Literal, TypeAlias
+
+IsAnyOfStrategy: TypeAlias = Literal["expanding", "padded", "array", "values"]
+
+# the number of values above which the values strategy uses a VALUES list
+VALUES_STRATEGY_THRESHOLD = 64
+
+# the strategy used by each dialect, by dialect name
+IS_ANY_OF_STRATEGIES: Dict[str, IsAnyOfStrategy] = {}
+
+
+def _is_empty(value: Any) -> bool:
+    """Whether the isAnyOf value matches no rows.
+
+    Args:
+        value (Any): The value being filtered.
+
+    Returns:
+        bool: True if the value is missing or an empty collection, otherwise False.
+    """
+    return value is None or (
+        isinstance(value, Collection) and len(cast(Collection[object], value)) == 0
+    )
 
 
 def apply_is_any_of_operator(column: Any, value: Any) -> Any:
@@ -21,8 +63,122 @@ def apply_is_any_of_operator(column: Any, value: Any) -> Any:
     # only '=', '!=', 'is_()', 'is_not()', 'is_distinct_from()',
     # 'is_not_distinct_from()' operators can be used with None/True/False
     # so below have to special case them.
-    if value is None or (
-        isinstance(value, Collection) and len(cast(Collection[object], value)) == 0
-    ):
+    if _is_empty(value):
         return column.in_(tuple())
     return column.in_(value)
+
+
+def apply_padded_is_any_of_operator(column: Any, value: Any) -> Any:
+    """Handles applying the isAnyOf operator, padding the values to a power of two.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the isAnyOf filter using the provided value.
+    """
+    if _is_empty(value) or not isinstance(value, (list, tuple)):
+        return apply_is_any_of_operator(column=column, value=value)
+    padded: List[Any] = list(value)
+    size = 1 << (len(padded) - 1).bit_length()
+    # repeating a value doesn't change which rows are matched
+    padded.extend([padded[-1]] * (size - len(padded)))
+    return column.in_(padded)
+
+
+def apply_array_is_any_of_operator(column: Any, value: Any) -> Any:
+    """Handles applying the isAnyOf operator, binding the values as a single array.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+
+    Returns:
+        Any: The column after applying the isAnyOf filter using the provided value.
+    """
+    if _is_empty(value) or not isinstance(value, (list, tuple)):
+        return apply_is_any_of_operator(column=column, value=value)
+    array_type = ARRAY(getattr(column, "type", NullType()))
+    return column == any_(bindparam(None, value=list(value), type_=array_type))
+
+
+def apply_values_is_any_of_operator(
+    column: Any, value: Any, threshold: int = VALUES_STRATEGY_THRESHOLD
+) -> Any:
+    """Handles applying the isAnyOf operator, using a VALUES list for large lists.
+
+    Args:
+        column (Any): The column the operator is being applied to, or equivalent
+            property, expression, subquery, etc.
+        value (Any): The value being filtered.
+        threshold (int, optional): The number of values above which a VALUES list is
+            used. Defaults to VALUES_STRATEGY_THRESHOLD.
+
+    Returns:
+        Any: The column after applying the isAnyOf filter using the provided value.
+    """
+    if (
+        _is_empty(value)
+        or not isinstance(value, (list, tuple))
+        or len(value) <= threshold
+    ):
+        return apply_is_any_of_operator(column=column, value=value)
+    rows = values(
+        sql_column("value", getattr(column, "type", NullType())), name="is_any_of"
+    ).data([(item,) for item in value])
+    return column.in_(select(rows))
+
+
+_STRATEGY_APPLICATORS: Dict[IsAnyOfStrategy, Callable[[Any, Any], Any]] = {
+    "expanding": apply_is_any_of_operator,
+    "padded": apply_padded_is_any_of_operator,
+    "array": apply_array_is_any_of_operator,
+    "values": apply_values_is_any_of_operator,
+}
+
+
+def get_is_any_of_applicator(strategy: IsAnyOfStrategy) -> Callable[[Any, Any], Any]:
+    """Retrieves the isAnyOf applicator implementing a strategy.
+
+    Args:
+        strategy (IsAnyOfStrategy): The isAnyOf strategy.
+
+    Raises:
+        ValueError: Raised when the strategy is not supported.
+
+    Returns:
+        Callable[[Any, Any], Any]: The applicator accepting the column and the value.
+    """
+    applicator = _STRATEGY_APPLICATORS.get(strategy)
+    if applicator is None:
+        raise ValueError(f"Unsupported isAnyOf strategy {strategy}")
+    return applicator
+
+
+def set_is_any_of_strategy(dialect_name: str, strategy: IsAnyOfStrategy) -> None:
+    """Selects the isAnyOf strategy used for a dialect.
+
+    Args:
+        dialect_name (str): The name of the dialect, such as "postgresql".
+        strategy (IsAnyOfStrategy): The isAnyOf strategy.
+
+    Raises:
+        ValueError: Raised when the strategy is not supported.
+    """
+    get_is_any_of_applicator(strategy=strategy)
+    IS_ANY_OF_STRATEGIES[dialect_name] = strategy
+
+
+def get_is_any_of_strategy(dialect_name: str) -> IsAnyOfStrategy:
+    """Retrieves the isAnyOf strategy used for a dialect.
+
+    Args:
+        dialect_name (str): The name of the dialect, such as "postgresql".
+
+    Returns:
+        IsAnyOfStrategy: The selected strategy, which defaults to "expanding".
+    """
+    return IS_ANY_OF_STRATEGIES.get(dialect_name, "expanding")
@@ -1,28 +1,17 @@
 """The apply_model module is responsible for applying a GridSortModel to a query."""
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Mapping, Optional, TypeVar
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.elements import BooleanClauseList
+from sqlalchemy.sql.selectable import Select
 
 from mui.v5.grid import GridFilterItem, GridFilterModel, GridLinkOperator
-from mui.v5.integrations.sqlalchemy.filter.applicators import (
-    SUPPORTED_BASIC_OPERATORS,
-    apply_after_operator,
-    apply_basic_operator,
-    apply_before_operator,
-    apply_contains_operator,
-    apply_endswith_operator,
-    apply_is_any_of_operator,
-    apply_is_empty_operator,
-    apply_is_not_empty_operator,
-    apply_is_operator,
-    apply_not_operator,
-    apply_on_or_after_operator,
-    apply_on_or_before_operator,
-    apply_startswith_operator,
+from mui.v5.integrations.sqlalchemy.filter.registry import (
+    OperatorApplicator,
+    get_operator_applicator,
 )
-from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.resolver import MapperResolver, Resolver
 
 _Q = TypeVar("_Q")
 
@@ -48,14 +37,20 @@ def _get_link_operator(
         return or_
 
 
-def apply_operator_to_column(item: GridFilterItem, resolver: Resolver) -> Any:
+def apply_operator_to_column(
+    item: GridFilterItem,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Any:
     """Applies the operator value represented by the GridFilterItem to the column.
 
     This function uses the provided resolver to retrieve the SQLAlchemy's column, or
     other filterable expression, and applies the appropriate SQLAlchemy or Python
     operator.
 
-    This does not currently support custom operators.
+    The operator's applicator is located in the operator registry, so custom
+    operators may be supported using `register_operator()`, or by providing them
+    using the operators argument.
 
     Support:
         * Equal to
@@ -92,44 +87,66 @@ def apply_operator_to_column(item: GridFilterItem, resolver: Resolver) -> Any:
         item (GridFilterItem): The item being applied to the column.
         resolver (Resolver): The resolver to use to locate the column or
             filterable expression.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Raises:
+        ValueError: Raised when the operator is not supported.
 
     Returns:
         Any: The comparison operator for use in SQLAlchemy queries.
     """
-    column = resolver(item.column_field)
-    # we have 1:1 mappings of these operators in Python
-    if item.operator_value in SUPPORTED_BASIC_OPERATORS:
-        return apply_basic_operator(column, item)
-    elif item.operator_value == "is":
-        return apply_is_operator(column, item.value)
-    elif item.operator_value == "isEmpty":
-        return apply_is_empty_operator(column)
-    elif item.operator_value == "isNotEmpty":
-        return apply_is_not_empty_operator(column)
-    elif item.operator_value == "isAnyOf":
-        return apply_is_any_of_operator(column, item.value)
-    elif item.operator_value == "contains":
-        return apply_contains_operator(column, item.value)
-    elif item.operator_value == "startsWith":
-        return apply_startswith_operator(column, item.value)
-    elif item.operator_value == "endsWith":
-        return apply_endswith_operator(column, item.value)
-    elif item.operator_value == "not":
-        return apply_not_operator(column, item.value)
-    elif item.operator_value == "before":
-        return apply_before_operator(column, item.value)
-    elif item.operator_value == "after":
-        return apply_after_operator(column, item.value)
-    elif item.operator_value == "onOrBefore":
-        return apply_on_or_before_operator(column, item.value)
-    elif item.operator_value == "onOrAfter":
-        return apply_on_or_after_operator(column, item.value)
-    else:
-        raise ValueError(f"Unsupported operator {item.operator_value}")
+    applicator = get_operator_applicator(name=item.operator_value, operators=operators)
+    clause = applicator(resolver(item.column_field), item)
+    if isinstance(resolver, MapperResolver):
+        return resolver.wrap_clause(field=item.column_field, clause=clause)
+    return clause
+
+
+def get_filter_clause_from_items(
+    model: GridFilterModel,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Optional[Any]:
+    """Builds the clause represented by a grid filter model's items section.
+
+    Args:
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Returns:
+        Optional[Any]: The filter clause, or None if the model has no items.
+    """
+    if len(model.items) == 0:
+        return None
+
+    link_operator = _get_link_operator(model=model)
+    # the link operator is either the and_ or or_ sqlalchemy function to determine
+    # how the boolean clause list is applied
+    return link_operator(
+        # the get_operator_value returns a function which we immediately call.
+        # The function is a comparison function supported by SQLAlchemy such as
+        # eq, ne, le, lt, etc. which is applied to the model's resolved column
+        # and the filter value.
+        # Basically, it builds something like this, dynamically:
+        # .filter(and_(gt(Request.id, 100), eq(Request.title, "Example"))
+        *[
+            apply_operator_to_column(item=item, resolver=resolver, operators=operators)
+            for item in model.items
+        ]
+    )
 
 
 def apply_filter_items_to_query_from_items(
-    query: "Query[_Q]", model: GridFilterModel, resolver: Resolver
+    query: "Query[_Q]",
+    model: GridFilterModel,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
 ) -> "Query[_Q]":
     """Applies a grid filter model's items section to a SQLAlchemy query.
 
@@ -138,28 +155,44 @@ def apply_filter_items_to_query_from_items(
         model (GridFilterModel): The filter model being applied.
         resolver (Resolver): A resolver to convert field names from the model to
             SQLAlchemy column's or expressions.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
 
     Returns:
         Query[_Q]: The filtered query.
     """
-    if len(model.items) == 0:
+    clause = get_filter_clause_from_items(
+        model=model, resolver=resolver, operators=operators
+    )
+    if clause is None:
         return query
+    return query.filter(clause)
 
-    link_operator = _get_link_operator(model=model)
-    # this is a bit gross, but is the easiest way to ensure it's applied properly
-    return query.filter(
-        # the link operator is either the and_ or or_ sqlalchemy function to determine
-        # how the boolean clause list is applied
-        link_operator(
-            # the get_operator_value returns a function which we immediately call.
-            # The function is a comparison function supported by SQLAlchemy such as
-            # eq, ne, le, lt, etc. which is applied to the model's resolved column
-            # and the filter value.
-            # Basically, it builds something like this, dynamically:
-            # .filter(and_(gt(Request.id, 100), eq(Request.title, "Example"))
-            *[
-                apply_operator_to_column(item=item, resolver=resolver)
-                for item in model.items
-            ]
-        )
+
+def apply_filter_items_to_select_from_items(
+    statement: Select,
+    model: GridFilterModel,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+) -> Select:
+    """Applies a grid filter model's items section to a 2.0 style select statement.
+
+    Args:
+        statement (Select): The statement to be filtered.
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+
+    Returns:
+        Select: The filtered statement.
+    """
+    clause = get_filter_clause_from_items(
+        model=model, resolver=resolver, operators=operators
     )
+    if clause is None:
+        return statement
+    return statement.where(clause)
@@ -1,34 +1,116 @@
 """The apply_model module is responsible for applying a GridSortModel to a query."""
-from typing import TypeVar
+from typing import Mapping, Optional, TypeVar
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import Select
 
 from mui.v5.grid import GridFilterModel
 from mui.v5.integrations.sqlalchemy.filter.apply_items import (
     apply_filter_items_to_query_from_items,
+    apply_filter_items_to_select_from_items,
 )
+from mui.v5.integrations.sqlalchemy.filter.quick import (
+    QuickFilter,
+    apply_quick_filter_to_query_from_model,
+    apply_quick_filter_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.filter.registry import OperatorApplicator
+from mui.v5.integrations.sqlalchemy.filter.staging import stage_is_any_of_values
 from mui.v5.integrations.sqlalchemy.resolver import Resolver
 
 _Q = TypeVar("_Q")
 
 
 def apply_filter_to_query_from_model(
-    query: "Query[_Q]", model: GridFilterModel, resolver: Resolver
+    query: "Query[_Q]",
+    model: GridFilterModel,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+    temporary_table_threshold: Optional[int] = None,
+    quick_filter: Optional[QuickFilter] = None,
 ) -> "Query[_Q]":
     """Applies a GridFilterModel to a SQLAlchemy query.
 
-    If the model is an empty list, the query is returned, as-is.
+    If the model is an empty list, the query is returned, as-is. The quick filter
+    values are only applied when a quick filter backend is provided.
 
     Args:
         query (Query[_Q]): The query to apply the sort model to.
         model (GridFilterModel): The filter model to apply to the query.
         resolver (Resolver): The resolver is responsible for retrieving the column or
             other property on a SQLAlchemy model.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+        temporary_table_threshold (Optional[int], optional): The number of isAnyOf
+            values above which the values are inserted into a temporary table, using
+            the query's session, and filtered using a semi-join. None to disable.
+            Defaults to None.
+        quick_filter (Optional[QuickFilter], optional): The backend which applies the
+            quick filter values, such as `LikeQuickFilter(fields=["name"])`. None to
+            ignore the quick filter values. Defaults to None.
+
+    Raises:
+        ValueError: Raised when isAnyOf values are staged in temporary tables, but
+            the query has no session.
 
     Returns:
         Query[_Q]: The filtered query.
     """
+    if temporary_table_threshold is not None:
+        model = stage_is_any_of_values(
+            query=query,
+            model=model,
+            resolver=resolver,
+            threshold=temporary_table_threshold,
+        )
     query = apply_filter_items_to_query_from_items(
-        query=query, model=model, resolver=resolver
+        query=query, model=model, resolver=resolver, operators=operators
     )
+    if quick_filter is not None:
+        query = apply_quick_filter_to_query_from_model(
+            query=query, model=model, resolver=resolver, quick_filter=quick_filter
+        )
     return query
+
+
+def apply_filter_to_select_from_model(
+    statement: Select,
+    model: GridFilterModel,
+    resolver: Resolver,
+    operators: Optional[Mapping[str, OperatorApplicator]] = None,
+    quick_filter: Optional[QuickFilter] = None,
+) -> Select:
+    """Applies a GridFilterModel to a 2.0 style select statement.
+
+    If the model is an empty list, the statement is returned, as-is. The quick filter
+    values are only applied when a quick filter backend is provided. Unlike queries,
+    a statement isn't bound to a session, so isAnyOf values can't be staged in
+    temporary tables.
+
+    Args:
+        statement (Select): The statement to apply the filter model to.
+        model (GridFilterModel): The filter model to apply to the statement.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            operator applicators which take precedence over the registered
+            applicators. Defaults to None.
+        quick_filter (Optional[QuickFilter], optional): The backend which applies the
+            quick filter values. None to ignore the quick filter values. Defaults to
+            None.
+
+    Returns:
+        Select: The filtered statement.
+    """
+    statement = apply_filter_items_to_select_from_items(
+        statement=statement, model=model, resolver=resolver, operators=operators
+    )
+    if quick_filter is not None:
+        statement = apply_quick_filter_to_select_from_model(
+            statement=statement,
+            model=model,
+            resolver=resolver,
+            quick_filter=quick_filter,
+        )
+    return statement
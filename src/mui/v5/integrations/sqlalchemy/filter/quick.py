@@ -0,0 +1,391 @@
+"""The quick module applies the quick filter values of a grid filter model.
+
+The data grid's quick filter, its search box, splits the search text into values and
+matches the rows where every value (or, using the "or" quick filter logic operator,
+any value) is found in at least one of the searched columns. The quick filter is
+combined with the filter model's items using "and".
+
+Searching many columns for a substring can't use a B-tree index, so the quick filter
+backend controls how the values are matched:
+
+* LikeQuickFilter: `name ILIKE '%' || ? || '%' OR email ILIKE ...`, which is
+    portable, and supports the case folding strategies of the string operators.
+* TsvectorQuickFilter: `to_tsvector(concat_ws(' ', name, email)) @@
+    plainto_tsquery(?)`, which uses PostgreSQL's full-text search, and a GIN index on
+    the document.
+* Fts5QuickFilter: `id IN (SELECT rowid FROM search WHERE search MATCH ?)`, which
+    uses an SQLite FTS5 virtual table indexing the searched columns.
+
+Custom backends, such as one using a search engine, may be created by subclassing
+`QuickFilter` and implementing `get_value_clause()`.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import String, and_, cast, func, literal_column, or_, select
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import column as sql_column
+from sqlalchemy.sql import table as sql_table
+from sqlalchemy.sql.selectable import Select
+
+from mui.v5.grid import GridFilterModel, GridLinkOperator
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    CaseFolding,
+    apply_case_folded_operator,
+    validate_case_folding,
+)
+from mui.v5.integrations.sqlalchemy.resolver import MapperResolver, Resolver
+
+_Q = TypeVar("_Q")
+
+
+def _get_quick_filter_values(model: GridFilterModel) -> List[str]:
+    """Retrieves the quick filter values which filter the rows.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+
+    Returns:
+        List[str]: The quick filter values, excluding missing and blank values, which
+            match every row.
+    """
+    values = (
+        str(value).strip()
+        for value in model.quick_filter_values or []
+        if value is not None
+    )
+    return [value for value in values if value != ""]
+
+
+def _as_string(column: Any) -> Any:
+    """Casts a column to a string, if it isn't already one.
+
+    Args:
+        column (Any): The column, or equivalent property, expression, etc.
+
+    Returns:
+        Any: The string column.
+    """
+    if isinstance(getattr(column, "type", None), String):
+        return column
+    return cast(column, String())
+
+
+class QuickFilter(ABC):
+    """The interface implemented by all quick filter backends.
+
+    Attributes:
+        fields (Sequence[str]): The fields searched by the quick filter, which are
+            resolved using the data grid query's resolver.
+    """
+
+    fields: Sequence[str]
+
+    def __init__(self, fields: Sequence[str] = ()) -> None:
+        """Initialize a new quick filter.
+
+        Args:
+            fields (Sequence[str], optional): The fields searched by the quick filter.
+                Defaults to ().
+        """
+        self.fields = tuple(fields)
+
+    @abstractmethod
+    def get_value_clause(self, value: str, resolver: Resolver) -> Any:
+        """Builds the clause matching the rows containing a quick filter value.
+
+        Args:
+            value (str): The quick filter value.
+            resolver (Resolver): The resolver of the searched fields.
+
+        Returns:
+            Any: The filter clause.
+        """
+
+    def get_clause(self, model: GridFilterModel, resolver: Resolver) -> Optional[Any]:
+        """Builds the clause represented by a grid filter model's quick filter values.
+
+        Args:
+            model (GridFilterModel): The grid filter model.
+            resolver (Resolver): The resolver of the searched fields.
+
+        Returns:
+            Optional[Any]: The filter clause, or None if there are no quick filter
+                values.
+        """
+        values = _get_quick_filter_values(model=model)
+        if len(values) == 0:
+            return None
+        link_operator = (
+            or_ if model.quick_filter_logic_operator == GridLinkOperator.Or else and_
+        )
+        return link_operator(
+            *[self.get_value_clause(value=value, resolver=resolver) for value in values]
+        )
+
+
+class LikeQuickFilter(QuickFilter):
+    """A quick filter which matches each searched column using `LIKE`.
+
+    Columns which aren't strings are cast to strings, so that numbers may be
+    searched as well.
+
+    Attributes:
+        case_folding (CaseFolding): The case folding strategy used to compare the
+            strings.
+        fields (Sequence[str]): The fields searched by the quick filter.
+    """
+
+    case_folding: CaseFolding
+
+    def __init__(
+        self, fields: Sequence[str], case_folding: CaseFolding = "ilike"
+    ) -> None:
+        """Initialize a new LIKE quick filter.
+
+        Args:
+            fields (Sequence[str]): The fields searched by the quick filter.
+            case_folding (CaseFolding, optional): The case folding strategy used to
+                compare the strings. Defaults to "ilike", matching the data grid's
+                case-insensitive quick filter.
+
+        Raises:
+            ValueError: Raised when no fields are provided.
+            ValueError: Raised when the case folding strategy is not supported.
+        """
+        if len(fields) == 0:
+            raise ValueError("At least one field must be searched")
+        validate_case_folding(case_folding)
+        super().__init__(fields=fields)
+        self.case_folding = case_folding
+
+    def get_value_clause(self, value: str, resolver: Resolver) -> Any:
+        """Builds the clause matching the rows where any field contains the value.
+
+        Args:
+            value (str): The quick filter value.
+            resolver (Resolver): The resolver of the searched fields.
+
+        Returns:
+            Any: The filter clause.
+        """
+        clauses = [
+            apply_case_folded_operator(
+                _as_string(resolver(field)), value, "contains", self.case_folding
+            )
+            for field in self.fields
+        ]
+        if isinstance(resolver, MapperResolver):
+            clauses = [
+                resolver.wrap_clause(field=field, clause=clause)
+                for field, clause in zip(self.fields, clauses)
+            ]
+        return or_(*clauses)
+
+
+class TsvectorQuickFilter(QuickFilter):
+    """A quick filter using PostgreSQL's full-text search.
+
+    The rows are matched using `document @@ plainto_tsquery(config, value)`. The
+    document defaults to `to_tsvector(config, concat_ws(' ', *fields))`, which may be
+    indexed using a GIN expression index, or may be a stored tsvector column. The
+    document has a single value per row, so its fields can't traverse a to-many
+    relationship.
+
+    Attributes:
+        config (str): The text search configuration, such as "english".
+        document (Optional[Any]): The tsvector column or expression being searched,
+            or None to build it from the fields.
+        fields (Sequence[str]): The fields searched by the quick filter.
+    """
+
+    config: str
+    document: Optional[Any]
+
+    def __init__(
+        self,
+        fields: Sequence[str] = (),
+        config: str = "simple",
+        document: Optional[Any] = None,
+    ) -> None:
+        """Initialize a new full-text search quick filter.
+
+        Args:
+            fields (Sequence[str], optional): The fields searched by the quick filter,
+                when no document is provided. Defaults to ().
+            config (str, optional): The text search configuration. Defaults to
+                "simple", which doesn't stem words or remove stop words.
+            document (Optional[Any], optional): The tsvector column or expression
+                being searched. Defaults to None.
+
+        Raises:
+            ValueError: Raised when neither fields nor a document are provided.
+        """
+        if len(fields) == 0 and document is None:
+            raise ValueError("Either the fields or the document must be provided")
+        super().__init__(fields=fields)
+        self.config = config
+        self.document = document
+
+    def get_document(self, resolver: Resolver) -> Any:
+        """Retrieves the tsvector being searched.
+
+        Args:
+            resolver (Resolver): The resolver of the searched fields.
+
+        Raises:
+            ValueError: Raised when the resolver is a mapper resolver, and a field
+                traverses a to-many relationship, which has many values per row.
+
+        Returns:
+            Any: The tsvector column or expression.
+        """
+        if self.document is not None:
+            return self.document
+        if isinstance(resolver, MapperResolver):
+            for field in self.fields:
+                if resolver.is_to_many(field):
+                    raise ValueError(
+                        f"The to-many field {field} can't be part of the document"
+                    )
+        return func.to_tsvector(
+            self.config,
+            func.concat_ws(
+                " ", *[_as_string(resolver(field)) for field in self.fields]
+            ),
+        )
+
+    def get_value_clause(self, value: str, resolver: Resolver) -> Any:
+        """Builds the clause matching the rows whose document contains the value.
+
+        Args:
+            value (str): The quick filter value.
+            resolver (Resolver): The resolver of the searched fields.
+
+        Raises:
+            ValueError: Raised when a field of the document traverses a to-many
+                relationship.
+
+        Returns:
+            Any: The filter clause.
+        """
+        return self.get_document(resolver=resolver).op("@@")(
+            func.plainto_tsquery(self.config, value)
+        )
+
+
+class Fts5QuickFilter(QuickFilter):
+    """A quick filter using an SQLite FTS5 virtual table.
+
+    The virtual table indexes the searched columns, with each row's rowid matching
+    the key of the filtered rows, such as:
+
+        CREATE VIRTUAL TABLE example_search USING fts5(name, email);
+        INSERT INTO example_search (rowid, name, email)
+            SELECT id, name, email FROM example;
+
+    The rows are filtered using a semi-join against the rows matching the value, so
+    the virtual table's columns, rather than the fields, are searched.
+
+    Attributes:
+        fields (Sequence[str]): Unused, as the virtual table's columns are searched.
+        key (Any): The column of the filtered rows matching the virtual table's rowid.
+        table_name (str): The name of the FTS5 virtual table.
+    """
+
+    key: Any
+    table_name: str
+
+    def __init__(self, table_name: str, key: Any) -> None:
+        """Initialize a new FTS5 quick filter.
+
+        Args:
+            table_name (str): The name of the FTS5 virtual table.
+            key (Any): The column of the filtered rows matching the virtual table's
+                rowid, such as the primary key.
+        """
+        super().__init__()
+        self.table_name = table_name
+        self.key = key
+
+    @staticmethod
+    def get_match_query(value: str) -> str:
+        """Converts a quick filter value into an FTS5 query.
+
+        Each word is quoted, so that the value is searched as plain text rather than
+        being interpreted using FTS5's query syntax, and matches the rows containing
+        every word.
+
+        Args:
+            value (str): The quick filter value.
+
+        Returns:
+            str: The FTS5 query.
+        """
+        return " ".join('"' + word.replace('"', '""') + '"' for word in value.split())
+
+    def get_value_clause(self, value: str, resolver: Resolver) -> Any:
+        """Builds the clause matching the rows whose virtual table row contains the
+        value.
+
+        Args:
+            value (str): The quick filter value.
+            resolver (Resolver): Unused, as the virtual table's columns are searched.
+
+        Returns:
+            Any: The filter clause.
+        """
+        search = sql_table(self.table_name, sql_column("rowid"))
+        matches = select(search.c.rowid).where(
+            literal_column(self.table_name).op("MATCH")(self.get_match_query(value))
+        )
+        return self.key.in_(matches)
+
+
+def apply_quick_filter_to_query_from_model(
+    query: "Query[_Q]",
+    model: GridFilterModel,
+    resolver: Resolver,
+    quick_filter: QuickFilter,
+) -> "Query[_Q]":
+    """Applies a grid filter model's quick filter values to a SQLAlchemy query.
+
+    Args:
+        query (Query[_Q]): The query to be filtered.
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        quick_filter (QuickFilter): The quick filter backend.
+
+    Returns:
+        Query[_Q]: The filtered query.
+    """
+    clause = quick_filter.get_clause(model=model, resolver=resolver)
+    if clause is None:
+        return query
+    return query.filter(clause)
+
+
+def apply_quick_filter_to_select_from_model(
+    statement: Select,
+    model: GridFilterModel,
+    resolver: Resolver,
+    quick_filter: QuickFilter,
+) -> Select:
+    """Applies a grid filter model's quick filter values to a 2.0 style select
+    statement.
+
+    Args:
+        statement (Select): The statement to be filtered.
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        quick_filter (QuickFilter): The quick filter backend.
+
+    Returns:
+        Select: The filtered statement.
+    """
+    clause = quick_filter.get_clause(model=model, resolver=resolver)
+    if clause is None:
+        return statement
+    return statement.where(clause)
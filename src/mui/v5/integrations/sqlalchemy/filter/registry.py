@@ -0,0 +1,245 @@
+"""The registry module maps filter operator names to their applicators.
+
+Each applicator receives the resolved column and the filter item, and returns the
+filter clause. Dispatching through a mapping keeps the cost of locating an operator
+constant, regardless of how many operators are supported, and allows custom operators
+to be registered without modifying the integration:
+
+    >>> from sqlalchemy import and_
+    >>> def apply_between_operator(column: Any, item: GridFilterItem) -> Any:
+    ...     lower, upper = item.value
+    ...     return and_(column >= lower, column <= upper)
+    ...
+    >>> register_operator("between", apply_between_operator)
+"""
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from mui.v5.grid import GridFilterItem
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    SUPPORTED_BASIC_OPERATORS,
+    CaseFolding,
+    DateGranularity,
+    StringOperator,
+    apply_after_operator,
+    apply_basic_operator,
+    apply_before_operator,
+    apply_case_folded_operator,
+    apply_contains_operator,
+    apply_day_after_operator,
+    apply_day_before_operator,
+    apply_day_is_operator,
+    apply_day_not_operator,
+    apply_day_on_or_after_operator,
+    apply_day_on_or_before_operator,
+    apply_endswith_operator,
+    apply_is_any_of_operator,
+    apply_is_empty_operator,
+    apply_is_not_empty_operator,
+    apply_is_operator,
+    apply_not_operator,
+    apply_on_or_after_operator,
+    apply_on_or_before_operator,
+    apply_startswith_operator,
+    validate_case_folding,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators.case_folding import (
+    UNCHANGED_CASE_FOLDINGS,
+)
+
+OperatorApplicator = Callable[[Any, GridFilterItem], Any]
+ColumnCaseFolding = Union[CaseFolding, Mapping[str, CaseFolding]]
+
+
+def adapt_value_applicator(applicator: Callable[[Any, Any], Any]) -> OperatorApplicator:
+    """Adapts an applicator which accepts the filter value to accept the filter item.
+
+    This allows the value based applicators, such as `apply_contains_operator`, to be
+    registered as operator applicators.
+
+    Args:
+        applicator (Callable[[Any, Any], Any]): The applicator accepting the column
+            and the value being filtered.
+
+    Returns:
+        OperatorApplicator: The applicator accepting the column and the filter item.
+    """
+
+    def apply(column: Any, item: GridFilterItem) -> Any:
+        """Applies the applicator to the column and the filter item's value."""
+        return applicator(column, item.value)
+
+    return apply
+
+
+def _apply_column(applicator: Callable[[Any], Any]) -> OperatorApplicator:
+    """Adapts an applicator which accepts only the column to accept the filter item.
+
+    Args:
+        applicator (Callable[[Any], Any]): The applicator accepting the column.
+
+    Returns:
+        OperatorApplicator: The applicator accepting the column and the filter item.
+    """
+
+    def apply(column: Any, item: GridFilterItem) -> Any:
+        """Applies the applicator to the column, ignoring the filter item."""
+        return applicator(column)
+
+    return apply
+
+
+OPERATOR_REGISTRY: Dict[str, OperatorApplicator] = {
+    **{literal: apply_basic_operator for literal in SUPPORTED_BASIC_OPERATORS},
+    "is": adapt_value_applicator(apply_is_operator),
+    "isEmpty": _apply_column(apply_is_empty_operator),
+    "isNotEmpty": _apply_column(apply_is_not_empty_operator),
+    "isAnyOf": adapt_value_applicator(apply_is_any_of_operator),
+    "contains": adapt_value_applicator(apply_contains_operator),
+    "startsWith": adapt_value_applicator(apply_startswith_operator),
+    "endsWith": adapt_value_applicator(apply_endswith_operator),
+    "not": adapt_value_applicator(apply_not_operator),
+    "before": adapt_value_applicator(apply_before_operator),
+    "after": adapt_value_applicator(apply_after_operator),
+    "onOrBefore": adapt_value_applicator(apply_on_or_before_operator),
+    "onOrAfter": adapt_value_applicator(apply_on_or_after_operator),
+}
+
+# the date operators, applied to the half-open range of the day being filtered
+DAY_GRANULARITY_OPERATORS: Mapping[str, OperatorApplicator] = {
+    "is": adapt_value_applicator(apply_day_is_operator),
+    "not": adapt_value_applicator(apply_day_not_operator),
+    "before": adapt_value_applicator(apply_day_before_operator),
+    "after": adapt_value_applicator(apply_day_after_operator),
+    "onOrBefore": adapt_value_applicator(apply_day_on_or_before_operator),
+    "onOrAfter": adapt_value_applicator(apply_day_on_or_after_operator),
+}
+
+
+def get_date_operators(
+    granularity: DateGranularity,
+) -> Mapping[str, OperatorApplicator]:
+    """Retrieves the applicators of the date operators for a date granularity.
+
+    Args:
+        granularity (DateGranularity): "exact" compares the column to the date and
+            time being filtered, while "day" compares the column to the whole day.
+
+    Raises:
+        ValueError: Raised when the granularity is not supported.
+
+    Returns:
+        Mapping[str, OperatorApplicator]: The date operator applicators, which are
+            empty when the registered applicators are used.
+    """
+    if granularity == "exact":
+        return {}
+    if granularity == "day":
+        return DAY_GRANULARITY_OPERATORS
+    raise ValueError(f"Unsupported date granularity {granularity}")
+
+
+def _apply_case_folded(
+    operator: StringOperator, case_folding: ColumnCaseFolding
+) -> OperatorApplicator:
+    """Creates the applicator of a string operator using a case folding strategy.
+
+    Args:
+        operator (StringOperator): The string operator, such as "contains".
+        case_folding (ColumnCaseFolding): The case folding strategy, or the
+            strategies by field, where fields without a strategy are case-sensitive.
+
+    Returns:
+        OperatorApplicator: The applicator accepting the column and the filter item.
+    """
+
+    def apply(column: Any, item: GridFilterItem) -> Any:
+        """Applies the operator using the case folding strategy of the item's field."""
+        strategy = (
+            case_folding
+            if isinstance(case_folding, str)
+            else case_folding.get(item.column_field, "sensitive")
+        )
+        return apply_case_folded_operator(column, item.value, operator, strategy)
+
+    return apply
+
+
+def get_case_folding_operators(
+    case_folding: ColumnCaseFolding,
+) -> Mapping[str, OperatorApplicator]:
+    """Retrieves the applicators of the string operators for a case folding strategy.
+
+    Args:
+        case_folding (ColumnCaseFolding): The case folding strategy of every column,
+            such as "lower", or the strategies by field, such as
+            `{"name": "lower", "email": "citext"}`. Fields without a strategy are
+            compared case-sensitively.
+
+    Raises:
+        ValueError: Raised when a strategy is not supported.
+
+    Returns:
+        Mapping[str, OperatorApplicator]: The contains, startsWith, and endsWith
+            applicators, which are empty when the registered applicators are used.
+    """
+    strategies = (
+        [case_folding] if isinstance(case_folding, str) else case_folding.values()
+    )
+    for strategy in strategies:
+        validate_case_folding(strategy)
+    if all(strategy in UNCHANGED_CASE_FOLDINGS for strategy in strategies):
+        return {}
+    return {
+        "contains": _apply_case_folded("contains", case_folding),
+        "startsWith": _apply_case_folded("startsWith", case_folding),
+        "endsWith": _apply_case_folded("endsWith", case_folding),
+    }
+
+
+def register_operator(
+    name: str, applicator: OperatorApplicator, replace: bool = False
+) -> None:
+    """Registers the applicator of a filter operator.
+
+    Args:
+        name (str): The operator value, as sent by the data grid.
+        applicator (OperatorApplicator): The function receiving the resolved column
+            and the filter item, which returns the filter clause.
+        replace (bool, optional): True to replace an operator which is already
+            registered. Defaults to False.
+
+    Raises:
+        ValueError: Raised when the operator is already registered and replace is
+            False.
+    """
+    if name in OPERATOR_REGISTRY and not replace:
+        raise ValueError(f"The operator {name} is already registered")
+    OPERATOR_REGISTRY[name] = applicator
+
+
+def get_operator_applicator(
+    name: Optional[str], operators: Optional[Mapping[str, OperatorApplicator]] = None
+) -> OperatorApplicator:
+    """Retrieves the applicator of a filter operator.
+
+    Args:
+        name (Optional[str]): The operator value of the filter item.
+        operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+            applicators which take precedence over the registered applicators, such as
+            those specific to a single endpoint. Defaults to None.
+
+    Raises:
+        ValueError: Raised when the operator is not supported.
+
+    Returns:
+        OperatorApplicator: The applicator of the operator.
+    """
+    applicator = None
+    if name is not None:
+        if operators is not None:
+            applicator = operators.get(name)
+        if applicator is None:
+            applicator = OPERATOR_REGISTRY.get(name)
+    if applicator is None:
+        raise ValueError(f"Unsupported operator {name}")
+    return applicator
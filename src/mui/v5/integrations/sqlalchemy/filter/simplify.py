@@ -0,0 +1,533 @@
+"""The simplify module removes redundant and contradictory filter items.
+
+Users build filter panels with overlapping items, such as `id > 5` and `id > 10`, or
+an isEmpty and isNotEmpty pair for the same column. Each item becomes a predicate in
+the statement, so redundant items make the statement larger and harder for the
+database to plan, while contradictory items match no rows at all.
+
+The items of each column are combined according to the filter model's link operator:
+
+    and: id > 5, id > 10, id < 20             ->  id > 10, id < 20
+    and: id isAnyOf [1, 2, 3], id != 2         ->  id isAnyOf [1, 3]
+    and: id isEmpty, id isNotEmpty             ->  no rows
+    or:  id = 1, id isAnyOf [2, 3]             ->  id isAnyOf [1, 2, 3]
+    or:  id isEmpty, id isNotEmpty             ->  every row
+
+The bounds and values of numbers are compared, as the database compares them the same
+way, while strings are not, as their comparison depends on the column's collation.
+Items are simplified according to the semantics of the built-in applicators, so
+custom applicators for the basic, isAnyOf, isEmpty, and isNotEmpty operators must
+keep those semantics for the simplified model to match the same rows.
+
+The items of fields which may match a different related row for each item, such as
+those traversing a to-many relationship, can't be combined, so they may be skipped.
+"""
+from math import isnan
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from mui.v5.grid import (
+    GridFilterItem,
+    GridFilterModel,
+    GridLinkOperator,
+    normalize_operator_value,
+)
+
+_Bound = Tuple[Any, bool]
+
+_LOWER_BOUND_OPERATORS = frozenset((">", ">="))
+_UPPER_BOUND_OPERATORS = frozenset(("<", "<="))
+# the operators which never match a NULL, as long as their value isn't None
+_NULL_REJECTING_OPERATORS = frozenset(
+    ("=", "!=", ">", ">=", "<", "<=", "isAnyOf", "contains", "startsWith", "endsWith")
+)
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a value is a number which the database compares the same way.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: True if the value is an integer or float, excluding booleans and NaN.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return not (isinstance(value, float) and isnan(value))
+
+
+def _is_scalar(value: Any) -> bool:
+    """Whether a value may be combined into an isAnyOf item's values.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: True if the value is a number or a string, otherwise False.
+    """
+    return _is_number(value) or isinstance(value, str)
+
+
+def _is_any_of_values(item: GridFilterItem) -> Optional[List[Any]]:
+    """Retrieves the values of an isAnyOf item, if they're scalars.
+
+    Args:
+        item (GridFilterItem): The isAnyOf item.
+
+    Returns:
+        Optional[List[Any]]: The values, or None if any value isn't a scalar.
+    """
+    value = item.value
+    if value is None:
+        return []
+    if not isinstance(value, (list, tuple)):
+        return None
+    values: List[Any] = list(value)
+    return values if all(_is_scalar(v) for v in values) else None
+
+
+def _create_item(
+    column_field: str, operator_value: str, value: Any = None
+) -> GridFilterItem:
+    """Creates a simplified filter item.
+
+    Args:
+        column_field (str): The column being filtered.
+        operator_value (str): The canonical operator.
+        value (Any, optional): The filter value. Defaults to None.
+
+    Returns:
+        GridFilterItem: The filter item.
+    """
+    # the values come from validated items, so they aren't validated a second time
+    return GridFilterItem.construct(
+        _fields_set={"column_field", "id", "operator_value", "value"},
+        column_field=column_field,
+        id=None,
+        operator_value=operator_value,
+        value=value,
+    )
+
+
+def _create_values_item(column_field: str, values: List[Any]) -> GridFilterItem:
+    """Creates an equality or isAnyOf item matching any of the values.
+
+    Args:
+        column_field (str): The column being filtered.
+        values (List[Any]): The values, which must not be empty.
+
+    Returns:
+        GridFilterItem: An equality item if there's a single value, otherwise an
+            isAnyOf item.
+    """
+    if len(values) == 1:
+        return _create_item(column_field, "=", values[0])
+    return _create_item(column_field, "isAnyOf", values)
+
+
+def _unique(values: List[Any]) -> List[Any]:
+    """Removes the duplicate values, keeping the first occurrence of each.
+
+    Args:
+        values (List[Any]): The values.
+
+    Returns:
+        List[Any]: The unique values. Values which are equal but of a different type,
+            such as 1 and "1", are both kept.
+    """
+    unique: Dict[Tuple[str, Any], Any] = {}
+    for value in values:
+        unique.setdefault((type(value).__name__, value), value)
+    return list(unique.values())
+
+
+def _deduplicate(items: List[GridFilterItem]) -> List[GridFilterItem]:
+    """Removes the repeated items, which don't change which rows match.
+
+    Args:
+        items (List[GridFilterItem]): The filter items.
+
+    Returns:
+        List[GridFilterItem]: The unique filter items, ignoring their identifiers.
+    """
+    unique: Dict[Tuple[str, Optional[str], str], GridFilterItem] = {}
+    for item in items:
+        key = (item.column_field, _get_operator_value(item), repr(item.value))
+        unique.setdefault(key, item)
+    return list(unique.values())
+
+
+def _tighter_lower(bound: Optional[_Bound], other: _Bound) -> _Bound:
+    """The more restrictive of two lower bounds."""
+    if bound is None or other[0] > bound[0]:
+        return other
+    if other[0] == bound[0]:
+        return (bound[0], bound[1] and other[1])
+    return bound
+
+
+def _tighter_upper(bound: Optional[_Bound], other: _Bound) -> _Bound:
+    """The more restrictive of two upper bounds."""
+    if bound is None or other[0] < bound[0]:
+        return other
+    if other[0] == bound[0]:
+        return (bound[0], bound[1] and other[1])
+    return bound
+
+
+def _looser_lower(bound: Optional[_Bound], other: _Bound) -> _Bound:
+    """The less restrictive of two lower bounds."""
+    if bound is None or other[0] < bound[0]:
+        return other
+    if other[0] == bound[0]:
+        return (bound[0], bound[1] or other[1])
+    return bound
+
+
+def _looser_upper(bound: Optional[_Bound], other: _Bound) -> _Bound:
+    """The less restrictive of two upper bounds."""
+    if bound is None or other[0] > bound[0]:
+        return other
+    if other[0] == bound[0]:
+        return (bound[0], bound[1] or other[1])
+    return bound
+
+
+def _within(value: Any, lower: Optional[_Bound], upper: Optional[_Bound]) -> bool:
+    """Whether a value satisfies the bounds.
+
+    Args:
+        value (Any): The number.
+        lower (Optional[_Bound]): The lower bound and whether it's inclusive.
+        upper (Optional[_Bound]): The upper bound and whether it's inclusive.
+
+    Returns:
+        bool: True if the value is within the bounds, otherwise False.
+    """
+    if lower is not None and (value < lower[0] or (value == lower[0] and not lower[1])):
+        return False
+    if upper is not None and (value > upper[0] or (value == upper[0] and not upper[1])):
+        return False
+    return True
+
+
+def _bound_item(column_field: str, bound: _Bound, lower: bool) -> GridFilterItem:
+    """Creates the item of a bound.
+
+    Args:
+        column_field (str): The column being filtered.
+        bound (_Bound): The bound and whether it's inclusive.
+        lower (bool): True if it's a lower bound, otherwise False.
+
+    Returns:
+        GridFilterItem: The comparison item.
+    """
+    operator_value = (">" if lower else "<") + ("=" if bound[1] else "")
+    return _create_item(column_field, operator_value, bound[0])
+
+
+def _rejects_null(operator_value: Optional[str]) -> bool:
+    """Whether an item never matches a NULL.
+
+    Args:
+        operator_value (Optional[str]): The item's canonical operator.
+
+    Returns:
+        bool: True if the item's operator never matches a NULL, otherwise False.
+    """
+    return operator_value in _NULL_REJECTING_OPERATORS
+
+
+def _get_operator_value(item: GridFilterItem) -> Optional[str]:
+    """Retrieves the canonical operator of an item.
+
+    Comparing a column to None using the equality operators checks whether the column
+    is NULL, so these are converted into isEmpty and isNotEmpty.
+
+    Args:
+        item (GridFilterItem): The filter item.
+
+    Returns:
+        Optional[str]: The canonical operator.
+    """
+    operator_value = normalize_operator_value(item.operator_value)
+    if item.value is None and operator_value == "=":
+        return "isEmpty"
+    if item.value is None and operator_value == "!=":
+        return "isNotEmpty"
+    return operator_value
+
+
+class _AndColumn:
+    """The items of a single column, linked using and."""
+
+    def __init__(self, column_field: str) -> None:
+        """Initialize a new column of items linked using and, without any items.
+
+        Args:
+            column_field (str): The column field of the items.
+        """
+        self.column_field = column_field
+        # the items which aren't simplified
+        self.items: List[GridFilterItem] = []
+        self.is_empty = False
+        self.is_not_empty = False
+        self.rejects_null = False
+        self.unsatisfiable = False
+        self.lower: Optional[_Bound] = None
+        self.upper: Optional[_Bound] = None
+        # the numbers the column must be one of, if there are equality items
+        self.allowed: Optional[List[Any]] = None
+        self.excluded: List[Any] = []
+
+    def add(self, item: GridFilterItem, operator_value: Optional[str]) -> None:
+        """Combines an item with the column's previous items.
+
+        Args:
+            item (GridFilterItem): The filter item.
+            operator_value (Optional[str]): The item's canonical operator.
+        """
+        value = item.value
+        values = _is_any_of_values(item) if operator_value == "isAnyOf" else None
+        if operator_value == "isEmpty":
+            self.is_empty = True
+        elif operator_value == "isNotEmpty":
+            self.is_not_empty = True
+        elif values is not None and len(values) == 0:
+            # an empty isAnyOf matches no rows
+            self.unsatisfiable = True
+        elif values is not None and all(_is_number(v) for v in values):
+            self._allow(values)
+        elif operator_value == "=" and _is_number(value):
+            self._allow([value])
+        elif operator_value == "!=" and _is_number(value):
+            self.excluded.append(value)
+        elif operator_value in _LOWER_BOUND_OPERATORS and _is_number(value):
+            self.lower = _tighter_lower(self.lower, (value, operator_value == ">="))
+        elif operator_value in _UPPER_BOUND_OPERATORS and _is_number(value):
+            self.upper = _tighter_upper(self.upper, (value, operator_value == "<="))
+        else:
+            self.rejects_null = self.rejects_null or _rejects_null(operator_value)
+            self.items.append(item)
+
+    def _allow(self, values: List[Any]) -> None:
+        """Restricts the column to the values.
+
+        Args:
+            values (List[Any]): The numbers the column must be one of.
+        """
+        if self.allowed is None:
+            self.allowed = _unique(values)
+        else:
+            self.allowed = [v for v in self.allowed if v in values]
+
+    def simplify(self) -> Optional[List[GridFilterItem]]:
+        """Builds the simplified items of the column.
+
+        Returns:
+            Optional[List[GridFilterItem]]: The simplified items, or None if the
+                items match no rows.
+        """
+        lower, upper = self.lower, self.upper
+        # every comparison rejects NULL, which implies isNotEmpty
+        compared = (
+            lower is not None
+            or upper is not None
+            or self.allowed is not None
+            or len(self.excluded) > 0
+            or self.rejects_null
+        )
+        if self.unsatisfiable:
+            return None
+        if self.is_empty:
+            if self.is_not_empty or compared:
+                return None
+            return [_create_item(self.column_field, "isEmpty"), *self.items]
+        items: List[GridFilterItem] = []
+        if self.allowed is not None:
+            allowed = [
+                v
+                for v in self.allowed
+                if _within(v, lower, upper) and v not in self.excluded
+            ]
+            if len(allowed) == 0:
+                return None
+            items.append(_create_values_item(self.column_field, allowed))
+        elif lower is not None and upper is not None and lower[0] >= upper[0]:
+            if lower[0] > upper[0] or not (lower[1] and upper[1]):
+                return None
+            if lower[0] in self.excluded:
+                return None
+            items.append(_create_item(self.column_field, "=", lower[0]))
+        else:
+            if lower is not None:
+                items.append(_bound_item(self.column_field, lower, lower=True))
+            if upper is not None:
+                items.append(_bound_item(self.column_field, upper, lower=False))
+            items.extend(
+                _create_item(self.column_field, "!=", value)
+                for value in _unique(self.excluded)
+                if _within(value, lower, upper)
+            )
+        if self.is_not_empty and not compared:
+            items.append(_create_item(self.column_field, "isNotEmpty"))
+        return items + self.items
+
+
+class _OrColumn:
+    """The items of a single column, linked using or."""
+
+    def __init__(self, column_field: str) -> None:
+        """Initialize a new column of items linked using or, without any items.
+
+        Args:
+            column_field (str): The column field of the items.
+        """
+        self.column_field = column_field
+        # the items which aren't simplified
+        self.items: List[GridFilterItem] = []
+        self.is_empty = False
+        self.is_not_empty = False
+        self.lower: Optional[_Bound] = None
+        self.upper: Optional[_Bound] = None
+        # the values the column may be one of, if there are equality items
+        self.values: Optional[List[Any]] = None
+
+    def add(self, item: GridFilterItem, operator_value: Optional[str]) -> None:
+        """Combines an item with the column's previous items.
+
+        Args:
+            item (GridFilterItem): The filter item.
+            operator_value (Optional[str]): The item's canonical operator.
+        """
+        value = item.value
+        values = _is_any_of_values(item) if operator_value == "isAnyOf" else None
+        if operator_value == "isEmpty":
+            self.is_empty = True
+        elif operator_value == "isNotEmpty":
+            self.is_not_empty = True
+        elif values is not None:
+            # an empty isAnyOf matches no rows, so it doesn't add any values
+            self.values = (self.values or []) + values
+        elif operator_value == "=" and _is_scalar(value):
+            self.values = (self.values or []) + [value]
+        elif operator_value in _LOWER_BOUND_OPERATORS and _is_number(value):
+            self.lower = _looser_lower(self.lower, (value, operator_value == ">="))
+        elif operator_value in _UPPER_BOUND_OPERATORS and _is_number(value):
+            self.upper = _looser_upper(self.upper, (value, operator_value == "<="))
+        else:
+            self.items.append(item)
+
+    def simplify(self) -> Optional[List[GridFilterItem]]:
+        """Builds the simplified items of the column.
+
+        Returns:
+            Optional[List[GridFilterItem]]: The simplified items, an empty list if the
+                items match every row, or None if the items match no rows.
+        """
+        lower, upper = self.lower, self.upper
+        if (
+            lower is not None
+            and upper is not None
+            and (
+                lower[0] < upper[0] or (lower[0] == upper[0] and (lower[1] or upper[1]))
+            )
+        ):
+            # the bounds overlap, so together they match every number
+            self.is_not_empty = True
+        if self.is_empty and self.is_not_empty:
+            return []
+        items: List[GridFilterItem] = []
+        if self.is_empty:
+            items.append(_create_item(self.column_field, "isEmpty"))
+        if self.is_not_empty:
+            # the items which reject NULL only match rows which isNotEmpty matches
+            items.append(_create_item(self.column_field, "isNotEmpty"))
+            items.extend(
+                item
+                for item in self.items
+                if not _rejects_null(_get_operator_value(item))
+            )
+            return items
+        if lower is not None:
+            items.append(_bound_item(self.column_field, lower, lower=True))
+        if upper is not None:
+            items.append(_bound_item(self.column_field, upper, lower=False))
+        if self.values is not None:
+            # the values matched by the bounds are redundant
+            values = [
+                v
+                for v in _unique(self.values)
+                if not (_is_number(v) and _within_either(v, lower, upper))
+            ]
+            if len(values) > 0:
+                items.append(_create_values_item(self.column_field, values))
+        items.extend(self.items)
+        return items if len(items) > 0 else None
+
+
+def _within_either(
+    value: Any, lower: Optional[_Bound], upper: Optional[_Bound]
+) -> bool:
+    """Whether a value satisfies either bound, which are linked using or.
+
+    Args:
+        value (Any): The number.
+        lower (Optional[_Bound]): The lower bound and whether it's inclusive.
+        upper (Optional[_Bound]): The upper bound and whether it's inclusive.
+
+    Returns:
+        bool: True if the value satisfies either bound, otherwise False.
+    """
+    return (lower is not None and _within(value, lower, None)) or (
+        upper is not None and _within(value, None, upper)
+    )
+
+
+def simplify_filter_model(
+    model: GridFilterModel, skip_field: Optional[Callable[[str], bool]] = None
+) -> Optional[GridFilterModel]:
+    """Merges and removes the redundant items of a grid filter model.
+
+    Args:
+        model (GridFilterModel): The grid filter model.
+        skip_field (Optional[Callable[[str], bool]], optional): Returns True for the
+            fields whose items are kept as they are, such as fields traversing a
+            to-many relationship, whose items each match any of the related rows.
+            None to simplify the items of every field. Defaults to None.
+
+    Returns:
+        Optional[GridFilterModel]: The simplified grid filter model, which has no
+            items if it matches every row, or None if it provably matches no rows.
+    """
+    if len(model.items) == 0:
+        return model
+    is_or = model.link_operator == GridLinkOperator.Or
+    columns: Dict[str, Union[_AndColumn, _OrColumn]] = {}
+    skipped: List[GridFilterItem] = []
+    for item in model.items:
+        if skip_field is not None and skip_field(item.column_field):
+            skipped.append(item)
+            continue
+        column = columns.get(item.column_field)
+        if column is None:
+            column = (
+                _OrColumn(item.column_field) if is_or else _AndColumn(item.column_field)
+            )
+            columns[item.column_field] = column
+        column.add(item, _get_operator_value(item))
+    items: List[GridFilterItem] = []
+    for column in columns.values():
+        simplified = column.simplify()
+        if simplified is None and not is_or:
+            # an and is unsatisfiable if any of its columns are
+            return None
+        if simplified is not None and len(simplified) == 0 and is_or:
+            # an or matches every row if any of its columns do
+            return model.copy(update={"items": []})
+        items.extend(simplified or [])
+    items.extend(skipped)
+    if is_or and len(items) == 0:
+        # an or is unsatisfiable if all of its columns are
+        return None
+    return model.copy(update={"items": _deduplicate(items)})
@@ -0,0 +1,195 @@
+"""The staging module moves large isAnyOf lists into temporary tables.
+
+Users frequently paste thousands of identifiers into an isAnyOf filter. As an `IN`
+clause, each identifier is a separate parameter, which exceeds SQLite's variable limit
+and is slow for other databases to parse and plan. Instead, the values are inserted
+into a temporary table using a single executemany, and the filter becomes a semi-join:
+
+    WHERE test_model.id IN (SELECT grid_is_any_of_<id>.value FROM grid_is_any_of_<id>)
+
+The temporary tables are created on the session's connection the first time they're
+needed, and are reused by every later request using the same connection. Each list
+of values is staged in a table of its own within a request, so a connection holds
+one table per value type and isAnyOf filter, rather than one per request. The
+previous values are deleted before new values are inserted, and on PostgreSQL, when
+the transaction is committed.
+"""
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+from uuid import uuid4
+
+from sqlalchemy import Column, MetaData, Table, literal, select
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.sqltypes import NullType
+
+from mui.v5.grid import GridFilterItem, GridFilterModel
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+
+# the connection's record of which staging holds each table's rows, and in which
+# transaction they were inserted
+_OWNERS_KEY = "mui_grid_is_any_of_owners"
+
+
+def _get_value_type(column: Any, values: Sequence[Any]) -> Any:
+    """Retrieves the type of the temporary table's value column.
+
+    Args:
+        column (Any): The column being filtered.
+        values (Sequence[Any]): The values being filtered.
+
+    Returns:
+        Any: The type of the column being filtered, or the type inferred from the
+            first value if the column is untyped.
+    """
+    column_type = getattr(column, "type", None)
+    if column_type is None or isinstance(column_type, NullType):
+        return literal(values[0]).type
+    return column_type
+
+
+class TemporaryTableStaging:
+    """The isAnyOf values staged in temporary tables.
+
+    Adding values only builds the selection which filters by them, so a query can be
+    built without executing any statements. The values are inserted when `stage()`
+    is called, which is repeated before each statement using the selections is
+    executed. It's a no-op while the tables still hold the values.
+
+    Attributes:
+        tables (List[Tuple[Table, Sequence[Any]]]): The tables, and the values they
+            hold, in the order they were added.
+    """
+
+    tables: List[Tuple[Table, Sequence[Any]]]
+
+    def __init__(self) -> None:
+        """Initialize a new, empty staging of isAnyOf values."""
+        self.tables = []
+        self._token = uuid4().hex
+
+    def add(self, column: Any, values: Sequence[Any]) -> Select:
+        """Adds values to stage in a temporary table.
+
+        Args:
+            column (Any): The column being filtered.
+            values (Sequence[Any]): The values being filtered. This must not be
+                empty.
+
+        Returns:
+            Select: The selection of the values from the temporary table.
+        """
+        value_type = _get_value_type(column=column, values=values)
+        digest = sha256(repr(value_type).encode("utf-8")).hexdigest()[:12]
+        # lists of the same type are staged in a table each, which is reused by the
+        # lists in the same position of later requests
+        slot = sum(1 for table, _ in self.tables if table.name.endswith(digest))
+        table = Table(
+            f"grid_is_any_of_{slot}_{digest}",
+            MetaData(),
+            Column("value", value_type),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DELETE ROWS",
+        )
+        self.tables.append((table, values))
+        return select(table.c.value)
+
+    def stage(self, session: Session) -> None:
+        """Inserts the values into the temporary tables, creating them if necessary.
+
+        The values of a table are only inserted if another staging used it since,
+        or they were inserted in a previous transaction.
+
+        Args:
+            session (Session): The session the filtered query is executed with.
+        """
+        if not self.tables:
+            return
+        connection = session.connection()
+        transaction = connection.get_transaction()
+        owners: Dict[str, Tuple[str, Any]] = connection.info.setdefault(_OWNERS_KEY, {})
+        for table, values in self.tables:
+            token, owner_transaction = owners.get(table.name, (None, None))
+            if token == self._token and owner_transaction is transaction:
+                continue
+            table.create(bind=connection, checkfirst=True)
+            connection.execute(table.delete())
+            # a list of parameters is sent as a single executemany
+            connection.execute(table.insert(), [{"value": value} for value in values])
+            owners[table.name] = (self._token, transaction)
+
+
+def stage_values_in_temporary_table(
+    session: Session, column: Any, values: Sequence[Any]
+) -> "Select":
+    """Inserts the values into a temporary table.
+
+    The table is reused by the next call staging values of the same type on the
+    session's connection, so the selection is only valid until then. Use a
+    `TemporaryTableStaging` to stage several lists at once.
+
+    Args:
+        session (Session): The session the filtered query is executed with.
+        column (Any): The column being filtered.
+        values (Sequence[Any]): The values being filtered. This must not be empty.
+
+    Returns:
+        Select: The selection of the values from the temporary table.
+    """
+    staging = TemporaryTableStaging()
+    selection = staging.add(column=column, values=values)
+    staging.stage(session=session)
+    return selection
+
+
+def stage_is_any_of_values(
+    query: "Query[Any]",
+    model: GridFilterModel,
+    resolver: Resolver,
+    threshold: int,
+    staging: Optional[TemporaryTableStaging] = None,
+) -> GridFilterModel:
+    """Moves the values of large isAnyOf filters into temporary tables.
+
+    Args:
+        query (Query[Any]): The query being filtered, whose session is used to create
+            the temporary tables.
+        model (GridFilterModel): The filter model being applied.
+        resolver (Resolver): A resolver to convert field names from the model to
+            SQLAlchemy column's or expressions.
+        threshold (int): The number of values above which they're moved into a
+            temporary table.
+        staging (Optional[TemporaryTableStaging], optional): The staging the values
+            are added to, which the caller stages before executing the query. None to
+            insert the values immediately. Defaults to None.
+
+    Raises:
+        ValueError: Raised when the threshold is negative.
+        ValueError: Raised when the query has no session.
+
+    Returns:
+        GridFilterModel: The filter model, or a copy where the values of large
+            isAnyOf filters are replaced with selections from temporary tables.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be a non-negative integer")
+    if query.session is None:
+        raise ValueError("A session is required to stage isAnyOf values")
+    pending = staging if staging is not None else TemporaryTableStaging()
+    items: List[GridFilterItem] = []
+    staged = False
+    for item in model.items:
+        if (
+            item.operator_value == "isAnyOf"
+            and isinstance(item.value, (list, tuple))
+            and len(item.value) > threshold
+        ):
+            selection = pending.add(
+                column=resolver(item.column_field), values=item.value
+            )
+            item = item.copy(update={"value": selection})
+            staged = True
+        items.append(item)
+    if staging is None:
+        pending.stage(session=cast(Session, query.session))
+    return model.copy(update={"items": items}) if staged else model
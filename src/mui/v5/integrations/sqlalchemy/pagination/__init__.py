@@ -1,6 +1,26 @@
 from mui.v5.integrations.sqlalchemy.pagination.apply_model import (
     apply_limit_offset_to_query_from_model,
+    apply_limit_offset_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.pagination.deferred import (
+    apply_deferred_join_to_query_from_model,
+    apply_deferred_join_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.pagination.keyset import (
+    apply_keyset_to_query_from_model,
+    apply_keyset_to_select_from_model,
+    get_keyset_columns,
+    get_keyset_predicate,
 )
 
 # isort: unique-list
-__all__ = ["apply_limit_offset_to_query_from_model"]
+__all__ = [
+    "apply_deferred_join_to_query_from_model",
+    "apply_deferred_join_to_select_from_model",
+    "apply_keyset_to_query_from_model",
+    "apply_keyset_to_select_from_model",
+    "apply_limit_offset_to_query_from_model",
+    "apply_limit_offset_to_select_from_model",
+    "get_keyset_columns",
+    "get_keyset_predicate",
+]
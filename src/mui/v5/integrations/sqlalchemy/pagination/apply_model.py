@@ -2,22 +2,47 @@
 from typing import TypeVar
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from mui.v5.grid import GridPaginationModel
 
 T = TypeVar("T")
+_S = TypeVar("_S", Select, CompoundSelect)
 
 
 def apply_limit_offset_to_query_from_model(
-    query: "Query[T]", model: GridPaginationModel
+    query: "Query[T]", model: GridPaginationModel, lookahead: bool = False
 ) -> "Query[T]":
     """Applies the limit and offset to a SQLAlchemy query from a pagination model.
 
     Args:
         query (Query[T]): The SQLAlchemy query to apply the pagination model to.
         model (GridPaginationModel): The GridPaginationModel to apply to the query.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
 
     Returns:
         Query[T]: The SQLAlchemy query which has had the limit and offset applied.
     """
-    return query.limit(model.page_size).offset(model.offset)
+    limit = model.page_size + 1 if lookahead else model.page_size
+    return query.limit(limit).offset(model.offset)
+
+
+def apply_limit_offset_to_select_from_model(
+    statement: _S, model: GridPaginationModel, lookahead: bool = False
+) -> _S:
+    """Applies the limit and offset to a 2.0 style select statement from a pagination
+    model.
+
+    Args:
+        statement (_S): The select or compound select statement to apply the
+            pagination model to.
+        model (GridPaginationModel): The GridPaginationModel to apply to the statement.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
+
+    Returns:
+        _S: The statement which has had the limit and offset applied.
+    """
+    limit = model.page_size + 1 if lookahead else model.page_size
+    return statement.limit(limit).offset(model.offset)
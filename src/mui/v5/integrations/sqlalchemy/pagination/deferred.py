@@ -0,0 +1,183 @@
+"""The deferred module applies deferred join pagination to a query.
+
+At deep offsets, `LIMIT` / `OFFSET` forces the database to build every skipped row in
+full before discarding it. For wide rows this is expensive. A deferred join instead
+locates the page using only the key columns, which can frequently be satisfied by an
+index-only scan, and then joins back to the full rows for just the keys on the page:
+
+    SELECT wide.* FROM wide JOIN (
+        SELECT id FROM wide WHERE ... ORDER BY ... LIMIT :limit OFFSET :offset
+    ) AS page ON wide.id = page.id
+    ORDER BY ...
+"""
+from typing import Any, Sequence, TypeVar
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import Select
+
+from mui.v5.grid import GridPaginationModel, GridSortModel
+from mui.v5.integrations.sqlalchemy.pagination.apply_model import (
+    apply_limit_offset_to_query_from_model,
+    apply_limit_offset_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.sort import (
+    apply_sort_to_query_from_model,
+    apply_sort_to_select_from_model,
+)
+
+T = TypeVar("T")
+
+
+def _order_by_model_and_keys(
+    query: "Query[T]",
+    sort_model: GridSortModel,
+    resolver: Resolver,
+    keys: Sequence[Any],
+) -> "Query[T]":
+    """Orders a query by the sort model, followed by the key columns.
+
+    The keys are appended so that rows which share the same sort values are always
+    returned in the same order, by both the key query and the joined query.
+
+    Args:
+        query (Query[T]): The query to order.
+        sort_model (GridSortModel): The sort model to order the query by.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        keys (Sequence[Any]): The columns which uniquely identify a row.
+
+    Returns:
+        Query[T]: The ordered query.
+    """
+    query = apply_sort_to_query_from_model(
+        query=query, model=sort_model, resolver=resolver
+    )
+    return query.order_by(*keys)
+
+
+def _order_select_by_model_and_keys(
+    statement: Select,
+    sort_model: GridSortModel,
+    resolver: Resolver,
+    keys: Sequence[Any],
+) -> Select:
+    """Orders a select statement by the sort model, followed by the key columns.
+
+    Args:
+        statement (Select): The statement to order.
+        sort_model (GridSortModel): The sort model to order the statement by.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        keys (Sequence[Any]): The columns which uniquely identify a row.
+
+    Returns:
+        Select: The ordered statement.
+    """
+    statement = apply_sort_to_select_from_model(
+        statement=statement, model=sort_model, resolver=resolver
+    )
+    return statement.order_by(*keys)
+
+
+def apply_deferred_join_to_query_from_model(
+    query: "Query[T]",
+    sort_model: GridSortModel,
+    pagination_model: GridPaginationModel,
+    resolver: Resolver,
+    keys: Sequence[Any],
+    lookahead: bool = False,
+) -> "Query[T]":
+    """Applies deferred join pagination to a SQLAlchemy query.
+
+    The filtered query is reduced to the key columns, which are sorted and paginated
+    as a subquery. The query is then joined to the subquery, so that only the rows on
+    the page are loaded, and re-sorted to keep the order of the page. The query must
+    not have been ordered or paginated yet.
+
+    Args:
+        query (Query[T]): The filtered SQLAlchemy query to paginate.
+        sort_model (GridSortModel): The sort model to order the query by.
+        pagination_model (GridPaginationModel): The pagination model to apply.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        keys (Sequence[Any]): The columns which uniquely identify a row, such as the
+            primary key.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
+
+    Raises:
+        ValueError: Raised when no key columns are provided.
+
+    Returns:
+        Query[T]: The query of the rows on the page, in order.
+    """
+    if len(keys) == 0:
+        raise ValueError("At least one key column is required for a deferred join")
+    key_query = _order_by_model_and_keys(
+        query=query.with_entities(*keys),
+        sort_model=sort_model,
+        resolver=resolver,
+        keys=keys,
+    )
+    page = apply_limit_offset_to_query_from_model(
+        query=key_query, model=pagination_model, lookahead=lookahead
+    ).subquery()
+    query = query.join(
+        page, and_(*(key == page_key for key, page_key in zip(keys, page.c)))
+    )
+    return _order_by_model_and_keys(
+        query=query, sort_model=sort_model, resolver=resolver, keys=keys
+    )
+
+
+def apply_deferred_join_to_select_from_model(
+    statement: Select,
+    sort_model: GridSortModel,
+    pagination_model: GridPaginationModel,
+    resolver: Resolver,
+    keys: Sequence[Any],
+    lookahead: bool = False,
+) -> Select:
+    """Applies deferred join pagination to a 2.0 style select statement.
+
+    The filtered statement is reduced to the key columns, which are sorted and
+    paginated as a subquery. The statement is then joined to the subquery, so that
+    only the rows on the page are loaded, and re-sorted to keep the order of the page.
+    The statement must not have been ordered or paginated yet.
+
+    Args:
+        statement (Select): The filtered select statement to paginate.
+        sort_model (GridSortModel): The sort model to order the statement by.
+        pagination_model (GridPaginationModel): The pagination model to apply.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        keys (Sequence[Any]): The columns which uniquely identify a row, such as the
+            primary key.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
+
+    Raises:
+        ValueError: Raised when no key columns are provided.
+
+    Returns:
+        Select: The statement of the rows on the page, in order.
+    """
+    if len(keys) == 0:
+        raise ValueError("At least one key column is required for a deferred join")
+    key_statement = _order_select_by_model_and_keys(
+        statement=statement.with_only_columns(*keys),
+        sort_model=sort_model,
+        resolver=resolver,
+        keys=keys,
+    )
+    page = apply_limit_offset_to_select_from_model(
+        statement=key_statement, model=pagination_model, lookahead=lookahead
+    ).subquery()
+    statement = statement.join(
+        page, and_(*(key == page_key for key, page_key in zip(keys, page.c)))
+    )
+    return _order_select_by_model_and_keys(
+        statement=statement, sort_model=sort_model, resolver=resolver, keys=keys
+    )
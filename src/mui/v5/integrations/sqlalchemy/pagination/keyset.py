@@ -0,0 +1,320 @@
+"""The keyset module applies keyset (seek) pagination to a query.
+
+Rather than skipping `OFFSET` rows, which forces the database to scan and discard every
+row before the requested page, keyset pagination filters the query to the rows that
+sort after the last row the client has seen:
+
+    WHERE (sort_columns, tie_breaker) > (:last_seen_values, :last_seen_tie_breaker)
+
+This allows the database to seek directly to the page using an index, so the cost of
+a page does not grow with its depth.
+
+A comparison with NULL is never true, so nullable columns are pinned to sort their
+NULLs last in ascending order, and first in descending order, and the predicate
+matches the NULLs which sort after the last row explicitly.
+"""
+from operator import eq, gt, lt
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import and_, asc, desc, false, nulls_first, nulls_last, or_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import Select
+
+from mui.v5.grid import (
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortModel,
+    decode_cursor,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+
+T = TypeVar("T")
+_K = TypeVar("_K", "Query[Any]", Select)
+
+KeysetColumn = Tuple[Any, GridSortDirection]
+
+
+def get_keyset_columns(
+    sort_model: GridSortModel, resolver: Resolver, tie_breakers: Sequence[Any]
+) -> List[KeysetColumn]:
+    """Retrieves the columns, and their directions, which make up the keyset.
+
+    The keyset is made up of each sorted column in the sort model, followed by the
+    tie-breaker columns. The tie-breakers must uniquely identify a row, such as the
+    primary key, to ensure that rows sharing sort values are not skipped or repeated.
+
+    Args:
+        sort_model (GridSortModel): The sort model being applied to the query.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        tie_breakers (Sequence[Any]): The columns which uniquely identify a row. These
+            are always sorted in ascending order.
+
+    Returns:
+        List[KeysetColumn]: The columns and directions, in order of precedence.
+    """
+    columns: List[KeysetColumn] = [
+        (resolver(item.field), item.sort)
+        for item in sort_model
+        # unsorted items do not contribute to the order of the rows
+        if item.sort is not None
+    ]
+    columns.extend((column, GridSortDirection.ASC) for column in tie_breakers)
+    return columns
+
+
+def _is_nullable(column: Any) -> bool:
+    """Whether a keyset column may contain NULL values.
+
+    Args:
+        column (Any): The keyset column.
+
+    Returns:
+        bool: False if the column is declared NOT NULL, such as a primary key,
+            otherwise True. Expressions other than columns are assumed to be nullable.
+    """
+    expression = getattr(column, "expression", column)
+    return getattr(expression, "nullable", True) is not False
+
+
+def _get_order_by_expression(column: Any, direction: GridSortDirection) -> Any:
+    """Builds the order by expression of a keyset column.
+
+    Args:
+        column (Any): The keyset column.
+        direction (GridSortDirection): The direction the column is sorted in.
+
+    Returns:
+        Any: The expression, with the position of NULLs pinned if the column is
+            nullable.
+    """
+    if direction == GridSortDirection.DESC:
+        expression = desc(column)
+        return nulls_first(expression) if _is_nullable(column) else expression
+    expression = asc(column)
+    return nulls_last(expression) if _is_nullable(column) else expression
+
+
+def _get_equality_clause(column: Any, value: Any) -> Any:
+    """Builds the clause locating the rows which share the value of a keyset column.
+
+    Args:
+        column (Any): The keyset column.
+        value (Any): The value of the column in the last row that was seen.
+
+    Returns:
+        Any: The clause for use in SQLAlchemy queries.
+    """
+    return column.is_(None) if value is None else eq(column, value)
+
+
+def _get_successor_clause(
+    column: Any, direction: GridSortDirection, value: Any, nullable: bool
+) -> Any:
+    """Builds the clause locating the rows whose value of a keyset column sorts after
+    the value of the last row that was seen.
+
+    Args:
+        column (Any): The keyset column.
+        direction (GridSortDirection): The direction the column is sorted in.
+        value (Any): The value of the column in the last row that was seen.
+        nullable (bool): Whether the column may contain NULL values.
+
+    Returns:
+        Any: The clause for use in SQLAlchemy queries.
+    """
+    descending = direction == GridSortDirection.DESC
+    if value is None:
+        # the NULLs sort last in ascending order, and first in descending order
+        return column.isnot(None) if descending else false()
+    if descending:
+        return lt(column, value)
+    return or_(gt(column, value), column.is_(None)) if nullable else gt(column, value)
+
+
+def get_keyset_predicate(columns: Sequence[KeysetColumn], values: Sequence[Any]) -> Any:
+    """Builds the predicate locating the rows which sort after the provided values.
+
+    When every column is sorted in the same direction, and none are nullable, a row
+    value comparison is used as it is the most index-friendly form. Otherwise, the
+    comparison is expanded:
+
+        (a > :a) OR (a = :a AND b < :b) OR (a = :a AND b = :b AND c > :c)
+
+    The NULLs of nullable columns are treated as sorting after every other value,
+    matching the order of `apply_keyset_to_query_from_model()`.
+
+    Args:
+        columns (Sequence[KeysetColumn]): The keyset columns and their directions.
+        values (Sequence[Any]): The values of the keyset columns from the last row
+            that was seen by the client.
+
+    Raises:
+        ValueError: Raised when the number of values does not match the number of
+            keyset columns.
+
+    Returns:
+        Any: The predicate for use in SQLAlchemy queries.
+    """
+    if len(columns) != len(values):
+        raise ValueError("The cursor does not match the keyset columns")
+    nullable = [_is_nullable(column) for column, _ in columns]
+    directions = {direction for _, direction in columns}
+    if len(directions) == 1 and not any(nullable):
+        comparator = lt if GridSortDirection.DESC in directions else gt
+        return comparator(tuple_(*(column for column, _ in columns)), tuple_(*values))
+    clauses: List[Any] = []
+    for index, (column, direction) in enumerate(columns):
+        equalities = [
+            _get_equality_clause(column=previous_column, value=previous_value)
+            for (previous_column, _), previous_value in zip(
+                columns[:index], values[:index]
+            )
+        ]
+        successors = _get_successor_clause(
+            column=column,
+            direction=direction,
+            value=values[index],
+            nullable=nullable[index],
+        )
+        clauses.append(and_(*equalities, successors))
+    return or_(*clauses)
+
+
+def apply_keyset_to_query_from_model(
+    query: "Query[T]",
+    sort_model: GridSortModel,
+    pagination_model: GridPaginationModel,
+    resolver: Resolver,
+    tie_breakers: Sequence[Any],
+    cursor: Optional[str] = None,
+    lookahead: bool = False,
+) -> "Query[T]":
+    """Applies keyset pagination to a SQLAlchemy query.
+
+    This orders the query by the keyset columns, seeks past the row represented by the
+    cursor (if any), and limits the query to a single page. The query must not have
+    been ordered yet.
+
+    Args:
+        query (Query[T]): The filtered SQLAlchemy query to paginate.
+        sort_model (GridSortModel): The sort model to order the query by.
+        pagination_model (GridPaginationModel): The pagination model providing the
+            page size, and the cursor if one was not explicitly provided.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        tie_breakers (Sequence[Any]): The columns which uniquely identify a row.
+        cursor (Optional[str], optional): The cursor returned with the previous page.
+            Defaults to the pagination model's cursor.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
+
+    Raises:
+        ValueError: Raised when the cursor is invalid or was created for a different
+            sort model.
+
+    Returns:
+        Query[T]: The ordered, seeked, and limited query.
+    """
+    return _seek(
+        query=query,
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        resolver=resolver,
+        tie_breakers=tie_breakers,
+        cursor=cursor,
+        lookahead=lookahead,
+    )
+
+
+def apply_keyset_to_select_from_model(
+    statement: Select,
+    sort_model: GridSortModel,
+    pagination_model: GridPaginationModel,
+    resolver: Resolver,
+    tie_breakers: Sequence[Any],
+    cursor: Optional[str] = None,
+    lookahead: bool = False,
+) -> Select:
+    """Applies keyset pagination to a 2.0 style select statement.
+
+    This orders the statement by the keyset columns, seeks past the row represented by
+    the cursor (if any), and limits the statement to a single page. The statement must
+    not have been ordered yet.
+
+    Args:
+        statement (Select): The filtered select statement to paginate.
+        sort_model (GridSortModel): The sort model to order the statement by.
+        pagination_model (GridPaginationModel): The pagination model providing the
+            page size, and the cursor if one was not explicitly provided.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        tie_breakers (Sequence[Any]): The columns which uniquely identify a row.
+        cursor (Optional[str], optional): The cursor returned with the previous page.
+            Defaults to the pagination model's cursor.
+        lookahead (bool, optional): True to retrieve one additional row, which
+            indicates that another page exists. Defaults to False.
+
+    Raises:
+        ValueError: Raised when the cursor is invalid or was created for a different
+            sort model.
+
+    Returns:
+        Select: The ordered, seeked, and limited statement.
+    """
+    return _seek(
+        query=statement,
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        resolver=resolver,
+        tie_breakers=tie_breakers,
+        cursor=cursor,
+        lookahead=lookahead,
+    )
+
+
+def _seek(
+    query: _K,
+    sort_model: GridSortModel,
+    pagination_model: GridPaginationModel,
+    resolver: Resolver,
+    tie_breakers: Sequence[Any],
+    cursor: Optional[str],
+    lookahead: bool,
+) -> _K:
+    """Orders, seeks, and limits a query or select statement to a single page.
+
+    Args:
+        query (_K): The filtered query or select statement to paginate.
+        sort_model (GridSortModel): The sort model to order the query by.
+        pagination_model (GridPaginationModel): The pagination model providing the
+            page size, and the cursor if one was not explicitly provided.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+        tie_breakers (Sequence[Any]): The columns which uniquely identify a row.
+        cursor (Optional[str]): The cursor returned with the previous page, or None
+            to use the pagination model's cursor.
+        lookahead (bool): True to retrieve one additional row.
+
+    Raises:
+        ValueError: Raised when the cursor is invalid or was created for a different
+            sort model.
+
+    Returns:
+        _K: The ordered, seeked, and limited query or select statement.
+    """
+    columns = get_keyset_columns(
+        sort_model=sort_model, resolver=resolver, tie_breakers=tie_breakers
+    )
+    cursor = cursor if cursor is not None else pagination_model.cursor
+    if cursor is not None:
+        values = decode_cursor(cursor=cursor, sort_model=sort_model)
+        query = query.filter(get_keyset_predicate(columns=columns, values=values))
+    query = query.order_by(
+        *[
+            _get_order_by_expression(column=column, direction=direction)
+            for column, direction in columns
+        ]
+    )
+    page_size = pagination_model.page_size
+    return query.limit(page_size + 1 if lookahead else page_size)
@@ -3,7 +3,8 @@
 A resolver is used to resolve a data grid column name to a column or other sortable or
 filterable SQLAlchemy model.
 """
+from mui.v5.integrations.sqlalchemy.resolver.mapper import MapperResolver
 from mui.v5.integrations.sqlalchemy.resolver.types import Resolver
 
 # isort: unique-list
-__all__ = ["Resolver"]
+__all__ = ["MapperResolver", "Resolver"]
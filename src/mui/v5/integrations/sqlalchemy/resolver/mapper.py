@@ -0,0 +1,478 @@
+"""The mapper module creates resolvers by inspecting a mapped class.
+
+Hand-written resolvers normalize and compare the field name against each attribute
+on every call. The mapper resolver instead inspects the mapped class once, and
+precomputes the attribute of every spelling of each field the data grid may send, so
+resolving a field is a single dictionary lookup:
+
+    >>> resolver = MapperResolver(ExampleModel, exclude=["password_hash"])
+    >>> resolver("groupNumber") is ExampleModel.group_number
+    True
+    >>> resolver("group_number") is resolver("groupnumber")
+    True
+
+Fields may also be dotted paths through the class's relationships, such as
+"parent.name". The related classes are aliased once per path, so that every query
+using the resolver shares the same aliases, and each relationship is joined at most
+once. To-one relationships are joined using `LEFT OUTER JOIN`, which can't duplicate
+or remove rows. The filters of to-many relationships are instead wrapped in `EXISTS`
+semi-joins, so that a row matching several related rows is still returned once:
+
+    SELECT child.* FROM child LEFT OUTER JOIN parent AS parent_1
+        ON parent_1.id = child.parent_id
+    WHERE parent_1.name = ? AND EXISTS (
+        SELECT 1 FROM child AS child_1
+        WHERE parent_1.id = child_1.parent_id AND child_1.category = ?
+    )
+"""
+from re import sub
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.hybrid import HYBRID_PROPERTY
+from sqlalchemy.orm import Query, aliased
+from sqlalchemy.orm.base import NOT_EXTENSION
+from sqlalchemy.sql import Select
+
+_J = TypeVar("_J", "Query[Any]", Select)
+
+
+def _to_camel_case(name: str) -> str:
+    """Converts a snake case name into camel case.
+
+    Args:
+        name (str): The name, such as "group_number".
+
+    Returns:
+        str: The camel case name, such as "groupNumber".
+    """
+    head, *tail = name.split("_")
+    return head + "".join(word[:1].upper() + word[1:] for word in tail)
+
+
+def _to_snake_case(name: str) -> str:
+    """Converts a camel case name into snake case.
+
+    Args:
+        name (str): The name, such as "groupNumber".
+
+    Returns:
+        str: The snake case name, such as "group_number".
+    """
+    return sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+
+
+def _compact(name: str) -> str:
+    """Converts a name into its case and separator insensitive form.
+
+    Args:
+        name (str): The name, such as "Group_Number".
+
+    Returns:
+        str: The compact name, such as "groupnumber".
+    """
+    return name.replace("_", "").lower()
+
+
+def _get_aliases(name: str) -> Tuple[str, ...]:
+    """Retrieves the spellings of an attribute's name which the data grid may send.
+
+    Args:
+        name (str): The attribute's name.
+
+    Returns:
+        Tuple[str, ...]: The camel case, snake case, lowercase, and compact aliases,
+            such as "groupNumber", "group_number", and "groupnumber".
+    """
+    return (_to_camel_case(name), _to_snake_case(name), name.lower(), _compact(name))
+
+
+class _Step(NamedTuple):
+    """A relationship traversed by a dotted field path.
+
+    Attributes:
+        path (Tuple[str, ...]): The attribute names leading to the related class, such
+            as `("parent",)`.
+        relationship (Any): The relationship attribute, of the mapped class or the
+            alias of the previous step.
+        target (Any): The alias of the related class.
+        to_many (bool): Whether the relationship relates a row to many rows.
+    """
+
+    path: Tuple[str, ...]
+    relationship: Any
+    target: Any
+    to_many: bool
+
+
+class _Path(NamedTuple):
+    """A resolved dotted field path.
+
+    Attributes:
+        attribute (Any): The attribute of the last related class's alias.
+        name (str): The dotted path of attribute names, such as "parent.name".
+        joins (Tuple[_Step, ...]): The leading to-one relationships, which are joined.
+        semi_joins (Tuple[_Step, ...]): The relationships following the first to-many
+            relationship, whose filters are wrapped in `EXISTS` semi-joins.
+    """
+
+    attribute: Any
+    name: str
+    joins: Tuple[_Step, ...]
+    semi_joins: Tuple[_Step, ...]
+
+
+class MapperResolver:
+    """A resolver of the attributes of a mapped class.
+
+    The columns, hybrid properties, and relationships of the class are resolvable,
+    using their attribute names, or the camel case, snake case, and lowercase aliases
+    of those names. Attribute names take precedence over the aliases of another
+    attribute. The attributes of related classes are resolvable using dotted paths,
+    such as "parent.name".
+
+    Attributes:
+        fields (Tuple[str, ...]): The names of the resolvable attributes.
+        max_depth (int): The maximum number of relationships in a dotted path.
+        model (Any): The mapped class.
+    """
+
+    fields: Tuple[str, ...]
+    max_depth: int
+    model: Any
+
+    def __init__(
+        self,
+        model: Any,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        aliases: Optional[Mapping[str, str]] = None,
+        max_depth: int = 2,
+    ) -> None:
+        """Initialize a new mapper resolver.
+
+        Args:
+            model (Any): The mapped class.
+            include (Optional[Iterable[str]], optional): The names of the only
+                attributes which are resolvable, or dotted paths of the only related
+                attributes, such as "parent.name". None to resolve every attribute.
+                Defaults to None.
+            exclude (Optional[Iterable[str]], optional): The names or dotted paths of
+                the attributes which aren't resolvable, such as sensitive columns.
+                Defaults to None.
+            aliases (Optional[Mapping[str, str]], optional): Additional field names,
+                mapped to the name of the attribute they resolve to, such as
+                `{"group": "group_number"}`. Defaults to None.
+            max_depth (int, optional): The maximum number of relationships in a
+                dotted path, which limits the aliases created for the paths sent by
+                clients. 0 to disable dotted paths. Defaults to 2.
+
+        Raises:
+            ValueError: Raised when an included, excluded, or aliased attribute isn't
+                an attribute of the mapped class, or its related classes.
+            ValueError: Raised when the maximum depth is negative.
+        """
+        if max_depth < 0:
+            raise ValueError("max_depth must be a non-negative integer")
+        attributes = self._get_attributes(model=model)
+        included = set(attributes if include is None else include)
+        excluded = set(exclude or ())
+        aliased_names = dict(aliases or {})
+        paths = {name for name in included | excluded if "." in name}
+        unknown = (included | excluded | set(aliased_names.values())) - set(attributes)
+        if unknown - paths:
+            raise ValueError(
+                f"{model.__name__} has no attributes named "
+                f"{', '.join(sorted(unknown - paths))}"
+            )
+        resolvable = {
+            name: attribute
+            for name, attribute in attributes.items()
+            if name in included and name not in excluded
+        }
+        names: Dict[str, str] = {}
+        for name in resolvable:
+            for alias in _get_aliases(name):
+                names.setdefault(alias, name)
+        # attribute names take precedence over the aliases of other attributes
+        names.update((name, name) for name in resolvable)
+        names.update(
+            (alias, name) for alias, name in aliased_names.items() if name in resolvable
+        )
+        self.model = model
+        self.fields = tuple(resolvable)
+        self.max_depth = max_depth
+        self._lookup = {alias: resolvable[name] for alias, name in names.items()}
+        self._compact_names = {_compact(alias): name for alias, name in names.items()}
+        self._compact_names.update((_compact(name), name) for name in resolvable)
+        self._resolvable = resolvable
+        self._included = None if include is None else included
+        self._excluded = excluded
+        self._aliases = aliased_names
+        self._lock = Lock()
+        self._paths: Dict[str, _Path] = {}
+        self._steps: Dict[Tuple[str, ...], _Step] = {}
+        self._related: Dict[Any, "MapperResolver"] = {}
+        for path in paths:
+            self._walk(field=path, check_depth=False)
+
+    @staticmethod
+    def _get_attributes(model: Any) -> Dict[str, Any]:
+        """Retrieves the resolvable attributes of a mapped class.
+
+        Args:
+            model (Any): The mapped class.
+
+        Returns:
+            Dict[str, Any]: The columns, hybrid properties, and relationships, by name.
+        """
+        mapper = inspect(model)
+        return {
+            name: getattr(model, name)
+            for name, descriptor in mapper.all_orm_descriptors.items()
+            if name != "__mapper__"
+            and (
+                descriptor.extension_type is HYBRID_PROPERTY
+                or (
+                    descriptor.extension_type is NOT_EXTENSION
+                    and descriptor.is_attribute
+                )
+            )
+        }
+
+    def _get_name(self, field: str) -> Optional[str]:
+        """Retrieves the name of the resolvable attribute a field resolves to.
+
+        Args:
+            field (str): The field name, in any spelling.
+
+        Returns:
+            Optional[str]: The attribute's name, or None if it isn't resolvable.
+        """
+        return self._compact_names.get(_compact(field))
+
+    def _get_related(self, model: Any) -> "MapperResolver":
+        """Retrieves the resolver of a related class's attribute names.
+
+        Args:
+            model (Any): The related mapped class.
+
+        Returns:
+            MapperResolver: The resolver of every attribute of the class.
+        """
+        related = self._related.get(model)
+        if related is None:
+            related = self._related[model] = MapperResolver(model, max_depth=0)
+        return related
+
+    def _walk(self, field: str, check_depth: bool = True) -> _Path:
+        """Resolves a dotted field path by walking the relationships it traverses.
+
+        The alias of each relationship path is created once, and reused by every path
+        traversing it.
+
+        Args:
+            field (str): The dotted field path, such as "parent.name".
+            check_depth (bool, optional): True to reject paths traversing more
+                relationships than the maximum depth. Defaults to True.
+
+        Raises:
+            ValueError: Raised when the path doesn't resolve to an attribute.
+
+        Returns:
+            _Path: The resolved path.
+        """
+        *segments, last = field.split(".")
+        if check_depth and len(segments) > self.max_depth:
+            raise ValueError(f"Resolver does not support the field {field}")
+        names: List[str] = []
+        steps: List[_Step] = []
+        model, entity = self.model, self.model
+        for segment in segments:
+            related = self._get_related(model)
+            name = self._aliases.get(segment) if not names else None
+            name = name or related._get_name(segment)
+            relationship = inspect(model).relationships.get(name) if name else None
+            if name is None or relationship is None:
+                raise ValueError(f"Resolver does not support the field {field}")
+            names.append(name)
+            step = self._steps.get(tuple(names))
+            if step is None:
+                step = self._steps[tuple(names)] = _Step(
+                    path=tuple(names),
+                    relationship=getattr(entity, name),
+                    target=aliased(relationship.mapper.class_),
+                    to_many=bool(relationship.uselist),
+                )
+            steps.append(step)
+            model, entity = relationship.mapper.class_, step.target
+        name = self._get_related(model)._get_name(last)
+        if name is None:
+            raise ValueError(f"Resolver does not support the field {field}")
+        count = next(
+            (index for index, step in enumerate(steps) if step.to_many), len(steps)
+        )
+        return _Path(
+            attribute=getattr(entity, name),
+            name=".".join([*names, name]),
+            joins=tuple(steps[:count]),
+            semi_joins=tuple(steps[count:]),
+        )
+
+    def _get_path(self, field: str) -> _Path:
+        """Resolves a dotted field path, memoizing the result.
+
+        Args:
+            field (str): The dotted field path, such as "parent.name".
+
+        Raises:
+            ValueError: Raised when the path isn't resolvable.
+
+        Returns:
+            _Path: The resolved path.
+        """
+        path = self._paths.get(field)
+        if path is not None:
+            return path
+        # the aliases must be unique to each path, even when resolved concurrently
+        with self._lock:
+            path = self._paths.get(field) or self._walk(field=field)
+            if not self._is_included(name=path.name):
+                raise ValueError(f"Resolver does not support the field {field}")
+            self._paths[field] = path
+        return path
+
+    def _is_included(self, name: str) -> bool:
+        """Whether a dotted path is resolvable, given the included and excluded paths.
+
+        Args:
+            name (str): The dotted path of attribute names, such as "parent.name".
+
+        Returns:
+            bool: True if no prefix of the path, such as "parent", or the path itself
+                is excluded, and one of them is included.
+        """
+        names = name.split(".")
+        prefixes = {".".join(names[:index]) for index in range(1, len(names) + 1)}
+        if prefixes & self._excluded:
+            return False
+        return self._included is None or bool(prefixes & self._included)
+
+    def __call__(self, field: str) -> Any:
+        """Resolves a data grid field to the mapped class's attribute.
+
+        Args:
+            field (str): The field name, as sent by the data grid.
+
+        Raises:
+            ValueError: Raised when the field isn't resolvable.
+
+        Returns:
+            Any: The column, hybrid property, or relationship attribute.
+        """
+        try:
+            return self._lookup[field]
+        except KeyError:
+            pass
+        if "." in field:
+            attribute = self._get_path(field).attribute
+        else:
+            # other spellings, such as "GroupNumber", are resolved without their case
+            # and separators, and the result is memoized for the following requests
+            name = self._get_name(field)
+            if name is None:
+                raise ValueError(f"Resolver does not support the field {field}")
+            attribute = self._resolvable[name]
+        self._lookup[field] = attribute
+        return attribute
+
+    def is_to_many(self, field: str) -> bool:
+        """Whether a field's path traverses a to-many relationship.
+
+        The attribute of a to-many relationship has many values per row, so it may
+        be filtered using `wrap_clause()`, but not sorted.
+
+        Args:
+            field (str): The field name, as sent by the data grid.
+
+        Raises:
+            ValueError: Raised when the field isn't resolvable.
+
+        Returns:
+            bool: True if the field is a dotted path traversing a to-many
+                relationship, otherwise False.
+        """
+        return "." in field and len(self._get_path(field).semi_joins) > 0
+
+    def wrap_clause(self, field: str, clause: Any) -> Any:
+        """Wraps the clause filtering a field in the semi-joins of its path.
+
+        Each relationship following the path's first to-many relationship is
+        filtered using `EXISTS`, so the clause matches the rows having any related
+        row which matches it, without duplicating those rows.
+
+        Args:
+            field (str): The field name, as sent by the data grid.
+            clause (Any): The clause filtering the field's resolved attribute.
+
+        Raises:
+            ValueError: Raised when the field isn't resolvable.
+
+        Returns:
+            Any: The clause, wrapped in the semi-joins, if any.
+        """
+        if "." not in field:
+            return clause
+        for step in reversed(self._get_path(field).semi_joins):
+            relationship = step.relationship.of_type(step.target)
+            clause = (
+                relationship.any(clause) if step.to_many else relationship.has(clause)
+            )
+        return clause
+
+    def join(self, query: _J, fields: Iterable[str], joined: Iterable[str] = ()) -> _J:
+        """Joins the to-one relationships traversed by the fields' paths to a query.
+
+        Each relationship is joined once, using `LEFT OUTER JOIN`, no matter how many
+        fields traverse it. The to-many relationships aren't joined, as their filters
+        use semi-joins instead.
+
+        Args:
+            query (_J): The query or select statement being joined.
+            fields (Iterable[str]): The fields being filtered or sorted.
+            joined (Iterable[str], optional): The fields whose relationships were
+                already joined to the query. Defaults to ().
+
+        Raises:
+            ValueError: Raised when a field isn't resolvable.
+
+        Returns:
+            _J: The joined query or select statement.
+        """
+        seen: Set[Tuple[str, ...]] = {
+            step.path
+            for field in joined
+            if "." in field
+            for step in self._get_path(field).joins
+        }
+        for field in fields:
+            if "." not in field:
+                continue
+            for step in self._get_path(field).joins:
+                if step.path in seen:
+                    continue
+                seen.add(step.path)
+                query = query.outerjoin(step.relationship.of_type(step.target))
+        return query
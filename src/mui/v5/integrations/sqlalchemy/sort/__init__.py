@@ -1,7 +1,12 @@
 from mui.v5.integrations.sqlalchemy.sort.apply_item import get_sort_expression_from_item
 from mui.v5.integrations.sqlalchemy.sort.apply_model import (
     apply_sort_to_query_from_model,
+    apply_sort_to_select_from_model,
 )
 
 # isort: unique-list
-__all__ = ["apply_sort_to_query_from_model", "get_sort_expression_from_item"]
+__all__ = [
+    "apply_sort_to_query_from_model",
+    "apply_sort_to_select_from_model",
+    "get_sort_expression_from_item",
+]
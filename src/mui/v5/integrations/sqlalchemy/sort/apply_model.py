@@ -2,12 +2,14 @@
 from typing import TypeVar
 
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from mui.v5.grid.sort import GridSortModel
 from mui.v5.integrations.sqlalchemy.resolver import Resolver
 from mui.v5.integrations.sqlalchemy.sort.apply_item import get_sort_expression_from_item
 
 _Q = TypeVar("_Q")
+_S = TypeVar("_S", Select, CompoundSelect)
 
 
 def apply_sort_to_query_from_model(
@@ -53,3 +55,35 @@ def apply_sort_to_query_from_model(
         ]
     )
     return query
+
+
+def apply_sort_to_select_from_model(
+    statement: _S, model: GridSortModel, resolver: Resolver
+) -> _S:
+    """Applies a GridSortModel to a 2.0 style select statement.
+
+    If the model is an empty list, the statement is returned, as-is. The resolver of a
+    compound select, such as a `UNION`, should resolve the fields to the columns of the
+    compound select, such as `statement.selected_columns.name`.
+
+    Args:
+        statement (_S): The select or compound select statement to apply the sort
+            model to.
+        model (GridSortModel): The sort model to apply to the statement. This contains
+            zero or more GridSortItems.
+        resolver (Resolver): The resolver is responsible for retrieving the column or
+            other property on a SQLAlchemy model.
+
+    Returns:
+        _S: The ordered statement.
+    """
+    if len(model) == 0:
+        return statement
+    return statement.order_by(
+        *[
+            get_sort_expression_from_item(item=item, resolver=resolver)
+            for item in model
+            # unsorted items would otherwise be rendered as ORDER BY NULL
+            if item.sort is not None
+        ]
+    )
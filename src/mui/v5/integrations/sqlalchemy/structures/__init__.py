@@ -1,4 +1,18 @@
-from mui.v5.integrations.sqlalchemy.structures.query import DataGridQuery
+from mui.v5.integrations.sqlalchemy.structures.async_query import AsyncDataGridQuery
+from mui.v5.integrations.sqlalchemy.structures.query import (
+    DataGridQuery,
+    PaginationStrategy,
+    TotalKind,
+    TotalStrategy,
+)
+from mui.v5.integrations.sqlalchemy.structures.select import DataGridSelect
 
 # isort: unique-list
-__all__ = ["DataGridQuery"]
+__all__ = [
+    "AsyncDataGridQuery",
+    "DataGridQuery",
+    "DataGridSelect",
+    "PaginationStrategy",
+    "TotalKind",
+    "TotalStrategy",
+]
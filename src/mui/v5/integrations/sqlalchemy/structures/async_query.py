@@ -0,0 +1,239 @@
+"""The async_query module contains the AsyncDataGridQuery data structure.
+
+This structure applies the grid models to a 2.0 style `select()` statement, and
+executes it using an `AsyncSession`, so that asynchronous services retrieve the page
+and total without blocking the event loop.
+
+A session executes one statement at a time. When a count engine is provided, the
+total is instead counted using a pooled connection of its own, so the count and page
+statements may run concurrently:
+
+    >>> dg_query = AsyncDataGridQuery(
+    ...     statement=select(ExampleModel),
+    ...     session=session,
+    ...     column_resolver=resolver,
+    ...     pagination_model=pagination_model,
+    ...     count_engine=engine,
+    ... )
+    >>> items, total = await asyncio.gather(dg_query.items(), dg_query.total())
+"""
+from math import ceil
+from typing import Generic, List, Mapping, Optional, TypeVar, Union, overload
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.sql import Select
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel, GridSortModel
+from mui.v5.integrations.sqlalchemy.cache import StatementCache
+from mui.v5.integrations.sqlalchemy.filter import (
+    ColumnCaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    OperatorApplicator,
+    QuickFilter,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.structures.base import DataGridSelectBase
+from mui.v5.integrations.sqlalchemy.structures.factory import Factory
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class AsyncDataGridQuery(DataGridSelectBase, Generic[_T]):
+    """An asynchronous data grid query, executed using an AsyncSession.
+
+    The rows are paginated using `LIMIT` / `OFFSET`.
+
+    Args:
+        Generic (_type_): The model being retrieved by the statement.
+
+    Attributes:
+        count_engine (Optional[AsyncEngine]): The engine whose connections count the
+            rows, concurrently with the session retrieving the page.
+        session (AsyncSession): The session executing the statements.
+        statement (Select): The statement, after all models have been applied.
+    """
+
+    count_engine: Optional[AsyncEngine]
+    session: AsyncSession
+
+    def __init__(
+        self,
+        statement: Select,
+        session: AsyncSession,
+        column_resolver: Resolver,
+        filter_model: Optional[GridFilterModel] = None,
+        sort_model: Optional[GridSortModel] = None,
+        pagination_model: Optional[GridPaginationModel] = None,
+        count_engine: Optional[AsyncEngine] = None,
+        lookahead: bool = False,
+        operators: Optional[Mapping[str, OperatorApplicator]] = None,
+        statement_cache: Optional[StatementCache] = None,
+        is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+        simplify_filter: bool = False,
+        date_granularity: DateGranularity = "exact",
+        case_folding: ColumnCaseFolding = "sensitive",
+        quick_filter: Optional[QuickFilter] = None,
+    ) -> None:
+        """Initialize a new asynchronous data grid query.
+
+        Args:
+            statement (Select): The base select statement which the models will be
+                applied to, such as `select(ExampleModel)`.
+            session (AsyncSession): The session executing the statements.
+            column_resolver (Resolver): The field resolver which converts a UI field
+                to the corresponding SQLAlchemy column, column property, etc.
+            filter_model (Optional[GridFilterModel], optional): The filter model to
+                apply, if provided. Defaults to None.
+            sort_model (Optional[GridSortModel], optional): The sort model to apply,
+                if provided. Defaults to None.
+            pagination_model (Optional[GridPaginationModel], optional): The pagination
+                model to apply, if provided. Defaults to None.
+            count_engine (Optional[AsyncEngine], optional): The engine whose pooled
+                connections count the rows, so that `total()` may run concurrently
+                with `items()`. The count doesn't see the session's uncommitted
+                changes. None to count the rows using the session. Defaults to None.
+            lookahead (bool, optional): True to retrieve one row more than the page
+                size, which is discarded, to detect whether another page exists
+                without counting the rows. The result is recorded in `has_next` when
+                `items()` is awaited. Defaults to False.
+            operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+                filter operator applicators which take precedence over the registered
+                applicators. Defaults to None.
+            statement_cache (Optional[StatementCache], optional): The cache used to
+                reuse the filter and sort clauses of requests sharing the same shape,
+                binding the filter values as parameters. Defaults to None.
+            is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values
+                of isAnyOf filters are bound. Defaults to the strategy selected for the
+                session's dialect using `set_is_any_of_strategy()`, or "expanding".
+            simplify_filter (bool, optional): True to merge and remove the redundant
+                items of the filter model using `simplify_filter_model()` before
+                applying it. When the filter provably matches no rows, `items()` and
+                `total()` return without querying the database. Defaults to False.
+            date_granularity (DateGranularity, optional): How the date operators
+                compare the column to the filtered date, either "exact" or "day".
+                Defaults to "exact".
+            case_folding (ColumnCaseFolding, optional): How the contains,
+                startsWith, and endsWith operators compare strings, or a mapping of
+                the strategy of each field. Defaults to "sensitive".
+            quick_filter (Optional[QuickFilter], optional): The backend which applies
+                the quick filter values of the filter model. None to ignore the quick
+                filter values. Defaults to None.
+
+        Raises:
+            ValueError: Raised when the date granularity is not supported.
+            ValueError: Raised when a case folding strategy is not supported.
+            ValueError: Raised when the column resolver is a mapper resolver, and a
+                sorted field traverses a to-many relationship.
+        """
+        super().__init__(
+            column_resolver=column_resolver,
+            session=session.sync_session,
+            filter_model=filter_model,
+            sort_model=sort_model,
+            pagination_model=pagination_model,
+            lookahead=lookahead,
+            operators=operators,
+            statement_cache=statement_cache,
+            is_any_of_strategy=is_any_of_strategy,
+            simplify_filter=simplify_filter,
+            date_granularity=date_granularity,
+            case_folding=case_folding,
+            quick_filter=quick_filter,
+        )
+        self.session = session
+        self.count_engine = count_engine
+        self._build(statement=statement)
+
+    async def total(self) -> int:
+        """Returns the total number of rows that exist with the filter.
+
+        The count is executed using a connection of the count engine, if one was
+        provided, otherwise using the session. If the simplified filter matches no
+        rows, no statement is executed.
+
+        Returns:
+            int: The count of total items before pagination, but after filtering.
+        """
+        if self._total is not None:
+            return self._total
+        if self._matches_nothing:
+            self._total = 0
+            return 0
+        statement = self._get_count_statement()
+        if self.count_engine is not None:
+            async with self.count_engine.connect() as connection:
+                total = (await connection.execute(statement)).scalar_one()
+        else:
+            total = (await self.session.execute(statement)).scalar_one()
+        self._total = int(total)
+        return self._total
+
+    @overload
+    async def items(self, factory: None = ...) -> List[_T]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            List[_T]: The list of models, without conversion.
+        """
+        ...
+
+    @overload
+    async def items(self, factory: Factory[_T, _R]) -> List[_R]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+        ...
+
+    async def items(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Union[List[_T], List[_R]]:
+        """Returns all results of the statement, after all models have been applied.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            List[_T]: The list of individual items located by the statement after all
+                models have been applied.
+        """
+        items = await self._fetch()
+        return [factory(item) for item in items] if factory is not None else items
+
+    async def _fetch(self) -> List[_T]:
+        """Executes the statement, recording whether another page exists.
+
+        Returns:
+            List[_T]: The list of individual items located by the statement. Rows
+                selecting a single entity or column are returned as that value.
+        """
+        if self._matches_nothing:
+            return self._get_empty_rows()
+        return self._get_rows(result=await self.session.execute(self.statement))
+
+    async def pages(self, total: Optional[int] = None) -> int:
+        """Returns the number of pages to display all results.
+
+        Args:
+            total (Optional[int], optional): The total number of results. This may
+                be provided to avoid the overhead of an additional database query to
+                retrieve the total. Defaults to None.
+
+        Returns:
+            int: The number of pages required to display all results at the current
+                page size.
+        """
+        if not total:
+            total = await self.total()
+        return int(ceil(total / float(self.per_page)))
@@ -0,0 +1,460 @@
+"""The base module contains the state shared by the data grid query structures.
+
+The structures differ in how their statements are built and executed, such as the
+legacy `Query` of `DataGridQuery`, or the `select()` statements of `DataGridSelect`
+and `AsyncDataGridQuery`, while the grid models, and the options controlling how
+they're applied, are shared.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import false, func, select
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import Select
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel, GridSortModel
+from mui.v5.integrations.sqlalchemy.cache import (
+    StatementCache,
+    get_cached_filter_clause,
+    get_cached_sort_expressions,
+)
+from mui.v5.integrations.sqlalchemy.filter import (
+    ColumnCaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    OperatorApplicator,
+    QuickFilter,
+    adapt_value_applicator,
+    get_case_folding_operators,
+    get_date_operators,
+    get_filter_clause_from_items,
+    get_is_any_of_applicator,
+    get_is_any_of_strategy,
+    simplify_filter_model,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators import IS_ANY_OF_STRATEGIES
+from mui.v5.integrations.sqlalchemy.pagination import (
+    apply_limit_offset_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import MapperResolver, Resolver
+from mui.v5.integrations.sqlalchemy.sort import get_sort_expression_from_item
+
+_J = TypeVar("_J", "Query[Any]", Select)
+
+
+class DataGridBase:
+    """The grid models, and the options controlling how they're applied.
+
+    Attributes:
+        column_resovler (Resolver): The field resolver.
+        case_folding (ColumnCaseFolding): The case folding strategy of the string
+            operators.
+        date_granularity (DateGranularity): The granularity of the date operators.
+        filter_model (Optional[GridFilterModel]): The filter model being applied.
+        has_next (Optional[bool]): Whether another page exists, when the lookahead
+            row was retrieved.
+        lookahead (bool): Whether one row more than the page size is retrieved.
+        operators (Optional[Mapping[str, OperatorApplicator]]): The filter operator
+            applicators which take precedence over the registered applicators.
+        pagination_model (Optional[GridPaginationModel]): The pagination model being
+            applied.
+        quick_filter (Optional[QuickFilter]): The backend applying the quick filter
+            values.
+        sort_model (Optional[GridSortModel]): The sort model being applied.
+        statement_cache (Optional[StatementCache]): The cache of the filter and sort
+            clauses.
+    """
+
+    _matches_nothing: bool
+    _total: Optional[int]
+    case_folding: ColumnCaseFolding
+    date_granularity: DateGranularity
+    filter_model: Optional[GridFilterModel]
+    has_next: Optional[bool]
+    lookahead: bool
+    operators: Optional[Mapping[str, OperatorApplicator]]
+    pagination_model: Optional[GridPaginationModel]
+    quick_filter: Optional[QuickFilter]
+    sort_model: Optional[GridSortModel]
+    statement_cache: Optional[StatementCache]
+
+    def __init__(
+        self,
+        column_resolver: Resolver,
+        session: Optional[Any],
+        filter_model: Optional[GridFilterModel] = None,
+        sort_model: Optional[GridSortModel] = None,
+        pagination_model: Optional[GridPaginationModel] = None,
+        lookahead: bool = False,
+        operators: Optional[Mapping[str, OperatorApplicator]] = None,
+        statement_cache: Optional[StatementCache] = None,
+        is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+        simplify_filter: bool = False,
+        date_granularity: DateGranularity = "exact",
+        case_folding: ColumnCaseFolding = "sensitive",
+        quick_filter: Optional[QuickFilter] = None,
+    ) -> None:
+        """Initialize the grid models and options.
+
+        Args:
+            column_resolver (Resolver): The field resolver which converts a UI field
+                to the corresponding SQLAlchemy column, column property, etc.
+            session (Optional[Any]): The session executing the statements, whose
+                dialect selects the isAnyOf strategy.
+            filter_model (Optional[GridFilterModel], optional): The filter model to
+                apply, if provided. Defaults to None.
+            sort_model (Optional[GridSortModel], optional): The sort model to apply,
+                if provided. Defaults to None.
+            pagination_model (Optional[GridPaginationModel], optional): The pagination
+                model to apply, if provided. Defaults to None.
+            lookahead (bool, optional): True to retrieve one row more than the page
+                size, to detect whether another page exists. Defaults to False.
+            operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+                filter operator applicators which take precedence over the registered
+                applicators. Defaults to None.
+            statement_cache (Optional[StatementCache], optional): The cache used to
+                reuse the filter and sort clauses of requests sharing the same shape.
+                Defaults to None.
+            is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values
+                of isAnyOf filters are bound. Defaults to the strategy selected for the
+                session's dialect, or "expanding".
+            simplify_filter (bool, optional): True to merge and remove the redundant
+                items of the filter model before applying it. Defaults to False.
+            date_granularity (DateGranularity, optional): How the date operators
+                compare the column to the filtered date. Defaults to "exact".
+            case_folding (ColumnCaseFolding, optional): How the string operators
+                compare strings. Defaults to "sensitive".
+            quick_filter (Optional[QuickFilter], optional): The backend which applies
+                the quick filter values of the filter model. Defaults to None.
+
+        Raises:
+            ValueError: Raised when the date granularity is not supported.
+            ValueError: Raised when a case folding strategy is not supported.
+        """
+        # annotated here, as a callable class attribute would be treated as a method
+        self.column_resovler: Resolver = column_resolver
+        self._matches_nothing = False
+        if simplify_filter and filter_model is not None:
+            # each item of a to-many field matches any related row, so the items
+            # can't be combined
+            simplified = simplify_filter_model(
+                model=filter_model,
+                skip_field=(
+                    column_resolver.is_to_many
+                    if isinstance(column_resolver, MapperResolver)
+                    else None
+                ),
+            )
+            self._matches_nothing = simplified is None
+            filter_model = simplified if simplified is not None else filter_model
+        self.filter_model = filter_model
+        self.sort_model = sort_model
+        self.pagination_model = pagination_model
+        self.date_granularity = date_granularity
+        self.case_folding = case_folding
+        self.quick_filter = quick_filter
+        self.operators = self._get_operators(
+            session=session,
+            operators=operators,
+            is_any_of_strategy=is_any_of_strategy,
+            date_granularity=date_granularity,
+            case_folding=case_folding,
+        )
+        self.statement_cache = statement_cache
+        self.lookahead = lookahead
+        self.has_next = None
+        self._total = None
+
+    @staticmethod
+    def _get_operators(
+        session: Optional[Any],
+        operators: Optional[Mapping[str, OperatorApplicator]],
+        is_any_of_strategy: Optional[IsAnyOfStrategy],
+        date_granularity: DateGranularity,
+        case_folding: ColumnCaseFolding,
+    ) -> Optional[Mapping[str, OperatorApplicator]]:
+        """Adds the applicators of the isAnyOf strategy, the date granularity, and the
+        case folding strategy to the operators, if necessary.
+
+        Args:
+            session (Optional[Any]): The session executing the statements.
+            operators (Optional[Mapping[str, OperatorApplicator]]): The explicitly
+                provided operator applicators, which take precedence over the strategy.
+            is_any_of_strategy (Optional[IsAnyOfStrategy]): The explicitly provided
+                isAnyOf strategy, if any.
+            date_granularity (DateGranularity): The granularity of the date operators.
+            case_folding (ColumnCaseFolding): The case folding strategy of the string
+                operators.
+
+        Raises:
+            ValueError: Raised when the date granularity is not supported.
+            ValueError: Raised when a case folding strategy is not supported.
+
+        Returns:
+            Optional[Mapping[str, OperatorApplicator]]: The operator applicators.
+        """
+        defaults = {
+            **get_date_operators(granularity=date_granularity),
+            **get_case_folding_operators(case_folding=case_folding),
+        }
+        if defaults:
+            operators = {**defaults, **(operators or {})}
+        if operators is not None and "isAnyOf" in operators:
+            return operators
+        strategy = is_any_of_strategy
+        # the dialect is only inspected once a strategy has been selected for one
+        if strategy is None and IS_ANY_OF_STRATEGIES and session is not None:
+            strategy = get_is_any_of_strategy(
+                dialect_name=session.get_bind().dialect.name
+            )
+        if strategy is None or strategy == "expanding":
+            return operators
+        applicator = get_is_any_of_applicator(strategy=strategy)
+        return {**(operators or {}), "isAnyOf": adapt_value_applicator(applicator)}
+
+    @property
+    def _filter_fields(self) -> List[str]:
+        """The fields filtered by the filter model's items and quick filter.
+
+        Returns:
+            List[str]: The filtered fields.
+        """
+        if self.filter_model is None or self._matches_nothing:
+            return []
+        fields = [item.column_field for item in self.filter_model.items]
+        if self.quick_filter is not None and self.filter_model.quick_filter_values:
+            fields.extend(self.quick_filter.fields)
+        return fields
+
+    def _get_sort_fields(self) -> List[str]:
+        """Retrieves the fields sorted by the sort model.
+
+        Raises:
+            ValueError: Raised when the column resolver is a mapper resolver, and a
+                sorted field traverses a to-many relationship, which has many values
+                per row.
+
+        Returns:
+            List[str]: The sorted fields.
+        """
+        fields = [item.field for item in self.sort_model or [] if item.sort is not None]
+        if isinstance(self.column_resovler, MapperResolver):
+            for field in fields:
+                if self.column_resovler.is_to_many(field):
+                    raise ValueError(f"The to-many field {field} can't be sorted")
+        return fields
+
+    def _join_query(
+        self, query: _J, fields: Sequence[str], joined: Sequence[str] = ()
+    ) -> _J:
+        """Joins the relationships traversed by the related fields to the query.
+
+        Args:
+            query (_J): The query or select statement being joined.
+            fields (Sequence[str]): The fields being filtered or sorted.
+            joined (Sequence[str], optional): The fields whose relationships were
+                already joined. Defaults to ().
+
+        Returns:
+            _J: The joined query, if the column resolver is a mapper resolver.
+        """
+        if not isinstance(self.column_resovler, MapperResolver):
+            return query
+        return self.column_resovler.join(query=query, fields=fields, joined=joined)
+
+    def _get_filter_clause(self) -> Tuple[Optional[Any], Dict[str, Any]]:
+        """Builds the clause of the filter model's items and quick filter values.
+
+        Returns:
+            Tuple[Optional[Any], Dict[str, Any]]: The filter clause, or None if there
+                is nothing to filter, and the values of its bound parameters, when
+                the clause was cached.
+        """
+        if self.filter_model is None:
+            return None, {}
+        parameters: Dict[str, Any] = {}
+        if self.statement_cache is not None:
+            clause, parameters = get_cached_filter_clause(
+                model=self.filter_model,
+                resolver=self.column_resovler,
+                cache=self.statement_cache,
+                operators=self.operators,
+            )
+        else:
+            clause = get_filter_clause_from_items(
+                model=self.filter_model,
+                resolver=self.column_resovler,
+                operators=self.operators,
+            )
+        if self.quick_filter is not None:
+            quick_clause = self.quick_filter.get_clause(
+                model=self.filter_model, resolver=self.column_resovler
+            )
+            if quick_clause is not None:
+                clause = quick_clause if clause is None else clause & quick_clause
+        return clause, parameters
+
+    def _get_sort_expressions(self) -> List[Any]:
+        """Builds the order by expressions of the sort model.
+
+        Returns:
+            List[Any]: The expressions, in order of precedence.
+        """
+        if self.sort_model is None:
+            return []
+        if self.statement_cache is not None:
+            return get_cached_sort_expressions(
+                model=self.sort_model,
+                resolver=self.column_resovler,
+                cache=self.statement_cache,
+            )
+        return [
+            get_sort_expression_from_item(item=item, resolver=self.column_resovler)
+            for item in self.sort_model
+            if item.sort is not None
+        ]
+
+    @property
+    def per_page(self) -> int:
+        """Alias for page_size."""
+        return self.page_size
+
+    @property
+    def page_size(self) -> int:
+        """Returns the page size.
+
+        Returns:
+            int: 0 if no pagination model exists, otherwise the page size.
+        """
+        return self.pagination_model.page_size if self.pagination_model else 0
+
+    @property
+    def page(self) -> int:
+        """Returns the current page number.
+
+        Returns:
+            int: 0 if no pagination model exists, otherwise the page number.
+        """
+        return self.pagination_model.page if self.pagination_model else 0
+
+
+class DataGridSelectBase(DataGridBase):
+    """The grid models applied to a 2.0 style `select()` statement.
+
+    The structures executing the statement differ in whether they're synchronous.
+    The rows are paginated using `LIMIT` / `OFFSET`.
+
+    Attributes:
+        statement (Select): The statement, after all models have been applied.
+    """
+
+    _statement: Select
+    statement: Select
+
+    def _build(self, statement: Select) -> None:
+        """Applies the grid models to the statement.
+
+        Args:
+            statement (Select): The base select statement.
+
+        Raises:
+            ValueError: Raised when the column resolver is a mapper resolver, and a
+                sorted field traverses a to-many relationship.
+        """
+        sort_fields = self._get_sort_fields()
+        statement = self._join_query(query=statement, fields=self._filter_fields)
+        statement = self._filter_statement(statement=statement)
+        # we filter it first, so that our total is accurate
+        self._statement = statement
+        statement = self._join_query(
+            query=statement, fields=sort_fields, joined=self._filter_fields
+        )
+        # then we apply the order and pagination limits
+        expressions = self._get_sort_expressions()
+        if expressions:
+            statement = statement.order_by(*expressions)
+        self.statement = self._paginate_statement(statement=statement)
+
+    def _filter_statement(self, statement: Select) -> Select:
+        """Applies the filter model to the statement.
+
+        Args:
+            statement (Select): The statement being filtered.
+
+        Returns:
+            Select: The filtered statement.
+        """
+        if self._matches_nothing:
+            return statement.where(false())
+        clause, parameters = self._get_filter_clause()
+        if clause is None:
+            return statement
+        statement = statement.where(clause)
+        return statement.params(**parameters) if parameters else statement
+
+    def _paginate_statement(self, statement: Select) -> Select:
+        """Applies the pagination model to the statement.
+
+        Args:
+            statement (Select): The statement being paginated (limit / offset).
+
+        Returns:
+            Select: The paginated (limited) statement.
+        """
+        if self.pagination_model is None:
+            return statement
+        return apply_limit_offset_to_select_from_model(
+            statement=statement, model=self.pagination_model, lookahead=self.lookahead
+        )
+
+    def _get_count_statement(self) -> Select:
+        """Builds the statement counting the filtered rows.
+
+        Returns:
+            Select: The count statement.
+        """
+        return select(func.count()).select_from(
+            self._statement.order_by(None).subquery()
+        )
+
+    def _get_rows(self, result: Result) -> List[Any]:
+        """Extracts the rows of the page from the result, recording whether another
+        page exists.
+
+        Args:
+            result (Result): The result of executing the statement.
+
+        Returns:
+            List[Any]: The rows. Rows selecting a single entity or column are
+                returned as that value.
+        """
+        rows: List[Any] = (
+            list(result.scalars().all())
+            if len(self.statement.column_descriptions) == 1
+            else list(result.all())
+        )
+        if self.lookahead and self.pagination_model is not None:
+            # the additional row only tells us that another page exists
+            self.has_next = len(rows) > self.page_size
+            rows = rows[: self.page_size]
+        return rows
+
+    def _get_empty_rows(self) -> List[Any]:
+        """Records the state of a filter which matches no rows.
+
+        Returns:
+            List[Any]: The empty list of rows.
+        """
+        if self.lookahead and self.pagination_model is not None:
+            self.has_next = False
+        self._total = 0
+        return []
+
+    @property
+    def has_previous(self) -> bool:
+        """Returns whether a page exists before the current page.
+
+        Returns:
+            bool: True if the current page isn't the first page, otherwise False.
+        """
+        return self.page > 0
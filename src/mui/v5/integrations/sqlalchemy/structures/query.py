@@ -4,36 +4,91 @@ This structure is used to provide helpers related to pagination, such as
 total row counts.
 """
 from math import ceil
-from typing import Generic, List, Optional, TypeVar, Union, overload
+from typing import (
+    Any,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
-from sqlalchemy.orm import Query
+from sqlalchemy import false, func, inspect
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import Query, Session
+from typing_extensions import Literal, TypeAlias
 
-from mui.v5.grid import GridFilterModel, GridPaginationModel, GridSortModel
-from mui.v5.integrations.sqlalchemy.filter import apply_filter_to_query_from_model
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortModel,
+    encode_cursor,
+)
+from mui.v5.integrations.sqlalchemy.cache import (
+    CountCache,
+    StatementCache,
+    get_cached_filter_clause,
+    get_cached_sort_expressions,
+    get_count_cache_key,
+    get_query_table_names,
+)
+from mui.v5.integrations.sqlalchemy.filter import (
+    ColumnCaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    OperatorApplicator,
+    QuickFilter,
+    TemporaryTableStaging,
+    apply_filter_to_query_from_model,
+    apply_quick_filter_to_query_from_model,
+    stage_is_any_of_values,
+)
 from mui.v5.integrations.sqlalchemy.pagination import (
+    apply_deferred_join_to_query_from_model,
+    apply_keyset_to_query_from_model,
     apply_limit_offset_to_query_from_model,
+    get_keyset_columns,
 )
 from mui.v5.integrations.sqlalchemy.resolver import Resolver
 from mui.v5.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
+from mui.v5.integrations.sqlalchemy.structures.base import DataGridBase
 from mui.v5.integrations.sqlalchemy.structures.factory import Factory
+from mui.v5.integrations.sqlalchemy.total import count_capped, estimate_row_count
 
 _T = TypeVar("_T")
 _R = TypeVar("_R")
 
+PaginationStrategy: TypeAlias = Literal["offset", "keyset", "deferred_join"]
+TotalStrategy: TypeAlias = Literal["exact", "capped", "estimated"]
+TotalKind: TypeAlias = Literal["exact", "lower_bound", "estimate"]
+
 
-class DataGridQuery(Generic[_T]):
+class DataGridQuery(DataGridBase, Generic[_T]):
     """A data grid query handles utilities related to our query.
 
     Args:
         Generic (_type_): The model being retrieved by the query.
     """
 
+    _base_query: "Query[_T]"
+    _cache_key: Optional[str]
     _query: "Query[_T]"
-    column_resovler: Resolver
-    filter_model: Optional[GridFilterModel]
-    pagination_model: Optional[GridPaginationModel]
+    _staging: Optional[TemporaryTableStaging]
+    count_cache: Optional[CountCache]
+    next_cursor: Optional[str]
+    pagination_strategy: PaginationStrategy
     query: "Query[_T]"
-    sort_model: Optional[GridSortModel]
+    temporary_table_threshold: Optional[int]
+    tie_breakers: Sequence[Any]
+    total_cap: int
+    total_kind: Optional[TotalKind]
+    total_strategy: TotalStrategy
+    window_total: bool
 
     def __init__(
         self,
@@ -42,6 +97,21 @@ class DataGridQuery(Generic[_T]):
         filter_model: Optional[GridFilterModel] = None,
         sort_model: Optional[GridSortModel] = None,
         pagination_model: Optional[GridPaginationModel] = None,
+        pagination_strategy: PaginationStrategy = "offset",
+        tie_breaker: Optional[Any] = None,
+        window_total: bool = False,
+        count_cache: Optional[CountCache] = None,
+        total_strategy: TotalStrategy = "exact",
+        total_cap: int = 10000,
+        lookahead: bool = False,
+        operators: Optional[Mapping[str, OperatorApplicator]] = None,
+        statement_cache: Optional[StatementCache] = None,
+        is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+        temporary_table_threshold: Optional[int] = None,
+        simplify_filter: bool = False,
+        date_granularity: DateGranularity = "exact",
+        case_folding: ColumnCaseFolding = "sensitive",
+        quick_filter: Optional[QuickFilter] = None,
     ) -> None:
         """Initialize a new data grid query.
 
@@ -55,19 +125,244 @@ class DataGridQuery(Generic[_T]):
                 if provided. Defaults to None.
             pagination_model (Optional[GridPaginationModel], optional): The pagination
                 model to apply, if provided. Defaults to None.
+            pagination_strategy (PaginationStrategy, optional): How pages are located.
+                "offset" uses LIMIT / OFFSET. "keyset" seeks past the cursor of the
+                pagination model, and records the cursor of the returned page in
+                `next_cursor` when `items()` is called. "deferred_join" paginates only
+                the tie-breaker columns, then loads the rows on the page by joining
+                back to them, which avoids building every skipped row of a wide model
+                at deep offsets. Defaults to "offset".
+            tie_breaker (Optional[Any], optional): The column which uniquely
+                identifies a row, used to order rows which share the same sort values
+                when using keyset pagination, and as the join key when using the
+                deferred join. Defaults to the primary key of the query's first
+                entity.
+            window_total (bool, optional): True to retrieve the filtered total in the
+                same statement as the page, using a `COUNT(*) OVER ()` window column.
+                When enabled, call `items()` before `total()` or `pages()` to avoid an
+                additional count query. Defaults to False.
+            count_cache (Optional[CountCache], optional): The cache used to store the
+                filtered total, so that paginating through the same filter only counts
+                the rows once. It isn't used when operators are provided, as the key
+                can't identify their applicators. Defaults to None.
+            total_strategy (TotalStrategy, optional): How `total()` counts the rows.
+                "exact" counts every row. "capped" counts at most `total_cap + 1`
+                rows, so a total greater than the cap means "more than total_cap".
+                "estimated" uses the query planner's row estimate, falling back to an
+                exact count when the dialect provides no estimate. The kind of total
+                that was returned is recorded in `total_kind`. Defaults to "exact".
+            total_cap (int, optional): The maximum number of rows counted by the
+                "capped" total strategy. Defaults to 10000.
+            lookahead (bool, optional): True to retrieve one row more than the page
+                size, which is discarded, to detect whether another page exists
+                without counting the rows. The result is recorded in `has_next` when
+                `items()` is called. Defaults to False.
+            operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+                filter operator applicators which take precedence over the registered
+                applicators. Defaults to None.
+            statement_cache (Optional[StatementCache], optional): The cache used to
+                reuse the filter and sort clauses of requests sharing the same shape,
+                binding the filter values as parameters. Defaults to None.
+            is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values
+                of isAnyOf filters are bound. Defaults to the strategy selected for the
+                session's dialect using `set_is_any_of_strategy()`, or "expanding".
+            temporary_table_threshold (Optional[int], optional): The number of
+                isAnyOf values above which the values are inserted into a temporary
+                table, and filtered using a semi-join. None to disable.
+                Defaults to None.
+            simplify_filter (bool, optional): True to merge and remove the redundant
+                items of the filter model using `simplify_filter_model()` before
+                applying it. When the filter provably matches no rows, `items()` and
+                `total()` return without querying the database. Defaults to False.
+            date_granularity (DateGranularity, optional): How the date operators, such
+                as is and onOrAfter, compare the column to the filtered date. "exact"
+                compares the column to the date and time. "day" compares the column
+                to the half-open range of the day, `[day, day + 1)`, so that a
+                timestamp column matches every row within the day, while indexes on
+                the column are still used. Defaults to "exact".
+            case_folding (ColumnCaseFolding, optional): How the contains,
+                startsWith, and endsWith operators compare strings. "sensitive" is
+                case-sensitive. "ilike" uses ILIKE, "lower" compares the lower case
+                column and value to use a functional index, "nocase" uses SQLite's
+                NOCASE collation, and "citext" leaves the comparison of PostgreSQL
+                citext columns unchanged. A mapping selects the strategy of each
+                field, where other fields are case-sensitive. Defaults to
+                "sensitive".
+            quick_filter (Optional[QuickFilter], optional): The backend which applies
+                the quick filter values of the filter model, such as
+                `LikeQuickFilter(fields=["name"])`. None to ignore the quick filter
+                values. Defaults to None.
+
+        Raises:
+            ValueError: Raised when keyset or deferred join pagination is requested,
+                but no tie-breaker was provided and the primary key could not be
+                inferred.
+            ValueError: Raised when isAnyOf values are staged in temporary tables,
+                but the query has no session.
+            ValueError: Raised when the window total is requested with keyset or
+                deferred join pagination, as the window would only count the rows
+                after the cursor or on the page, respectively.
+            ValueError: Raised when the date granularity is not supported.
+            ValueError: Raised when a case folding strategy is not supported.
+            ValueError: Raised when the column resolver is a mapper resolver, and a
+                sorted field traverses a to-many relationship.
         """
-        self.column_resovler = column_resolver
-        self.filter_model = filter_model
-        self.sort_model = sort_model
-        self.pagination_model = pagination_model
+        if window_total and pagination_strategy != "offset":
+            raise ValueError(
+                f"window_total is not supported with {pagination_strategy} pagination"
+            )
+        super().__init__(
+            column_resolver=column_resolver,
+            session=query.session,
+            filter_model=filter_model,
+            sort_model=sort_model,
+            pagination_model=pagination_model,
+            lookahead=lookahead,
+            operators=operators,
+            statement_cache=statement_cache,
+            is_any_of_strategy=is_any_of_strategy,
+            simplify_filter=simplify_filter,
+            date_granularity=date_granularity,
+            case_folding=case_folding,
+            quick_filter=quick_filter,
+        )
+        self.pagination_strategy = pagination_strategy
+        self.temporary_table_threshold = temporary_table_threshold
+        self._staging = (
+            TemporaryTableStaging() if temporary_table_threshold is not None else None
+        )
+        self.next_cursor = None
+        self.window_total = window_total
+        self.count_cache = count_cache
+        self._has_custom_operators = bool(operators)
+        self.total_strategy = total_strategy
+        self.total_cap = total_cap
+        self.total_kind = None
+        self._base_query = query
+        self._cache_key = None
+        self.tie_breakers = (
+            self._get_tie_breakers(query=query, tie_breaker=tie_breaker)
+            if pagination_strategy != "offset"
+            else []
+        )
+        sort_fields = self._get_sort_fields()
+        # the related fields' relationships are joined once, however many items use
+        # them, and the relationships which are only sorted aren't counted
+        query = self._join_query(query=query, fields=self._filter_fields)
         query = self._filter_query(query=query)
         # we filter it first, so that our total is accurate
         self._query = query
+        query = self._join_query(
+            query=query, fields=sort_fields, joined=self._filter_fields
+        )
         # then we apply the order and pagination limits
-        query = self._order_query(query=query)
-        query = self._paginate_query(query=query)
+        if self._uses_keyset:
+            query = self._seek_query(query=query)
+        elif self._uses_deferred_join:
+            query = self._deferred_join_query(query=query)
+        else:
+            query = self._order_query(query=query)
+            query = self._paginate_query(query=query)
         self.query = query
 
+    @staticmethod
+    def _get_tie_breakers(
+        query: "Query[_T]", tie_breaker: Optional[Any]
+    ) -> Sequence[Any]:
+        """Retrieves the columns used to order rows which share the same sort values.
+
+        Args:
+            query (Query[_T]): The base query.
+            tie_breaker (Optional[Any]): The explicitly provided tie-breaker, if any.
+
+        Raises:
+            ValueError: Raised when no tie-breaker was provided and the primary key of
+                the query's first entity could not be inferred.
+
+        Returns:
+            Sequence[Any]: The tie-breaker columns.
+        """
+        if tie_breaker is not None:
+            return [tie_breaker]
+        entity = (
+            query.column_descriptions[0]["entity"]
+            if query.column_descriptions
+            else None
+        )
+        mapper = inspect(entity, raiseerr=False) if entity is not None else None
+        primary_key = getattr(mapper, "primary_key", None)
+        if not primary_key:
+            raise ValueError(
+                "A tie_breaker is required for keyset and deferred join pagination"
+                " when the primary key cannot be inferred from the query"
+            )
+        return list(primary_key)
+
+    @property
+    def _uses_keyset(self) -> bool:
+        """Whether the query is paginated using keyset pagination.
+
+        Returns:
+            bool: True if keyset pagination is requested and a pagination model
+                exists, otherwise False.
+        """
+        return (
+            self.pagination_strategy == "keyset" and self.pagination_model is not None
+        )
+
+    @property
+    def _uses_deferred_join(self) -> bool:
+        """Whether the query is paginated using a deferred join.
+
+        Returns:
+            bool: True if deferred join pagination is requested and a pagination
+                model exists, otherwise False.
+        """
+        return (
+            self.pagination_strategy == "deferred_join"
+            and self.pagination_model is not None
+        )
+
+    def _deferred_join_query(self, query: "Query[_T]") -> "Query[_T]":
+        """Applies the sort model and deferred join pagination to the query.
+
+        Args:
+            query (Query[_T]): The query being ordered and paginated.
+
+        Returns:
+            Query[_T]: The ordered and paginated query.
+        """
+        if self.pagination_model is None:
+            return query
+        return apply_deferred_join_to_query_from_model(
+            query=query,
+            sort_model=self.sort_model or [],
+            pagination_model=self.pagination_model,
+            resolver=self.column_resovler,
+            keys=self.tie_breakers,
+            lookahead=self.lookahead,
+        )
+
+    def _seek_query(self, query: "Query[_T]") -> "Query[_T]":
+        """Applies the sort model and keyset pagination to the query.
+
+        Args:
+            query (Query[_T]): The query being ordered and paginated.
+
+        Returns:
+            Query[_T]: The ordered and paginated query.
+        """
+        if self.pagination_model is None:
+            return query
+        return apply_keyset_to_query_from_model(
+            query=query,
+            sort_model=self.sort_model or [],
+            pagination_model=self.pagination_model,
+            resolver=self.column_resovler,
+            tie_breakers=self.tie_breakers,
+            lookahead=self.lookahead,
+        )
+
     def _filter_query(self, query: "Query[_T]") -> "Query[_T]":
         """Applies the filter model to the query.
 
@@ -77,10 +372,46 @@ class DataGridQuery(Generic[_T]):
         Returns:
             Query[_T]: The filtered query.
         """
+        if self._matches_nothing:
+            return query.filter(false())
         if self.filter_model is None:
             return query
+        filter_model = self.filter_model
+        if self.temporary_table_threshold is not None:
+            # the values are inserted once a statement is executed
+            filter_model = stage_is_any_of_values(
+                query=query,
+                model=filter_model,
+                resolver=self.column_resovler,
+                threshold=self.temporary_table_threshold,
+                staging=self._staging,
+            )
+        # the temporary tables are unique to each request, so their clause isn't cached
+        if self.statement_cache is not None and filter_model is self.filter_model:
+            clause, parameters = get_cached_filter_clause(
+                model=filter_model,
+                resolver=self.column_resovler,
+                cache=self.statement_cache,
+                operators=self.operators,
+            )
+            if clause is not None:
+                query = query.filter(clause)
+                if parameters:
+                    query = query.params(**parameters)
+            if self.quick_filter is None:
+                return query
+            return apply_quick_filter_to_query_from_model(
+                query=query,
+                model=filter_model,
+                resolver=self.column_resovler,
+                quick_filter=self.quick_filter,
+            )
         return apply_filter_to_query_from_model(
-            query=query, model=self.filter_model, resolver=self.column_resovler
+            query=query,
+            model=filter_model,
+            resolver=self.column_resovler,
+            operators=self.operators,
+            quick_filter=self.quick_filter,
         )
 
     def _order_query(self, query: "Query[_T]") -> "Query[_T]":
@@ -94,6 +425,13 @@ class DataGridQuery(Generic[_T]):
         """
         if self.sort_model is None:
             return query
+        if self.statement_cache is not None:
+            expressions = get_cached_sort_expressions(
+                model=self.sort_model,
+                resolver=self.column_resovler,
+                cache=self.statement_cache,
+            )
+            return query.order_by(*expressions) if expressions else query
         return apply_sort_to_query_from_model(
             query=query, model=self.sort_model, resolver=self.column_resovler
         )
@@ -110,32 +448,126 @@ class DataGridQuery(Generic[_T]):
         if self.pagination_model is None:
             return query
         return apply_limit_offset_to_query_from_model(
-            query=query, model=self.pagination_model
+            query=query, model=self.pagination_model, lookahead=self.lookahead
         )
 
     def total(self) -> int:
         """Returns the total number of rows that exist with the filter.
 
-        This disables ordering (sorting) to improve performance.
+        This disables ordering (sorting) to improve performance. If the total was
+        already retrieved alongside the items, using the window total, is stored in
+        the count cache, or the simplified filter matches no rows, no additional
+        query is executed.
+
+        The total is counted according to the total strategy, and `total_kind`
+        records whether the returned total is exact, a lower bound, or an estimate.
 
         Returns:
             int: The count of total items before pagination, but after filtering.
         """
-        return self._query.order_by(None).count()
+        if self._total is not None:
+            return self._total
+        if self._matches_nothing:
+            self._total = 0
+            self.total_kind = "exact"
+            return 0
+        if self.total_strategy == "estimated":
+            self._stage()
+            estimate = estimate_row_count(query=self._query)
+            if estimate is not None:
+                self._total = estimate
+                self.total_kind = "estimate"
+                return estimate
+        # the key can't identify custom applicators, so their totals aren't cached
+        if self.count_cache is not None and not self._has_custom_operators:
+            cached = self.count_cache.get(self._count_cache_key)
+            if cached is not None:
+                self._total = cached
+                self.total_kind = self._get_total_kind(total=cached)
+                return cached
+        self._stage()
+        total = (
+            count_capped(query=self._query, cap=self.total_cap)
+            if self.total_strategy == "capped"
+            else self._query.order_by(None).count()
+        )
+        self._store_total(total=total)
+        return total
 
-    @property
-    def per_page(self) -> int:
-        """Alias for page_size."""
-        return self.page_size
+    def _stage(self) -> None:
+        """Inserts the staged isAnyOf values into their temporary tables, if needed."""
+        if self._staging is not None and self._base_query.session is not None:
+            self._staging.stage(session=cast(Session, self._base_query.session))
+
+    def _get_total_kind(self, total: int) -> TotalKind:
+        """Determines the kind of a counted total.
+
+        Args:
+            total (int): The counted total.
+
+        Returns:
+            TotalKind: "lower_bound" if the capped total strategy stopped counting at
+                the cap, otherwise "exact".
+        """
+        if self.total_strategy == "capped" and total > self.total_cap:
+            return "lower_bound"
+        return "exact"
 
     @property
-    def page_size(self) -> int:
-        """Returns the page size.
+    def _count_cache_key(self) -> str:
+        """The key used to store the filtered total in the count cache.
 
         Returns:
-            int: 0 if no pagination model exists, otherwise the page size.
+            str: The count cache key.
+        """
+        if self._cache_key is None:
+            # the quick filter values match different rows with other backends or
+            # fields, so the clause built by the backend is part of the key
+            quick_filter_clause = (
+                self.quick_filter.get_clause(
+                    model=self.filter_model, resolver=self.column_resovler
+                )
+                if self.quick_filter is not None and self.filter_model is not None
+                else None
+            )
+            key = get_count_cache_key(
+                query=self._base_query,
+                filter_model=self.filter_model,
+                quick_filter_clause=quick_filter_clause,
+            )
+            # totals filtered by day aren't interchangeable with exact date totals
+            if self.date_granularity != "exact":
+                key = f"{self.date_granularity}:{key}"
+            # nor are case-insensitive totals interchangeable with sensitive totals
+            if self.case_folding != "sensitive":
+                case_folding = (
+                    self.case_folding
+                    if isinstance(self.case_folding, str)
+                    else sorted(self.case_folding.items())
+                )
+                key = f"case_folding:{case_folding}:{key}"
+            # capped totals aren't interchangeable with exact totals
+            self._cache_key = (
+                f"capped:{self.total_cap}:{key}"
+                if self.total_strategy == "capped"
+                else key
+            )
+        return self._cache_key
+
+    def _store_total(self, total: int) -> None:
+        """Stores the filtered total, and adds it to the count cache if one exists.
+
+        Args:
+            total (int): The count of total items after filtering.
         """
-        return self.pagination_model.page_size if self.pagination_model else 0
+        self._total = total
+        self.total_kind = self._get_total_kind(total=total)
+        if self.count_cache is not None and not self._has_custom_operators:
+            self.count_cache.set(
+                key=self._count_cache_key,
+                value=total,
+                tables=get_query_table_names(query=self._query),
+            )
 
     @overload
     def items(self, factory: None = ...) -> List[_T]:
@@ -175,9 +607,67 @@ class DataGridQuery(Generic[_T]):
             List[_T]: The list of individual items located by the query after all
                 models have been applied.
         """
-        items = self.query.all()
+        items = self._fetch()
         return [factory(item) for item in items] if factory is not None else items
 
+    def _fetch(self) -> List[_T]:
+        """Executes the query, recording any pagination details of the result.
+
+        Returns:
+            List[_T]: The list of individual items located by the query.
+        """
+        if self._matches_nothing:
+            if self.lookahead and self.pagination_model is not None:
+                self.has_next = False
+            self._total = 0
+            self.total_kind = "exact"
+            return []
+        keyset_columns = (
+            [
+                column
+                for column, _ in get_keyset_columns(
+                    sort_model=self.sort_model or [],
+                    resolver=self.column_resovler,
+                    tie_breakers=self.tie_breakers,
+                )
+            ]
+            if self._uses_keyset
+            else []
+        )
+        self._stage()
+        window_columns = [func.count().over()] if self.window_total else []
+        items: List[_T]
+        extras: List[Tuple[Any, ...]] = []
+        if not keyset_columns and not window_columns:
+            items = self.query.all()
+        else:
+            items, extras = _fetch_with_extra_columns(
+                query=self.query, columns=keyset_columns + window_columns
+            )
+        if self.lookahead and self.pagination_model is not None:
+            # the additional row only tells us that another page exists
+            self.has_next = len(items) > self.page_size
+            items = items[: self.page_size]
+            extras = extras[: self.page_size]
+        if self._uses_keyset:
+            is_full_page = len(items) == self.page_size and len(items) > 0
+            self.next_cursor = (
+                encode_cursor(
+                    values=extras[-1][: len(keyset_columns)],
+                    sort_model=self.sort_model,
+                )
+                if (self.has_next if self.lookahead else is_full_page)
+                else None
+            )
+        if self.window_total:
+            # an empty page past the first page doesn't tell us the total, so we leave
+            # it to total() to count the rows
+            if len(extras) > 0:
+                self._store_total(total=int(extras[0][-1]))
+            elif self.page == 0:
+                self._store_total(total=0)
+        return items
+
     def pages(self, total: Optional[int] = None) -> int:
         """Returns the number of pages to display all results.
 
@@ -195,10 +685,56 @@ class DataGridQuery(Generic[_T]):
         return int(ceil(total / float(self.per_page)))
 
     @property
-    def page(self) -> int:
-        """Returns the current page number.
+    def has_previous(self) -> bool:
+        """Returns whether a page exists before the current page.
 
         Returns:
-            int: 0 if no pagination model exists, otherwise the page number.
+            bool: True if the current page isn't the first page, otherwise False.
         """
-        return self.pagination_model.page if self.pagination_model else 0
+        if self._uses_keyset and self.pagination_model is not None:
+            return self.pagination_model.cursor is not None
+        return self.page > 0
+
+
+def _is_single_entity(query: "Query[Any]") -> bool:
+    """Whether the query selects a single mapped entity, whose rows are returned as
+    instances of the entity rather than as rows.
+
+    Args:
+        query (Query[Any]): The query being executed.
+
+    Returns:
+        bool: True if the query selects a single mapped class or aliased class.
+    """
+    if len(query.column_descriptions) != 1:
+        return False
+    entity = inspect(query.column_descriptions[0]["expr"], raiseerr=False)
+    return bool(
+        getattr(entity, "is_mapper", False)
+        or getattr(entity, "is_aliased_class", False)
+    )
+
+
+def _fetch_with_extra_columns(
+    query: "Query[_T]", columns: Sequence[Any]
+) -> Tuple[List[_T], List[Tuple[Any, ...]]]:
+    """Executes the query with additional columns, separating them from the results.
+
+    Args:
+        query (Query[_T]): The query to execute.
+        columns (Sequence[Any]): The additional columns to select alongside each row.
+
+    Returns:
+        Tuple[List[_T], List[Tuple[Any, ...]]]: The rows, as the query would have
+            returned them, and the values of the additional columns for each row.
+    """
+    entity_count = len(query.column_descriptions)
+    rows: List[Any] = query.add_columns(*columns).all()
+    extras = [tuple(row[entity_count:]) for row in rows]
+    if _is_single_entity(query):
+        return [row[0] for row in rows], extras
+    if not rows:
+        return [], extras
+    # slicing a row returns a tuple, so the rows are rebuilt with the query's fields
+    make_row: Any = result_tuple(rows[0]._fields[:entity_count])
+    return [make_row(row[:entity_count]) for row in rows], extras
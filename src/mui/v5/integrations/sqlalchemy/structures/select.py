@@ -0,0 +1,218 @@
+"""The select module contains the DataGridSelect data structure.
+
+This structure applies the grid models to a 2.0 style `select()` statement, and
+executes it using `Session.execute()`, as an alternative to the legacy `Query` of
+`DataGridQuery`:
+
+    >>> dg_select = DataGridSelect(
+    ...     statement=select(ExampleModel),
+    ...     session=session,
+    ...     column_resolver=resolver,
+    ...     pagination_model=pagination_model,
+    ... )
+    >>> items, total = dg_select.items(), dg_select.total()
+"""
+from math import ceil
+from typing import Generic, List, Mapping, Optional, TypeVar, Union, overload
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel, GridSortModel
+from mui.v5.integrations.sqlalchemy.cache import StatementCache
+from mui.v5.integrations.sqlalchemy.filter import (
+    ColumnCaseFolding,
+    DateGranularity,
+    IsAnyOfStrategy,
+    OperatorApplicator,
+    QuickFilter,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.structures.base import DataGridSelectBase
+from mui.v5.integrations.sqlalchemy.structures.factory import Factory
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class DataGridSelect(DataGridSelectBase, Generic[_T]):
+    """A data grid select statement, executed using a Session.
+
+    The rows are paginated using `LIMIT` / `OFFSET`.
+
+    Args:
+        Generic (_type_): The model being retrieved by the statement.
+
+    Attributes:
+        session (Session): The session executing the statements.
+        statement (Select): The statement, after all models have been applied.
+    """
+
+    session: Session
+
+    def __init__(
+        self,
+        statement: Select,
+        session: Session,
+        column_resolver: Resolver,
+        filter_model: Optional[GridFilterModel] = None,
+        sort_model: Optional[GridSortModel] = None,
+        pagination_model: Optional[GridPaginationModel] = None,
+        lookahead: bool = False,
+        operators: Optional[Mapping[str, OperatorApplicator]] = None,
+        statement_cache: Optional[StatementCache] = None,
+        is_any_of_strategy: Optional[IsAnyOfStrategy] = None,
+        simplify_filter: bool = False,
+        date_granularity: DateGranularity = "exact",
+        case_folding: ColumnCaseFolding = "sensitive",
+        quick_filter: Optional[QuickFilter] = None,
+    ) -> None:
+        """Initialize a new data grid select statement.
+
+        Args:
+            statement (Select): The base select statement which the models will be
+                applied to, such as `select(ExampleModel)`.
+            session (Session): The session executing the statements.
+            column_resolver (Resolver): The field resolver which converts a UI field
+                to the corresponding SQLAlchemy column, column property, etc.
+            filter_model (Optional[GridFilterModel], optional): The filter model to
+                apply, if provided. Defaults to None.
+            sort_model (Optional[GridSortModel], optional): The sort model to apply,
+                if provided. Defaults to None.
+            pagination_model (Optional[GridPaginationModel], optional): The pagination
+                model to apply, if provided. Defaults to None.
+            lookahead (bool, optional): True to retrieve one row more than the page
+                size, which is discarded, to detect whether another page exists
+                without counting the rows. The result is recorded in `has_next` when
+                `items()` is called. Defaults to False.
+            operators (Optional[Mapping[str, OperatorApplicator]], optional): The
+                filter operator applicators which take precedence over the registered
+                applicators. Defaults to None.
+            statement_cache (Optional[StatementCache], optional): The cache used to
+                reuse the filter and sort clauses of requests sharing the same shape,
+                binding the filter values as parameters. Defaults to None.
+            is_any_of_strategy (Optional[IsAnyOfStrategy], optional): How the values
+                of isAnyOf filters are bound. Defaults to the strategy selected for the
+                session's dialect using `set_is_any_of_strategy()`, or "expanding".
+            simplify_filter (bool, optional): True to merge and remove the redundant
+                items of the filter model using `simplify_filter_model()` before
+                applying it. When the filter provably matches no rows, `items()` and
+                `total()` return without querying the database. Defaults to False.
+            date_granularity (DateGranularity, optional): How the date operators
+                compare the column to the filtered date, either "exact" or "day".
+                Defaults to "exact".
+            case_folding (ColumnCaseFolding, optional): How the contains,
+                startsWith, and endsWith operators compare strings, or a mapping of
+                the strategy of each field. Defaults to "sensitive".
+            quick_filter (Optional[QuickFilter], optional): The backend which applies
+                the quick filter values of the filter model. None to ignore the quick
+                filter values. Defaults to None.
+
+        Raises:
+            ValueError: Raised when the date granularity is not supported.
+            ValueError: Raised when a case folding strategy is not supported.
+            ValueError: Raised when the column resolver is a mapper resolver, and a
+                sorted field traverses a to-many relationship.
+        """
+        super().__init__(
+            column_resolver=column_resolver,
+            session=session,
+            filter_model=filter_model,
+            sort_model=sort_model,
+            pagination_model=pagination_model,
+            lookahead=lookahead,
+            operators=operators,
+            statement_cache=statement_cache,
+            is_any_of_strategy=is_any_of_strategy,
+            simplify_filter=simplify_filter,
+            date_granularity=date_granularity,
+            case_folding=case_folding,
+            quick_filter=quick_filter,
+        )
+        self.session = session
+        self._build(statement=statement)
+
+    def total(self) -> int:
+        """Returns the total number of rows that exist with the filter.
+
+        If the simplified filter matches no rows, no statement is executed.
+
+        Returns:
+            int: The count of total items before pagination, but after filtering.
+        """
+        if self._total is not None:
+            return self._total
+        if self._matches_nothing:
+            self._total = 0
+            return 0
+        total = self.session.execute(self._get_count_statement()).scalar_one()
+        self._total = int(total)
+        return self._total
+
+    @overload
+    def items(self, factory: None = ...) -> List[_T]:
+        """When a factory function is not provided, simply return the models.
+
+        Args:
+            factory (None, optional): This is not provided. Defaults to None.
+
+        Returns:
+            List[_T]: The list of models, without conversion.
+        """
+        ...
+
+    @overload
+    def items(self, factory: Factory[_T, _R]) -> List[_R]:
+        """When a factory function is provided, return a list of items created by
+        the factory.
+
+        Args:
+            factory (Callable[[_T], _R]): The factory to convert the type(s).
+
+        Returns:
+            List[_R]: The list of created items.
+        """
+        ...
+
+    def items(
+        self, factory: Optional[Factory[_T, _R]] = None
+    ) -> Union[List[_T], List[_R]]:
+        """Returns all results of the statement, after all models have been applied.
+
+        Args:
+            factory (Optional[Callable[[_T], _R]]): The factory function to convert the
+                model into a different type.
+
+        Returns:
+            List[_T]: The list of individual items located by the statement after all
+                models have been applied.
+        """
+        items = self._fetch()
+        return [factory(item) for item in items] if factory is not None else items
+
+    def _fetch(self) -> List[_T]:
+        """Executes the statement, recording whether another page exists.
+
+        Returns:
+            List[_T]: The list of individual items located by the statement. Rows
+                selecting a single entity or column are returned as that value.
+        """
+        if self._matches_nothing:
+            return self._get_empty_rows()
+        return self._get_rows(result=self.session.execute(self.statement))
+
+    def pages(self, total: Optional[int] = None) -> int:
+        """Returns the number of pages to display all results.
+
+        Args:
+            total (Optional[int], optional): The total number of results. This may
+                be provided to avoid the overhead of an additional database query to
+                retrieve the total. Defaults to None.
+
+        Returns:
+            int: The number of pages required to display all results at the current
+                page size.
+        """
+        if not total:
+            total = self.total()
+        return int(ceil(total / float(self.per_page)))
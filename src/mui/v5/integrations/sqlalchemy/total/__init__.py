@@ -0,0 +1,19 @@
+"""The total module contains the strategies used to count the filtered rows.
+
+An exact count requires the database to visit every matching row, which can take
+seconds on very large tables. These strategies trade precision for speed.
+"""
+from mui.v5.integrations.sqlalchemy.total.capped import count_capped
+from mui.v5.integrations.sqlalchemy.total.estimate import (
+    RowEstimator,
+    estimate_row_count,
+    register_row_estimator,
+)
+
+# isort: unique-list
+__all__ = [
+    "RowEstimator",
+    "count_capped",
+    "estimate_row_count",
+    "register_row_estimator",
+]
@@ -0,0 +1,28 @@
+"""The capped module counts the filtered rows up to a maximum."""
+from typing import Any
+
+from sqlalchemy.orm import Query
+
+
+def count_capped(query: "Query[Any]", cap: int) -> int:
+    """Counts at most `cap + 1` rows of the query.
+
+    The database stops visiting rows once the limit is reached, so the cost of the
+    count is bounded regardless of how many rows match the filter. A result greater
+    than the cap means that more than `cap` rows exist.
+
+    Args:
+        query (Query[Any]): The filtered query to count.
+        cap (int): The maximum number of rows to report exactly.
+
+    Raises:
+        ValueError: Raised when the cap is negative.
+
+    Returns:
+        int: The number of rows, up to `cap + 1`.
+    """
+    if cap < 0:
+        raise ValueError("cap must not be negative")
+    # count() wraps the limited query in a sub-query:
+    # SELECT count(*) FROM (SELECT ... LIMIT :cap) AS anon_1
+    return query.order_by(None).limit(cap + 1).count()
@@ -0,0 +1,126 @@
+"""The estimate module retrieves the query planner's estimate of the filtered rows.
+
+Estimators are registered per dialect. PostgreSQL and MySQL / MariaDB are supported
+out of the box using `EXPLAIN`. SQLite's planner does not estimate row counts, so no
+estimator is registered for it and callers fall back to an exact count.
+"""
+from json import loads
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement
+from typing_extensions import TypeAlias
+
+RowEstimator: TypeAlias = Callable[["Query[Any]"], Optional[int]]
+
+
+class _Explain(Executable, ClauseElement):
+    """Wraps a statement in the dialect's EXPLAIN statement.
+
+    Compiling the statement through SQLAlchemy ensures that bound parameters are
+    processed exactly as they are when the statement itself is executed.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        """Initialize the EXPLAIN statement.
+
+        Args:
+            statement (Any): The statement being explained.
+        """
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")  # type: ignore[misc]
+def _compile_postgresql_explain(
+    element: _Explain, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """Compiles the EXPLAIN statement for PostgreSQL."""
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+@compiles(_Explain)  # type: ignore[misc]
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    """Compiles the EXPLAIN statement for other dialects, such as MySQL."""
+    return f"EXPLAIN {compiler.process(element.statement, **kw)}"
+
+
+def _estimate_postgresql(query: "Query[Any]") -> Optional[int]:
+    """Retrieves the planner's row estimate from PostgreSQL.
+
+    Args:
+        query (Query[Any]): The filtered query to estimate.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None if unavailable.
+    """
+    session = query.session
+    if session is None:
+        return None
+    plan = session.execute(_Explain(query.order_by(None).statement)).scalar()
+    if isinstance(plan, str):
+        plan = loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _estimate_mysql(query: "Query[Any]") -> Optional[int]:
+    """Retrieves the planner's row estimate from MySQL or MariaDB.
+
+    Args:
+        query (Query[Any]): The filtered query to estimate.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None if unavailable.
+    """
+    session = query.session
+    if session is None:
+        return None
+    row = session.execute(_Explain(query.order_by(None).statement)).mappings().first()
+    if row is None or row.get("rows") is None:
+        return None
+    # filtered is the estimated percentage of rows remaining after the conditions
+    filtered = row.get("filtered")
+    percentage = float(filtered) if filtered is not None else 100.0
+    return int(int(row["rows"]) * percentage / 100)
+
+
+_ESTIMATORS: Dict[str, RowEstimator] = {
+    "mariadb": _estimate_mysql,
+    "mysql": _estimate_mysql,
+    "postgresql": _estimate_postgresql,
+}
+
+
+def register_row_estimator(dialect_name: str, estimator: RowEstimator) -> None:
+    """Registers, or replaces, the row estimator used for a dialect.
+
+    Args:
+        dialect_name (str): The name of the SQLAlchemy dialect, such as "sqlite".
+        estimator (RowEstimator): The callable which returns the estimated number of
+            rows for a query, or None if no estimate is available.
+    """
+    _ESTIMATORS[dialect_name] = estimator
+
+
+def estimate_row_count(query: "Query[Any]") -> Optional[int]:
+    """Retrieves the query planner's estimate of the number of rows a query returns.
+
+    Args:
+        query (Query[Any]): The filtered query to estimate.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None if the dialect has no
+            registered estimator or no estimate was available.
+    """
+    if query.session is None:
+        return None
+    dialect_name = query.session.get_bind().dialect.name
+    estimator = _ESTIMATORS.get(dialect_name)
+    return estimator(query) if estimator is not None else None
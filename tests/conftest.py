@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
 from math import floor
-from typing import Generator, Union
+from typing import Any, Generator, List, Union
 
 from pytest import fixture
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Query, Session
 
@@ -182,6 +182,23 @@ def engine() -> Generator[Engine, None, None]:
     Base.metadata.drop_all(bind=engine)
 
 
+@fixture
+def statements(engine: Engine) -> Generator[List[str], None, None]:
+    """The SQL statements executed while the fixture is active.
+
+    Yields:
+        List[str]: The SQL of each statement, in the order they were executed.
+    """
+    executed: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 @fixture(scope="session")
 def session(engine: Engine, parent_model_count: int) -> Generator[Session, None, None]:
     """The SQLAlchemy session, after committing models to the database.
@@ -0,0 +1,43 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from pytest import raises
+
+from mui.v5.grid import GridSortDirection, GridSortItem, GridSortModel
+from mui.v5.grid.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    sort_model: GridSortModel = [
+        GridSortItem(field="created_at", sort=GridSortDirection.DESC),
+        GridSortItem(field="name", sort=None),
+    ]
+    values = [
+        datetime(2022, 11, 1, 12, tzinfo=timezone.utc),
+        date(2022, 11, 1),
+        Decimal("1.50"),
+        uuid4(),
+        "name",
+        10,
+        None,
+    ]
+    cursor = encode_cursor(values=values, sort_model=sort_model)
+    assert "=" not in cursor
+    assert decode_cursor(cursor=cursor, sort_model=sort_model) == values
+
+
+def test_cursor_rejects_different_sort_model() -> None:
+    cursor = encode_cursor(
+        values=[1], sort_model=[GridSortItem(field="id", sort=GridSortDirection.ASC)]
+    )
+    with raises(ValueError):
+        decode_cursor(
+            cursor=cursor,
+            sort_model=[GridSortItem(field="id", sort=GridSortDirection.DESC)],
+        )
+
+
+def test_cursor_rejects_malformed_cursor() -> None:
+    with raises(ValueError):
+        decode_cursor(cursor="not a cursor!")
@@ -0,0 +1,90 @@
+from typing import Any, Dict, List
+from urllib.parse import quote
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import ValidationError, parse_obj_as
+from pytest import mark, raises
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridSortModel,
+    decode_grid_filter_model,
+    decode_grid_sort_model,
+    encode_grid_filter_model,
+    encode_grid_sort_model,
+)
+from tests.mui.v5.grid.filter.test_model import (
+    CamelCaseGridFilterModelData,
+    SnakeCaseGridFilterModelData,
+)
+from tests.mui.v5.grid.sort.test_item import GridSortItemData
+
+
+@given(st.one_of(CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData))
+def test_grid_filter_model_round_trips(obj: Dict[str, Any]) -> None:
+    model = GridFilterModel.parse_obj(obj)
+    assert repr(decode_grid_filter_model(encode_grid_filter_model(model))) == repr(
+        model
+    )
+
+
+@given(st.lists(GridSortItemData))
+def test_grid_sort_model_round_trips(obj: List[Dict[str, Any]]) -> None:
+    model = parse_obj_as(GridSortModel, obj)
+    assert decode_grid_sort_model(encode_grid_sort_model(model)) == model
+
+
+def test_compact_grid_filter_model_is_smaller_than_json() -> None:
+    model = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {
+                    "columnField": "name",
+                    "id": i,
+                    "operatorValue": "contains",
+                    "value": i,
+                }
+                for i in range(20)
+            ],
+            "linkOperator": "or",
+        }
+    )
+    compact = encode_grid_filter_model(model)
+    assert quote(compact) == compact
+    assert len(compact) * 3 < len(quote(model.json(by_alias=True)))
+
+
+def test_compact_grid_filter_model_omits_trailing_nulls() -> None:
+    compact = encode_grid_filter_model(
+        GridFilterModel.parse_obj({"items": [{"columnField": "name"}]})
+    )
+    # [[["name"]]]
+    assert compact == "W1tbIm5hbWUiXV1d"
+
+
+@mark.parametrize(
+    "compact",
+    (
+        # not base64url
+        "!!!",
+        # "nope"
+        "Im5vcGUi",
+        # [[], "and", null, "or", "extra"]
+        "W1tdLCJhbmQiLG51bGwsIm9yIiwiZXh0cmEiXQ",
+    ),
+)
+def test_malformed_compact_grid_models_raise_value_error(compact: str) -> None:
+    with raises(ValueError, match="Invalid compact grid model"):
+        decode_grid_filter_model(compact)
+    with raises(ValueError, match="Invalid compact grid model"):
+        decode_grid_sort_model(compact)
+
+
+def test_invalid_compact_grid_models_raise_validation_error() -> None:
+    # [[[1]], "xor"]
+    with raises(ValidationError):
+        decode_grid_filter_model("W1tbMV1dLCJ4b3IiXQ")
+    # [["name"]]
+    with raises(ValidationError):
+        decode_grid_sort_model("W1sibmFtZSJdXQ")
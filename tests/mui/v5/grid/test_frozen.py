@@ -0,0 +1,105 @@
+from copy import deepcopy
+from pickle import dumps, loads
+from typing import Any, Dict, List, cast
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pytest import raises
+
+from mui.v5.grid import (
+    FrozenDict,
+    FrozenList,
+    GridSortDirection,
+    RequestGridModels,
+    freeze_request_grid_models,
+    freeze_value,
+    thaw_value,
+)
+from tests.mui.v5.grid.filter.test_model import (
+    CamelCaseGridFilterModelData,
+    SnakeCaseGridFilterModelData,
+)
+from tests.mui.v5.grid.pagination.test_model import (
+    CamelCaseGridPaginationModelData,
+    SnakeCaseGridPaginationModelData,
+)
+from tests.mui.v5.grid.sort.test_item import GridSortItemData
+
+RequestGridModelsData = st.fixed_dictionaries(
+    {
+        "filterModel": st.one_of(
+            CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData
+        ),
+        "paginationModel": st.one_of(
+            CamelCaseGridPaginationModelData, SnakeCaseGridPaginationModelData
+        ),
+        "sortModel": st.lists(GridSortItemData),
+    }
+)
+
+
+@given(RequestGridModelsData)
+def test_frozen_request_grid_models_equal_the_models(obj: Dict[str, Any]) -> None:
+    models = RequestGridModels.parse_obj(obj)
+    frozen = freeze_request_grid_models(models)
+    assert repr(frozen.dict()) == repr(models.dict())
+    assert frozen.json(by_alias=True) == models.json(by_alias=True)
+    assert frozen.__fields_set__ == models.__fields_set__
+
+
+@given(RequestGridModelsData)
+def test_frozen_request_grid_models_copy_and_pickle(obj: Dict[str, Any]) -> None:
+    frozen = freeze_request_grid_models(RequestGridModels.parse_obj(obj))
+    # repr is compared, as NaN values are not equal to themselves
+    assert repr(deepcopy(frozen)) == repr(frozen)
+    assert repr(loads(dumps(frozen))) == repr(frozen)
+    assert freeze_request_grid_models(frozen) is frozen
+
+
+def test_frozen_request_grid_models_cannot_be_modified() -> None:
+    frozen = freeze_request_grid_models(
+        RequestGridModels.parse_obj(
+            {
+                "filterModel": {
+                    "items": [
+                        {
+                            "columnField": "id",
+                            "operatorValue": "isAnyOf",
+                            "value": [1, 2],
+                        }
+                    ]
+                },
+                "sortModel": [{"field": "id", "sort": "asc"}],
+            }
+        )
+    )
+    with raises(TypeError):
+        frozen.filter_model = frozen.filter_model  # type: ignore[misc]
+    with raises(TypeError):
+        frozen.filter_model.items.append(frozen.filter_model.items[0])
+    with raises(TypeError):
+        cast(List[Any], frozen.filter_model.items[0].value).append(3)
+    with raises(TypeError):
+        frozen.sort_model[0].sort = GridSortDirection.DESC
+    with raises(TypeError):
+        frozen.sort_model += frozen.sort_model  # type: ignore[misc]
+    with raises(TypeError):
+        frozen.pagination_model.page = 2
+    assert isinstance(frozen.sort_model, FrozenList)
+    assert hash(frozen.sort_model[0]) == hash(deepcopy(frozen.sort_model[0]))
+    assert frozen.copy(update={"sort_model": []}).sort_model == []
+
+
+def test_freeze_value_freezes_nested_dictionaries() -> None:
+    value = {"ids": [1, 2], "range": {"start": 0}}
+    frozen = freeze_value(value)
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen["ids"], FrozenList)
+    assert hash(frozen) == hash(freeze_value(value))
+    assert loads(dumps(frozen)) == value
+    assert thaw_value(frozen) == value
+    assert type(thaw_value(frozen)["range"]) is dict
+    with raises(TypeError):
+        frozen["ids"] = []
+    with raises(TypeError):
+        cast(Dict[str, Any], frozen).update(range=None)
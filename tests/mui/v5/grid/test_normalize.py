@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, cast
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import parse_obj_as
+from pytest import raises
+
+from mui.v5.grid import (
+    OPERATOR_SYNONYMS,
+    GridFilterModel,
+    GridLinkOperator,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    GridSortModel,
+    RequestGridModels,
+    fingerprint,
+    normalize,
+    shape_fingerprint,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators import SUPPORTED_BASIC_OPERATORS
+from tests.mui.v5.grid.filter.test_model import (
+    CamelCaseGridFilterModelData,
+    SnakeCaseGridFilterModelData,
+)
+from tests.mui.v5.grid.sort.test_item import GridSortItemData
+
+
+@given(st.one_of(CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData))
+def test_normalize_grid_filter_model_is_idempotent(obj: Dict[str, Any]) -> None:
+    normalized = normalize(GridFilterModel.parse_obj(obj))
+    # repr is compared, as NaN values are not equal to themselves
+    assert repr(normalize(normalized)) == repr(normalized)
+    assert fingerprint(normalized) == fingerprint(GridFilterModel.parse_obj(obj))
+
+
+@given(st.lists(GridSortItemData))
+def test_normalize_grid_sort_model_is_idempotent(obj: List[Dict[str, Any]]) -> None:
+    normalized = normalize(parse_obj_as(GridSortModel, obj))
+    assert normalize(normalized) == normalized
+    assert all(item.sort is not None for item in normalized)
+    assert len({item.field for item in normalized}) == len(normalized)
+
+
+def test_semantically_equal_grid_filter_models_share_a_fingerprint() -> None:
+    model = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "id", "id": 1, "operatorValue": "eq", "value": 1},
+                {
+                    "columnField": "name",
+                    "id": 2,
+                    "operatorValue": "isAnyOf",
+                    "value": ["b", "a", "b"],
+                },
+            ],
+        }
+    )
+    equal = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {
+                    "column_field": "name",
+                    "operator_value": "isAnyOf",
+                    "value": ["a", "b"],
+                },
+                {"column_field": "id", "id": 7, "operator_value": "=", "value": 1},
+                {"column_field": "id", "id": 8, "operator_value": "equals", "value": 1},
+            ],
+            "linkOperator": "and",
+            "quickFilterLogicOperator": "or",
+            "quickFilterValues": [],
+        }
+    )
+    assert normalize(model) == normalize(equal)
+    assert fingerprint(model) == fingerprint(equal)
+    assert fingerprint(model) != fingerprint(
+        model.copy(update={"link_operator": GridLinkOperator.Or})
+    )
+
+
+def test_shape_fingerprint_ignores_values() -> None:
+    def create(value: Any, page: int) -> RequestGridModels:
+        return RequestGridModels.parse_obj(
+            {
+                "filterModel": {
+                    "items": [
+                        {"columnField": "id", "operatorValue": ">", "value": value}
+                    ]
+                },
+                "paginationModel": {"page": page, "pageSize": 10},
+                "sortModel": [{"field": "id", "sort": "asc"}],
+            }
+        )
+
+    models = create(value=1, page=0)
+    assert fingerprint(models) != fingerprint(create(value=2, page=1))
+    assert shape_fingerprint(models) == shape_fingerprint(create(value=2, page=1))
+    assert shape_fingerprint(models) != shape_fingerprint(create(value=None, page=0))
+    assert shape_fingerprint(models) != shape_fingerprint(
+        models.copy(update={"pagination_model": GridPaginationModel(page_size=20)})
+    )
+    assert shape_fingerprint(models) != shape_fingerprint(
+        models.copy(
+            update={
+                "sort_model": [GridSortItem(field="id", sort=GridSortDirection.DESC)]
+            }
+        )
+    )
+
+
+def test_operator_synonyms_are_supported_by_the_basic_applicator() -> None:
+    assert set(OPERATOR_SYNONYMS).union(OPERATOR_SYNONYMS.values()) == (
+        SUPPORTED_BASIC_OPERATORS
+    )
+
+
+def test_unsupported_grid_models_raise_type_error() -> None:
+    with raises(TypeError):
+        fingerprint(cast(Any, {}))
@@ -0,0 +1,250 @@
+from copy import deepcopy
+from json import dumps, loads
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union, cast
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import BaseModel, ValidationError, parse_obj_as, parse_raw_as
+from pytest import MonkeyPatch, importorskip, mark, raises
+
+from mui.v5.grid import parse
+from mui.v5.grid import (
+    DEFAULT_JSON_DECODER,
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortModel,
+    parse_grid_filter_model,
+    parse_grid_filter_model_raw,
+    parse_grid_pagination_model,
+    parse_grid_pagination_model_raw,
+    parse_grid_sort_model,
+    parse_grid_sort_model_raw,
+)
+from tests.mui.v5.grid.filter.test_model import (
+    CamelCaseGridFilterModelData,
+    SnakeCaseGridFilterModelData,
+)
+from tests.mui.v5.grid.pagination.test_model import (
+    CamelCaseGridPaginationModelData,
+    SnakeCaseGridPaginationModelData,
+)
+from tests.mui.v5.grid.sort.test_item import GridSortItemData
+
+JsonData = st.recursive(
+    st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(),
+        st.floats(allow_nan=False),
+        st.text(max_size=8),
+    ),
+    lambda children: st.one_of(
+        st.lists(children, max_size=4),
+        st.dictionaries(
+            st.sampled_from(
+                (
+                    "items",
+                    "columnField",
+                    "operatorValue",
+                    "id",
+                    "value",
+                    "linkOperator",
+                    "field",
+                    "sort",
+                    "page",
+                    "pageSize",
+                    "cursor",
+                )
+            ),
+            children,
+            max_size=4,
+        ),
+    ),
+    max_leaves=12,
+)
+
+
+def assert_models_equal(
+    fast: Union[BaseModel, Sequence[BaseModel]],
+    slow: Union[BaseModel, Sequence[BaseModel]],
+) -> None:
+    assert repr(fast) == repr(slow)
+    fast_models = [fast] if isinstance(fast, BaseModel) else fast
+    slow_models = [slow] if isinstance(slow, BaseModel) else slow
+    # comparing the unset fields ensures the nested models have the same fields set
+    assert [model.json(exclude_unset=True) for model in fast_models] == [
+        model.json(exclude_unset=True) for model in slow_models
+    ]
+
+
+def assert_parsed_equally(
+    obj: Any, fast: Callable[[Any], Any], slow: Callable[[Any], Any]
+) -> None:
+    expected_error: Optional[Exception] = None
+    try:
+        # the root validator adds the missing optional keys to the parsed object
+        expected = slow(deepcopy(obj))
+    except (TypeError, ValueError) as error:
+        expected_error = error
+    if isinstance(expected_error, ValidationError):
+        with raises(ValidationError) as validation_error_info:
+            fast(obj)
+        validation_error = cast(ValidationError, validation_error_info.value)
+        assert validation_error.errors() == expected_error.errors()
+    elif expected_error is not None:
+        # such as the JSON decoding errors which parse_raw_as doesn't wrap
+        with raises(type(expected_error)) as error_info:
+            fast(obj)
+        assert str(error_info.value) == str(expected_error)
+    else:
+        assert_models_equal(fast(obj), expected)
+
+
+@given(st.one_of(CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData))
+def test_parse_grid_filter_model_matches_pydantic(obj: Dict[str, Any]) -> None:
+    assert_models_equal(
+        parse_grid_filter_model(obj), GridFilterModel.parse_obj(deepcopy(obj))
+    )
+
+
+@given(st.lists(GridSortItemData))
+def test_parse_grid_sort_model_matches_pydantic(obj: List[Dict[str, Any]]) -> None:
+    assert_models_equal(parse_grid_sort_model(obj), parse_obj_as(GridSortModel, obj))
+
+
+@given(st.one_of(CamelCaseGridPaginationModelData, SnakeCaseGridPaginationModelData))
+def test_parse_grid_pagination_model_matches_pydantic(obj: Dict[str, Any]) -> None:
+    assert_models_equal(
+        parse_grid_pagination_model(obj), GridPaginationModel.parse_obj(obj)
+    )
+
+
+@given(JsonData)
+def test_parse_arbitrary_json_matches_pydantic(obj: Any) -> None:
+    assert_parsed_equally(
+        obj,
+        fast=parse_grid_filter_model,
+        slow=GridFilterModel.parse_obj,
+    )
+    assert_parsed_equally(
+        obj,
+        fast=parse_grid_sort_model,
+        slow=lambda obj: parse_obj_as(GridSortModel, obj),
+    )
+    assert_parsed_equally(
+        obj, fast=parse_grid_pagination_model, slow=GridPaginationModel.parse_obj
+    )
+
+
+@mark.parametrize(
+    "raw",
+    (
+        '{"items": [{"columnField": "name", "id": 1, "operatorValue": "contains"}]}',
+        '{"items": [{"columnField": "name", "id": "1"}], "linkOperator": "or"}',
+        '{"items": "name"}',
+        '{"linkOperator": "xor"}',
+        "not json",
+        "",
+    ),
+)
+def test_parse_grid_filter_model_raw_matches_pydantic(raw: str) -> None:
+    assert_parsed_equally(
+        raw, fast=parse_grid_filter_model_raw, slow=GridFilterModel.parse_raw
+    )
+
+
+@mark.parametrize(
+    "raw",
+    (
+        '[{"field": "name", "sort": "asc"}, {"field": "id", "sort": null}]',
+        '[{"field": "name"}]',
+        '[{"field": "name", "sort": "ascending"}]',
+        '{"field": "name", "sort": "asc"}',
+        "[",
+    ),
+)
+def test_parse_grid_sort_model_raw_matches_pydantic(raw: str) -> None:
+    assert_parsed_equally(
+        raw,
+        fast=parse_grid_sort_model_raw,
+        slow=lambda raw: parse_raw_as(GridSortModel, raw),
+    )
+
+
+@mark.parametrize(
+    "raw",
+    (
+        '{"page": 2, "pageSize": 30, "cursor": "abc"}',
+        '{"page": "2", "page_size": "30"}',
+        '{"page": -1, "pageSize": 0}',
+        '{"page": 1.5}',
+        "{",
+    ),
+)
+def test_parse_grid_pagination_model_raw_matches_pydantic(raw: str) -> None:
+    assert_parsed_equally(
+        raw, fast=parse_grid_pagination_model_raw, slow=GridPaginationModel.parse_raw
+    )
+
+
+def test_parse_grid_pagination_model_converts_query_string_integers() -> None:
+    parsed = parse_grid_pagination_model({"page": "3", "pageSize": "25"})
+    assert parsed == GridPaginationModel(page=3, page_size=25)
+    assert parsed.__fields_set__ == {"page", "page_size"}
+
+
+def test_parse_grid_filter_model_raw_uses_construct() -> None:
+    raw = dumps({"items": [{"columnField": "name", "value": "a"}]})
+    parsed = parse_grid_filter_model_raw(raw)
+    assert parsed.items[0].operator_value is None
+    assert parsed.__fields_set__ == {
+        "items",
+        "link_operator",
+        "quick_filter_logic_operator",
+        "quick_filter_values",
+    }
+
+
+def test_parse_grid_models_raw_use_the_decoder() -> None:
+    decoded: List[Union[str, bytes]] = []
+
+    def decoder(raw: Union[str, bytes]) -> Any:
+        decoded.append(raw)
+        return loads(raw)
+
+    parse_grid_filter_model_raw(raw='{"items": []}', decoder=decoder)
+    parse_grid_sort_model_raw(raw="[]", decoder=decoder)
+    parse_grid_pagination_model_raw(raw='{"page": 1}', decoder=decoder)
+    assert decoded == ['{"items": []}', "[]", '{"page": 1}']
+
+
+def test_default_json_decoder_uses_orjson_when_installed(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    orjson = importorskip("orjson")
+    decoded: List[Union[str, bytes]] = []
+    loads_with_orjson = orjson.loads
+
+    def orjson_loads(raw: Union[str, bytes]) -> Any:
+        decoded.append(raw)
+        return loads_with_orjson(raw)
+
+    monkeypatch.setattr(orjson, "loads", orjson_loads)
+    decoder = parse._get_default_json_decoder()
+    assert decoder('{"page": 1}') == {"page": 1}
+    assert decoded == ['{"page": 1}']
+
+
+@mark.parametrize("raw", ("18446744073709551617", b"-9223372036854775809"))
+def test_default_json_decoder_preserves_large_integers(raw: Union[str, bytes]) -> None:
+    assert DEFAULT_JSON_DECODER(raw) == loads(raw)
+
+
+def test_documents_rejected_by_the_decoder_are_decoded_by_pydantic() -> None:
+    # orjson, for example, rejects NaN which the standard library accepts
+    def decoder(raw: Union[str, bytes]) -> Any:
+        raise ValueError("unsupported document")
+
+    raw = '{"items": [{"columnField": "id", "value": NaN}]}'
+    parsed = parse_grid_filter_model_raw(raw=raw, decoder=decoder)
+    assert repr(parsed) == repr(GridFilterModel.parse_raw(raw))
@@ -0,0 +1,125 @@
+from typing import Any, Dict, List, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pytest import mark, raises
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridLinkOperator,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    parse_grid_filter_model_from_query_string,
+    parse_grid_pagination_model_from_query_string,
+    parse_grid_sort_model_from_query_string,
+    parse_nested_query_string,
+)
+
+Names = st.text(
+    alphabet=st.characters(blacklist_characters="[]"), min_size=1, max_size=8
+).filter(lambda name: not name.isdecimal())
+NestedData = st.recursive(
+    st.text(max_size=8),
+    lambda children: st.one_of(
+        st.lists(children, min_size=1, max_size=4),
+        st.dictionaries(Names, children, min_size=1, max_size=4),
+    ),
+    max_leaves=12,
+)
+
+
+def serialize(prefix: str, value: Any) -> List[Tuple[str, str]]:
+    """Serializes a value into nested arguments, as qs does using indexes."""
+    if isinstance(value, list):
+        value = dict(enumerate(value))
+    if isinstance(value, dict):
+        return [
+            arg
+            for key, child in value.items()
+            for arg in serialize(f"{prefix}[{key}]", child)
+        ]
+    return [(prefix, value)]
+
+
+@given(st.dictionaries(Names, NestedData, max_size=4))
+def test_parse_nested_query_string_round_trips(obj: Dict[str, Any]) -> None:
+    args = [arg for key, value in obj.items() for arg in serialize(key, value)]
+    assert parse_nested_query_string(args) == obj
+
+
+def test_parse_nested_query_string_orders_arrays_by_index() -> None:
+    args = [("a[2]", "c"), ("a[0]", "a"), ("a[1]", "b"), ("b[]", "x"), ("b[]", "y")]
+    assert parse_nested_query_string(args) == {"a": ["a", "b", "c"], "b": ["x", "y"]}
+
+
+def test_parse_nested_query_string_skips_other_keys() -> None:
+    args = [("a[b]", "1"), ("c[", "malformed"), ("d", "2")]
+    assert parse_nested_query_string(args, keys=("a",)) == {"a": {"b": "1"}}
+
+
+@mark.parametrize(
+    "args",
+    (
+        [("a", "1"), ("a[b]", "2")],
+        [("a[b]", "1"), ("a[b]", "2")],
+        [("a[0]", "1"), ("a[b]", "2")],
+        [("a[b", "1")],
+        [("[a]", "1")],
+        [("a[b]c]", "1")],
+    ),
+)
+def test_parse_nested_query_string_rejects_malformed_arguments(
+    args: List[Tuple[str, str]]
+) -> None:
+    with raises(ValueError):
+        parse_nested_query_string(args)
+
+
+def test_parse_grid_filter_model_from_query_string() -> None:
+    args = [
+        ("filterModel[items][0][columnField]", "name"),
+        ("filterModel[items][0][operatorValue]", "contains"),
+        ("filterModel[items][0][value]", "a"),
+        ("filterModel[items][1][columnField]", "id"),
+        ("filterModel[items][1][id]", "2"),
+        ("filterModel[items][1][operatorValue]", "isAnyOf"),
+        ("filterModel[items][1][value][]", "1"),
+        ("filterModel[items][1][value][]", "2"),
+        ("filterModel[linkOperator]", "or"),
+    ]
+    model = parse_grid_filter_model_from_query_string(args, key="filterModel")
+    assert model == GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "name", "operatorValue": "contains", "value": "a"},
+                {
+                    "columnField": "id",
+                    "id": 2,
+                    "operatorValue": "isAnyOf",
+                    "value": ["1", "2"],
+                },
+            ],
+            "linkOperator": GridLinkOperator.Or,
+        }
+    )
+    assert parse_grid_filter_model_from_query_string(args, key="other") is None
+
+
+def test_parse_grid_sort_model_from_query_string_defaults_sort_to_none() -> None:
+    args = [
+        ("sortModel[0][field]", "name"),
+        ("sortModel[0][sort]", "desc"),
+        ("sortModel[1][field]", "id"),
+    ]
+    assert parse_grid_sort_model_from_query_string(args, key="sortModel") == [
+        GridSortItem(field="name", sort=GridSortDirection.DESC),
+        GridSortItem(field="id", sort=None),
+    ]
+
+
+def test_parse_grid_pagination_model_from_query_string() -> None:
+    args = [("paginationModel[page]", "2"), ("paginationModel[pageSize]", "25")]
+    assert parse_grid_pagination_model_from_query_string(
+        args, key="paginationModel"
+    ) == GridPaginationModel(page=2, page_size=25)
@@ -0,0 +1,117 @@
+from copy import deepcopy
+from hashlib import sha256
+from pickle import dumps, loads
+from typing import Any, Dict, List, cast
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import parse_obj_as
+from pytest import raises
+
+from mui.v5.grid import (
+    FrozenGridFilterModel,
+    FrozenList,
+    GridFilterItemSnapshot,
+    GridFilterModel,
+    GridFilterModelSnapshot,
+    GridPaginationModel,
+    GridPaginationModelSnapshot,
+    GridSortDirection,
+    GridSortItem,
+    GridSortModel,
+    GridSortModelSnapshot,
+    freeze_grid_filter_model,
+)
+from tests.mui.v5.grid.filter.test_model import (
+    CamelCaseGridFilterModelData,
+    SnakeCaseGridFilterModelData,
+)
+from tests.mui.v5.grid.pagination.test_model import CamelCaseGridPaginationModelData
+from tests.mui.v5.grid.sort.test_item import GridSortItemData
+
+
+@given(st.one_of(CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData))
+def test_grid_filter_model_snapshot_round_trips(obj: Dict[str, Any]) -> None:
+    model = GridFilterModel.parse_obj(obj)
+    snapshot = GridFilterModelSnapshot.from_model(model)
+    # repr is compared, as NaN values are not equal to themselves
+    assert repr(GridFilterModelSnapshot.from_model(snapshot.to_model())) == repr(
+        snapshot
+    )
+    assert repr(loads(dumps(snapshot))) == repr(snapshot)
+    assert repr(deepcopy(snapshot)) == repr(snapshot)
+
+
+@given(st.one_of(CamelCaseGridFilterModelData, SnakeCaseGridFilterModelData))
+def test_grid_filter_model_snapshot_ignores_item_order(obj: Dict[str, Any]) -> None:
+    model = GridFilterModel.parse_obj(obj)
+    reversed_model = model.copy(update={"items": model.items[::-1]})
+    snapshot = GridFilterModelSnapshot.from_model(model)
+    reversed_snapshot = GridFilterModelSnapshot.from_model(reversed_model)
+    assert snapshot.fingerprint == reversed_snapshot.fingerprint
+    assert hash(snapshot) == hash(reversed_snapshot)
+
+
+@given(st.lists(GridSortItemData))
+def test_grid_sort_model_snapshot_round_trips(obj: List[Dict[str, Any]]) -> None:
+    model = parse_obj_as(GridSortModel, obj)
+    snapshot = GridSortModelSnapshot.from_model(model)
+    assert snapshot.to_model() == model
+    assert loads(dumps(snapshot)) == snapshot
+    assert {snapshot: True}[GridSortModelSnapshot.from_model(model)]
+
+
+@given(CamelCaseGridPaginationModelData)
+def test_grid_pagination_model_snapshot_round_trips(obj: Dict[str, Any]) -> None:
+    model = GridPaginationModel.parse_obj(obj)
+    snapshot = GridPaginationModelSnapshot.from_model(model)
+    assert snapshot.to_model() == model
+    assert loads(dumps(snapshot)) == snapshot
+
+
+def test_grid_sort_model_snapshot_keeps_item_order() -> None:
+    name = GridSortItem(field="name", sort=GridSortDirection.ASC)
+    id_ = GridSortItem(field="id", sort=GridSortDirection.DESC)
+    assert GridSortModelSnapshot.from_model(
+        [name, id_]
+    ) != GridSortModelSnapshot.from_model([id_, name])
+
+
+def test_grid_filter_item_snapshot_fingerprint_is_stable() -> None:
+    snapshot = GridFilterItemSnapshot(
+        column_field="id", operator_value="isAnyOf", value=[1, 2]
+    )
+    assert snapshot.value == [1, 2]
+    assert isinstance(snapshot.value, FrozenList)
+    canonical = (
+        '["GridFilterItemSnapshot",{"column_field":"id","id":null,'
+        '"operator_value":"isAnyOf","value":[1,2]}]'
+    )
+    assert snapshot.fingerprint == sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def test_grid_model_snapshots_are_immutable() -> None:
+    snapshot = GridFilterItemSnapshot(column_field="name", value={"a": [1]})
+    value = cast(Dict[str, Any], snapshot.value)
+    with raises(TypeError):
+        snapshot.column_field = "id"  # type: ignore[misc]
+    with raises(TypeError):
+        del snapshot.value
+    with raises(TypeError):
+        value["a"] = 2
+    with raises(TypeError):
+        value["a"].append(2)
+
+
+def test_grid_model_snapshots_are_frozen_grid_models() -> None:
+    model = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "name", "operatorValue": "isAnyOf", "value": [1]}]}
+    )
+    snapshot = GridFilterModelSnapshot.from_model(model)
+    assert isinstance(snapshot, FrozenGridFilterModel)
+    assert freeze_grid_filter_model(snapshot) is snapshot
+    assert GridFilterModelSnapshot.from_model(snapshot) is snapshot
+    assert GridFilterModelSnapshot.parse_obj(model.dict()) == snapshot
+    assert GridFilterModelSnapshot.parse_obj(model.dict()).fingerprint == (
+        snapshot.fingerprint
+    )
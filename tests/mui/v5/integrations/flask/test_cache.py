@@ -0,0 +1,65 @@
+from json import loads
+from typing import Any, List, Union
+from urllib.parse import quote
+
+from flask import Flask
+from pytest import raises
+
+from mui.v5.grid import FrozenRequestGridModels, GridPaginationModel
+from mui.v5.integrations.flask import GridModelsCache, get_grid_models_from_request
+
+app = Flask(__name__)
+
+FILTER_MODEL = quote('{"items": [{"columnField": "name", "value": "a"}]}')
+SORT_MODEL = quote('[{"field": "name", "sort": "asc"}]')
+
+
+def test_grid_models_cache_skips_parsing_repeated_arguments() -> None:
+    decoded: List[Union[str, bytes]] = []
+
+    def decoder(raw: Union[str, bytes]) -> Any:
+        decoded.append(raw)
+        return loads(raw)
+
+    cache = GridModelsCache()
+    path = f"/?filter_model={FILTER_MODEL}&sort_model[]={SORT_MODEL}&page=2&other=1"
+    with app.test_request_context(path=path):
+        first = get_grid_models_from_request(decoder=decoder, cache=cache)
+    with app.test_request_context(path=path.replace("other=1", "other=2")):
+        second = get_grid_models_from_request(decoder=decoder, cache=cache)
+    assert second is first
+    assert isinstance(first, FrozenRequestGridModels)
+    assert len(decoded) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert first.filter_model.items[0].value == "a"
+    assert first.pagination_model == GridPaginationModel(page=2)
+
+
+def test_grid_models_cache_distinguishes_arguments_and_options() -> None:
+    cache = GridModelsCache()
+    with app.test_request_context(path=f"/?filter_model={FILTER_MODEL}&page=1"):
+        first = get_grid_models_from_request(cache=cache)
+    with app.test_request_context(path=f"/?filter_model={FILTER_MODEL}&page=2"):
+        second = get_grid_models_from_request(cache=cache)
+        third = get_grid_models_from_request(
+            cache=cache, filter_model_key="filterModel"
+        )
+    assert first.pagination_model.page == 1
+    assert second.pagination_model.page == 2
+    assert third.filter_model.items == []
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 3)
+
+
+def test_grid_models_cache_evicts_least_recently_used_models() -> None:
+    cache = GridModelsCache(maxsize=2)
+    for page in (1, 2, 1, 3, 1, 2):
+        with app.test_request_context(path=f"/?page={page}"):
+            get_grid_models_from_request(cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (2, 4, 2)
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_grid_models_cache_requires_a_positive_maxsize() -> None:
+    with raises(ValueError):
+        GridModelsCache(maxsize=0)
@@ -1,4 +1,5 @@
-from typing import Dict
+from json import loads
+from typing import Any, Dict, List, Union
 from urllib.parse import quote
 
 from flask import Flask
@@ -6,9 +7,11 @@ from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.strategies import SearchStrategy
 
+from mui.v5.grid.compact import encode_grid_filter_model, encode_grid_sort_model
 from mui.v5.grid.filter.model import GridFilterModel
 from mui.v5.grid.pagination.model import GridPaginationModel
 from mui.v5.grid.request import RequestGridModels
+from mui.v5.grid.sort.direction import GridSortDirection
 from mui.v5.grid.sort.item import GridSortItem
 from mui.v5.integrations.flask.request import get_grid_models_from_request
 from tests.mui.v5.grid.filter.test_model import (
@@ -175,3 +178,81 @@ def test_parse_nested_snake_case_request_grid_models_from_flask_request(
             assert all(isinstance(item, GridSortItem) for item in model.sort_model)
             # grid pagination model validation
             assert isinstance(model.pagination_model, GridPaginationModel)
+
+
+def test_request_grid_models_are_decoded_once_by_the_decoder() -> None:
+    decoded: List[Union[str, bytes]] = []
+
+    def decoder(raw: Union[str, bytes]) -> Any:
+        decoded.append(raw)
+        return loads(raw)
+
+    filter_model = '{"items": [{"columnField": "name", "value": "a"}]}'
+    sort_model = '[{"field": "name", "sort": "asc"}]'
+    pagination_model = '{"page": 2, "pageSize": 10}'
+    with app.test_request_context(
+        path=(
+            f"/?{SNAKE_FILTER_MODEL_KEY}={quote(filter_model)}"
+            f"&{SNAKE_SORT_MODEL_KEY}={quote(sort_model)}"
+            f"&{SNAKE_PAGINATION_MODEL_KEY}={quote(pagination_model)}"
+        ),
+    ):
+        model = get_grid_models_from_request(
+            sort_model_key=SNAKE_SORT_MODEL_KEY,
+            filter_model_key=SNAKE_FILTER_MODEL_KEY,
+            pagination_model_key=SNAKE_PAGINATION_MODEL_KEY,
+            decoder=decoder,
+        )
+    assert decoded == [filter_model, sort_model, pagination_model]
+    assert model.filter_model.items[0].value == "a"
+    assert model.sort_model == [GridSortItem(field="name", sort=GridSortDirection.ASC)]
+    assert model.pagination_model == GridPaginationModel(page=2, page_size=10)
+
+
+def test_parse_compact_request_grid_models_from_flask_request() -> None:
+    filter_model = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "name", "operatorValue": "contains", "value": "a"}]}
+    )
+    sort_model = [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+    with app.test_request_context(
+        path=(
+            f"/?{SNAKE_FILTER_MODEL_KEY}={encode_grid_filter_model(filter_model)}"
+            f"&{SNAKE_SORT_MODEL_KEY}={encode_grid_sort_model(sort_model)}"
+        ),
+    ):
+        model = get_grid_models_from_request(
+            sort_model_key=SNAKE_SORT_MODEL_KEY,
+            filter_model_key=SNAKE_FILTER_MODEL_KEY,
+            sort_model_format="compact",
+            filter_model_format="compact",
+        )
+    assert model.filter_model == filter_model
+    assert model.sort_model == sort_model
+
+
+def test_parse_nested_request_grid_models_from_flask_request() -> None:
+    query_string = "&".join(
+        (
+            "filterModel[items][0][columnField]=name",
+            "filterModel[items][0][operatorValue]=contains",
+            "filterModel[items][0][value]=a",
+            "sortModel[0][field]=name",
+            "sortModel[0][sort]=desc",
+            "paginationModel[page]=2",
+            "paginationModel[pageSize]=10",
+        )
+    )
+    with app.test_request_context(path=f"/?{quote(query_string, safe='=&')}"):
+        model = get_grid_models_from_request(
+            sort_model_key=CAMEL_SORT_MODEL_KEY,
+            filter_model_key=CAMEL_FILTER_MODEL_KEY,
+            pagination_model_key=CAMEL_PAGINATION_MODEL_KEY,
+            sort_model_format="querystring",
+            filter_model_format="querystring",
+            pagination_model_format="querystring",
+        )
+    assert model.filter_model == GridFilterModel.parse_obj(
+        {"items": [{"columnField": "name", "operatorValue": "contains", "value": "a"}]}
+    )
+    assert model.sort_model == [GridSortItem(field="name", sort=GridSortDirection.DESC)]
+    assert model.pagination_model == GridPaginationModel(page=2, page_size=10)
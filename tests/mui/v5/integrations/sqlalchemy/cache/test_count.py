@@ -0,0 +1,180 @@
+from typing import Any, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel
+from mui.v5.integrations.sqlalchemy import (
+    DataGridQuery,
+    LikeQuickFilter,
+    MemoryCountCache,
+)
+from mui.v5.integrations.sqlalchemy.cache import get_count_cache_key
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memory_count_cache_expires_entries() -> None:
+    timer = FakeTimer()
+    cache = MemoryCountCache(ttl=10, timer=timer)
+    cache.set(key="key", value=5, tables={"table"})
+    assert cache.get("key") == 5
+    timer.now = 10
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_memory_count_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCountCache(maxsize=2)
+    cache.set(key="a", value=1, tables=set())
+    cache.set(key="b", value=2, tables=set())
+    assert cache.get("a") == 1
+    cache.set(key="c", value=3, tables=set())
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_memory_count_cache_invalidates_by_table() -> None:
+    cache = MemoryCountCache()
+    cache.set(key="a", value=1, tables={"parent", "child"})
+    cache.set(key="b", value=2, tables={"parent"})
+    cache.set(key="c", value=3, tables={"other"})
+    cache.invalidate("child")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.invalidate("parent")
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_count_cache_key_ignores_filter_item_aliases(
+    query: "Query[ParentModel]",
+) -> None:
+    camel = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "id", "operatorValue": ">", "value": 1}]}
+    )
+    snake = GridFilterModel.parse_obj(
+        {"items": [{"column_field": "id", "operator_value": ">", "value": 1}]}
+    )
+    other = GridFilterModel.parse_obj(
+        {"items": [{"column_field": "id", "operator_value": ">", "value": 2}]}
+    )
+    key = get_count_cache_key(query=query, filter_model=camel)
+    assert key == get_count_cache_key(query=query, filter_model=snake)
+    assert key != get_count_cache_key(query=query, filter_model=other)
+    assert key != get_count_cache_key(
+        query=query.filter(ParentModel.grouping_id == 1), filter_model=camel
+    )
+
+
+def test_count_cache_key_ignores_filter_item_order(
+    query: "Query[ParentModel]",
+) -> None:
+    items = [
+        {"columnField": "id", "operatorValue": ">", "value": 1},
+        {"columnField": "name", "operatorValue": "contains", "value": "a"},
+    ]
+    model = GridFilterModel.parse_obj({"items": items})
+    reordered = GridFilterModel.parse_obj({"items": items[::-1]})
+    assert get_count_cache_key(query=query, filter_model=model) == get_count_cache_key(
+        query=query, filter_model=reordered
+    )
+
+
+def test_data_grid_query_counts_once_per_filter(
+    engine: Engine, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    cache = MemoryCountCache()
+    filter_model = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "grouping_id", "operatorValue": "<", "value": 3}]}
+    )
+    expected_total = query.filter(ParentModel.grouping_id < 3).count()
+    statements: List[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for page in range(3):
+            dg_query = DataGridQuery(
+                query=query,
+                column_resolver=resolver,
+                filter_model=filter_model,
+                pagination_model=GridPaginationModel(page=page),
+                count_cache=cache,
+            )
+            assert dg_query.total() == expected_total
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert len(statements) == 1
+
+    cache.invalidate(ParentModel.__tablename__)
+    assert len(cache) == 0
+
+
+def test_data_grid_query_counts_once_per_quick_filter(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    cache = MemoryCountCache()
+    filter_model = GridFilterModel.parse_obj({"items": [], "quickFilterValues": ["7"]})
+    expected_totals = (
+        (
+            LikeQuickFilter(fields=["name"]),
+            query.filter(ParentModel.name.contains("7")),
+        ),
+        (
+            LikeQuickFilter(fields=["grouping_id"]),
+            query.filter(ParentModel.id % 10 == 7),
+        ),
+        (None, query),
+        (
+            LikeQuickFilter(fields=["name"]),
+            query.filter(ParentModel.name.contains("7")),
+        ),
+    )
+    for quick_filter, expected in expected_totals:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=filter_model,
+            count_cache=cache,
+            quick_filter=quick_filter,
+        )
+        assert dg_query.total() == expected.count()
+    assert len(cache) == 3
+
+
+def test_data_grid_query_does_not_cache_totals_of_custom_operators(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    cache = MemoryCountCache()
+    filter_model = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "grouping_id", "operatorValue": "<", "value": 3}]}
+    )
+    default = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model,
+        count_cache=cache,
+    )
+    assert default.total() == 120
+    custom = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model,
+        count_cache=cache,
+        operators={"<": lambda column, item: column <= item.value},
+    )
+    assert custom.total() == 160
+    assert len(cache) == 1
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Optional
+
+from pytest import mark, raises
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v5.integrations.sqlalchemy import DataGridQuery, StatementCache
+from mui.v5.integrations.sqlalchemy.cache import get_filter_shape
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.structures.query import PaginationStrategy
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def get_filter_model(*items: Dict[str, Any]) -> GridFilterModel:
+    return GridFilterModel.parse_obj({"items": list(items), "linkOperator": "and"})
+
+
+def get_ids(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    filter_model: GridFilterModel,
+    cache: Optional[StatementCache] = None,
+    pagination_strategy: PaginationStrategy = "offset",
+) -> List[int]:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model,
+        sort_model=[GridSortItem(field="name", sort=GridSortDirection.DESC)],
+        pagination_model=GridPaginationModel(page=1, page_size=5),
+        pagination_strategy=pagination_strategy,
+        statement_cache=cache,
+    )
+    # the total also has to bind the cached parameters
+    assert dg_query.total() >= 0
+    return [item.id for item in dg_query.items()]
+
+
+@mark.parametrize("pagination_strategy", ("offset", "deferred_join"))
+def test_cached_clauses_match_uncached_clauses(
+    pagination_strategy: PaginationStrategy,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    cache = StatementCache()
+    for low, ids, name in ((10, list(range(200)), "2"), (5, list(range(100)), "1")):
+        filter_model = get_filter_model(
+            {"columnField": "id", "operatorValue": ">", "value": low},
+            {"columnField": "id", "operatorValue": "isAnyOf", "value": ids},
+            {"columnField": "name", "operatorValue": "contains", "value": name},
+            {"columnField": "null_field", "operatorValue": "isEmpty"},
+        )
+        page_ids = get_ids(
+            query=query,
+            resolver=resolver,
+            filter_model=filter_model,
+            cache=cache,
+            pagination_strategy=pagination_strategy,
+        )
+        assert len(page_ids) == 5
+        assert page_ids == get_ids(
+            query=query,
+            resolver=resolver,
+            filter_model=filter_model,
+            pagination_strategy=pagination_strategy,
+        )
+    # the filter and sort clauses are each built once, then reused
+    assert len(cache) == (2 if pagination_strategy == "offset" else 1)
+    assert cache.hits == len(cache)
+
+
+@mark.parametrize(
+    "first,second",
+    (
+        ({"operatorValue": "==", "value": 1}, {"operatorValue": "==", "value": None}),
+        (
+            {"operatorValue": "isAnyOf", "value": [1]},
+            {"operatorValue": "isAnyOf", "value": []},
+        ),
+        ({"operatorValue": "is", "value": 1}, {"operatorValue": "is", "value": 2}),
+        ({"operatorValue": ">", "value": 1}, {"operatorValue": "<", "value": 1}),
+    ),
+)
+def test_filter_shape_includes_values_which_change_the_clause(
+    first: Dict[str, Any], second: Dict[str, Any]
+) -> None:
+    assert get_filter_shape(
+        get_filter_model({"columnField": "id", **first})
+    ) != get_filter_shape(get_filter_model({"columnField": "id", **second}))
+
+
+def test_filter_shape_excludes_bindable_values() -> None:
+    assert get_filter_shape(
+        get_filter_model(
+            {"columnField": "id", "operatorValue": "isAnyOf", "value": [1]}
+        )
+    ) == get_filter_shape(
+        get_filter_model(
+            {"columnField": "id", "operatorValue": "isAnyOf", "value": [1, 2, 3]}
+        )
+    )
+
+
+def test_statement_cache_evicts_least_recently_used() -> None:
+    cache = StatementCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_statement_cache_requires_a_positive_size() -> None:
+    with raises(ValueError):
+        StatementCache(maxsize=0)
@@ -0,0 +1,131 @@
+from typing import Any
+
+from pytest import mark, raises
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.filter import get_case_folding_operators
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    apply_case_folded_operator,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures import ParentModel
+
+
+def get_sql(clause: Any, dialect: Any) -> str:
+    return str(clause.compile(dialect=dialect))
+
+
+def name_model(operator: str, value: Any) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {"items": [{"columnField": "name", "operatorValue": operator, "value": value}]}
+    )
+
+
+@mark.parametrize(
+    "case_folding,operator,expected",
+    (
+        (
+            "sensitive",
+            "contains",
+            "test_model.name LIKE '%%' || %(name_1)s || '%%'",
+        ),
+        (
+            "citext",
+            "startsWith",
+            "test_model.name LIKE %(name_1)s || '%%'",
+        ),
+        (
+            "ilike",
+            "contains",
+            "test_model.name ILIKE '%%' || %(param_1)s || '%%'",
+        ),
+        (
+            "lower",
+            "startsWith",
+            "lower(test_model.name) LIKE lower(%(param_1)s) || '%%'",
+        ),
+        (
+            "nocase",
+            "endsWith",
+            "(test_model.name COLLATE nocase) LIKE '%%' || %(param_1)s",
+        ),
+    ),
+)
+def test_case_folded_operator_expressions(
+    case_folding: Any, operator: Any, expected: str
+) -> None:
+    clause = apply_case_folded_operator(ParentModel.name, "a", operator, case_folding)
+    assert get_sql(clause, PGDialect_psycopg2()) == expected
+
+
+def test_ilike_falls_back_to_lower_without_ilike() -> None:
+    clause = apply_case_folded_operator(ParentModel.name, "a", "contains", "ilike")
+    assert get_sql(clause, sqlite.dialect()) == (
+        "lower(test_model.name) LIKE lower('%' || ? || '%')"
+    )
+
+
+@mark.parametrize("case_folding", ("sensitive", "ilike", "lower", "nocase"))
+@mark.parametrize(
+    "operator,value,expected",
+    (
+        ("contains", "model 12", 11),
+        ("startsWith", "PARENT", 400),
+        ("endsWith", "", 400),
+    ),
+)
+def test_case_folded_operators_filter_rows(
+    case_folding: Any,
+    operator: str,
+    value: str,
+    expected: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    # SQLite's LIKE is already case-insensitive for ASCII, so each strategy matches
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=name_model(operator, value),
+        case_folding=case_folding,
+    )
+    assert dg_query.total() == expected
+
+
+def test_case_folding_by_field(query: "Query[ParentModel]", resolver: Resolver) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=name_model("contains", "Model 12"),
+        case_folding={"name": "lower"},
+    )
+    assert "lower(test_model.name)" in get_sql(dg_query.query.statement, None)
+    sensitive = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=name_model("contains", "Model 12"),
+        case_folding={"created_at": "lower"},
+    )
+    assert "lower(" not in get_sql(sensitive.query.statement, None)
+
+
+def test_unchanged_case_foldings_keep_the_registered_operators() -> None:
+    assert get_case_folding_operators("sensitive") == {}
+    assert get_case_folding_operators({"name": "citext"}) == {}
+    assert set(get_case_folding_operators("lower")) == {
+        "contains",
+        "startsWith",
+        "endsWith",
+    }
+
+
+@mark.parametrize("case_folding", ("upper", {"name": "upper"}))
+def test_unsupported_case_folding_raises(
+    case_folding: Any, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    with raises(ValueError):
+        DataGridQuery(query=query, column_resolver=resolver, case_folding=case_folding)
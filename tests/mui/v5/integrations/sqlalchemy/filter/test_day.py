@@ -0,0 +1,167 @@
+from datetime import date, datetime, timezone
+from typing import Any
+
+import sqlalchemy as sa
+from pytest import mark, raises
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterModel
+from mui.v5.integrations.sqlalchemy import (
+    DAY_GRANULARITY_OPERATORS,
+    DataGridQuery,
+    MemoryCountCache,
+    apply_filter_to_query_from_model,
+)
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    apply_day_is_operator,
+    apply_day_on_or_before_operator,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures import ParentModel
+
+# the fixture rows are created at noon, once a day, starting on 2022-11-01
+DAY = "2022-11-04"
+
+
+def day_model(operator: str, value: Any = DAY) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "created_at", "operatorValue": operator, "value": value}
+            ]
+        }
+    )
+
+
+def test_day_is_operator_uses_a_half_open_range() -> None:
+    clause = apply_day_is_operator(ParentModel.created_at, DAY)
+    compiled = clause.compile(dialect=sqlite.dialect())
+    assert str(compiled) == "test_model.created_at >= ? AND test_model.created_at < ?"
+    assert list(compiled.params.values()) == [
+        datetime(2022, 11, 4),
+        datetime(2022, 11, 5),
+    ]
+
+
+def test_day_operators_keep_the_time_zone() -> None:
+    clause = apply_day_on_or_before_operator(
+        ParentModel.created_at, "2022-11-04T23:30:00+00:00"
+    )
+    compiled = clause.compile()
+    assert list(compiled.params.values()) == [
+        datetime(2022, 11, 5, tzinfo=timezone.utc)
+    ]
+
+
+def test_day_operators_compare_date_columns_to_dates() -> None:
+    column = sa.column("day", sa.Date())
+    compiled = apply_day_is_operator(column, DAY).compile()
+    assert list(compiled.params.values()) == [date(2022, 11, 4), date(2022, 11, 5)]
+
+
+def test_day_operators_compare_time_columns_exactly() -> None:
+    column = sa.column("time", sa.Time())
+    assert str(apply_day_is_operator(column, "2022-11-04T10:00:00")) == (
+        "time = :time_1"
+    )
+
+
+@mark.parametrize(
+    "operator,expected",
+    (
+        ("is", 1),
+        ("not", 399),
+        ("after", 396),
+        ("before", 3),
+        ("onOrAfter", 397),
+        ("onOrBefore", 4),
+    ),
+)
+def test_day_granularity_operators(
+    operator: str,
+    expected: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query,
+        model=day_model(operator),
+        resolver=resolver,
+        operators=DAY_GRANULARITY_OPERATORS,
+    )
+    assert filtered.count() == expected
+
+
+def test_data_grid_query_date_granularity(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    count_cache = MemoryCountCache()
+    exact = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=day_model("is"),
+        count_cache=count_cache,
+    )
+    by_day = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=day_model("is"),
+        count_cache=count_cache,
+        date_granularity="day",
+    )
+    assert exact.total() == 0
+    # the totals are cached separately, as they differ
+    assert by_day.total() == 1
+    assert [row.id for row in by_day.items()] == [4]
+
+
+def test_data_grid_query_explicit_operators_take_precedence(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=day_model("is", "2022-11-04T12:00:00"),
+        date_granularity="day",
+        operators={"is": lambda column, item: column.is_(None)},
+    )
+    assert dg_query.total() == 0
+
+
+def test_data_grid_query_date_granularity_ignores_other_columns(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=GridFilterModel.parse_obj(
+            {
+                "items": [
+                    {
+                        "columnField": "name",
+                        "operatorValue": "is",
+                        "value": "ParentModel 4",
+                    }
+                ]
+            }
+        ),
+        date_granularity="day",
+    )
+    assert [row.id for row in dg_query.items()] == [4]
+
+
+def test_day_operators_compare_other_columns_exactly() -> None:
+    column = sa.column("name", sa.String())
+    assert str(apply_day_is_operator(column, "a")) == "name = :name_1"
+
+
+def test_unsupported_date_granularity_raises(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    with raises(ValueError):
+        DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            date_granularity="month",  # type: ignore[arg-type]
+        )
@@ -0,0 +1,79 @@
+from typing import Any, List
+
+from pytest import MonkeyPatch, mark, raises
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery, set_is_any_of_strategy
+from mui.v5.integrations.sqlalchemy.filter.applicators import (
+    IS_ANY_OF_STRATEGIES,
+    apply_array_is_any_of_operator,
+    apply_padded_is_any_of_operator,
+    apply_values_is_any_of_operator,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def get_sql(clause: Any, dialect: Any) -> str:
+    return str(
+        clause.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+    )
+
+
+def test_padded_strategy_shares_statements_between_similar_sizes() -> None:
+    statements = {
+        get_sql(
+            apply_padded_is_any_of_operator(ParentModel.id, list(range(size))),
+            sqlite.dialect(),
+        )
+        for size in range(5, 9)
+    }
+    assert len(statements) == 1
+    assert statements.pop().count("?") == 8
+
+
+def test_array_strategy_binds_a_single_parameter() -> None:
+    sql = get_sql(
+        apply_array_is_any_of_operator(ParentModel.id, [1, 2, 3]), PGDialect_psycopg2()
+    )
+    assert sql == "test_model.id = ANY (%(param_1)s::INTEGER[])"
+
+
+@mark.parametrize("size,uses_values", ((3, False), (65, True)))
+def test_values_strategy_applies_above_the_threshold(
+    size: int, uses_values: bool
+) -> None:
+    sql = get_sql(
+        apply_values_is_any_of_operator(ParentModel.id, list(range(size))),
+        PGDialect_psycopg2(),
+    )
+    assert ("VALUES" in sql) is uses_values
+
+
+@mark.parametrize("strategy", ("padded", None))
+def test_strategy_is_selected_per_dialect(
+    strategy: Any,
+    monkeypatch: MonkeyPatch,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    monkeypatch.setitem(IS_ANY_OF_STRATEGIES, "sqlite", "padded")
+    ids: List[int] = [3, 5, 8]
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=GridFilterModel.parse_obj(
+            {"items": [{"columnField": "id", "operatorValue": "isAnyOf", "value": ids}]}
+        ),
+        is_any_of_strategy=strategy,
+    )
+    assert get_sql(dg_query.query.statement, sqlite.dialect()).count("?") == 4
+    assert sorted(item.id for item in dg_query.items()) == ids
+
+
+def test_unsupported_strategy_raises() -> None:
+    with raises(ValueError):
+        set_is_any_of_strategy("sqlite", "unsupported")  # type: ignore[arg-type]
@@ -0,0 +1,191 @@
+from typing import Any, Dict, Generator, List, Optional
+
+from pytest import fixture, mark, raises
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import GridFilterModel
+from mui.v5.integrations.sqlalchemy import (
+    DataGridQuery,
+    Fts5QuickFilter,
+    LikeQuickFilter,
+    StatementCache,
+    TsvectorQuickFilter,
+    apply_filter_to_query_from_model,
+    apply_filter_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures import ParentModel
+
+
+def quick_model(
+    values: Optional[List[Any]],
+    logic_operator: Optional[str] = None,
+    items: Optional[List[Dict[str, Any]]] = None,
+) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": items or [],
+            "quickFilterValues": values,
+            "quickFilterLogicOperator": logic_operator,
+        }
+    )
+
+
+@fixture(scope="module")
+def search_table(session: Session) -> Generator[str, None, None]:
+    session.execute(text("CREATE VIRTUAL TABLE parent_search USING fts5(name)"))
+    session.execute(
+        text(
+            "INSERT INTO parent_search (rowid, name) "
+            f"SELECT id, name FROM {ParentModel.__tablename__}"
+        )
+    )
+    yield "parent_search"
+    session.execute(text("DROP TABLE parent_search"))
+
+
+@mark.parametrize(
+    "values,logic_operator,expected",
+    (
+        # 12, 112, 120 to 129, 212, and 312
+        (["MODEL", "12"], None, 14),
+        (["model", "12"], "and", 14),
+        (["12", "13"], "or", 28),
+        (["12", "13"], "and", 0),
+        ([" ", None], None, 400),
+        (None, None, 400),
+    ),
+)
+def test_like_quick_filter(
+    values: Optional[List[Any]],
+    logic_operator: Optional[str],
+    expected: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query,
+        model=quick_model(values, logic_operator),
+        resolver=resolver,
+        quick_filter=LikeQuickFilter(fields=["name"]),
+    )
+    assert filtered.count() == expected
+
+
+def test_like_quick_filter_searches_numbers(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query,
+        model=quick_model(["399"]),
+        resolver=resolver,
+        quick_filter=LikeQuickFilter(fields=["id", "grouping_id"]),
+    )
+    assert [row.id for row in filtered] == [399]
+
+
+def test_quick_filter_is_ignored_without_a_backend(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query, model=quick_model(["12"]), resolver=resolver
+    )
+    assert filtered.count() == 400
+
+
+@mark.parametrize("statement_cache", (None, StatementCache()))
+def test_quick_filter_is_combined_with_the_items(
+    statement_cache: Optional[StatementCache],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=quick_model(
+            ["12"],
+            items=[{"columnField": "id", "operatorValue": ">", "value": 120}],
+        ),
+        quick_filter=LikeQuickFilter(fields=["name"]),
+        statement_cache=statement_cache,
+    )
+    # 121 to 129, 212, and 312
+    assert dg_query.total() == 11
+
+
+def test_quick_filter_is_combined_with_the_items_of_a_select(
+    session: Session, resolver: Resolver
+) -> None:
+    statement = apply_filter_to_select_from_model(
+        statement=select(ParentModel.id),
+        model=quick_model(
+            ["12"],
+            items=[{"columnField": "id", "operatorValue": ">", "value": 120}],
+        ),
+        resolver=resolver,
+        quick_filter=LikeQuickFilter(fields=["name"]),
+    )
+    assert session.execute(statement).scalars().all() == [
+        *range(121, 130),
+        212,
+        312,
+    ]
+
+
+def test_tsvector_quick_filter() -> None:
+    quick_filter = TsvectorQuickFilter(fields=["name", "id"], config="english")
+    clause = quick_filter.get_value_clause(
+        value="parent model", resolver=lambda field: getattr(ParentModel, field)
+    )
+    assert str(clause.compile(dialect=PGDialect_psycopg2())) == (
+        "to_tsvector(%(to_tsvector_1)s, concat_ws(%(concat_ws_1)s, test_model.name, "
+        "CAST(test_model.id AS VARCHAR))) @@ plainto_tsquery(%(plainto_tsquery_1)s, "
+        "%(plainto_tsquery_2)s)"
+    )
+
+
+def test_tsvector_quick_filter_uses_the_document() -> None:
+    quick_filter = TsvectorQuickFilter(document=ParentModel.name)
+    clause = quick_filter.get_value_clause(value="a", resolver=str)
+    assert str(clause.compile(dialect=PGDialect_psycopg2())).startswith(
+        "test_model.name @@ plainto_tsquery("
+    )
+
+
+@mark.parametrize(
+    "values,expected",
+    (
+        (["parentmodel"], 400),
+        (["model"], 0),
+        (["ParentModel 12"], 1),
+        (['"12"'], 1),
+        (["12", "13"], 0),
+    ),
+)
+def test_fts5_quick_filter(
+    values: List[str],
+    expected: int,
+    search_table: str,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    filtered = apply_filter_to_query_from_model(
+        query=query,
+        model=quick_model(values),
+        resolver=resolver,
+        quick_filter=Fts5QuickFilter(table_name=search_table, key=ParentModel.id),
+    )
+    assert filtered.count() == expected
+
+
+def test_fts5_match_query_quotes_each_word() -> None:
+    assert Fts5QuickFilter.get_match_query('a "b" OR') == '"a" """b""" "OR"'
+
+
+def test_quick_filters_require_fields() -> None:
+    with raises(ValueError):
+        LikeQuickFilter(fields=[])
+    with raises(ValueError):
+        TsvectorQuickFilter()
@@ -0,0 +1,112 @@
+from typing import Any, Dict, Tuple, cast
+
+from pytest import MonkeyPatch, fixture, mark, raises
+from sqlalchemy import and_
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterItem, GridFilterModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.filter import (
+    OperatorApplicator,
+    apply_filter_to_query_from_model,
+    get_operator_applicator,
+    register_operator,
+    registry,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def apply_between_operator(column: Any, item: GridFilterItem) -> Any:
+    lower, upper = cast(Tuple[Any, Any], item.value)
+    return and_(column >= lower, column <= upper)
+
+
+@fixture
+def operator_registry(monkeypatch: MonkeyPatch) -> Dict[str, OperatorApplicator]:
+    """Isolates the operators registered by a test from the other tests."""
+    operators = dict(registry.OPERATOR_REGISTRY)
+    monkeypatch.setattr(registry, "OPERATOR_REGISTRY", operators)
+    return operators
+
+
+def get_filter_model(operator: str, value: Any) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {"items": [{"columnField": "id", "operatorValue": operator, "value": value}]}
+    )
+
+
+@mark.parametrize(
+    "operator",
+    (
+        "==",
+        "=",
+        "eq",
+        "equals",
+        "!=",
+        "ne",
+        ">",
+        "gt",
+        ">=",
+        "ge",
+        "<",
+        "lt",
+        "<=",
+        "le",
+        "is",
+        "not",
+        "isEmpty",
+        "isNotEmpty",
+        "isAnyOf",
+        "contains",
+        "startsWith",
+        "endsWith",
+        "before",
+        "after",
+        "onOrBefore",
+        "onOrAfter",
+    ),
+)
+def test_built_in_operators_are_registered(operator: str) -> None:
+    assert operator in registry.OPERATOR_REGISTRY
+
+
+@mark.parametrize("operator", (None, "between"))
+def test_unsupported_operator_raises(operator: Any) -> None:
+    with raises(ValueError):
+        get_operator_applicator(name=operator)
+
+
+def test_register_operator(
+    operator_registry: Dict[str, OperatorApplicator],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    register_operator("between", apply_between_operator)
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=get_filter_model("between", [10, 19]),
+    )
+    assert [item.id for item in dg_query.items()] == list(range(10, 20))
+
+
+def test_register_operator_does_not_replace_by_default(
+    operator_registry: Dict[str, OperatorApplicator],
+) -> None:
+    with raises(ValueError):
+        register_operator("contains", apply_between_operator)
+    register_operator("contains", apply_between_operator, replace=True)
+    assert operator_registry["contains"] is apply_between_operator
+
+
+def test_operators_take_precedence_over_the_registry(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    filtered_query = apply_filter_to_query_from_model(
+        query=query,
+        model=get_filter_model("==", [10, 11]),
+        resolver=resolver,
+        operators={"==": apply_between_operator},
+    )
+    assert [item.id for item in filtered_query.all()] == [10, 11]
@@ -0,0 +1,247 @@
+from typing import Any, Dict, List, Optional, Set
+
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+from pytest import mark
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridFilterModel, GridLinkOperator
+from mui.v5.integrations.sqlalchemy import (
+    DataGridQuery,
+    apply_filter_to_query_from_model,
+    simplify_filter_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures import ParentModel
+
+_OPERATORS = ("=", "!=", ">", ">=", "<", "<=", "isAnyOf", "isEmpty", "isNotEmpty")
+
+
+def model(link_operator: str, *items: Dict[str, Any]) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": [
+                {
+                    "columnField": item["field"],
+                    "operatorValue": item["operator"],
+                    "value": item.get("value"),
+                }
+                for item in items
+            ],
+            "linkOperator": link_operator,
+        }
+    )
+
+
+def summarize(filter_model: Optional[GridFilterModel]) -> Any:
+    if filter_model is None:
+        return None
+    return [
+        (item.column_field, item.operator_value, item.value)
+        for item in filter_model.items
+    ]
+
+
+def matching_ids(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    filter_model: Optional[GridFilterModel],
+) -> Set[int]:
+    if filter_model is None:
+        return set()
+    filtered = apply_filter_to_query_from_model(
+        query=query, model=filter_model, resolver=resolver
+    )
+    return {row.id for row in filtered.all()}
+
+
+@mark.parametrize(
+    "filter_model,expected",
+    (
+        (
+            model(
+                "and",
+                {"field": "id", "operator": ">", "value": 5},
+                {"field": "id", "operator": ">", "value": 10},
+                {"field": "id", "operator": "<", "value": 20},
+            ),
+            [("id", ">", 10), ("id", "<", 20)],
+        ),
+        (
+            model(
+                "and",
+                {"field": "id", "operator": "isAnyOf", "value": [1, 2, 3]},
+                {"field": "id", "operator": "!=", "value": 2},
+            ),
+            [("id", "isAnyOf", [1, 3])],
+        ),
+        (
+            model(
+                "and",
+                {"field": "id", "operator": ">=", "value": 5},
+                {"field": "id", "operator": "<=", "value": 5},
+            ),
+            [("id", "=", 5)],
+        ),
+        (
+            model(
+                "and",
+                {"field": "id", "operator": "isEmpty"},
+                {"field": "id", "operator": "isNotEmpty"},
+            ),
+            None,
+        ),
+        (
+            model(
+                "and",
+                {"field": "id", "operator": ">", "value": 10},
+                {"field": "id", "operator": "<", "value": 5},
+            ),
+            None,
+        ),
+        (
+            model(
+                "or",
+                {"field": "id", "operator": "=", "value": 1},
+                {"field": "id", "operator": "isAnyOf", "value": [2, 3]},
+            ),
+            [("id", "isAnyOf", [1, 2, 3])],
+        ),
+        (
+            model(
+                "or",
+                {"field": "id", "operator": "isEmpty"},
+                {"field": "id", "operator": "isNotEmpty"},
+            ),
+            [],
+        ),
+        (
+            model(
+                "or",
+                {"field": "id", "operator": "isAnyOf", "value": []},
+                {"field": "grouping_id", "operator": "isAnyOf", "value": []},
+            ),
+            None,
+        ),
+    ),
+)
+def test_simplify_filter_model(filter_model: GridFilterModel, expected: Any) -> None:
+    assert summarize(simplify_filter_model(filter_model)) == expected
+
+
+def test_simplify_filter_model_keeps_the_link_and_quick_filter() -> None:
+    filter_model = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "id", "operatorValue": ">", "value": 1},
+                {"columnField": "id", "operatorValue": ">", "value": 2},
+            ],
+            "linkOperator": "or",
+            "quickFilterValues": ["a"],
+        }
+    )
+    simplified = simplify_filter_model(filter_model)
+    assert simplified is not None
+    assert simplified.link_operator == GridLinkOperator.Or
+    assert simplified.quick_filter_values == ["a"]
+    assert summarize(simplified) == [("id", ">", 1)]
+
+
+def test_simplify_filter_model_doesnt_compare_strings() -> None:
+    filter_model = model(
+        "and",
+        {"field": "name", "operator": "=", "value": "a"},
+        {"field": "name", "operator": "=", "value": "b"},
+    )
+    assert summarize(simplify_filter_model(filter_model)) == [
+        ("name", "=", "a"),
+        ("name", "=", "b"),
+    ]
+
+
+def test_simplify_filter_model_keeps_the_items_of_skipped_fields() -> None:
+    filter_model = model(
+        "and",
+        {"field": "children.id", "operator": "<", "value": 3},
+        {"field": "children.id", "operator": ">", "value": 398},
+        {"field": "id", "operator": ">", "value": 1},
+        {"field": "id", "operator": ">", "value": 2},
+    )
+    simplified = simplify_filter_model(
+        filter_model, skip_field=lambda field: field.startswith("children.")
+    )
+    assert summarize(simplified) == [
+        ("id", ">", 2),
+        ("children.id", "<", 3),
+        ("children.id", ">", 398),
+    ]
+
+
+_values = st.one_of(st.none(), st.integers(min_value=-2, max_value=12))
+
+
+def with_is_any_of_values(item: Dict[str, Any]) -> Dict[str, Any]:
+    if item["operator"] != "isAnyOf" or item["value"] is None:
+        return item
+    return {**item, "value": [item["value"], item["value"] + 1]}
+
+
+_items = st.fixed_dictionaries(
+    {
+        "field": st.sampled_from(("id", "grouping_id", "null_field")),
+        "operator": st.sampled_from(_OPERATORS),
+        "value": _values,
+    }
+).map(with_is_any_of_values)
+
+
+@settings(
+    max_examples=150,
+    deadline=None,
+    suppress_health_check=(HealthCheck.too_slow,),
+)
+@given(
+    link_operator=st.sampled_from(("and", "or")),
+    items=st.lists(_items, min_size=1, max_size=5),
+)
+def test_simplified_filter_model_matches_the_same_rows(
+    link_operator: str,
+    items: List[Dict[str, Any]],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    filter_model = model(link_operator, *items)
+    assert matching_ids(
+        query=query, resolver=resolver, filter_model=simplify_filter_model(filter_model)
+    ) == matching_ids(query=query, resolver=resolver, filter_model=filter_model)
+
+
+def test_data_grid_query_short_circuits_empty_filters(
+    query: "Query[ParentModel]", resolver: Resolver, engine: Engine
+) -> None:
+    statements: List[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=model(
+            "and",
+            {"field": "id", "operator": ">", "value": 10},
+            {"field": "id", "operator": "<", "value": 5},
+        ),
+        simplify_filter=True,
+    )
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert dg_query.items() == []
+        assert dg_query.total() == 0
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == []
+    assert dg_query.total_kind == "exact"
+    assert dg_query.query.count() == 0
@@ -0,0 +1,150 @@
+from typing import List
+
+from pytest import mark, raises
+from sqlalchemy import text
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.filter import stage_is_any_of_values
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+def get_filter_model(ids: List[int]) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {"items": [{"columnField": "id", "operatorValue": "isAnyOf", "value": ids}]}
+    )
+
+
+@mark.parametrize("size,is_staged", ((10, False), (50, True)))
+def test_large_is_any_of_lists_are_staged_in_a_temporary_table(
+    size: int,
+    is_staged: bool,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    parent_model_count: int,
+    statements: List[str],
+) -> None:
+    # include identifiers which don't exist, to ensure they are not matched
+    ids = list(range(parent_model_count - size // 2, parent_model_count + size // 2))
+    expected = query.filter(ParentModel.id.in_(ids)).order_by(ParentModel.id).all()
+    statements.clear()
+    dg_query = DataGridQuery(
+        query=query.order_by(ParentModel.id),
+        column_resolver=resolver,
+        filter_model=get_filter_model(ids),
+        pagination_model=GridPaginationModel(page_size=size),
+        temporary_table_threshold=10,
+    )
+    assert dg_query.items() == expected
+    assert dg_query.total() == len(expected)
+    assert any("CREATE TEMPORARY TABLE" in sql for sql in statements) is is_staged
+    # the page and the count queries both use the semi-join
+    assert sum("IN (SELECT grid_is_any_of_" in sql for sql in statements) == (
+        2 if is_staged else 0
+    )
+
+
+def get_staging_tables(session: Session) -> List[str]:
+    return list(
+        session.execute(
+            text(
+                "SELECT name FROM sqlite_temp_master "
+                "WHERE type = 'table' AND name LIKE 'grid_is_any_of_%'"
+            )
+        ).scalars()
+    )
+
+
+def test_values_are_staged_once_a_statement_is_executed(
+    query: "Query[ParentModel]", resolver: Resolver, statements: List[str]
+) -> None:
+    statements.clear()
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=get_filter_model(list(range(1, 51))),
+        temporary_table_threshold=10,
+    )
+    assert statements == []
+    assert dg_query.total() == 50
+
+
+def test_staging_tables_are_reused_by_later_requests(
+    session: Session, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    tables: List[List[str]] = []
+    for request in range(3):
+        ids = list(range(request * 20 + 1, request * 20 + 41))
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=get_filter_model(ids),
+            temporary_table_threshold=10,
+        )
+        assert [item.id for item in dg_query.items()] == ids
+        session.commit()
+        tables.append(get_staging_tables(session))
+    assert len(tables[0]) > 0
+    # no tables are left behind by the earlier requests
+    assert tables[0] == tables[1] == tables[2]
+
+
+def test_interleaved_queries_restage_their_values(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    first, second = (
+        DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            filter_model=get_filter_model(ids),
+            temporary_table_threshold=10,
+        )
+        for ids in (list(range(1, 31)), list(range(101, 121)))
+    )
+    assert len(first.items()) == 30
+    assert len(second.items()) == 20
+    # the second query replaced the values of the first query's table
+    assert first.total() == 30
+
+
+def test_each_list_is_staged_in_a_table_of_its_own(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    filter_model = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {
+                    "columnField": "id",
+                    "operatorValue": "isAnyOf",
+                    "value": list(range(1, 31)),
+                },
+                {
+                    "columnField": "grouping_id",
+                    "operatorValue": "isAnyOf",
+                    "value": list(range(0, 10, 2)) * 3,
+                },
+            ],
+            "linkOperator": "and",
+        }
+    )
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model,
+        temporary_table_threshold=10,
+    )
+    assert [item.id for item in dg_query.items()] == list(range(2, 31, 2))
+
+
+def test_staging_requires_a_non_negative_threshold(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    with raises(ValueError):
+        stage_is_any_of_values(
+            query=query,
+            model=get_filter_model([1, 2]),
+            resolver=resolver,
+            threshold=-1,
+        )
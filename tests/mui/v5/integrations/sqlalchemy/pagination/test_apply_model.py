@@ -1,11 +1,16 @@
+from typing import List
+
 from hypothesis import given
 from hypothesis import strategies as st
+from pytest import mark
+from sqlalchemy import select, union_all
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Query, Session
 
 from mui.v5.grid import GridPaginationModel
 from mui.v5.integrations.sqlalchemy.pagination import (
     apply_limit_offset_to_query_from_model,
+    apply_limit_offset_to_select_from_model,
 )
 from tests.conftest import GENERATED_PARENT_MODEL_COUNT
 from tests.fixtures.sqlalchemy import ParentModel
@@ -37,3 +42,28 @@ def test_apply_limit_offset_to_query_from_model(
         session.query(ParentModel).limit(model.page_size).offset(model.offset).count()
     )
     assert row_count == expected_row_count
+
+
+@mark.parametrize(
+    "lookahead,expected", ((False, [31, 32, 33]), (True, [31, 32, 33, 34]))
+)
+def test_apply_limit_offset_to_select_from_model(
+    lookahead: bool, expected: List[int], session: Session
+) -> None:
+    model = GridPaginationModel(page=10, page_size=3)
+    compound = union_all(
+        select(ParentModel.id).where(ParentModel.id <= 32),
+        select(ParentModel.id).where(ParentModel.id > 32),
+    )
+    statement = apply_limit_offset_to_select_from_model(
+        statement=select(ParentModel.id).order_by(ParentModel.id),
+        model=model,
+        lookahead=lookahead,
+    )
+    assert session.execute(statement).scalars().all() == expected
+    compound_statement = apply_limit_offset_to_select_from_model(
+        statement=compound.order_by(compound.selected_columns.id),
+        model=model,
+        lookahead=lookahead,
+    )
+    assert session.execute(compound_statement).scalars().all() == expected
@@ -0,0 +1,125 @@
+from typing import Any, List
+
+from pytest import mark, raises
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import (
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    GridSortModel,
+)
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.pagination import (
+    apply_deferred_join_to_query_from_model,
+    apply_deferred_join_to_select_from_model,
+    apply_limit_offset_to_query_from_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
+from tests.fixtures.sqlalchemy import ChildModel, ParentModel
+
+
+@mark.parametrize("page", (0, 7, 39))
+@mark.parametrize(
+    "directions",
+    (
+        (GridSortDirection.ASC,),
+        (GridSortDirection.DESC, GridSortDirection.ASC),
+    ),
+)
+def test_deferred_join_matches_offset_pagination(
+    page: int,
+    directions: List[GridSortDirection],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    sort_model: GridSortModel = [
+        GridSortItem(field=field, sort=direction)
+        for field, direction in zip(("grouping_id", "name"), directions)
+    ]
+    pagination_model = GridPaginationModel(page=page, page_size=10)
+    expected = apply_limit_offset_to_query_from_model(
+        query=apply_sort_to_query_from_model(
+            query=query,
+            model=sort_model + [GridSortItem(field="id", sort=GridSortDirection.ASC)],
+            resolver=resolver,
+        ),
+        model=pagination_model,
+    ).all()
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        pagination_strategy="deferred_join",
+    )
+    statement = str(dg_query.query.statement)
+    assert statement.count("LIMIT") == 1
+    assert "JOIN (SELECT" in statement
+    assert dg_query.items() == expected
+    assert dg_query.total() == query.count()
+
+
+def test_deferred_join_with_a_joined_query(
+    joined_query: "Query[ChildModel]", resolver: Resolver
+) -> None:
+    pagination_model = GridPaginationModel(page=3, page_size=25)
+    sort_model: GridSortModel = [
+        GridSortItem(field="parent_id", sort=GridSortDirection.DESC)
+    ]
+    keys: List[Any] = [ChildModel.id]
+    expected = (
+        joined_query.order_by(ChildModel.parent_id.desc(), ChildModel.id)
+        .limit(pagination_model.page_size)
+        .offset(pagination_model.offset)
+        .all()
+    )
+    items = apply_deferred_join_to_query_from_model(
+        query=joined_query,
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        resolver=resolver,
+        keys=keys,
+    ).all()
+    assert items == expected
+
+
+def test_deferred_join_requires_keys(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    with raises(ValueError):
+        apply_deferred_join_to_query_from_model(
+            query=query,
+            sort_model=[],
+            pagination_model=GridPaginationModel(),
+            resolver=resolver,
+            keys=[],
+        )
+
+
+def test_deferred_join_to_select_with_a_joined_statement(
+    session: Session, joined_query: "Query[ChildModel]", resolver: Resolver
+) -> None:
+    pagination_model = GridPaginationModel(page=3, page_size=25)
+    sort_model: GridSortModel = [
+        GridSortItem(field="parent_id", sort=GridSortDirection.DESC)
+    ]
+    expected = (
+        joined_query.order_by(ChildModel.parent_id.desc(), ChildModel.id)
+        .limit(pagination_model.page_size)
+        .offset(pagination_model.offset)
+        .all()
+    )
+    statement = apply_deferred_join_to_select_from_model(
+        statement=select(ChildModel).join(ChildModel.parent),
+        sort_model=sort_model,
+        pagination_model=pagination_model,
+        resolver=resolver,
+        keys=[ChildModel.id],
+    )
+    compiled = str(statement)
+    assert compiled.count("LIMIT") == 1
+    assert "JOIN (SELECT" in compiled
+    assert session.execute(statement).scalars().all() == expected
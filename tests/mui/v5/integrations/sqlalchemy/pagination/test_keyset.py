@@ -0,0 +1,201 @@
+from typing import Any, List, Optional, Tuple
+
+from pytest import mark
+from sqlalchemy import case, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import (
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+    GridSortModel,
+)
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.pagination import (
+    apply_keyset_to_query_from_model,
+    apply_keyset_to_select_from_model,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+@mark.parametrize(
+    "directions",
+    (
+        (GridSortDirection.ASC,),
+        (GridSortDirection.DESC,),
+        (GridSortDirection.DESC, GridSortDirection.ASC),
+    ),
+)
+def test_keyset_pagination_matches_offset_pagination(
+    directions: List[GridSortDirection],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    parent_model_count: int,
+) -> None:
+    fields = ("grouping_id", "name")
+    sort_model: GridSortModel = [
+        GridSortItem(field=field, sort=direction)
+        for field, direction in zip(fields, directions)
+    ]
+    expected = apply_sort_to_query_from_model(
+        query=query,
+        model=sort_model + [GridSortItem(field="id", sort=GridSortDirection.ASC)],
+        resolver=resolver,
+    ).all()
+
+    seen: List[ParentModel] = []
+    cursor: Optional[str] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page_size=37, cursor=cursor),
+            pagination_strategy="keyset",
+        )
+        # the generic dialect only renders an OFFSET clause when one was applied
+        assert "OFFSET" not in str(dg_query.query.statement)
+        seen.extend(dg_query.items())
+        cursor = dg_query.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == parent_model_count
+    assert [row.id for row in seen] == [row.id for row in expected]
+
+
+def test_apply_keyset_to_query_from_model_uses_row_value_comparison(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    sort_model: GridSortModel = [
+        GridSortItem(field="grouping_id", sort=GridSortDirection.ASC)
+    ]
+    first_page = apply_keyset_to_query_from_model(
+        query=query,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5),
+        resolver=resolver,
+        tie_breakers=[ParentModel.id],
+    )
+    last = first_page.all()[-1]
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5),
+        pagination_strategy="keyset",
+    )
+    dg_query.items()
+    assert dg_query.next_cursor is not None
+    second_page = apply_keyset_to_query_from_model(
+        query=query,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5),
+        resolver=resolver,
+        tie_breakers=[ParentModel.id],
+        cursor=dg_query.next_cursor,
+    )
+    compiled_str = str(second_page.statement.compile(dialect=sqlite.dialect()))
+    assert (
+        f"WHERE ({ParentModel.__tablename__}.grouping_id, "
+        f"{ParentModel.__tablename__}.id) > (?, ?)"
+    ) in compiled_str
+    assert all(
+        (row.grouping_id, row.id) > (last.grouping_id, last.id)
+        for row in second_page.all()
+    )
+
+
+def test_apply_keyset_to_select_from_model(
+    session: Session, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    sort_model: GridSortModel = [
+        GridSortItem(field="grouping_id", sort=GridSortDirection.DESC)
+    ]
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5),
+        pagination_strategy="keyset",
+    )
+    dg_query.items()
+    assert dg_query.next_cursor is not None
+    expected = apply_keyset_to_query_from_model(
+        query=query,
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5),
+        resolver=resolver,
+        tie_breakers=[ParentModel.id],
+        cursor=dg_query.next_cursor,
+        lookahead=True,
+    ).all()
+    statement = apply_keyset_to_select_from_model(
+        statement=select(ParentModel),
+        sort_model=sort_model,
+        pagination_model=GridPaginationModel(page_size=5, cursor=dg_query.next_cursor),
+        resolver=resolver,
+        tie_breakers=[ParentModel.id],
+        lookahead=True,
+    )
+    assert len(expected) == 6
+    assert session.execute(statement).scalars().all() == expected
+
+
+@mark.parametrize(
+    "directions",
+    (
+        (GridSortDirection.ASC,),
+        (GridSortDirection.DESC,),
+        (GridSortDirection.DESC, GridSortDirection.ASC),
+        (GridSortDirection.ASC, GridSortDirection.DESC),
+    ),
+)
+def test_keyset_pagination_pages_through_nullable_columns(
+    directions: List[GridSortDirection],
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    parent_model_count: int,
+) -> None:
+    # every seventh row sorts by NULL, as does every row of the null field
+    maybe: Any = case((ParentModel.id % 7 == 0, None), else_=ParentModel.grouping_id)
+
+    def nullable_resolver(field: str) -> Any:
+        return maybe if field == "maybe" else resolver(field)
+
+    fields = ("maybe", "null_field")
+    sort_model: GridSortModel = [
+        GridSortItem(field=field, sort=direction)
+        for field, direction in zip(fields, directions)
+    ]
+
+    def sort_key(row: ParentModel) -> Tuple[Any, ...]:
+        key: List[Any] = []
+        values = (None if row.id % 7 == 0 else row.grouping_id, row.null_field)
+        for value, direction in zip(values, directions):
+            # NULLs sort last in ascending order, and first in descending order
+            sign = -1 if direction == GridSortDirection.DESC else 1
+            key.extend((sign * (value is None), sign * (value or 0)))
+        return (*key, row.id)
+
+    expected = sorted(query.all(), key=sort_key)
+    seen: List[ParentModel] = []
+    cursor: Optional[str] = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=nullable_resolver,
+            sort_model=sort_model,
+            pagination_model=GridPaginationModel(page_size=37, cursor=cursor),
+            pagination_strategy="keyset",
+        )
+        seen.extend(dg_query.items())
+        cursor = dg_query.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == parent_model_count
+    assert [row.id for row in seen] == [row.id for row in expected]
@@ -0,0 +1,297 @@
+from typing import Any
+
+import sqlalchemy as sa
+from pytest import mark, raises
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
+from sqlalchemy.orm import Mapped, Query, Session, registry
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v5.integrations.sqlalchemy import (
+    DataGridQuery,
+    LikeQuickFilter,
+    MapperResolver,
+    PaginationStrategy,
+    StatementCache,
+    TsvectorQuickFilter,
+)
+from tests.fixtures import ChildModel, ParentModel
+
+hybrid_registry: registry = registry()
+
+
+@hybrid_registry.mapped
+class HybridModel:
+    __tablename__ = "hybrid_model"
+
+    id: Mapped[int] = sa.Column(sa.Integer(), primary_key=True)
+    first_name: Mapped[str] = sa.Column(sa.String(), nullable=False)
+    lastName: Mapped[str] = sa.Column(sa.String(), nullable=False)
+
+    @hybrid_property
+    def full_name(self) -> Any:
+        return self.first_name + " " + self.lastName
+
+    @hybrid_method
+    def named(self, name: str) -> Any:
+        return self.first_name == name
+
+
+@mark.parametrize(
+    "field,expected",
+    (
+        ("grouping_id", ParentModel.grouping_id),
+        ("groupingId", ParentModel.grouping_id),
+        ("groupingid", ParentModel.grouping_id),
+        ("GroupingID", ParentModel.grouping_id),
+        ("created_at", ParentModel.created_at),
+        ("createdAt", ParentModel.created_at),
+        ("children", ParentModel.children),
+    ),
+)
+def test_mapper_resolver_resolves_aliases(field: str, expected: Any) -> None:
+    assert MapperResolver(ParentModel)(field) is expected
+
+
+def test_mapper_resolver_resolves_hybrid_properties() -> None:
+    resolver = MapperResolver(HybridModel)
+    assert str(resolver("fullName")) == str(HybridModel.full_name)
+    assert resolver("last_name") is HybridModel.lastName
+    assert resolver.fields == ("id", "first_name", "lastName", "full_name")
+    with raises(ValueError):
+        resolver("named")
+
+
+def test_mapper_resolver_include_exclude_and_aliases() -> None:
+    resolver = MapperResolver(
+        ParentModel,
+        include=["id", "name", "grouping_id"],
+        exclude=["name"],
+        aliases={"group": "grouping_id"},
+    )
+    assert resolver.fields == ("id", "grouping_id")
+    assert resolver("group") is ParentModel.grouping_id
+    for field in ("name", "created_at"):
+        with raises(ValueError):
+            resolver(field)
+
+
+def test_mapper_resolver_memoizes_other_spellings() -> None:
+    resolver = MapperResolver(ParentModel)
+    assert "Grouping_ID" not in resolver._lookup
+    assert resolver("Grouping_ID") is ParentModel.grouping_id
+    assert resolver._lookup["Grouping_ID"] is ParentModel.grouping_id
+
+
+def test_mapper_resolver_rejects_unknown_attributes() -> None:
+    with raises(ValueError):
+        MapperResolver(ChildModel, include=["unknown"])
+    with raises(ValueError):
+        MapperResolver(ChildModel, exclude=["unknown"])
+    with raises(ValueError):
+        MapperResolver(ChildModel, aliases={"alias": "unknown"})
+
+
+def test_mapper_resolver_with_data_grid_query(query: "Query[ParentModel]") -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=MapperResolver(ParentModel),
+        filter_model=GridFilterModel.parse_obj(
+            {"items": [{"columnField": "groupingId", "operatorValue": "=", "value": 3}]}
+        ),
+        sort_model=[GridSortItem(field="id", sort=GridSortDirection.DESC)],
+    )
+    assert [row.id for row in dg_query.items()][:2] == [393, 383]
+
+
+def test_mapper_resolver_resolves_related_fields() -> None:
+    resolver = MapperResolver(ChildModel)
+    parent_name = resolver("parent.name")
+    assert str(parent_name) == "AliasedClass_ParentModel.name"
+    # every spelling of the path shares the alias of the relationship
+    assert resolver("Parent.Name") is parent_name
+    assert resolver("parent.groupingId").class_ is parent_name.class_
+    assert not resolver.is_to_many("parent.name")
+    assert resolver.is_to_many("parent.children.category")
+    for field in ("parent.unknown", "unknown.name", "category.name"):
+        with raises(ValueError):
+            resolver(field)
+
+
+def test_mapper_resolver_related_include_exclude_and_depth() -> None:
+    resolver = MapperResolver(
+        ParentModel, include=["id", "children.category"], exclude=["children.parent"]
+    )
+    assert resolver.fields == ("id",)
+    assert str(resolver("children.category")) == "AliasedClass_ChildModel.category"
+    for field in ("children", "children.id", "children.parent.name"):
+        with raises(ValueError):
+            resolver(field)
+    with raises(ValueError):
+        MapperResolver(ParentModel, exclude=["children.unknown"])
+    with raises(ValueError):
+        MapperResolver(ChildModel, max_depth=1)("parent.children.id")
+    with raises(ValueError):
+        MapperResolver(ChildModel, max_depth=-1)
+
+
+def related_filter_model(*items: Any) -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": field, "operatorValue": operator, "value": value}
+                for field, operator, value in items
+            ]
+        }
+    )
+
+
+@mark.parametrize("cached", (False, True))
+@mark.parametrize("pagination_strategy", ("offset", "keyset", "deferred_join"))
+def test_related_fields_are_joined_once(
+    pagination_strategy: PaginationStrategy, cached: bool, session: Session
+) -> None:
+    resolver = MapperResolver(ChildModel)
+    statement_cache = StatementCache() if cached else None
+    # the cached clauses reuse the resolver's aliases, which are joined again
+    for _ in range(2):
+        dg_query = DataGridQuery(
+            query=session.query(ChildModel),
+            column_resolver=resolver,
+            filter_model=related_filter_model(
+                ("parent.groupingId", "=", 3), ("parent.id", ">", 200)
+            ),
+            sort_model=[
+                GridSortItem(field="parent.id", sort=GridSortDirection.DESC),
+                GridSortItem(field="id", sort=GridSortDirection.ASC),
+            ],
+            pagination_model=GridPaginationModel(page=0, page_size=2),
+            pagination_strategy=pagination_strategy,
+            statement_cache=statement_cache,
+        )
+        # 20 of the parents, with 400 children each
+        assert dg_query.total() == 8000
+        assert [row.parent_id for row in dg_query.items()] == [393, 393]
+        statement = str(dg_query._query.statement)
+        assert statement.count("JOIN test_model") == 1
+
+
+def test_only_sorted_relationships_are_not_counted(session: Session) -> None:
+    dg_query = DataGridQuery(
+        query=session.query(ChildModel),
+        column_resolver=MapperResolver(ChildModel),
+        sort_model=[GridSortItem(field="parent.name", sort=GridSortDirection.ASC)],
+    )
+    assert "JOIN" not in str(dg_query._query.statement)
+    assert "JOIN" in str(dg_query.query.statement)
+
+
+def test_to_many_filters_use_semi_joins(query: "Query[ParentModel]") -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=MapperResolver(ParentModel),
+        filter_model=related_filter_model(
+            ("children.category", "=", "cat-1"), ("id", "<=", 10)
+        ),
+    )
+    # each parent has 100 children in each category, but is only returned once
+    assert dg_query.total() == 10
+    assert len(dg_query.items()) == 10
+    statement = str(dg_query.query.statement)
+    assert "EXISTS" in statement
+    assert "JOIN" not in statement
+
+
+def test_to_many_filters_are_not_simplified(
+    session: Session, query: "Query[ParentModel]"
+) -> None:
+    lo, hi = (
+        session.query(sa.func.min(ChildModel.id), sa.func.max(ChildModel.id))
+        .filter(ChildModel.parent_id == 1)
+        .one()
+    )
+    # each item is matched by a different child of the first parent
+    filter_model = related_filter_model(
+        ("children.id", "<", lo + 2), ("children.id", ">", hi - 2)
+    )
+    for simplify_filter in (False, True):
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=MapperResolver(ParentModel),
+            filter_model=filter_model,
+            simplify_filter=simplify_filter,
+        )
+        assert [row.id for row in dg_query.items()] == [1]
+        assert dg_query.total() == 1
+    either = GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "children.id", "operatorValue": "isEmpty"},
+                {"columnField": "children.id", "operatorValue": "isNotEmpty"},
+            ],
+            "linkOperator": "or",
+        }
+    )
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=MapperResolver(ParentModel),
+        filter_model=either,
+        simplify_filter=True,
+    )
+    # a parent without children has neither an empty nor a non-empty child
+    assert dg_query.filter_model is not None
+    assert len(dg_query.filter_model.items) == 2
+
+
+def test_to_many_fields_cannot_be_sorted(query: "Query[ParentModel]") -> None:
+    with raises(ValueError):
+        DataGridQuery(
+            query=query,
+            column_resolver=MapperResolver(ParentModel),
+            sort_model=[
+                GridSortItem(field="children.category", sort=GridSortDirection.ASC)
+            ],
+        )
+
+
+def test_quick_filter_searches_related_fields(session: Session) -> None:
+    dg_query = DataGridQuery(
+        query=session.query(ChildModel),
+        column_resolver=MapperResolver(ChildModel),
+        filter_model=GridFilterModel.parse_obj(
+            {"items": [], "quickFilterValues": ["model 12"]}
+        ),
+        quick_filter=LikeQuickFilter(fields=["parent.name"]),
+    )
+    # the children of parents 12, and 120 to 129
+    assert dg_query.total() == 4400
+
+
+def test_tsvector_quick_filter_rejects_to_many_fields(
+    session: Session, query: "Query[ParentModel]"
+) -> None:
+    filter_model = GridFilterModel.parse_obj(
+        {"items": [], "quickFilterValues": ["cat-1"]}
+    )
+    with raises(ValueError):
+        DataGridQuery(
+            query=query,
+            column_resolver=MapperResolver(ParentModel),
+            filter_model=filter_model,
+            quick_filter=TsvectorQuickFilter(fields=["name", "children.category"]),
+        )
+    dg_query = DataGridQuery(
+        query=session.query(ChildModel),
+        column_resolver=MapperResolver(ChildModel),
+        filter_model=filter_model,
+        quick_filter=TsvectorQuickFilter(fields=["category", "parent.name"]),
+    )
+    # the to-one relationship is joined, rather than selected from
+    statement = str(dg_query.query.statement.compile(dialect=PGDialect_psycopg2()))
+    assert "LEFT OUTER JOIN test_model" in statement
+    assert "FROM test_related_model, " not in statement
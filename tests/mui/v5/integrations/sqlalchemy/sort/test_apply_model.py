@@ -1,13 +1,16 @@
 from typing import Any, Callable, Optional
 
 from pytest import mark
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, select, union_all
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Query, Session
 
 from mui.v5.grid import GridSortDirection, GridSortItem, GridSortModel
 from mui.v5.integrations.sqlalchemy.resolver import Resolver
-from mui.v5.integrations.sqlalchemy.sort import apply_sort_to_query_from_model
+from mui.v5.integrations.sqlalchemy.sort import (
+    apply_sort_to_query_from_model,
+    apply_sort_to_select_from_model,
+)
 from tests.conftest import PARENT_MODEL_RESOLVABLE_FIELDS
 from tests.fixtures.sqlalchemy import ParentModel
 
@@ -124,3 +127,33 @@ def test_apply_sort_to_query_from_model_multiple_fields(
     if direction is not None:
         for expected_item, sorted_item in zip(expected_results, sorted_results):
             assert expected_item.id == sorted_item.id
+
+
+def test_apply_sort_to_select_from_model(
+    session: Session, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    model: GridSortModel = [
+        GridSortItem(field="grouping_id", sort=GridSortDirection.DESC),
+        GridSortItem(field="name", sort=None),
+        GridSortItem(field="id", sort=GridSortDirection.ASC),
+    ]
+    statement = apply_sort_to_select_from_model(
+        statement=select(ParentModel), model=model, resolver=resolver
+    )
+    expected = apply_sort_to_query_from_model(
+        query=query, model=model, resolver=resolver
+    ).all()
+    assert session.execute(statement).scalars().all() == expected
+
+
+def test_apply_sort_to_compound_select_from_model(session: Session) -> None:
+    statement = union_all(
+        select(ParentModel.id).where(ParentModel.id < 3),
+        select(ParentModel.id).where(ParentModel.id > 398),
+    )
+    sorted_statement = apply_sort_to_select_from_model(
+        statement=statement,
+        model=[GridSortItem(field="id", sort=GridSortDirection.DESC)],
+        resolver=lambda field: statement.selected_columns[field],
+    )
+    assert session.execute(sorted_statement).scalars().all() == [400, 399, 2, 1]
@@ -0,0 +1,203 @@
+from asyncio import gather, run
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, Set, TypeVar
+
+from pytest import TempPathFactory, fixture, importorskip, mark
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v5.integrations.sqlalchemy import (
+    AsyncDataGridQuery,
+    MapperResolver,
+    StatementCache,
+)
+from tests.fixtures import Base, Category, ChildModel, ParentModel
+
+_T = TypeVar("_T")
+
+PARENT_COUNT = 40
+
+
+@fixture(scope="module")
+def database_url(tmp_path_factory: TempPathFactory) -> str:
+    importorskip("aiosqlite")
+    path: Path = tmp_path_factory.mktemp("async") / "grid.sqlite"
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(bind=engine, future=True) as session:
+        for i in range(1, PARENT_COUNT + 1):
+            parent = ParentModel(name=f"ParentModel {i}", grouping_id=i % 10)
+            parent.children = [
+                ChildModel(category=Category.CATEGORY_0),
+                ChildModel(category=Category.CATEGORY_1),
+            ]
+            session.add(parent)
+        session.commit()
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def run_with_session(
+    database_url: str, test: Callable[[AsyncEngine, AsyncSession], Awaitable[_T]]
+) -> _T:
+    async def run_test() -> _T:
+        engine = create_async_engine(database_url)
+        try:
+            async with AsyncSession(engine) as session:
+                return await test(engine, session)
+        finally:
+            await engine.dispose()
+
+    return run(run_test())
+
+
+def grouping_model(value: Any, operator: str = "=") -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": [
+                {"columnField": "groupingId", "operatorValue": operator, "value": value}
+            ]
+        }
+    )
+
+
+def test_async_query_filters_sorts_and_paginates(database_url: str) -> None:
+    async def test(engine: AsyncEngine, session: AsyncSession) -> None:
+        dg_query: AsyncDataGridQuery[ParentModel] = AsyncDataGridQuery(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=MapperResolver(ParentModel),
+            filter_model=grouping_model(3),
+            sort_model=[GridSortItem(field="id", sort=GridSortDirection.DESC)],
+            pagination_model=GridPaginationModel(page=1, page_size=3),
+        )
+        items = await dg_query.items()
+        assert all(isinstance(item, ParentModel) for item in items)
+        assert [item.id for item in items] == [3]
+        assert await dg_query.total() == 4
+        assert await dg_query.pages() == 2
+        assert dg_query.has_previous
+        assert await dg_query.items(factory=lambda item: item.name) == ["ParentModel 3"]
+
+    run_with_session(database_url, test)
+
+
+def test_async_query_counts_concurrently(database_url: str) -> None:
+    async def test(engine: AsyncEngine, session: AsyncSession) -> None:
+        connections: Set[int] = set()
+
+        def before_cursor_execute(connection: Any, *args: Any) -> None:
+            connections.add(id(connection.connection.dbapi_connection))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        dg_query: AsyncDataGridQuery[ParentModel] = AsyncDataGridQuery(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=MapperResolver(ParentModel),
+            filter_model=grouping_model(5, ">"),
+            pagination_model=GridPaginationModel(page=0, page_size=5),
+            count_engine=engine,
+        )
+        items, total = await gather(dg_query.items(), dg_query.total())
+        assert len(items) == 5
+        assert total == 16
+        # the page and the count were retrieved using two pooled connections
+        assert len(connections) == 2
+
+    run_with_session(database_url, test)
+
+
+@mark.parametrize("last_page,has_next", ((0, True), (7, False)))
+def test_async_query_lookahead(
+    last_page: int, has_next: bool, database_url: str
+) -> None:
+    async def test(engine: AsyncEngine, session: AsyncSession) -> None:
+        dg_query: AsyncDataGridQuery[ParentModel] = AsyncDataGridQuery(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=MapperResolver(ParentModel),
+            pagination_model=GridPaginationModel(page=last_page, page_size=5),
+            lookahead=True,
+        )
+        assert len(await dg_query.items()) == 5
+        assert dg_query.has_next is has_next
+
+    run_with_session(database_url, test)
+
+
+def test_async_query_which_matches_nothing_is_not_executed(
+    database_url: str,
+) -> None:
+    async def test(engine: AsyncEngine, session: AsyncSession) -> List[str]:
+        statements: List[str] = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        dg_query: AsyncDataGridQuery[ParentModel] = AsyncDataGridQuery(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=MapperResolver(ParentModel),
+            filter_model=GridFilterModel.parse_obj(
+                {
+                    "items": [
+                        {"columnField": "id", "operatorValue": "<", "value": 1},
+                        {"columnField": "id", "operatorValue": ">", "value": 2},
+                    ]
+                }
+            ),
+            simplify_filter=True,
+        )
+        assert await dg_query.items() == []
+        assert await dg_query.total() == 0
+        return statements
+
+    assert run_with_session(database_url, test) == []
+
+
+@mark.parametrize("statement_cache", (None, StatementCache()))
+def test_async_query_related_fields(
+    statement_cache: Optional[StatementCache], database_url: str
+) -> None:
+    async def test(engine: AsyncEngine, session: AsyncSession) -> None:
+        resolver = MapperResolver(ChildModel)
+        for grouping_id in (1, 2):
+            dg_query: AsyncDataGridQuery[ChildModel] = AsyncDataGridQuery(
+                statement=select(ChildModel),
+                session=session,
+                column_resolver=resolver,
+                filter_model=GridFilterModel.parse_obj(
+                    {
+                        "items": [
+                            {
+                                "columnField": "parent.groupingId",
+                                "operatorValue": "=",
+                                "value": grouping_id,
+                            },
+                            {
+                                "columnField": "parent.children.category",
+                                "operatorValue": "=",
+                                "value": "cat-1",
+                            },
+                        ]
+                    }
+                ),
+                sort_model=[
+                    GridSortItem(field="parent.name", sort=GridSortDirection.ASC)
+                ],
+                statement_cache=statement_cache,
+            )
+            # the two children of each of the four parents in the group
+            assert await dg_query.total() == 8
+            items = await dg_query.items()
+            assert {item.parent_id % 10 for item in items} == {grouping_id}
+
+    run_with_session(database_url, test)
@@ -0,0 +1,148 @@
+from typing import Any, Dict, List
+
+from pytest import mark, raises
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import GridFilterModel, GridPaginationModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+@mark.parametrize("page", (0, 3))
+def test_window_total_uses_a_single_statement(
+    page: int,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    statements: List[str],
+) -> None:
+    filter_model = GridFilterModel.parse_obj(
+        {"items": [{"columnField": "grouping_id", "operatorValue": ">", "value": 4}]}
+    )
+    expected_total = query.filter(ParentModel.grouping_id > 4).count()
+    statements.clear()
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        filter_model=filter_model,
+        pagination_model=GridPaginationModel(page=page, page_size=10),
+        window_total=True,
+    )
+    items = dg_query.items()
+    assert len(items) == 10
+    assert all(isinstance(item, ParentModel) for item in items)
+    assert dg_query.total() == expected_total
+    assert dg_query.pages() == -(-expected_total // 10)
+    assert len(statements) == 1
+    assert "OVER ()" in statements[0]
+
+
+@mark.parametrize("columns", (("id",), ("id", "name")))
+@mark.parametrize(
+    "options",
+    (
+        {"window_total": True},
+        {"pagination_strategy": "keyset", "tie_breaker": ParentModel.id},
+    ),
+)
+def test_extra_columns_preserve_the_rows_of_column_queries(
+    columns: List[str], options: Dict[str, Any], session: Session, resolver: Resolver
+) -> None:
+    query = session.query(*(getattr(ParentModel, column) for column in columns))
+    pagination_model = GridPaginationModel(page=0, page_size=3)
+    expected = DataGridQuery(
+        query=query, column_resolver=resolver, pagination_model=pagination_model
+    ).items()
+    items = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=pagination_model,
+        **options,
+    ).items()
+    assert items == expected
+    assert [type(item) for item in items] == [type(item) for item in expected]
+    assert [item.id for item in items] == [1, 2, 3]
+
+
+def test_window_total_falls_back_to_count_past_the_last_page(
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    parent_model_count: int,
+    statements: List[str],
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page=parent_model_count, page_size=10),
+        window_total=True,
+    )
+    assert dg_query.items() == []
+    assert dg_query.total() == parent_model_count
+    assert len(statements) == 2
+
+
+def test_window_total_is_not_supported_with_keyset_pagination(
+    query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    with raises(ValueError):
+        DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            pagination_model=GridPaginationModel(),
+            pagination_strategy="keyset",
+            window_total=True,
+        )
+
+
+@mark.parametrize(
+    "page,expected_has_next", ((0, True), (38, True), (39, False), (40, False))
+)
+def test_lookahead_detects_the_next_page_without_counting(
+    page: int,
+    expected_has_next: bool,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+    parent_model_count: int,
+    statements: List[str],
+) -> None:
+    page_size = 10
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page=page, page_size=page_size),
+        lookahead=True,
+    )
+    assert dg_query.has_next is None
+    items = dg_query.items()
+    expected_size = max(0, min(page_size, parent_model_count - page * page_size))
+    assert len(items) == expected_size
+    assert dg_query.has_next is expected_has_next
+    assert dg_query.has_previous is (page > 0)
+    assert len(statements) == 1
+    assert "count" not in statements[0].lower()
+
+
+def test_lookahead_with_keyset_pagination_stops_on_the_last_page(
+    query: "Query[ParentModel]", resolver: Resolver, parent_model_count: int
+) -> None:
+    page_size = 100
+    seen: List[int] = []
+    cursor = None
+    while True:
+        dg_query = DataGridQuery(
+            query=query,
+            column_resolver=resolver,
+            pagination_model=GridPaginationModel(page_size=page_size, cursor=cursor),
+            pagination_strategy="keyset",
+            lookahead=True,
+        )
+        assert dg_query.has_previous is (cursor is not None)
+        seen.extend(item.id for item in dg_query.items())
+        cursor = dg_query.next_cursor
+        assert (cursor is not None) is dg_query.has_next
+        if cursor is None:
+            break
+    # a page size which evenly divides the rows would otherwise end on an empty page
+    assert parent_model_count % page_size == 0
+    assert len(seen) == parent_model_count
+    assert len(set(seen)) == parent_model_count
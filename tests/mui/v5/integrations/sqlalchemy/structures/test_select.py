@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional
+
+from pytest import mark, raises
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from mui.v5.grid import (
+    GridFilterModel,
+    GridPaginationModel,
+    GridSortDirection,
+    GridSortItem,
+)
+from mui.v5.integrations.sqlalchemy import (
+    DataGridQuery,
+    DataGridSelect,
+    MapperResolver,
+    StatementCache,
+)
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from tests.fixtures import ChildModel, ParentModel
+
+
+def grouping_model(value: int, operator: str = "=") -> GridFilterModel:
+    return GridFilterModel.parse_obj(
+        {
+            "items": [
+                {
+                    "columnField": "grouping_id",
+                    "operatorValue": operator,
+                    "value": value,
+                }
+            ]
+        }
+    )
+
+
+@mark.parametrize("statement_cache", (None, StatementCache()))
+def test_select_matches_query(
+    statement_cache: Optional[StatementCache],
+    session: Session,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    options: Dict[str, Any] = dict(
+        column_resolver=resolver,
+        filter_model=grouping_model(3),
+        sort_model=[GridSortItem(field="name", sort=GridSortDirection.DESC)],
+        pagination_model=GridPaginationModel(page=2, page_size=15),
+        statement_cache=statement_cache,
+    )
+    dg_query: DataGridQuery[ParentModel] = DataGridQuery(query=query, **options)
+    dg_select: DataGridSelect[ParentModel] = DataGridSelect(
+        statement=select(ParentModel), session=session, **options
+    )
+    items = dg_select.items()
+    assert all(isinstance(item, ParentModel) for item in items)
+    assert items == dg_query.items()
+    assert dg_select.total() == dg_query.total() == 40
+    assert dg_select.pages() == 3
+    assert dg_select.has_previous
+    assert dg_select.items(factory=lambda item: item.id) == [item.id for item in items]
+
+
+def test_select_of_columns_returns_rows(session: Session, resolver: Resolver) -> None:
+    dg_select: DataGridSelect[Any] = DataGridSelect(
+        statement=select(ParentModel.id, ParentModel.grouping_id),
+        session=session,
+        column_resolver=resolver,
+        filter_model=grouping_model(5, ">"),
+        sort_model=[GridSortItem(field="id", sort=GridSortDirection.ASC)],
+        pagination_model=GridPaginationModel(page=0, page_size=3),
+    )
+    assert [tuple(row) for row in dg_select.items()] == [(6, 6), (7, 7), (8, 8)]
+    assert dg_select.total() == 160
+
+
+@mark.parametrize("last_page,has_next", ((0, True), (39, False)))
+def test_select_lookahead(
+    last_page: int, has_next: bool, session: Session, resolver: Resolver
+) -> None:
+    dg_select: DataGridSelect[ParentModel] = DataGridSelect(
+        statement=select(ParentModel),
+        session=session,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page=last_page, page_size=10),
+        lookahead=True,
+    )
+    assert len(dg_select.items()) == 10
+    assert dg_select.has_next is has_next
+
+
+def test_select_which_matches_nothing_is_not_executed(
+    engine: Engine, session: Session, resolver: Resolver
+) -> None:
+    statements: List[str] = []
+
+    def before_cursor_execute(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        dg_select: DataGridSelect[ParentModel] = DataGridSelect(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=resolver,
+            filter_model=GridFilterModel.parse_obj(
+                {
+                    "items": [
+                        {"columnField": "id", "operatorValue": "<", "value": 1},
+                        {"columnField": "id", "operatorValue": ">", "value": 2},
+                    ]
+                }
+            ),
+            simplify_filter=True,
+        )
+        assert dg_select.items() == []
+        assert dg_select.total() == 0
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert statements == []
+
+
+def test_select_related_fields(session: Session) -> None:
+    dg_select: DataGridSelect[ChildModel] = DataGridSelect(
+        statement=select(ChildModel),
+        session=session,
+        column_resolver=MapperResolver(ChildModel),
+        filter_model=GridFilterModel.parse_obj(
+            {
+                "items": [
+                    {
+                        "columnField": "parent.groupingId",
+                        "operatorValue": "=",
+                        "value": 1,
+                    }
+                ]
+            }
+        ),
+        sort_model=[GridSortItem(field="parent.name", sort=GridSortDirection.ASC)],
+        pagination_model=GridPaginationModel(page=0, page_size=5),
+    )
+    assert dg_select.total() == 40 * 400
+    assert {item.parent_id % 10 for item in dg_select.items()} == {1}
+    with raises(ValueError):
+        DataGridSelect(
+            statement=select(ParentModel),
+            session=session,
+            column_resolver=MapperResolver(ParentModel),
+            sort_model=[
+                GridSortItem(field="children.category", sort=GridSortDirection.ASC)
+            ],
+        )
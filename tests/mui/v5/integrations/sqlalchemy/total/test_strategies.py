@@ -0,0 +1,80 @@
+from typing import Any
+
+from pytest import MonkeyPatch, mark
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Query
+
+from mui.v5.grid import GridPaginationModel
+from mui.v5.integrations.sqlalchemy import DataGridQuery
+from mui.v5.integrations.sqlalchemy.resolver import Resolver
+from mui.v5.integrations.sqlalchemy.total import count_capped, estimate
+from tests.fixtures.sqlalchemy import ParentModel
+
+
+@mark.parametrize("cap", (0, 10, 399, 400, 1000))
+def test_count_capped(
+    cap: int, query: "Query[ParentModel]", parent_model_count: int
+) -> None:
+    assert count_capped(query=query, cap=cap) == min(cap + 1, parent_model_count)
+
+
+@mark.parametrize(
+    ("cap", "expected_kind"),
+    ((50, "lower_bound"), (400, "exact")),
+)
+def test_capped_total_strategy(
+    cap: int,
+    expected_kind: str,
+    query: "Query[ParentModel]",
+    resolver: Resolver,
+) -> None:
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page_size=10),
+        total_strategy="capped",
+        total_cap=cap,
+    )
+    total = dg_query.total()
+    assert dg_query.total_kind == expected_kind
+    assert total == min(cap + 1, query.count())
+    assert dg_query.pages() == -(-total // 10)
+
+
+def test_estimated_total_strategy_falls_back_to_exact_count(
+    query: "Query[ParentModel]", resolver: Resolver, parent_model_count: int
+) -> None:
+    # sqlite has no planner row estimates
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(),
+        total_strategy="estimated",
+    )
+    assert dg_query.total() == parent_model_count
+    assert dg_query.total_kind == "exact"
+
+
+def test_estimated_total_strategy_uses_registered_estimator(
+    monkeypatch: MonkeyPatch, query: "Query[ParentModel]", resolver: Resolver
+) -> None:
+    def estimator(query: "Query[Any]") -> int:
+        return 12345
+
+    monkeypatch.setitem(estimate._ESTIMATORS, "sqlite", estimator)
+    dg_query = DataGridQuery(
+        query=query,
+        column_resolver=resolver,
+        pagination_model=GridPaginationModel(page_size=5),
+        total_strategy="estimated",
+    )
+    assert dg_query.total() == 12345
+    assert dg_query.total_kind == "estimate"
+    assert dg_query.pages() == 2469
+
+
+def test_postgresql_explain_wraps_statement(query: "Query[ParentModel]") -> None:
+    statement = estimate._Explain(query.filter(ParentModel.id > 5).statement)
+    compiled = str(statement.compile(dialect=PGDialect_psycopg2()))
+    assert compiled.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "WHERE test_model.id > %(id_1)s" in compiled